@@ -3,6 +3,16 @@ Backtest Automation DAG
 =======================
 Runs automated backtests and stores results.
 
+Modes (DAG param ``mode``):
+- ``engine`` (default): loads every symbol once and runs the project's
+  VanillaVBO through VectorizedBacktestEngine in a single task, per symbol
+  and as a portfolio. With ``sweep`` enabled, VBO_SWEEP parameter sets run
+  on the same in-memory data via ParallelBacktestRunner.
+- ``simple``: the legacy hand-written VBO, one task per symbol.
+
+Both modes write data/backtest_results/run_date=YYYYMMDD/results.parquet,
+read by the dbt model stg_backtest_results.
+
 Schedule: Weekly on Sunday at 2:00 AM KST
 """
 
@@ -10,6 +20,7 @@ from datetime import datetime, timedelta
 from pathlib import Path
 
 from airflow import DAG
+from airflow.models.param import Param
 from airflow.operators.python import PythonOperator, BranchPythonOperator
 from airflow.operators.empty import EmptyOperator
 
@@ -27,6 +38,13 @@ default_args = {
 SYMBOLS = ["BTC", "ETH", "XRP", "TRX", "ADA"]
 STRATEGIES = ["vbo", "momentum", "mean_reversion"]
 
+# Engine-mode parameter sweep (VanillaVBO keyword arguments per set)
+VBO_SWEEP = {
+    f"sma{sma}_trend{trend}": {"sma_period": sma, "trend_sma_period": trend}
+    for sma in (3, 4, 5)
+    for trend in (8, 10, 20)
+}
+
 
 def check_data_availability(**context) -> str:
     """Check if required data is available for backtesting.
@@ -37,22 +55,110 @@ def check_data_availability(**context) -> str:
     import os
     from pathlib import Path
 
+    from src.data.feature_pipeline import read_feature_store
+
     data_dir = Path(os.environ.get("DATA_DIR", "/opt/airflow/data"))
-    features_path = data_dir / "processed" / "combined_features.parquet"
+    df = read_feature_store(data_dir / "processed" / "features")
 
-    if not features_path.exists():
-        print("Combined features not found, skipping backtest")
+    if df.empty:
+        print("Feature store not found, skipping backtest")
         return "skip_backtest"
 
-    import pandas as pd
-    df = pd.read_parquet(features_path)
-
     if len(df) < 100:
         print(f"Insufficient data: {len(df)} rows")
         return "skip_backtest"
 
     print(f"Data available: {len(df)} rows")
-    return "run_backtests"
+    if context["params"].get("mode", "engine") == "simple":
+        return "run_backtests"
+    return "run_engine_backtests"
+
+
+def run_engine_backtests(**context) -> dict:
+    """Run VanillaVBO through the production engine on data loaded once.
+
+    Every symbol is read once into memory and shared by all runs: one
+    single-asset run per symbol, one portfolio run over all symbols and,
+    if the ``sweep`` param is set, one portfolio run per VBO_SWEEP entry
+    (parallel over workers that each receive the data once).
+
+    Returns:
+        Dictionary with summary of the written results
+    """
+    import os
+
+    from src.backtester.engine import VectorizedBacktestEngine
+    from src.backtester.engine.data_loader import load_parquet_data
+    from src.backtester.parallel import ParallelBacktestRunner
+    from src.backtester.results_table import (
+        PORTFOLIO_SYMBOL,
+        buy_and_hold_return,
+        result_row,
+        write_results_table,
+    )
+    from src.strategies.volatility_breakout import VanillaVBO
+
+    data_dir = Path(os.environ.get("DATA_DIR", "/opt/airflow/data"))
+    raw_dir = data_dir / "raw" / "day"
+
+    raw_data = {}
+    for symbol in SYMBOLS:
+        path = raw_dir / f"{symbol}.parquet"
+        if path.exists():
+            raw_data[symbol] = load_parquet_data(path)
+
+    if not raw_data:
+        return {"status": "no_results"}
+
+    engine = VectorizedBacktestEngine()
+    strategy_name = VanillaVBO().name
+    buy_hold = {symbol: buy_and_hold_return(df) for symbol, df in raw_data.items()}
+    portfolio_buy_hold = sum(buy_hold.values()) / len(buy_hold)
+
+    rows = []
+    for symbol, df in raw_data.items():
+        result = engine.run_on_data(VanillaVBO(), {symbol: df})
+        rows.append(
+            result_row(
+                result, symbol, strategy_name,
+                buy_hold_return=buy_hold[symbol], data_rows=len(df),
+            )
+        )
+        print(f"{strategy_name} {symbol}: Return={result.total_return:.2f}%, "
+              f"Sharpe={result.sharpe_ratio:.2f}, MDD={result.mdd:.2f}%")
+
+    portfolio = engine.run_on_data(VanillaVBO(), raw_data)
+    rows.append(
+        result_row(portfolio, PORTFOLIO_SYMBOL, strategy_name, buy_hold_return=portfolio_buy_hold)
+    )
+
+    if context["params"].get("sweep", False):
+        runner = ParallelBacktestRunner(n_workers=int(os.environ.get("BACKTEST_WORKERS", "4")))
+        sweep_results = runner.run_on_data(VanillaVBO, VBO_SWEEP, raw_data)
+        for name, result in sorted(sweep_results.items()):
+            rows.append(
+                result_row(
+                    result, PORTFOLIO_SYMBOL, strategy_name, param_set=name,
+                    params=VBO_SWEEP[name], buy_hold_return=portfolio_buy_hold,
+                )
+            )
+
+    run_date = context["execution_date"].strftime("%Y%m%d")
+    output_path = write_results_table(rows, data_dir / "backtest_results", run_date)
+    print(f"Wrote {len(rows)} results to {output_path}")
+
+    symbol_rows = [r for r in rows if r["symbol"] != PORTFOLIO_SYMBOL]
+    best = max(symbol_rows, key=lambda r: r["total_return"])
+    worst = min(symbol_rows, key=lambda r: r["total_return"])
+    return {
+        "date": run_date,
+        "total_strategies": len(symbol_rows),
+        "avg_return": sum(r["total_return"] for r in symbol_rows) / len(symbol_rows),
+        "avg_sharpe": sum(r["sharpe_ratio"] for r in symbol_rows) / len(symbol_rows),
+        "avg_mdd": sum(r["max_drawdown"] for r in symbol_rows) / len(symbol_rows),
+        "best_symbol": best["symbol"],
+        "worst_symbol": worst["symbol"],
+    }
 
 
 def run_vbo_backtest(symbol: str, **context) -> dict:
@@ -147,13 +253,12 @@ def aggregate_backtest_results(**context) -> dict:
         Dictionary with aggregated results
     """
     import os
-    import json
     from pathlib import Path
 
+    from src.backtester.results_table import write_results_table
+
     ti = context["ti"]
     data_dir = Path(os.environ.get("DATA_DIR", "/opt/airflow/data"))
-    output_dir = data_dir / "backtest_results"
-    output_dir.mkdir(parents=True, exist_ok=True)
 
     # Collect results from upstream tasks
     results = []
@@ -165,12 +270,14 @@ def aggregate_backtest_results(**context) -> dict:
     if not results:
         return {"status": "no_results"}
 
-    # Save results
+    # Save results to the partitioned results table
     execution_date = context["execution_date"].strftime("%Y%m%d")
-    output_path = output_dir / f"backtest_results_{execution_date}.json"
-
-    with open(output_path, "w") as f:
-        json.dump(results, f, indent=2, default=str)
+    rows = [
+        {**r, "param_set": "default", "params": "{}"}
+        for r in results
+        if r.get("status") == "success"
+    ]
+    write_results_table(rows, data_dir / "backtest_results", execution_date)
 
     # Calculate summary statistics
     import pandas as pd
@@ -194,7 +301,8 @@ def aggregate_backtest_results(**context) -> dict:
 def send_backtest_report(**context) -> None:
     """Send backtest report notification."""
     ti = context["ti"]
-    summary = ti.xcom_pull(task_ids="aggregate_results")
+    summaries = ti.xcom_pull(task_ids=["aggregate_results", "run_engine_backtests"])
+    summary = next((s for s in summaries if s), None)
 
     if not summary or summary.get("status") == "no_results":
         print("No backtest results to report")
@@ -230,6 +338,10 @@ with DAG(
     catchup=False,
     tags=["data-engineering", "crypto", "backtest"],
     doc_md=__doc__,
+    params={
+        "mode": Param("engine", enum=["engine", "simple"]),
+        "sweep": Param(False, type="boolean"),
+    },
 ) as dag:
 
     start = EmptyOperator(task_id="start")
@@ -264,13 +376,21 @@ with DAG(
         trigger_rule="none_failed_min_one_success",
     )
 
+    # Production engine on data loaded once (default mode)
+    engine_task = PythonOperator(
+        task_id="run_engine_backtests",
+        python_callable=run_engine_backtests,
+    )
+
     # Send report
     report_task = PythonOperator(
         task_id="send_report",
         python_callable=send_backtest_report,
+        trigger_rule="none_failed_min_one_success",
     )
 
     # Set dependencies
     start >> check_data
     check_data >> skip >> end
     check_data >> run_backtests >> vbo_tasks >> aggregate_task >> report_task >> end
+    check_data >> engine_task >> report_task
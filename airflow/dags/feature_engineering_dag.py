@@ -1,7 +1,8 @@
 """
 Feature Engineering DAG
 =======================
-Calculates technical indicators and features from raw OHLCV data.
+Calculates technical indicators and features from raw OHLCV data and appends
+new rows to the month-partitioned feature store (data/processed/features).
 
 Schedule: Daily at 10:00 AM KST (after data collection)
 Depends on: crypto_data_collection DAG
@@ -29,11 +30,14 @@ default_args = {
 SYMBOLS = ["BTC", "ETH", "XRP", "TRX", "ADA", "DOGE", "SOL", "AVAX"]
 
 
-def calculate_features(symbol: str, **context) -> dict:
-    """Calculate features for a single symbol.
+def calculate_features(**context) -> dict:
+    """Calculate features for all symbols and append them to the feature store.
+
+    Only rows newer than the stored rolling state (the last WARMUP_ROWS raw
+    rows per symbol) are computed, for all symbols at once, using the shared
+    indicator library (see src/data/feature_pipeline.py).
 
     Args:
-        symbol: Trading symbol
         context: Airflow context
 
     Returns:
@@ -41,136 +45,37 @@ def calculate_features(symbol: str, **context) -> dict:
     """
     import os
     import pandas as pd
-    import numpy as np
-
-    data_dir = Path(os.environ.get("DATA_DIR", "/opt/airflow/data"))
-    input_path = data_dir / "raw" / "day" / f"{symbol}.parquet"
-    output_dir = data_dir / "processed" / "features"
-    output_dir.mkdir(parents=True, exist_ok=True)
-    output_path = output_dir / f"{symbol}_features.parquet"
-
-    if not input_path.exists():
-        print(f"No raw data for {symbol}")
-        return {"symbol": symbol, "status": "no_data"}
-
-    # Load raw data
-    df = pd.read_parquet(input_path)
-    print(f"Loaded {symbol}: {len(df)} rows")
-
-    # Calculate features
-    features = pd.DataFrame(index=df.index)
-
-    # Price features
-    features["return_1d"] = df["close"].pct_change(1)
-    features["return_5d"] = df["close"].pct_change(5)
-    features["return_20d"] = df["close"].pct_change(20)
-
-    # Moving averages
-    features["ma_5"] = df["close"].rolling(5).mean()
-    features["ma_20"] = df["close"].rolling(20).mean()
-    features["ma_60"] = df["close"].rolling(60).mean()
-
-    # MA ratios
-    features["ma_5_20_ratio"] = features["ma_5"] / features["ma_20"]
-    features["ma_20_60_ratio"] = features["ma_20"] / features["ma_60"]
-    features["price_ma_20_ratio"] = df["close"] / features["ma_20"]
-
-    # Volatility
-    features["volatility_20d"] = df["close"].pct_change().rolling(20).std()
-    features["volatility_60d"] = df["close"].pct_change().rolling(60).std()
-
-    # RSI
-    delta = df["close"].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(14).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(14).mean()
-    rs = gain / loss
-    features["rsi_14"] = 100 - (100 / (1 + rs))
-
-    # Volume features
-    features["volume_ma_20"] = df["volume"].rolling(20).mean()
-    features["volume_ratio"] = df["volume"] / features["volume_ma_20"]
-
-    # ATR (Average True Range)
-    high_low = df["high"] - df["low"]
-    high_close = (df["high"] - df["close"].shift()).abs()
-    low_close = (df["low"] - df["close"].shift()).abs()
-    tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-    features["atr_14"] = tr.rolling(14).mean()
-    features["atr_ratio"] = features["atr_14"] / df["close"]
-
-    # Bollinger Bands
-    bb_ma = df["close"].rolling(20).mean()
-    bb_std = df["close"].rolling(20).std()
-    features["bb_upper"] = bb_ma + 2 * bb_std
-    features["bb_lower"] = bb_ma - 2 * bb_std
-    features["bb_width"] = (features["bb_upper"] - features["bb_lower"]) / bb_ma
-    features["bb_position"] = (df["close"] - features["bb_lower"]) / (
-        features["bb_upper"] - features["bb_lower"]
-    )
-
-    # MA alignment (trend strength)
-    features["ma_alignment"] = (
-        (features["ma_5"] > features["ma_20"]).astype(int) +
-        (features["ma_20"] > features["ma_60"]).astype(int)
-    ) / 2
-
-    # Add timestamp for tracking
-    features["calculated_at"] = datetime.now()
-
-    # Save features
-    features.to_parquet(output_path)
 
-    feature_count = len([c for c in features.columns if c != "calculated_at"])
-    nan_ratio = features.isna().sum().sum() / (len(features) * feature_count)
-
-    print(f"Saved {symbol} features: {len(features)} rows, {feature_count} features, "
-          f"{nan_ratio:.2%} NaN ratio")
-
-    return {
-        "symbol": symbol,
-        "status": "success",
-        "rows": len(features),
-        "features": feature_count,
-        "nan_ratio": nan_ratio,
-    }
-
-
-def create_combined_features(**context) -> dict:
-    """Combine all symbol features into a single dataset.
-
-    Returns:
-        Dictionary with combined dataset info
-    """
-    import os
-    import pandas as pd
+    from src.data.feature_pipeline import FEATURE_COLUMNS, update_feature_store
 
     data_dir = Path(os.environ.get("DATA_DIR", "/opt/airflow/data"))
-    features_dir = data_dir / "processed" / "features"
-    output_path = data_dir / "processed" / "combined_features.parquet"
-
-    all_features = []
+    store_dir = data_dir / "processed" / "features"
 
+    raw = {}
     for symbol in SYMBOLS:
-        file_path = features_dir / f"{symbol}_features.parquet"
-        if file_path.exists():
-            df = pd.read_parquet(file_path)
-            df["symbol"] = symbol
-            all_features.append(df)
-            print(f"Loaded {symbol}: {len(df)} rows")
-
-    if not all_features:
-        print("No feature files found")
+        input_path = data_dir / "raw" / "day" / f"{symbol}.parquet"
+        if not input_path.exists():
+            print(f"No raw data for {symbol}")
+            continue
+        raw[symbol] = pd.read_parquet(input_path)
+
+    if not raw:
         return {"status": "no_data"}
 
-    combined = pd.concat(all_features)
-    combined.to_parquet(output_path)
+    new_rows = update_feature_store(raw, store_dir)
 
-    print(f"Combined features: {len(combined)} total rows, {len(SYMBOLS)} symbols")
+    nan_ratio = (
+        new_rows[list(FEATURE_COLUMNS)].isna().to_numpy().mean() if len(new_rows) else 0.0
+    )
+    print(f"Appended {len(new_rows)} feature rows for {len(raw)} symbols, "
+          f"{nan_ratio:.2%} NaN ratio")
 
     return {
         "status": "success",
-        "total_rows": len(combined),
-        "symbols": len(all_features),
+        "rows": len(new_rows),
+        "symbols": len(raw),
+        "features": len(FEATURE_COLUMNS),
+        "nan_ratio": float(nan_ratio),
     }
 
 
@@ -183,13 +88,16 @@ def validate_features(**context) -> dict:
     import os
     import pandas as pd
 
+    from src.data.feature_pipeline import read_feature_store
+
     data_dir = Path(os.environ.get("DATA_DIR", "/opt/airflow/data"))
-    combined_path = data_dir / "processed" / "combined_features.parquet"
+    store_dir = data_dir / "processed" / "features"
 
-    if not combined_path.exists():
-        return {"status": "error", "message": "Combined features file not found"}
+    # Only recent partitions are read; older rows were validated when written
+    df = read_feature_store(store_dir, start=datetime.now() - timedelta(days=30))
 
-    df = pd.read_parquet(combined_path)
+    if df.empty:
+        return {"status": "error", "message": "No recent rows in feature store"}
 
     # Validation checks
     issues = []
@@ -249,20 +157,10 @@ with DAG(
         poke_interval=60,
     )
 
-    # Calculate features for each symbol
-    feature_tasks = []
-    for symbol in SYMBOLS:
-        task = PythonOperator(
-            task_id=f"calculate_{symbol}_features",
-            python_callable=calculate_features,
-            op_kwargs={"symbol": symbol},
-        )
-        feature_tasks.append(task)
-
-    # Combine features
-    combine_task = PythonOperator(
-        task_id="combine_features",
-        python_callable=create_combined_features,
+    # Calculate features for all symbols (incremental, batched)
+    feature_task = PythonOperator(
+        task_id="calculate_features",
+        python_callable=calculate_features,
     )
 
     # Validate features
@@ -272,4 +170,4 @@ with DAG(
     )
 
     # Set dependencies
-    start >> wait_for_data >> feature_tasks >> combine_task >> validate_task >> end
+    start >> wait_for_data >> feature_task >> validate_task >> end
@@ -33,19 +33,18 @@ def check_data_drift(**context) -> str:
     """
     import os
     import numpy as np
-    import pandas as pd
     from pathlib import Path
     from scipy import stats
 
+    from src.data.feature_pipeline import read_feature_store
+
     data_dir = Path(os.environ.get("DATA_DIR", "/opt/airflow/data"))
-    features_path = data_dir / "processed" / "combined_features.parquet"
+    df = read_feature_store(data_dir / "processed" / "features")
 
-    if not features_path.exists():
+    if df.empty:
         print("No feature data found")
         return "skip_retrain"
 
-    df = pd.read_parquet(features_path)
-
     # Split into reference (old) and current (recent) data
     split_date = df.index.max() - timedelta(days=30)
     reference = df[df.index < split_date]
@@ -117,8 +116,9 @@ def retrain_model(**context) -> dict:
     model_dir.mkdir(exist_ok=True)
 
     # Load features
-    features_path = data_dir / "processed" / "combined_features.parquet"
-    df = pd.read_parquet(features_path)
+    from src.data.feature_pipeline import read_feature_store
+
+    df = read_feature_store(data_dir / "processed" / "features")
 
     # Use Ultra-5 features
     feature_cols = ["return_20d", "volatility_20d", "rsi_14", "ma_alignment", "volume_ratio"]
@@ -0,0 +1,6 @@
+"""
+Performance benchmarks on synthetic OHLCV universes.
+
+Run from the repository root with ``python -m benchmarks`` (see
+benchmarks/README.md).
+"""
@@ -0,0 +1,107 @@
+"""
+Benchmark command line.
+
+    python -m benchmarks run --preset quick --output benchmarks/results/current.json
+    python -m benchmarks compare benchmarks/results/baseline.json benchmarks/results/current.json
+
+compare exits with status 1 when a benchmark regressed or failed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+from benchmarks.cases import CASES, select_cases
+from benchmarks.compare import compare_results, format_report, machine_differences
+from benchmarks.runner import load_results, run_suite, save_results
+from benchmarks.synthetic import PRESETS
+
+DEFAULT_OUTPUT = Path("benchmarks") / "results" / "current.json"
+
+
+def _run(args: argparse.Namespace) -> int:
+    cases = select_cases(args.case)
+    if not cases:
+        print(f"No benchmark matches {args.case}; available: {', '.join(c.name for c in CASES)}")
+        return 2
+    scales = PRESETS[args.preset]
+    if args.max_tickers is not None:
+        scales = tuple(s for s in scales if s.tickers <= args.max_tickers)
+
+    # Backtest internals log per task; keep the benchmark output readable
+    logging.getLogger("src").setLevel(logging.WARNING)
+    document = run_suite(
+        cases,
+        scales,
+        repeat=args.repeat,
+        warmup=args.warmup,
+        seed=args.seed,
+        progress=print,
+    )
+    document["settings"]["preset"] = args.preset
+    path = save_results(document, args.output)
+    print(f"Wrote {len(document['results'])} results to {path}")
+    return 1 if any("error" in r for r in document["results"]) else 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    baseline = load_results(args.baseline)
+    current = load_results(args.current)
+
+    differences = machine_differences(baseline, current)
+    if differences:
+        print("WARNING: baseline was measured on a different machine:")
+        for key, (old, new) in differences.items():
+            print(f"  {key}: {old} -> {new}")
+
+    comparisons = compare_results(
+        baseline,
+        current,
+        threshold=args.threshold,
+        min_delta_s=args.min_delta_ms / 1000,
+        stat=args.stat,
+    )
+    print(format_report(comparisons))
+
+    failed = [c for c in comparisons if c.status in ("regression", "error")]
+    if failed:
+        print(f"\n{len(failed)} benchmark(s) regressed or failed (threshold {args.threshold:.0%})")
+        return 1
+    print("\nNo regressions")
+    return 0
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Benchmark CLI entry point."""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks", description=__doc__.splitlines()[1]
+    )
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", help="Run benchmarks and write a results JSON")
+    run.add_argument("--preset", choices=sorted(PRESETS), default="quick", help="Scale preset")
+    run.add_argument("--case", action="append", help="Case name or prefix (repeatable)")
+    run.add_argument("--max-tickers", type=int, help="Skip scales with more tickers")
+    run.add_argument("--repeat", type=int, default=5, help="Timed rounds per case")
+    run.add_argument("--warmup", type=int, default=1, help="Untimed rounds per case")
+    run.add_argument("--seed", type=int, default=42, help="Synthetic data seed")
+    run.add_argument("--output", type=Path, default=DEFAULT_OUTPUT, help="Results JSON path")
+    run.set_defaults(handler=_run)
+
+    compare = sub.add_parser("compare", help="Flag regressions against a baseline")
+    compare.add_argument("baseline", type=Path, help="Baseline results JSON")
+    compare.add_argument("current", type=Path, help="Current results JSON")
+    compare.add_argument("--threshold", type=float, default=0.10, help="Relative slowdown limit")
+    compare.add_argument("--min-delta-ms", type=float, default=1.0, help="Absolute noise floor")
+    compare.add_argument("--stat", choices=("median_s", "min_s", "mean_s"), default="median_s")
+    compare.set_defaults(handler=_compare)
+
+    args = parser.parse_args(argv)
+    return int(args.handler(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
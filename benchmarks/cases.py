@@ -0,0 +1,278 @@
+"""
+Benchmark case registry.
+
+A case is a setup function that receives the Workspace of one scale and
+returns the zero-argument callable to time; everything done in setup
+(strategy construction, a reference backtest, ...) is excluded from the
+measurement. Cases declare the scales they are meaningful for, so the
+slow pipelines (grid search, walk-forward, permutation) only run on the
+small universes.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from benchmarks.synthetic import Scale
+from src.backtester.models import BacktestConfig
+from src.strategies.volatility_breakout import VanillaVBO
+
+__all__ = ["CASES", "BenchmarkCase", "Workspace", "raw_data_dir", "select_cases"]
+
+# Small grid: 4 combinations, enough to exercise the worker pool
+_PARAM_GRID: dict[str, list[Any]] = {"sma_period": [4, 5], "trend_sma_period": [8, 10]}
+
+
+@dataclass
+class Workspace:
+    """Synthetic universe of one scale, written to a temporary raw data directory."""
+
+    scale: Scale
+    data: dict[str, pd.DataFrame]
+    data_dir: Path  # {ticker}_{interval}.parquet files
+    tmp_dir: Path  # Scratch space for cases (e.g. cache directories)
+
+    @property
+    def tickers(self) -> list[str]:
+        """Ticker names of the universe."""
+        return list(self.data)
+
+    @property
+    def data_files(self) -> dict[str, Path]:
+        """{ticker: parquet path} as the engines expect."""
+        return {t: self.data_dir / f"{t}_{self.scale.interval}.parquet" for t in self.data}
+
+
+Setup = Callable[[Workspace], Callable[[], object]]
+
+
+@dataclass(frozen=True)
+class BenchmarkCase:
+    """One benchmarked operation."""
+
+    name: str
+    setup: Setup
+    max_tickers: int | None = None  # Skip larger universes
+    intervals: tuple[str, ...] | None = None  # Only these intervals (None: all)
+    max_repeat: int | None = None  # Cap on timed rounds for slow cases
+
+    def applies_to(self, scale: Scale) -> bool:
+        """Whether the case runs at the given scale."""
+        if self.max_tickers is not None and scale.tickers > self.max_tickers:
+            return False
+        return self.intervals is None or scale.interval in self.intervals
+
+
+@contextmanager
+def raw_data_dir(path: Path) -> Iterator[None]:
+    """
+    Point run_backtest and UpbitDataSource at another raw data directory.
+
+    grid_search and walk-forward analysis resolve data files from
+    RAW_DATA_DIR; the override reaches pool workers through fork.
+    """
+    import src.backtester.engine.backtest_runner as backtest_runner
+    import src.data.upbit_source as upbit_source
+
+    modules = (backtest_runner, upbit_source)
+    saved = [module.RAW_DATA_DIR for module in modules]
+    for module in modules:
+        setattr(module, "RAW_DATA_DIR", path)  # noqa: B010 (Final constant)
+    try:
+        yield
+    finally:
+        for module, value in zip(modules, saved, strict=True):
+            setattr(module, "RAW_DATA_DIR", value)  # noqa: B010
+
+
+def _config() -> BacktestConfig:
+    # No processed-data cache: measure the computation, keep data/processed untouched
+    return BacktestConfig(initial_capital=10_000_000.0, max_slots=4, use_cache=False)
+
+
+def _strategy_from_params(params: dict[str, Any]) -> VanillaVBO:
+    return VanillaVBO(**params)
+
+
+def _vectorized(ws: Workspace) -> Callable[[], object]:
+    from src.backtester.engine import VectorizedBacktestEngine
+
+    engine = VectorizedBacktestEngine(_config())
+    files = ws.data_files
+    return lambda: engine.run(VanillaVBO(), files)
+
+
+def _vectorized_on_data(ws: Workspace) -> Callable[[], object]:
+    from src.backtester.engine import VectorizedBacktestEngine
+
+    engine = VectorizedBacktestEngine(_config())
+    return lambda: engine.run_on_data(VanillaVBO(), ws.data)
+
+
+def _event_driven(ws: Workspace) -> Callable[[], object]:
+    from src.backtester.engine import EventDrivenBacktestEngine
+
+    engine = EventDrivenBacktestEngine(_config())
+    files = ws.data_files
+    return lambda: engine.run(VanillaVBO(), files)
+
+
+def _indicators_frame(ws: Workspace) -> Callable[[], object]:
+    from src.utils.indicators import atr, sma
+
+    wide = {
+        col: pd.DataFrame({t: df[col] for t, df in ws.data.items()})
+        for col in ("high", "low", "close")
+    }
+
+    def run() -> object:
+        sma(wide["close"], 20)
+        return atr(wide["high"], wide["low"], wide["close"], 14)
+
+    return run
+
+
+def _indicators_series(ws: Workspace) -> Callable[[], object]:
+    from src.utils.indicators import add_vbo_indicators, bollinger_bands, ema, rsi
+
+    frames = list(ws.data.values())
+
+    def run() -> object:
+        for df in frames:
+            ema(df["close"], 20)
+            rsi(df["close"], 14)
+            bollinger_bands(df["close"], 20, 2.0)
+            add_vbo_indicators(df.copy())
+        return None
+
+    return run
+
+
+def _cache_set(ws: Workspace) -> Callable[[], object]:
+    from src.data.cache.cache import IndicatorCache
+
+    cache = IndicatorCache(cache_dir=ws.tmp_dir / "cache_set", max_entries=1_000_000)
+    params = {"sma_period": 4}
+
+    def run() -> object:
+        for ticker, df in ws.data.items():
+            cache.set(ticker, ws.scale.interval, params, df)
+        return cache
+
+    return run
+
+
+def _cache_get(ws: Workspace) -> Callable[[], object]:
+    from src.data.cache.cache import IndicatorCache
+
+    cache = IndicatorCache(cache_dir=ws.tmp_dir / "cache_get", max_entries=1_000_000)
+    params = {"sma_period": 4}
+    for ticker, df in ws.data.items():
+        cache.set(ticker, ws.scale.interval, params, df)
+
+    def run() -> object:
+        hits = [cache.get(t, ws.scale.interval, params) for t in ws.data]
+        if any(hit is None for hit in hits):
+            raise RuntimeError("indicator cache miss in cache.get benchmark")
+        return hits
+
+    return run
+
+
+def _grid_search(ws: Workspace) -> Callable[[], object]:
+    from src.backtester.optimization_search import grid_search
+
+    def run() -> object:
+        with raw_data_dir(ws.data_dir):
+            return grid_search(
+                _strategy_from_params,
+                _PARAM_GRID,
+                ws.tickers,
+                ws.scale.interval,
+                _config(),
+                metric="sharpe_ratio",
+                maximize=True,
+                n_workers=2,
+            )
+
+    return run
+
+
+def _monte_carlo(ws: Workspace) -> Callable[[], object]:
+    from src.backtester.analysis.monte_carlo import run_monte_carlo
+    from src.backtester.engine import VectorizedBacktestEngine
+
+    result = VectorizedBacktestEngine(_config()).run_on_data(VanillaVBO(), ws.data)
+    if len(result.equity_curve) < 2:
+        raise RuntimeError("reference backtest produced no equity curve")
+    return lambda: run_monte_carlo(result, n_simulations=1000, random_seed=42)
+
+
+def _permutation(ws: Workspace) -> Callable[[], object]:
+    from src.backtester.analysis.permutation_test import PermutationTester
+
+    data = next(iter(ws.data.values()))
+    tester = PermutationTester(data, VanillaVBO, _config())
+    return lambda: tester.run(num_shuffles=20, verbose=False)
+
+
+def _walk_forward(ws: Workspace) -> Callable[[], object]:
+    from src.backtester.wfa.walk_forward import run_walk_forward_analysis
+
+    def run() -> object:
+        with raw_data_dir(ws.data_dir):
+            return run_walk_forward_analysis(
+                _strategy_from_params,
+                _PARAM_GRID,
+                ws.tickers,
+                ws.scale.interval,
+                _config(),
+                optimization_days=365,
+                test_days=90,
+                step_days=180,
+                n_workers=2,
+            )
+
+    return run
+
+
+CASES: tuple[BenchmarkCase, ...] = (
+    BenchmarkCase("engine.vectorized", _vectorized),
+    BenchmarkCase("engine.vectorized_on_data", _vectorized_on_data),
+    BenchmarkCase("engine.event_driven", _event_driven, max_tickers=100, max_repeat=3),
+    BenchmarkCase("indicators.frame", _indicators_frame),
+    BenchmarkCase("indicators.series", _indicators_series, max_tickers=100),
+    BenchmarkCase("cache.set", _cache_set),
+    BenchmarkCase("cache.get", _cache_get),
+    BenchmarkCase("optimization.grid_search", _grid_search, max_tickers=10, max_repeat=3),
+    BenchmarkCase("analysis.monte_carlo", _monte_carlo, max_tickers=100),
+    BenchmarkCase("analysis.permutation", _permutation, max_tickers=1, max_repeat=3),
+    BenchmarkCase(
+        "analysis.walk_forward",
+        _walk_forward,
+        max_tickers=10,
+        intervals=("day",),
+        max_repeat=1,
+    ),
+)
+
+
+def select_cases(patterns: list[str] | None = None) -> list[BenchmarkCase]:
+    """
+    Select cases by name prefix.
+
+    Args:
+        patterns: Name prefixes (e.g. ["engine", "cache.get"]); None selects all
+
+    Returns:
+        Matching cases in registry order
+    """
+    if not patterns:
+        return list(CASES)
+    return [c for c in CASES if any(c.name == p or c.name.startswith(f"{p}.") for p in patterns)]
@@ -0,0 +1,116 @@
+"""
+Regression check against a saved baseline.
+
+Benchmarks are matched by id; a benchmark regresses when the chosen
+statistic is slower than the baseline by more than a relative threshold
+and an absolute noise floor (sub-millisecond jitter never fails a run).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+__all__ = ["Comparison", "compare_results", "format_report", "machine_differences"]
+
+# Machine fields that make timings incomparable when they differ
+_MACHINE_KEYS = ("machine", "processor", "cpu_count", "python", "implementation")
+
+
+@dataclass(frozen=True)
+class Comparison:
+    """Baseline vs current timing of one benchmark."""
+
+    id: str
+    status: str  # "regression", "improvement", "unchanged", "new", "missing", "error"
+    baseline_s: float | None = None
+    current_s: float | None = None
+
+    @property
+    def ratio(self) -> float | None:
+        """current / baseline (> 1 is slower)."""
+        if self.baseline_s is None or self.current_s is None or self.baseline_s <= 0:
+            return None
+        return self.current_s / self.baseline_s
+
+
+def compare_results(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    threshold: float = 0.10,
+    min_delta_s: float = 0.001,
+    stat: str = "median_s",
+) -> list[Comparison]:
+    """
+    Compare two results documents.
+
+    Args:
+        baseline: Saved baseline document
+        current: Document of the run under test
+        threshold: Relative slowdown (0.10 = 10%) treated as a regression
+        min_delta_s: Absolute slowdown below which differences are noise
+        stat: Statistic to compare ("median_s", "min_s" or "mean_s")
+
+    Returns:
+        Comparisons in current-run order, then benchmarks missing from it
+    """
+    base = {r["id"]: r for r in baseline["results"]}
+    comparisons: list[Comparison] = []
+    seen: set[str] = set()
+
+    for entry in current["results"]:
+        bench_id = entry["id"]
+        seen.add(bench_id)
+        old = base.get(bench_id)
+        if "error" in entry:
+            comparisons.append(Comparison(bench_id, "error", old.get(stat) if old else None))
+            continue
+        new_s = float(entry[stat])
+        if old is None or "error" in old:
+            comparisons.append(Comparison(bench_id, "new", current_s=new_s))
+            continue
+
+        old_s = float(old[stat])
+        delta = new_s - old_s
+        if delta > old_s * threshold and delta > min_delta_s:
+            status = "regression"
+        elif -delta > old_s * threshold and -delta > min_delta_s:
+            status = "improvement"
+        else:
+            status = "unchanged"
+        comparisons.append(Comparison(bench_id, status, old_s, new_s))
+
+    for bench_id, old in base.items():
+        if bench_id not in seen:
+            comparisons.append(Comparison(bench_id, "missing", old.get(stat)))
+    return comparisons
+
+
+def machine_differences(
+    baseline: dict[str, Any], current: dict[str, Any]
+) -> dict[str, tuple[Any, Any]]:
+    """
+    Machine fields that differ between two documents.
+
+    Returns:
+        {field: (baseline value, current value)}
+    """
+    old = baseline.get("machine", {})
+    new = current.get("machine", {})
+    return {k: (old.get(k), new.get(k)) for k in _MACHINE_KEYS if old.get(k) != new.get(k)}
+
+
+def _ms(seconds: float | None) -> str:
+    return "-" if seconds is None else f"{seconds * 1000:.2f}"
+
+
+def format_report(comparisons: list[Comparison]) -> str:
+    """Render comparisons as a fixed-width table."""
+    width = max([len(c.id) for c in comparisons] + [9])
+    lines = [f"{'benchmark':<{width}}  {'base ms':>10}  {'now ms':>10}  {'ratio':>7}  status"]
+    for c in comparisons:
+        ratio = "-" if c.ratio is None else f"{c.ratio:.2f}x"
+        lines.append(
+            f"{c.id:<{width}}  {_ms(c.baseline_s):>10}  {_ms(c.current_s):>10}  {ratio:>7}  {c.status}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,223 @@
+"""
+Benchmark runner.
+
+Builds one synthetic Workspace per scale, times every applicable case
+(timeit-style: warmup rounds, then repeated rounds with the garbage
+collector paused) and stores the results as JSON together with the
+machine they were measured on.
+"""
+
+from __future__ import annotations
+
+import gc
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import time
+from collections.abc import Callable, Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from benchmarks.cases import BenchmarkCase, Workspace
+from benchmarks.synthetic import Scale, generate_universe, write_universe
+from src.utils.logger import get_logger
+
+__all__ = [
+    "SCHEMA_VERSION",
+    "load_results",
+    "machine_info",
+    "run_suite",
+    "save_results",
+    "time_callable",
+]
+
+logger = get_logger(__name__)
+
+SCHEMA_VERSION = 1
+
+
+def time_callable(func: Callable[[], object], repeat: int = 5, warmup: int = 1) -> list[float]:
+    """
+    Time a callable.
+
+    Args:
+        func: Zero-argument callable
+        repeat: Timed rounds
+        warmup: Untimed rounds first (imports, JIT-like caches, page cache)
+
+    Returns:
+        Wall-clock seconds of each timed round
+    """
+    for _ in range(warmup):
+        func()
+
+    times: list[float] = []
+    gc_was_enabled = gc.isenabled()
+    try:
+        for _ in range(repeat):
+            gc.collect()
+            gc.disable()
+            start = time.perf_counter()
+            func()
+            times.append(time.perf_counter() - start)
+            if gc_was_enabled:
+                gc.enable()
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+    return times
+
+
+def _git_commit() -> str | None:
+    """Current git commit of the working tree, if available."""
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            timeout=10,
+            check=True,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def machine_info() -> dict[str, Any]:
+    """Describe the machine and software stack the benchmarks ran on."""
+    import numpy as np
+    import pandas as pd
+
+    return {
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor() or platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "git_commit": _git_commit(),
+    }
+
+
+def _summary(times: list[float]) -> dict[str, float]:
+    return {
+        "min_s": min(times),
+        "median_s": statistics.median(times),
+        "mean_s": statistics.fmean(times),
+        "stdev_s": statistics.stdev(times) if len(times) > 1 else 0.0,
+    }
+
+
+def run_suite(
+    cases: Sequence[BenchmarkCase],
+    scales: Sequence[Scale],
+    repeat: int = 5,
+    warmup: int = 1,
+    seed: int = 42,
+    progress: Callable[[str], None] | None = None,
+) -> dict[str, Any]:
+    """
+    Run cases at every scale they apply to.
+
+    A failing case is recorded with its error instead of aborting the suite.
+
+    Args:
+        cases: Cases to run
+        scales: Universe sizes
+        repeat: Timed rounds per case (capped by BenchmarkCase.max_repeat)
+        warmup: Untimed rounds per case
+        seed: Synthetic data seed
+        progress: Optional callback receiving one line per finished case
+
+    Returns:
+        Results document (see save_results)
+    """
+    results: list[dict[str, Any]] = []
+    for scale in scales:
+        applicable = [c for c in cases if c.applies_to(scale)]
+        if not applicable:
+            continue
+
+        with tempfile.TemporaryDirectory(prefix="cqs-bench-") as tmp:
+            data = generate_universe(scale, seed=seed)
+            data_dir = Path(tmp) / "raw"
+            write_universe(data, scale.interval, data_dir)
+            workspace = Workspace(scale=scale, data=data, data_dir=data_dir, tmp_dir=Path(tmp))
+
+            for case in applicable:
+                rounds = min(repeat, case.max_repeat) if case.max_repeat else repeat
+                entry: dict[str, Any] = {
+                    "id": f"{case.name}[{scale.name}]",
+                    "case": case.name,
+                    "scale": scale.name,
+                    "tickers": scale.tickers,
+                    "interval": scale.interval,
+                    "bars": scale.bars,
+                    "repeat": rounds,
+                }
+                try:
+                    times = time_callable(case.setup(workspace), repeat=rounds, warmup=warmup)
+                except Exception as e:
+                    logger.error(f"Benchmark {entry['id']} failed: {e}", exc_info=True)
+                    entry["error"] = f"{type(e).__name__}: {e}"
+                else:
+                    entry["times_s"] = times
+                    entry.update(_summary(times))
+                results.append(entry)
+
+                if progress:
+                    status = entry.get("error") or f"median {entry['median_s'] * 1000:.1f} ms"
+                    progress(f"{entry['id']}: {status}")
+
+    return {
+        "schema": SCHEMA_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "machine": machine_info(),
+        "settings": {"repeat": repeat, "warmup": warmup, "seed": seed},
+        "results": results,
+    }
+
+
+def save_results(document: dict[str, Any], path: Path) -> Path:
+    """
+    Write a results document as JSON (atomically).
+
+    Args:
+        document: Document from run_suite
+        path: Target file
+
+    Returns:
+        Written path
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(document, indent=2), encoding="utf-8")
+    os.replace(tmp_path, path)
+    return path
+
+
+def load_results(path: Path) -> dict[str, Any]:
+    """
+    Read a results document.
+
+    Args:
+        path: JSON file written by save_results
+
+    Returns:
+        Results document
+
+    Raises:
+        ValueError: If the file is not a benchmark results document
+    """
+    document = json.loads(path.read_text(encoding="utf-8"))
+    if not isinstance(document, dict) or "results" not in document:
+        raise ValueError(f"Not a benchmark results file: {path}")
+    if document.get("schema") != SCHEMA_VERSION:
+        raise ValueError(f"Unsupported benchmark schema {document.get('schema')!r} in {path}")
+    return document
@@ -0,0 +1,165 @@
+"""
+Synthetic OHLCV universes for benchmarks.
+
+Same geometric Brownian motion model as scripts/generate_sample_data.py,
+vectorized with NumPy so that hundreds of tickers of minute bars can be
+generated in well under a second. Output is deterministic for a seed.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "BARS_PER_DAY",
+    "PRESETS",
+    "Scale",
+    "generate_ohlcv",
+    "generate_universe",
+    "write_universe",
+]
+
+# GBM parameters (scripts/generate_sample_data.py)
+START_PRICE = 50_000_000.0  # 50M KRW
+MU = 0.0  # Daily drift
+SIGMA = 0.04  # Daily volatility
+VOLUME_BASE = 50.0
+START_DATE = "2020-01-01"
+
+BARS_PER_DAY: dict[str, int] = {
+    "day": 1,
+    "minute240": 6,
+    "minute60": 24,
+    "minute30": 48,
+    "minute15": 96,
+    "minute5": 288,
+    "minute1": 1440,
+}
+
+_FREQ: dict[str, str] = {
+    "day": "D",
+    "minute240": "240min",
+    "minute60": "60min",
+    "minute30": "30min",
+    "minute15": "15min",
+    "minute5": "5min",
+    "minute1": "1min",
+}
+
+
+@dataclass(frozen=True)
+class Scale:
+    """Size of one synthetic universe."""
+
+    tickers: int
+    interval: str
+    bars: int
+
+    @property
+    def name(self) -> str:
+        """Short label used in benchmark ids (e.g. "10x_day_1000")."""
+        return f"{self.tickers}x_{self.interval}_{self.bars}"
+
+
+# Scale presets, smallest first (each extends the previous one)
+_QUICK = (Scale(1, "day", 1000), Scale(10, "day", 1000))
+_DEFAULT = (*_QUICK, Scale(100, "day", 1000), Scale(10, "minute60", 5000))
+_FULL = (
+    *_DEFAULT,
+    Scale(500, "day", 1000),
+    Scale(100, "minute60", 5000),
+    Scale(10, "minute1", 20000),
+)
+PRESETS: dict[str, tuple[Scale, ...]] = {"quick": _QUICK, "default": _DEFAULT, "full": _FULL}
+
+
+def generate_ohlcv(
+    bars: int,
+    interval: str = "day",
+    seed: int = 42,
+    start_price: float = START_PRICE,
+) -> pd.DataFrame:
+    """
+    Generate one ticker of GBM OHLCV bars.
+
+    Args:
+        bars: Number of bars
+        interval: Bar interval (key of BARS_PER_DAY)
+        seed: Random seed
+        start_price: Price of the first bar
+
+    Returns:
+        OHLCV DataFrame indexed by "datetime"
+    """
+    if interval not in BARS_PER_DAY:
+        raise ValueError(f"Unsupported interval: {interval}")
+
+    rng = np.random.default_rng(seed)
+    dt = 1.0 / BARS_PER_DAY[interval]
+    z = rng.standard_normal(bars)
+    log_steps = (MU - 0.5 * SIGMA**2) * dt + SIGMA * np.sqrt(dt) * z
+    log_steps[0] = 0.0
+    close = np.maximum(1.0, start_price * np.exp(np.cumsum(log_steps)))
+
+    # Simple synthetic OHLCV around the close price
+    wick = 0.01 * np.sqrt(dt)
+    high = close * (1.0 + np.abs(rng.normal(0.0, wick, bars)))
+    low = close * (1.0 - np.abs(rng.normal(0.0, wick, bars)))
+    df = pd.DataFrame(
+        {
+            "open": (high + low) / 2.0,
+            "high": high,
+            "low": low,
+            "close": close,
+            "volume": (VOLUME_BASE + np.abs(rng.normal(0.0, 10.0, bars))) * dt,
+        },
+        index=pd.date_range(START_DATE, periods=bars, freq=_FREQ[interval]),
+    )
+    df.index.name = "datetime"
+    return df
+
+
+def generate_universe(scale: Scale, seed: int = 42) -> dict[str, pd.DataFrame]:
+    """
+    Generate OHLCV for every ticker of a scale.
+
+    Args:
+        scale: Universe size
+        seed: Base random seed (ticker i uses seed + i)
+
+    Returns:
+        {ticker: OHLCV DataFrame}, tickers named KRW-SYN0000, KRW-SYN0001, ...
+    """
+    rng = np.random.default_rng(seed)
+    start_prices = START_PRICE * np.exp(rng.normal(0.0, 1.0, scale.tickers))
+    return {
+        f"KRW-SYN{i:04d}": generate_ohlcv(scale.bars, scale.interval, seed + i, start_prices[i])
+        for i in range(scale.tickers)
+    }
+
+
+def write_universe(
+    data: dict[str, pd.DataFrame], interval: str, directory: Path
+) -> dict[str, Path]:
+    """
+    Write a universe in the raw data layout ({ticker}_{interval}.parquet).
+
+    Args:
+        data: {ticker: OHLCV DataFrame}
+        interval: Bar interval
+        directory: Target directory (created if missing)
+
+    Returns:
+        {ticker: parquet path}
+    """
+    directory.mkdir(parents=True, exist_ok=True)
+    files: dict[str, Path] = {}
+    for ticker, df in data.items():
+        path = directory / f"{ticker}_{interval}.parquet"
+        df.to_parquet(path)
+        files[ticker] = path
+    return files
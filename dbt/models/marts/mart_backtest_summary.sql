@@ -16,10 +16,12 @@ with backtest_results as (
     select * from {{ ref('stg_backtest_results') }}
 ),
 
--- Latest results per symbol/strategy
+-- Latest results per symbol/strategy (default parameters, single-asset runs)
 latest_results as (
     select *
     from backtest_results
+    where param_set = 'default'
+      and symbol <> 'PORTFOLIO'
     qualify row_number() over (
         partition by symbol, strategy
         order by run_date desc
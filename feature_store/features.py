@@ -52,7 +52,7 @@ symbol_entity = Entity(
 # Price features source (from processed Parquet files)
 price_source = FileSource(
     name="price_features_source",
-    path="../data/processed/features/*.parquet",
+    path="../data/processed/features/",  # month-partitioned, see src/data/feature_pipeline.py
     timestamp_field="timestamp",
     description="Price-based technical indicators calculated from OHLCV data",
 )
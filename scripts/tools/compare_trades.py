@@ -12,6 +12,7 @@ sys.path.insert(0, str(project_root))
 import pandas as pd
 
 from src.backtester import BacktestConfig, run_backtest
+from src.data.query_service import get_query_service
 from src.strategies.volatility_breakout.vbo import create_vbo_strategy
 
 
@@ -166,9 +167,13 @@ def compare_trades():
         engine_trades_df.to_csv(output_path, index=False)
         print(f"\n[+] Engine trades saved to: {output_path}")
 
-        # Analyze by ticker
+        # Analyze by ticker (aggregated in DuckDB when installed)
+        service = get_query_service()
         print("\n[Engine] Trades by Ticker:")
-        print(engine_trades_df.groupby("ticker").size())
+        if service is not None:
+            print(service.trade_summary(output_path, by="ticker").to_string(index=False))
+        else:
+            print(engine_trades_df.groupby("ticker").size())
 
         # Analyze by date range
         if len(engine_trades_df) > 0:
@@ -180,10 +185,14 @@ def compare_trades():
             print(f"  End: {engine_trades_df['entry_date'].max()}")
 
             print("\n[Engine] Monthly Trade Count:")
-            monthly = engine_trades_df.groupby(
-                engine_trades_df["entry_date"].dt.to_period("M")
-            ).size()
-            print(monthly.head(20))
+            if service is not None:
+                monthly = service.trade_summary(output_path, by="month")
+                print(monthly.head(20).to_string(index=False))
+            else:
+                monthly = engine_trades_df.groupby(
+                    engine_trades_df["entry_date"].dt.to_period("M")
+                ).size()
+                print(monthly.head(20))
     else:
         print("[Engine] No trades found!")
 
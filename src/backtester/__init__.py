@@ -10,6 +10,7 @@ __all__ = [
     "BacktestReport",
     "PerformanceMetrics",
     "Trade",
+    "TradeLedger",
     "VectorizedBacktestEngine",
     "SimpleBacktestEngine",
     "EventDrivenBacktestEngine",
@@ -49,6 +50,10 @@ def __getattr__(name: str) -> Any:
         from src.backtester.models import Trade
 
         return Trade
+    elif name == "TradeLedger":
+        from src.backtester.trade_ledger import TradeLedger
+
+        return TradeLedger
 
     # Monte Carlo
     elif name == "MonteCarloResult":
@@ -3,6 +3,10 @@ Bootstrap Analysis: Phase 3 Statistical Reliability
 
 Resamples the dataset using block bootstrap to estimate confidence intervals
 for strategy performance metrics (return, Sharpe) and risk (MDD).
+
+Samples are backtested one by one; the metrics of all sample equity curves
+are computed in one batch by the metrics kernel, in the engine's units
+(percent return and MDD, Sharpe annualized with ANNUALIZATION_FACTOR).
 """
 
 import tempfile
@@ -16,7 +20,9 @@ import pandas as pd
 
 from src.backtester.analysis.bootstrap_backtest import simple_backtest_vectorized
 from src.backtester.engine import run_backtest
+from src.backtester.metrics_kernel import compute_metrics, stack_curves
 from src.backtester.models import BacktestConfig, BacktestResult
+from src.config import ANNUALIZATION_FACTOR
 from src.strategies.base import Strategy
 from src.utils.logger import get_logger
 
@@ -133,9 +139,7 @@ class BootstrapAnalyzer:
         return resampled_df
 
     def analyze(self, n_samples: int = 300, block_size: int = 30) -> BootstrapResult:
-        rets: list[float] = []
-        sharps: list[float] = []
-        mdds: list[float] = []
+        curves: list[np.ndarray] = []
 
         for i in range(n_samples):
             try:
@@ -145,26 +149,38 @@ class BootstrapAnalyzer:
                 except TypeError:
                     strategy = self.strategy_factory()  # type: ignore[call-arg]
                 r = self._simple_backtest(d, strategy)
-
-                # Filter extreme outliers (likely due to resampling edge cases)
-                # Keep returns within reasonable range for crypto: -100% to +100000% (1000x)
-                total_ret = r.total_return
-                sharpe = getattr(r, "sharpe_ratio", 0.0)
-                mdd = getattr(r, "mdd", 0.0)
-
-                if -1.0 <= total_ret <= 1000.0 and -10.0 <= sharpe <= 10.0:
-                    rets.append(total_ret)
-                    sharps.append(sharpe)
-                    mdds.append(mdd)
-                else:
-                    logger.debug(
-                        f"Filtered outlier sample {i}: return={total_ret:.2%}, sharpe={sharpe:.2f}"
-                    )
+                curves.append(np.asarray(r.equity_curve, dtype=np.float64))
 
             except Exception as e:
                 logger.debug(f"Bootstrap sample {i} failed: {e}")
                 continue
 
+        if not curves:
+            logger.warning("No valid bootstrap samples generated")
+            return BootstrapResult(returns=[], sharpes=[], mdds=[])
+
+        metrics = compute_metrics(
+            stack_curves(curves),
+            np.empty(0),
+            self.initial_capital,
+            annualization=ANNUALIZATION_FACTOR,
+        )
+
+        # Filter extreme outliers (likely due to resampling edge cases)
+        # Keep returns within reasonable range for crypto: -100% to +100000% (1000x)
+        total_ret = metrics.total_return
+        sharpe = metrics.sharpe_ratio
+        keep = (total_ret >= -100.0) & (total_ret <= 100000.0) & (np.abs(sharpe) <= 10.0)
+        for idx in np.flatnonzero(~keep):
+            logger.debug(
+                f"Filtered outlier sample {idx}: "
+                f"return={total_ret[idx]:.2f}%, sharpe={sharpe[idx]:.2f}"
+            )
+
+        rets: list[float] = total_ret[keep].tolist()
+        sharps: list[float] = sharpe[keep].tolist()
+        mdds: list[float] = metrics.mdd[keep].tolist()
+
         if not rets:
             logger.warning("No valid bootstrap samples generated")
             return BootstrapResult(returns=[], sharpes=[], mdds=[])
@@ -74,6 +74,7 @@ def simple_backtest_vectorized(
             equity.append(equity[-1] * (1 + pnl))
 
         result = BacktestResult()
+        result.equity_curve = np.array(equity)
         result.total_return = (equity[-1] - initial_capital) / initial_capital if equity else 0.0
 
         if len(equity) > 1:
@@ -1,15 +1,19 @@
 """
 Permutation test loop helpers.
 
-Provides helper functions for running permutation simulations.
+Provides helper functions for running permutation simulations. Every
+shuffle is simulated first; the metrics of all shuffles are then computed
+in one batch by the metrics kernel.
 """
 
 from collections.abc import Callable
 
+import numpy as np
 import pandas as pd
 
 from src.backtester.analysis.permutation_stats import shuffle_data
-from src.backtester.wfa.wfa_backtest import simple_backtest
+from src.backtester.metrics_kernel import compute_metrics, stack_curves
+from src.backtester.wfa.wfa_backtest import simulate_backtest
 from src.strategies.base import Strategy
 from src.utils.logger import get_logger
 
@@ -40,21 +44,17 @@ def run_permutation_loop(
     Returns:
         Tuple of (shuffled_returns, shuffled_sharpes, shuffled_win_rates)
     """
-    shuffled_returns: list[float] = []
-    shuffled_sharpes: list[float] = []
-    shuffled_win_rates: list[float] = []
+    curves: list[np.ndarray] = []
+    trade_returns: list[list[float]] = []
 
     for i in range(num_shuffles):
         try:
             shuffled_data = shuffle_data(data, shuffle_columns)
             strategy_shuffled = strategy_factory()
-            shuffled_result = simple_backtest(shuffled_data, strategy_shuffled, initial_capital)
+            trades, equity = simulate_backtest(shuffled_data, strategy_shuffled, initial_capital)
 
-            shuffled_returns.append(shuffled_result.total_return)
-            shuffled_sharpes.append(getattr(shuffled_result, "sharpe_ratio", 0.0))
-
-            if hasattr(shuffled_result, "win_rate"):
-                shuffled_win_rates.append(shuffled_result.win_rate)
+            curves.append(np.asarray(equity, dtype=np.float64))
+            trade_returns.append(trades)
 
             if verbose and (i + 1) % max(1, num_shuffles // 10) == 0:
                 logger.info(f"  Completed {i + 1}/{num_shuffles} permutations")
@@ -63,4 +63,22 @@ def run_permutation_loop(
             logger.debug(f"Permutation {i} failed: {e}")
             continue
 
-    return shuffled_returns, shuffled_sharpes, shuffled_win_rates
+    if not curves:
+        return [], [], []
+
+    # Equity points are per trade, not per bar, so no dates (CAGR unused);
+    # units match simple_backtest: fractions and 252-period Sharpe
+    pnl = np.concatenate([np.asarray(t, dtype=np.float64) for t in trade_returns])
+    metrics = compute_metrics(
+        stack_curves(curves),
+        np.empty(0),
+        initial_capital,
+        pnl=pnl,
+        pnl_pct=pnl * 100,
+        trade_run=np.repeat(np.arange(len(curves)), [len(t) for t in trade_returns]),
+    )
+    return (
+        (metrics.total_return / 100).tolist(),
+        metrics.sharpe_ratio.tolist(),
+        (metrics.win_rate / 100).tolist(),
+    )
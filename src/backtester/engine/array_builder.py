@@ -4,17 +4,39 @@ NumPy array builder for vectorized backtesting.
 Converts pandas DataFrames to efficient numpy arrays for simulation.
 """
 
+from collections.abc import Sequence
 from datetime import date
 
 import numpy as np
 import pandas as pd
 
+from src.risk.position_sizing import rolling_volatility
 from src.utils.memory import get_float_dtype
 
+# Indicator column name -> build_numpy_arrays key
+ARRAY_COLUMNS: dict[str, str] = {
+    "open": "opens",
+    "high": "highs",
+    "close": "closes",
+    "target": "targets",
+    "sma": "smas",
+    "sma_trend": "sma_trends",
+    "short_noise": "short_noises",
+    "long_noise": "long_noises",
+    "prev_range": "prev_ranges",
+}
+
+# Indicator columns only condition expressions read; built on request (columns=)
+EXPRESSION_COLUMNS = ("sma_trend", "long_noise", "prev_range")
+
+# Indicator columns copied onto the grid when a ticker has them (NaN otherwise)
+_OPTIONAL_COLUMNS = ("sma", "short_noise")
+
 
 def build_numpy_arrays(
     ticker_data: dict[str, pd.DataFrame],
     sorted_dates: np.ndarray,
+    columns: Sequence[str] = (),
 ) -> tuple[list[str], int, int, dict[str, np.ndarray]]:
     """
     Build numpy arrays from ticker DataFrames.
@@ -22,6 +44,8 @@ def build_numpy_arrays(
     Args:
         ticker_data: Dictionary of ticker -> DataFrame
         sorted_dates: Sorted array of dates
+        columns: Extra EXPRESSION_COLUMNS to put on the grid for
+            column_arrays (the simulation itself does not read them)
 
     Returns:
         Tuple of (tickers, n_tickers, n_dates, arrays_dict)
@@ -45,20 +69,83 @@ def build_numpy_arrays(
         "short_noises": np.full((n_tickers, n_dates), np.nan, dtype=float_dtype),
     }
 
+    unknown = [column for column in columns if column not in EXPRESSION_COLUMNS]
+    if unknown:
+        raise ValueError(f"No grid arrays for columns: {unknown}")
+    optional = (*_OPTIONAL_COLUMNS, *columns)
+    for column in columns:
+        arrays[ARRAY_COLUMNS[column]] = np.full((n_tickers, n_dates), np.nan, dtype=float_dtype)
+
     date_to_idx = {d: i for i, d in enumerate(sorted_dates)}
 
     for t_idx, ticker in enumerate(tickers):
-        _fill_ticker_arrays(ticker_data[ticker], t_idx, date_to_idx, arrays, float_dtype)
+        _fill_ticker_arrays(ticker_data[ticker], t_idx, date_to_idx, arrays, float_dtype, optional)
 
     return tickers, n_tickers, n_dates, arrays
 
 
+def column_arrays(arrays: dict[str, np.ndarray]) -> dict[str, np.ndarray]:
+    """
+    View build_numpy_arrays output under indicator column names.
+
+    Lets condition expressions written against DataFrame columns
+    (high, target, sma, ...) evaluate over the (n_tickers, n_dates) grid.
+
+    Args:
+        arrays: Arrays dict from build_numpy_arrays
+
+    Returns:
+        Dictionary of column name -> array (no copies)
+    """
+    return {column: arrays[key] for column, key in ARRAY_COLUMNS.items() if key in arrays}
+
+
+def build_volatility_array(
+    ticker_historical_data: dict[str, pd.DataFrame],
+    tickers: list[str],
+    sorted_dates: np.ndarray,
+    lookback_period: int,
+) -> np.ndarray:
+    """
+    Build date-aligned rolling volatility array for position sizing.
+
+    Volatility is computed once per ticker over its own history and then
+    scattered onto the simulation date grid, so sizing on date index d reads
+    the value for sorted_dates[d] rather than the d-th row of the history.
+
+    Args:
+        ticker_historical_data: Dictionary of ticker -> raw OHLCV DataFrame
+        tickers: Ticker order of the simulation arrays
+        sorted_dates: Sorted array of dates
+        lookback_period: Lookback period for volatility calculation
+
+    Returns:
+        Array of shape (n_tickers, n_dates), NaN where history is insufficient
+    """
+    float_dtype = get_float_dtype()
+    volatilities = np.full((len(tickers), len(sorted_dates)), np.nan, dtype=float_dtype)
+    date_to_idx = {d: i for i, d in enumerate(sorted_dates)}
+
+    for t_idx, ticker in enumerate(tickers):
+        hist_df = ticker_historical_data.get(ticker)
+        if hist_df is None or hist_df.empty:
+            continue
+        vol = rolling_volatility(hist_df["close"].astype(np.float64), lookback_period)
+        df_dates = pd.Series(pd.DatetimeIndex(hist_df.index).to_pydatetime()).dt.date
+        df_idx = df_dates.map(date_to_idx)
+        mask = df_idx.notna().to_numpy()
+        volatilities[t_idx, df_idx[mask].astype(int).to_numpy()] = vol.to_numpy()[mask]
+
+    return volatilities
+
+
 def _fill_ticker_arrays(
     df: pd.DataFrame,
     t_idx: int,
     date_to_idx: dict[date, int],
     arrays: dict[str, np.ndarray],
     float_dtype: type,
+    optional: Sequence[str] = _OPTIONAL_COLUMNS,
 ) -> None:
     """Fill arrays for a single ticker."""
     df_index = pd.DatetimeIndex(df.index)
@@ -77,17 +164,17 @@ def _fill_ticker_arrays(
     else:
         arrays["targets"][t_idx, idx] = df.loc[mask, "close"].to_numpy(dtype=float_dtype)
 
-    if "sma" in df.columns:
-        arrays["smas"][t_idx, idx] = df.loc[mask, "sma"].to_numpy(dtype=float_dtype)
-
     arrays["entry_signals"][t_idx, idx] = df.loc[mask, "entry_signal"].astype(bool).to_numpy()
     arrays["exit_signals"][t_idx, idx] = df.loc[mask, "exit_signal"].astype(bool).to_numpy()
     arrays["whipsaws"][t_idx, idx] = df.loc[mask, "is_whipsaw"].to_numpy(dtype=float_dtype)
     arrays["entry_prices"][t_idx, idx] = df.loc[mask, "entry_price"].to_numpy(dtype=float_dtype)
     arrays["exit_prices"][t_idx, idx] = df.loc[mask, "exit_price"].to_numpy(dtype=float_dtype)
 
-    if "short_noise" in df.columns:
-        arrays["short_noises"][t_idx, idx] = df.loc[mask, "short_noise"].to_numpy(dtype=float_dtype)
+    for column in optional:
+        if column in df.columns:
+            arrays[ARRAY_COLUMNS[column]][t_idx, idx] = df.loc[mask, column].to_numpy(
+                dtype=float_dtype
+            )
 
 
 def filter_valid_dates(
@@ -11,8 +11,10 @@ import pandas as pd
 
 from src.data.cache.cache import get_cache
 from src.strategies.base import Strategy
+from src.strategies.expressions import expression_hash
 from src.utils.logger import get_logger
 from src.utils.memory import optimize_dtypes
+from src.utils.profiling import get_profiler
 
 logger = get_logger(__name__)
 
@@ -60,11 +62,17 @@ def get_cache_params(strategy: Strategy) -> dict[str, Any]:
         if hasattr(strategy, attr):
             params[attr] = getattr(strategy, attr)
 
-    # Include entry/exit conditions in cache key
-    if hasattr(strategy, "entry_conditions"):
-        params["entry_conditions"] = [c.name for c in strategy.entry_conditions.conditions]
-    if hasattr(strategy, "exit_conditions"):
-        params["exit_conditions"] = [c.name for c in strategy.exit_conditions.conditions]
+    # Key on the signal rules themselves (thresholds included) when the
+    # strategy builds signals from expressions, else on condition names
+    expressions = strategy.signal_expressions() if isinstance(strategy, Strategy) else None
+    if isinstance(expressions, tuple):
+        params["entry_signal"] = expression_hash(expressions[0])
+        params["exit_signal"] = expression_hash(expressions[1])
+    else:
+        if hasattr(strategy, "entry_conditions"):
+            params["entry_conditions"] = [c.name for c in strategy.entry_conditions.conditions]
+        if hasattr(strategy, "exit_conditions"):
+            params["exit_conditions"] = [c.name for c in strategy.exit_conditions.conditions]
 
     return params
 
@@ -94,30 +102,80 @@ def load_ticker_data(
     interval = filepath.stem.split("_")[1] if "_" in filepath.stem else "unknown"
     raw_mtime = filepath.stat().st_mtime if filepath.exists() else None
 
+    profiler = get_profiler()
     cache = get_cache() if use_cache else None
     cached_df = None
     historical_df: pd.DataFrame | None = None
 
     if cache is not None:
-        cached_df = cache.get(ticker, interval, cache_params, raw_mtime)
+        with profiler.span("backtest.data_load"):
+            cached_df = cache.get(ticker, interval, cache_params, raw_mtime)
 
     if cached_df is not None:
         df = cached_df
-        logger.debug(f"Loaded {ticker} from cache")
+        logger.debug("Loaded %s from cache", ticker)
     else:
-        df = load_parquet_data(filepath)
-        df = optimize_dtypes(df)
+        with profiler.span("backtest.data_load"):
+            df = load_parquet_data(filepath)
+            df = optimize_dtypes(df)
 
         if position_sizing != "equal":
             historical_df = df.copy()
 
-        df = strategy.calculate_indicators(df)
-        df = strategy.generate_signals(df)
+        df = _compute_indicators_and_signals(strategy, df)
 
         if cache is not None:
             cache.set(ticker, interval, cache_params, df, raw_mtime)
-            logger.debug(f"Saved {ticker} to cache")
+            logger.debug("Saved %s to cache", ticker)
+
+    return _finalize_ticker_data(ticker, df, historical_df, position_sizing)
+
+
+def prepare_ticker_data(
+    ticker: str,
+    raw_df: pd.DataFrame,
+    strategy: Strategy,
+    position_sizing: str = "equal",
+) -> tuple[pd.DataFrame, pd.DataFrame | None]:
+    """
+    Prepare already loaded OHLCV data for a single ticker.
+
+    In-memory counterpart of load_ticker_data for callers that load every
+    ticker once and run several strategies on it; raw_df is not modified.
+
+    Args:
+        ticker: Ticker symbol
+        raw_df: OHLCV DataFrame (as returned by load_parquet_data)
+        strategy: Trading strategy
+        position_sizing: Position sizing method
+
+    Returns:
+        Tuple of (processed_df, historical_df or None)
+    """
+    df = optimize_dtypes(raw_df)
+    historical_df = df.copy() if position_sizing != "equal" else None
+
+    df = _compute_indicators_and_signals(strategy, df)
 
+    return _finalize_ticker_data(ticker, df, historical_df, position_sizing)
+
+
+def _compute_indicators_and_signals(strategy: Strategy, df: pd.DataFrame) -> pd.DataFrame:
+    """Run the strategy's indicator and signal stages under profiling spans."""
+    profiler = get_profiler()
+    with profiler.span("backtest.indicators"):
+        df = strategy.calculate_indicators(df)
+    with profiler.span("backtest.signals"):
+        return strategy.generate_signals(df)
+
+
+def _finalize_ticker_data(
+    ticker: str,
+    df: pd.DataFrame,
+    historical_df: pd.DataFrame | None,
+    position_sizing: str,
+) -> tuple[pd.DataFrame, pd.DataFrame | None]:
+    """Tag processed data with its ticker and pick the sizing history."""
     df["ticker"] = ticker
     df = optimize_dtypes(df)
 
@@ -3,7 +3,6 @@
 from datetime import date
 
 import numpy as np
-import pandas as pd
 
 from src.backtester.engine.position_sizer import calculate_position_sizes_for_entries
 from src.backtester.engine.trade_simulator import (
@@ -12,7 +11,7 @@ from src.backtester.engine.trade_simulator import (
     handle_whipsaw,
 )
 from src.backtester.models import BacktestConfig
-from src.risk.position_sizing import calculate_position_size
+from src.risk.position_sizing import calculate_position_size_from_volatility
 
 
 def process_entries(
@@ -25,7 +24,6 @@ def process_entries(
     n_tickers: int,
     arrays: dict[str, np.ndarray],
     valid_data: np.ndarray,
-    ticker_historical_data: dict[str, pd.DataFrame],
 ) -> None:
     """Process entry signals for the current date."""
     not_in_position = state.position_amounts == 0
@@ -35,6 +33,7 @@ def process_entries(
         return
 
     candidate_idx = _sort_candidates_by_noise(can_enter, arrays["short_noises"], d_idx)
+    volatilities = arrays.get("volatilities")
 
     position_sizes = calculate_position_sizes_for_entries(
         state,
@@ -44,7 +43,7 @@ def process_entries(
         arrays["entry_prices"],
         d_idx,
         current_date,
-        ticker_historical_data,
+        volatilities,
     )
 
     for t_idx in candidate_idx:
@@ -66,8 +65,7 @@ def process_entries(
             position_sizes,
             available_slots,
             buy_price,
-            d_idx,
-            ticker_historical_data,
+            volatilities[t_idx, d_idx] if volatilities is not None else None,
             config,
         )
 
@@ -110,26 +108,21 @@ def calculate_invest_amount(
     position_sizes: dict[str, float],
     available_slots: int,
     buy_price: float,
-    d_idx: int,
-    ticker_historical_data: dict[str, pd.DataFrame],
+    volatility: float | None,
     config: BacktestConfig,
 ) -> float:
     """Calculate investment amount for a single entry."""
     if config.position_sizing != "equal" and ticker in position_sizes:
         return position_sizes[ticker]
 
-    if config.position_sizing != "equal" and ticker in ticker_historical_data:
-        hist_df = ticker_historical_data[ticker]
-        hist_up_to_date = hist_df.iloc[: d_idx + 1]
-        return calculate_position_size(
+    if config.position_sizing != "equal" and volatility is not None:
+        return calculate_position_size_from_volatility(
             method=config.position_sizing,  # type: ignore[arg-type]
             available_cash=state.cash,
             available_slots=available_slots,
-            ticker=ticker,
             current_price=buy_price,
-            historical_data=hist_up_to_date,
+            volatility=float(volatility),
             target_risk_pct=config.position_sizing_risk_pct,
-            lookback_period=config.position_sizing_lookback,
         )
 
     return state.cash / available_slots
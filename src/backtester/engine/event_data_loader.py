@@ -4,6 +4,7 @@ Event-driven backtest data loader.
 Handles loading and preparation of data for event-driven backtesting.
 """
 
+import logging
 from dataclasses import dataclass
 from datetime import date
 from pathlib import Path
@@ -73,9 +74,14 @@ def load_event_data(
             if "exit_price" not in df.columns:
                 df["exit_price"] = df["close"]
 
-            logger.info(
-                f"Loaded {ticker}: {len(df)} rows, {df['entry_signal'].sum()} entry signals"
-            )
+            # Guarded: counting signals scans the column
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Loaded %s: %d rows, %d entry signals",
+                    ticker,
+                    len(df),
+                    df["entry_signal"].sum(),
+                )
             ticker_data[ticker] = df
 
         except Exception as e:
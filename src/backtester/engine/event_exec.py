@@ -114,7 +114,9 @@ def execute_exit(
         exit_reason=exit_reason,
     )
 
-    logger.debug(f"Close {position.ticker} @ {exit_price:.0f}: PnL={pnl_pct:.2f}% ({exit_reason})")
+    logger.debug(
+        "Close %s @ %.0f: PnL=%.2f%% (%s)", position.ticker, exit_price, pnl_pct, exit_reason
+    )
 
     return trade, revenue
 
@@ -149,7 +151,7 @@ def execute_entry(
     cost = amount * entry_price * (1 + config.fee_rate)
 
     if cost > cash:
-        logger.debug(f"Insufficient cash for {ticker}: need {cost:.0f}, have {cash:.0f}")
+        logger.debug("Insufficient cash for %s: need %.0f, have %.0f", ticker, cost, cash)
         return None, 0.0
 
     position = Position(
@@ -160,7 +162,7 @@ def execute_entry(
         highest_price=entry_price,
     )
 
-    logger.debug(f"Open {ticker} @ {entry_price:.0f}: amount={amount:.4f}, cost={cost:.0f}")
+    logger.debug("Open %s @ %.0f: amount=%.4f, cost=%.0f", ticker, entry_price, amount, cost)
 
     return position, cost
 
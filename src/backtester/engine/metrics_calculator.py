@@ -7,6 +7,7 @@ Handles performance metrics, trade statistics, and risk metrics.
 import numpy as np
 import pandas as pd
 
+from src.backtester.metrics_kernel import compute_metrics
 from src.backtester.models import BacktestConfig, BacktestResult
 from src.config import ANNUALIZATION_FACTOR
 from src.risk.metrics import PortfolioRiskMetrics, calculate_portfolio_risk_metrics
@@ -44,38 +45,34 @@ def calculate_metrics_vectorized(
     if len(equity_curve) < 2:
         return result
 
-    initial = config.initial_capital
-    final = equity_curve[-1]
+    # Return, risk and trade statistics in one pass (closed trades only)
+    closed = _closed_trades(trades_df)
+    pnl = closed["pnl"].to_numpy(dtype=np.float64) if len(closed) else None
+    pnl_pct = closed["pnl_pct"].to_numpy(dtype=np.float64) if len(closed) else None
+    metrics = compute_metrics(
+        equity_curve,
+        dates,
+        config.initial_capital,
+        pnl,
+        pnl_pct,
+        annualization=ANNUALIZATION_FACTOR,
+    ).row(0)
+    result.total_return = metrics["total_return"]
+    result.cagr = metrics["cagr"]
+    result.mdd = metrics["mdd"]
+    result.calmar_ratio = metrics["calmar_ratio"]
+    result.sharpe_ratio = metrics["sharpe_ratio"]
 
-    # Total return
-    result.total_return = (final / initial - 1) * 100
-
-    # CAGR (annualized return)
-    total_days = (dates[-1] - dates[0]).days
-    if total_days > 0 and initial > 0 and final > 0:
-        result.cagr = ((final / initial) ** (365.0 / total_days) - 1) * 100
-
-    # MDD (maximum drawdown)
-    cummax = np.maximum.accumulate(equity_curve)
-    drawdown = (cummax - equity_curve) / cummax
-    result.mdd = np.nanmax(drawdown) * 100
-
-    # Calmar Ratio
-    result.calmar_ratio = result.cagr / result.mdd if result.mdd > 0 else 0.0
-
-    # Sharpe Ratio
+    # Risk metrics
     returns = np.diff(equity_curve) / equity_curve[:-1]
     daily_returns = np.insert(returns, 0, 0)
-    if len(returns) > 0 and np.std(returns) > 0:
-        result.sharpe_ratio = (np.mean(returns) / np.std(returns)) * np.sqrt(ANNUALIZATION_FACTOR)
-
-    # Risk metrics
     result.risk_metrics = _calculate_risk_metrics(
         equity_curve, daily_returns, trades_df, asset_returns
     )
 
     # Trade statistics
-    _calculate_trade_statistics(result, trades_df)
+    if len(closed) > 0:
+        _apply_trade_statistics(result, metrics)
 
     return result
 
@@ -138,22 +135,20 @@ def _calculate_risk_metrics(
         return None
 
 
-def _calculate_trade_statistics(result: BacktestResult, trades_df: pd.DataFrame) -> None:
-    """Calculate trade statistics."""
+def _closed_trades(trades_df: pd.DataFrame) -> pd.DataFrame:
+    """Trades with an exit date (open positions have no realized P&L)."""
     if len(trades_df) == 0:
-        return
-
-    closed = trades_df[trades_df["exit_date"].notna()]
-    result.total_trades = len(closed)
+        return trades_df
+    return trades_df[trades_df["exit_date"].notna()]
 
-    if len(closed) == 0:
-        return
 
-    result.winning_trades = int((closed["pnl"] > 0).sum())
-    result.losing_trades = int((closed["pnl"] <= 0).sum())
-    result.win_rate = (result.winning_trades / len(closed)) * 100
-    result.avg_trade_return = float(closed["pnl_pct"].mean())
+def _apply_trade_statistics(result: BacktestResult, metrics: dict[str, float]) -> None:
+    """Copy kernel trade statistics, counting break-even trades as losses."""
+    result.total_trades = int(metrics["total_trades"])
+    result.winning_trades = int(metrics["winning_trades"])
+    result.losing_trades = result.total_trades - result.winning_trades
+    result.win_rate = metrics["win_rate"]
+    result.avg_trade_return = metrics["avg_trade_return"]
 
-    total_profit = closed.loc[closed["pnl"] > 0, "pnl"].sum()
-    total_loss = abs(closed.loc[closed["pnl"] <= 0, "pnl"].sum())
-    result.profit_factor = total_profit / total_loss if total_loss > 0 else float("inf")
+    gross_loss = metrics["gross_loss"]
+    result.profit_factor = metrics["gross_profit"] / gross_loss if gross_loss > 0 else float("inf")
@@ -11,8 +11,9 @@ import numpy as np
 import pandas as pd
 
 from src.backtester.models import BacktestConfig
+from src.risk.portfolio_methods import solve_mpt, solve_risk_parity
 from src.risk.portfolio_optimization import optimize_portfolio
-from src.risk.position_sizing import calculate_multi_asset_position_sizes
+from src.risk.position_sizing import calculate_multi_asset_position_sizes_from_volatility
 from src.utils.logger import get_logger
 
 if TYPE_CHECKING:
@@ -29,7 +30,7 @@ def calculate_position_sizes_for_entries(
     entry_prices: np.ndarray,
     d_idx: int,
     current_date: date,
-    ticker_historical_data: dict[str, pd.DataFrame],
+    volatilities: np.ndarray | None,
 ) -> dict[str, float]:
     """
     Calculate position sizes for candidate entries.
@@ -42,7 +43,7 @@ def calculate_position_sizes_for_entries(
         entry_prices: Entry prices array
         d_idx: Current date index
         current_date: Current date
-        ticker_historical_data: Historical data per ticker
+        volatilities: Date-aligned rolling volatility array (None if not built)
 
     Returns:
         Dictionary of ticker -> position size
@@ -59,11 +60,11 @@ def calculate_position_sizes_for_entries(
             state, config, candidate_idx, tickers, optimization_method
         )
     elif optimization_method == "kelly":
-        position_sizes = _calculate_kelly_sizes(state, config)
+        position_sizes = _calculate_kelly_sizes(state, config, tickers)
 
     if not position_sizes:
         position_sizes = _calculate_fallback_sizes(
-            state, config, candidate_idx, tickers, entry_prices, d_idx, ticker_historical_data
+            state, config, candidate_idx, tickers, entry_prices, d_idx, volatilities
         )
 
     return position_sizes
@@ -77,6 +78,11 @@ def _calculate_mpt_sizes(
     optimization_method: str,
 ) -> dict[str, float]:
     """Calculate MPT/risk parity position sizes."""
+    if state.rolling_returns is not None:
+        return _calculate_rolling_mpt_sizes(
+            state, config, candidate_idx, tickers, optimization_method
+        )
+
     position_sizes: dict[str, float] = {}
     candidate_tickers = [tickers[idx] for idx in candidate_idx]
 
@@ -115,27 +121,83 @@ def _calculate_mpt_sizes(
     return position_sizes
 
 
-def _calculate_kelly_sizes(
+def _calculate_rolling_mpt_sizes(
     state: "SimulationState",
     config: BacktestConfig,
+    candidate_idx: np.ndarray,
+    tickers: list[str],
+    optimization_method: str,
 ) -> dict[str, float]:
-    """Calculate Kelly criterion position sizes."""
-    if len(state.trades_list) < 10:
+    """
+    Calculate MPT/risk parity position sizes from the rolling return window.
+
+    Uses date-aligned incremental moments and warm-starts the solver from the
+    previous weights. Weights are re-solved when the eligible candidate set
+    changes or every config.portfolio_rebalance_bars bars; in between the
+    last weights are reused outright.
+    """
+    window = state.rolling_returns
+    if window is None or window.window < 10:
         return {}
 
-    try:
-        trades_df = pd.DataFrame(state.trades_list)
-        if "pnl_pct" not in trades_df.columns:
+    idx = window.full_assets(candidate_idx)
+    if len(idx) < 2:
+        return {}
+
+    eligible = tuple(tickers[i] for i in idx)
+    rebalance_period = window.version // max(1, config.portfolio_rebalance_bars)
+    cache_key = (optimization_method, eligible, rebalance_period)
+    if cache_key != state.weights_cache_key:
+        mean, cov = window.moments(idx)
+        initial_weights = _warm_start_weights(state.previous_weights, eligible)
+        try:
+            if optimization_method == "mpt":
+                result = solve_mpt(
+                    list(eligible),
+                    mean * 252,
+                    cov * 252,
+                    risk_free_rate=config.risk_free_rate,
+                    initial_weights=initial_weights,
+                )
+            else:
+                result = solve_risk_parity(
+                    list(eligible), mean * 252, cov * 252, initial_weights=initial_weights
+                )
+        except Exception as e:
+            logger.warning(f"Portfolio optimization failed: {e}")
             return {}
+        state.previous_weights = result.weights
+        state.weights_cache_key = cache_key
 
-        from src.risk.portfolio_optimization import PortfolioOptimizer
+    return {ticker: state.cash * weight for ticker, weight in state.previous_weights.items()}
 
-        optimizer = PortfolioOptimizer()
-        return optimizer.optimize_kelly_portfolio(
-            trades_df,
-            available_cash=state.cash,
-            max_kelly=config.max_kelly,
-        )
+
+def _warm_start_weights(
+    previous_weights: dict[str, float], tickers: tuple[str, ...]
+) -> np.ndarray | None:
+    """Build solver starting point from previous weights (new tickers get 1/n)."""
+    if not any(ticker in previous_weights for ticker in tickers):
+        return None
+    default = 1.0 / len(tickers)
+    weights = np.array([previous_weights.get(ticker, default) for ticker in tickers])
+    total = weights.sum()
+    if total <= 0:
+        return None
+    return np.asarray(weights / total)
+
+
+def _calculate_kelly_sizes(
+    state: "SimulationState",
+    config: BacktestConfig,
+    tickers: list[str],
+) -> dict[str, float]:
+    """Calculate Kelly criterion position sizes from running trade statistics."""
+    stats = state.trade_stats
+    if stats is None or stats.total_trades < 10:
+        return {}
+
+    try:
+        return stats.kelly_allocations(tickers, state.cash, config.max_kelly)
     except Exception as e:
         logger.warning(f"Kelly optimization failed: {e}")
         return {}
@@ -148,7 +210,7 @@ def _calculate_fallback_sizes(
     tickers: list[str],
     entry_prices: np.ndarray,
     d_idx: int,
-    ticker_historical_data: dict[str, pd.DataFrame],
+    volatilities: np.ndarray | None,
 ) -> dict[str, float]:
     """Calculate fallback position sizes using multi-asset method."""
     candidate_tickers = [tickers[idx] for idx in candidate_idx]
@@ -157,20 +219,17 @@ def _calculate_fallback_sizes(
         for idx in candidate_idx
         if not np.isnan(entry_prices[idx, d_idx])
     }
+    candidate_volatilities: dict[str, float] = {}
+    if volatilities is not None:
+        candidate_volatilities = {
+            tickers[idx]: float(volatilities[idx, d_idx]) for idx in candidate_idx
+        }
 
-    candidate_historical: dict[str, pd.DataFrame] = {}
-    for idx in candidate_idx:
-        ticker = tickers[idx]
-        if ticker in ticker_historical_data:
-            hist_df = ticker_historical_data[ticker]
-            candidate_historical[ticker] = hist_df.iloc[: d_idx + 1]
-
-    return calculate_multi_asset_position_sizes(
+    return calculate_multi_asset_position_sizes_from_volatility(
         method=config.position_sizing,  # type: ignore[arg-type]
         available_cash=state.cash,
         tickers=candidate_tickers,
         current_prices=candidate_prices,
-        historical_data=candidate_historical,
+        volatilities=candidate_volatilities,
         target_risk_pct=config.position_sizing_risk_pct,
-        lookback_period=config.position_sizing_lookback,
     )
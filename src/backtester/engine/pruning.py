@@ -0,0 +1,92 @@
+"""
+Early pruning for vectorized backtesting.
+
+Aborts a simulation as soon as it is clear the run cannot be competitive
+(drawdown limit breached, too few trades, or a caller-supplied predicate),
+so large parameter sweeps do not pay for simulating hopeless candidates.
+"""
+
+import numpy as np
+
+from src.backtester.engine.trade_simulator_state import SimulationState
+from src.backtester.models import BacktestConfig
+
+
+class PruningMonitor:
+    """Tracks running drawdown and evaluates pruning rules during simulation."""
+
+    def __init__(self, config: BacktestConfig) -> None:
+        """
+        Initialize monitor.
+
+        Args:
+            config: Backtest configuration with prune_* settings
+        """
+        self.config = config
+        self.check_every = max(1, config.prune_check_every)
+        self.peak = 0.0
+        self.max_drawdown = 0.0
+
+    def check(self, state: SimulationState, d_idx: int) -> str | None:
+        """
+        Update running statistics and evaluate pruning rules.
+
+        Drawdown is tracked on every bar so breaches between checks are not
+        missed; the rules themselves are evaluated every ``check_every`` bars.
+
+        Args:
+            state: Current simulation state (equity filled up to d_idx)
+            d_idx: Current date index
+
+        Returns:
+            Prune reason, or None if the simulation should continue
+        """
+        equity = float(state.equity_curve[d_idx])
+        if equity > self.peak:
+            self.peak = equity
+        elif self.peak > 0:
+            self.max_drawdown = max(self.max_drawdown, 1.0 - equity / self.peak)
+
+        if (d_idx + 1) % self.check_every != 0:
+            return None
+
+        config = self.config
+        if config.prune_max_drawdown is not None and self.max_drawdown > config.prune_max_drawdown:
+            return "max_drawdown"
+
+        n_entries = len(state.ledger) + int(np.count_nonzero(state.position_amounts))
+        if (
+            config.prune_min_trades is not None
+            and d_idx >= config.prune_min_trades_bar
+            and n_entries < config.prune_min_trades
+        ):
+            return "min_trades"
+
+        if config.prune_predicate is not None and config.prune_predicate(
+            state.equity_curve[: d_idx + 1], n_entries
+        ):
+            return "predicate"
+
+        return None
+
+
+def create_pruning_monitor(config: BacktestConfig) -> PruningMonitor | None:
+    """
+    Create a pruning monitor if any pruning rule is configured.
+
+    Args:
+        config: Backtest configuration
+
+    Returns:
+        PruningMonitor, or None when pruning is disabled (no per-bar overhead)
+    """
+    if (
+        config.prune_max_drawdown is None
+        and config.prune_min_trades is None
+        and config.prune_predicate is None
+    ):
+        return None
+    return PruningMonitor(config)
+
+
+__all__ = ["PruningMonitor", "create_pruning_monitor"]
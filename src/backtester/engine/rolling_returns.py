@@ -0,0 +1,96 @@
+"""
+Rolling return statistics for in-simulation portfolio optimization.
+
+Maintains a date-aligned ring buffer of per-asset daily returns together with
+running sums and cross-products, so the mean vector and covariance matrix of
+the last ``window`` bars are available in O(n_assets^2) per bar instead of
+rebuilding a DataFrame from Python lists on every entry day.
+"""
+
+import numpy as np
+
+
+class RollingReturnWindow:
+    """Fixed-size ring buffer of asset returns with incremental moments."""
+
+    def __init__(self, n_assets: int, window: int) -> None:
+        """
+        Initialize window.
+
+        Args:
+            n_assets: Number of assets (tickers)
+            window: Number of bars kept in the window
+        """
+        if window < 2:
+            raise ValueError(f"window must be >= 2, got {window}")
+        self.n_assets = n_assets
+        self.window = window
+        self.buffer = np.full((window, n_assets), np.nan, dtype=np.float64)
+        self.counts = np.zeros(n_assets, dtype=np.int64)
+        self.sums = np.zeros(n_assets, dtype=np.float64)
+        self.cross = np.zeros((n_assets, n_assets), dtype=np.float64)
+        self.position = 0
+        self.version = 0  # Incremented on every push; used as a cache key
+
+    def push(self, returns: np.ndarray) -> None:
+        """
+        Append one bar of returns (NaN for assets without a return this bar).
+
+        Args:
+            returns: Array of shape (n_assets,)
+        """
+        old = self.buffer[self.position]
+        old_valid = ~np.isnan(old)
+        new_valid = ~np.isnan(returns)
+        old_filled = np.where(old_valid, old, 0.0)
+        new_filled = np.where(new_valid, returns, 0.0)
+
+        self.buffer[self.position] = returns
+        self.counts += new_valid.astype(np.int64) - old_valid.astype(np.int64)
+        self.sums += new_filled - old_filled
+        self.cross += np.outer(new_filled, new_filled) - np.outer(old_filled, old_filled)
+
+        self.position = (self.position + 1) % self.window
+        self.version += 1
+        if self.position == 0:
+            # Recompute once per wrap so floating-point drift cannot accumulate
+            self._recompute()
+
+    def _recompute(self) -> None:
+        """Recompute running sums from the buffer."""
+        filled = np.nan_to_num(self.buffer, nan=0.0)
+        self.counts = np.count_nonzero(~np.isnan(self.buffer), axis=0).astype(np.int64)
+        self.sums = filled.sum(axis=0)
+        self.cross = filled.T @ filled
+
+    def full_assets(self, candidates: np.ndarray) -> np.ndarray:
+        """
+        Filter candidate asset indices to those with a return on every bar of the window.
+
+        Args:
+            candidates: Asset indices to filter
+
+        Returns:
+            Subset of candidates with a complete window
+        """
+        candidates = np.asarray(candidates, dtype=np.int64)
+        return np.asarray(candidates[self.counts[candidates] == self.window])
+
+    def moments(self, idx: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Sample mean and covariance of daily returns for complete-window assets.
+
+        Args:
+            idx: Asset indices (must all have a complete window, see full_assets)
+
+        Returns:
+            Tuple of (mean vector, covariance matrix)
+        """
+        n = self.window
+        sums = self.sums[idx]
+        mean = sums / n
+        cov = (self.cross[np.ix_(idx, idx)] - np.outer(sums, sums) / n) / (n - 1)
+        return mean, cov
+
+
+__all__ = ["RollingReturnWindow"]
@@ -168,6 +168,7 @@ def track_asset_returns(
     valid_data: np.ndarray,
 ) -> None:
     """Track individual asset returns for correlation analysis."""
+    bar_returns = np.full(n_tickers, np.nan) if state.rolling_returns is not None else None
     for t_idx in range(n_tickers):
         if valid_data[t_idx] and not np.isnan(closes[t_idx, d_idx]):
             current_close = closes[t_idx, d_idx]
@@ -176,7 +177,11 @@ def track_asset_returns(
                     current_close - state.previous_closes[t_idx]
                 ) / state.previous_closes[t_idx]
                 state.asset_returns[tickers[t_idx]].append(daily_return)
+                if bar_returns is not None:
+                    bar_returns[t_idx] = daily_return
             state.previous_closes[t_idx] = current_close
+    if bar_returns is not None and state.rolling_returns is not None:
+        state.rolling_returns.push(bar_returns)
 
 
 def finalize_open_positions(
@@ -187,7 +192,7 @@ def finalize_open_positions(
     closes: np.ndarray,
     config: BacktestConfig,
 ) -> None:
-    """Add open positions to trades list at end of simulation.
+    """Record open positions in the trade ledger at end of simulation.
 
     Calculates unrealized P&L using final closing prices.
 
@@ -214,23 +219,18 @@ def finalize_open_positions(
             # Calculate unrealized P&L
             costs = calculator.calculate_exit_costs(entry_price, final_price, amount)
 
-            state.trades_list.append(
-                {
-                    "ticker": tickers[t_idx],
-                    "entry_date": sorted_dates[state.position_entry_dates[t_idx]],
-                    "entry_price": entry_price,
-                    "exit_date": sorted_dates[-1],
-                    "exit_price": final_price,
-                    "amount": amount,
-                    "pnl": costs.pnl,
-                    "pnl_pct": costs.pnl_pct,
-                    "is_whipsaw": False,
-                    "commission_cost": costs.commission,
-                    "slippage_cost": costs.slippage,
-                    "is_stop_loss": False,
-                    "is_take_profit": False,
-                    "exit_reason": "open",
-                }
+            state.ledger.append(
+                t_idx,
+                state.position_entry_dates[t_idx],
+                len(sorted_dates) - 1,
+                entry_price,
+                final_price,
+                amount,
+                costs.pnl,
+                costs.pnl_pct,
+                costs.commission,
+                costs.slippage,
+                "open",
             )
 
 
@@ -38,24 +38,21 @@ def execute_exit(
 
     state.cash += costs.revenue
 
-    state.trades_list.append(
-        {
-            "ticker": tickers[t_idx],
-            "entry_date": sorted_dates[state.position_entry_dates[t_idx]],
-            "entry_price": entry_price,
-            "exit_date": current_date,
-            "exit_price": exit_price,
-            "amount": amount,
-            "pnl": costs.pnl,
-            "pnl_pct": costs.pnl_pct,
-            "is_whipsaw": False,
-            "commission_cost": costs.commission,
-            "slippage_cost": costs.slippage,
-            "is_stop_loss": is_stop_loss,
-            "is_take_profit": is_take_profit,
-            "exit_reason": exit_reason,
-        }
+    state.ledger.append(
+        t_idx,
+        state.position_entry_dates[t_idx],
+        d_idx,
+        entry_price,
+        exit_price,
+        amount,
+        costs.pnl,
+        costs.pnl_pct,
+        costs.commission,
+        costs.slippage,
+        exit_reason,
     )
+    if state.trade_stats is not None:
+        state.trade_stats.record(t_idx, costs.pnl_pct)
 
     order_manager.cancel_all_orders(ticker=tickers[t_idx])
     state.position_amounts[t_idx] = 0
@@ -83,24 +80,21 @@ def handle_whipsaw(
 
     state.cash = state.cash - invest_amount + costs.revenue
 
-    state.trades_list.append(
-        {
-            "ticker": tickers[t_idx],
-            "entry_date": current_date,
-            "entry_price": buy_price,
-            "exit_date": current_date,
-            "exit_price": sell_price,
-            "amount": costs.net_amount,
-            "pnl": costs.pnl,
-            "pnl_pct": costs.pnl_pct,
-            "is_whipsaw": True,
-            "commission_cost": costs.commission,
-            "slippage_cost": costs.slippage,
-            "is_stop_loss": False,
-            "is_take_profit": False,
-            "exit_reason": "whipsaw",
-        }
+    state.ledger.append(
+        t_idx,
+        d_idx,
+        d_idx,
+        buy_price,
+        sell_price,
+        costs.net_amount,
+        costs.pnl,
+        costs.pnl_pct,
+        costs.commission,
+        costs.slippage,
+        "whipsaw",
     )
+    if state.trade_stats is not None:
+        state.trade_stats.record(t_idx, costs.pnl_pct)
 
 
 def handle_normal_entry(
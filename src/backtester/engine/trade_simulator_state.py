@@ -4,11 +4,15 @@ Trade simulation state management.
 Contains state container and initialization for vectorized backtesting.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any
 
 import numpy as np
 
+from src.backtester.engine.rolling_returns import RollingReturnWindow
+from src.backtester.engine.trade_stats import TradeStats
+from src.backtester.trade_ledger import TradeLedger
+
 
 @dataclass
 class SimulationState:
@@ -19,9 +23,17 @@ class SimulationState:
     position_entry_prices: np.ndarray
     position_entry_dates: np.ndarray
     equity_curve: np.ndarray
-    trades_list: list[dict[str, Any]]
+    ledger: TradeLedger  # Closed trades (date indices into the simulation dates)
     asset_returns: dict[str, list[float]]
     previous_closes: np.ndarray
+    pruned_at: int | None = None  # Date index where the run was aborted early
+    prune_reason: str | None = None
+    # Rolling return moments for MPT / risk parity sizing (None when unused)
+    rolling_returns: RollingReturnWindow | None = None
+    previous_weights: dict[str, float] = field(default_factory=dict)
+    weights_cache_key: tuple[Any, ...] | None = None
+    # Running per-ticker closed-trade statistics (for Kelly sizing)
+    trade_stats: TradeStats | None = None
 
 
 def initialize_simulation_state(
@@ -52,7 +64,8 @@ def initialize_simulation_state(
         position_entry_prices=np.zeros(n_tickers, dtype=float_dtype),
         position_entry_dates=np.full(n_tickers, -1, dtype=np.int32),
         equity_curve=np.zeros(n_dates, dtype=float_dtype),
-        trades_list=[],
+        ledger=TradeLedger(tickers),
         asset_returns={ticker: [] for ticker in tickers},
         previous_closes=np.full(n_tickers, np.nan, dtype=float_dtype),
+        trade_stats=TradeStats(n_tickers),
     )
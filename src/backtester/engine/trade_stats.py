@@ -0,0 +1,74 @@
+"""
+Running per-ticker trade statistics for vectorized backtesting.
+
+Updated on every closed trade so Kelly sizing can read win/loss counts and
+sums in O(n_tickers) instead of rebuilding a DataFrame from all trades.
+"""
+
+import numpy as np
+
+from src.risk.portfolio_kelly import kelly_allocations_from_stats
+
+
+class TradeStats:
+    """Per-ticker win/loss counts and return sums of closed trades."""
+
+    def __init__(self, n_tickers: int) -> None:
+        """
+        Initialize accumulators.
+
+        Args:
+            n_tickers: Number of tickers
+        """
+        self.total_trades = 0
+        self.n_trades = np.zeros(n_tickers, dtype=np.int64)
+        self.n_wins = np.zeros(n_tickers, dtype=np.int64)
+        self.n_losses = np.zeros(n_tickers, dtype=np.int64)
+        self.sum_wins = np.zeros(n_tickers, dtype=np.float64)
+        self.sum_losses = np.zeros(n_tickers, dtype=np.float64)
+
+    def record(self, t_idx: int, pnl_pct: float) -> None:
+        """
+        Record a closed trade.
+
+        Args:
+            t_idx: Ticker index
+            pnl_pct: Trade return in percent
+        """
+        ret = float(pnl_pct) / 100.0
+        self.total_trades += 1
+        self.n_trades[t_idx] += 1
+        if ret > 0:
+            self.n_wins[t_idx] += 1
+            self.sum_wins[t_idx] += ret
+        elif ret < 0:
+            self.n_losses[t_idx] += 1
+            self.sum_losses[t_idx] += ret
+
+    def kelly_allocations(
+        self, tickers: list[str], available_cash: float, max_kelly: float
+    ) -> dict[str, float]:
+        """
+        Kelly allocations for tickers with enough winning and losing trades.
+
+        Args:
+            tickers: Ticker symbols in simulation order
+            available_cash: Cash to allocate
+            max_kelly: Cap on the Kelly fraction per ticker
+
+        Returns:
+            Dictionary mapping ticker to allocation
+        """
+        return kelly_allocations_from_stats(
+            tickers,
+            self.n_trades,
+            self.n_wins,
+            self.n_losses,
+            self.sum_wins,
+            self.sum_losses,
+            available_cash=available_cash,
+            max_kelly=max_kelly,
+        )
+
+
+__all__ = ["TradeStats"]
@@ -8,6 +8,7 @@ import pandas as pd
 
 from src.backtester.engine.array_builder import (
     build_numpy_arrays,
+    build_volatility_array,
     collect_valid_dates,
     filter_valid_dates,
 )
@@ -15,9 +16,12 @@ from src.backtester.engine.data_loader import (
     get_cache_params,
     load_parquet_data,
     load_ticker_data,
+    prepare_ticker_data,
 )
 from src.backtester.engine.entry_processor import process_entries
+from src.backtester.engine.pruning import create_pruning_monitor
 from src.backtester.engine.result_builder import build_backtest_result
+from src.backtester.engine.rolling_returns import RollingReturnWindow
 from src.backtester.engine.signal_processor import add_price_columns
 from src.backtester.engine.trade_simulator import (
     SimulationState,
@@ -33,10 +37,30 @@ from src.execution.orders.advanced_orders import AdvancedOrderManager
 from src.strategies.base import Strategy
 from src.utils.logger import get_logger
 from src.utils.memory import optimize_dtypes
+from src.utils.profiling import Profiler, get_profiler
 
 logger = get_logger(__name__)
 
 
+def _slice_dates(
+    ticker_data: dict[str, pd.DataFrame],
+    start_date: date | None,
+    end_date: date | None,
+) -> dict[str, pd.DataFrame]:
+    """Restrict prepared per-ticker data to [start_date, end_date] (inclusive)."""
+    sliced: dict[str, pd.DataFrame] = {}
+    for ticker, df in ticker_data.items():
+        index = pd.DatetimeIndex(df.index)
+        mask = np.ones(len(df), dtype=bool)
+        if start_date is not None:
+            mask &= index >= pd.Timestamp(start_date)
+        if end_date is not None:
+            mask &= index < pd.Timestamp(end_date) + pd.Timedelta(days=1)
+        if mask.any():
+            sliced[ticker] = df[mask]
+    return sliced
+
+
 class VectorizedBacktestEngine:
     """Vectorized backtesting engine using pandas/numpy."""
 
@@ -56,27 +80,97 @@ class VectorizedBacktestEngine:
         start_date: date | None = None,
         end_date: date | None = None,
     ) -> BacktestResult:
-        """Run vectorized backtest for a strategy on multiple assets."""
-        ticker_data, ticker_historical_data = self._load_all_ticker_data(strategy, data_files)
+        """Run vectorized backtest for a strategy on multiple assets.
+
+        Indicators are computed on the full history; start_date and end_date
+        then restrict the simulated dates, so windowed runs keep their
+        indicator warm-up.
+        """
+        with get_profiler().collect() as stats:
+            ticker_data, ticker_historical_data = self._load_all_ticker_data(strategy, data_files)
+            if start_date is not None or end_date is not None:
+                ticker_data = _slice_dates(ticker_data, start_date, end_date)
+            result = self._run_prepared(strategy, ticker_data, ticker_historical_data)
+        if stats is not None:
+            result.profile = Profiler.to_profile(stats)
+        return result
+
+    def run_on_data(
+        self,
+        strategy: Strategy,
+        raw_data: dict[str, pd.DataFrame],
+    ) -> BacktestResult:
+        """Run vectorized backtest on OHLCV data that is already loaded.
+
+        Lets callers load every ticker once and reuse it across strategies or
+        parameter sets; the indicator cache is bypassed.
+
+        Args:
+            strategy: Trading strategy
+            raw_data: {ticker: OHLCV DataFrame} as returned by load_data
+
+        Returns:
+            BacktestResult
+        """
+        ticker_data: dict[str, pd.DataFrame] = {}
+        ticker_historical_data: dict[str, pd.DataFrame] = {}
+
+        with get_profiler().collect() as stats:
+            for ticker, raw_df in raw_data.items():
+                try:
+                    df, hist_df = prepare_ticker_data(
+                        ticker, raw_df, strategy, position_sizing=self.config.position_sizing
+                    )
+                    df = add_price_columns(df, self.config)
+                    ticker_data[ticker] = optimize_dtypes(df)
+                    if hist_df is not None:
+                        ticker_historical_data[ticker] = hist_df
+                except Exception as e:
+                    logger.error("Error processing %s: %s", ticker, e, exc_info=True)
+
+            result = self._run_prepared(strategy, ticker_data, ticker_historical_data)
+        if stats is not None:
+            result.profile = Profiler.to_profile(stats)
+        return result
 
+    def _run_prepared(
+        self,
+        strategy: Strategy,
+        ticker_data: dict[str, pd.DataFrame],
+        ticker_historical_data: dict[str, pd.DataFrame],
+    ) -> BacktestResult:
+        """Simulate a strategy on prepared per-ticker data."""
         if not ticker_data:
             logger.warning("No data available for backtesting")
             return BacktestResult(strategy_name=strategy.name)
 
-        all_dates = collect_valid_dates(ticker_data)
-        sorted_dates = np.array(sorted(all_dates))
+        profiler = get_profiler()
+        with profiler.span("backtest.array_build"):
+            all_dates = collect_valid_dates(ticker_data)
+            sorted_dates = np.array(sorted(all_dates))
 
-        if len(sorted_dates) == 0:
-            return BacktestResult(strategy_name=strategy.name)
+            if len(sorted_dates) == 0:
+                return BacktestResult(strategy_name=strategy.name)
 
-        tickers, n_tickers, n_dates, arrays = build_numpy_arrays(ticker_data, sorted_dates)
-        sorted_dates, n_dates, arrays = filter_valid_dates(sorted_dates, arrays, n_dates)
+            tickers, n_tickers, n_dates, arrays = build_numpy_arrays(ticker_data, sorted_dates)
+            if ticker_historical_data:
+                arrays["volatilities"] = build_volatility_array(
+                    ticker_historical_data,
+                    tickers,
+                    sorted_dates,
+                    self.config.position_sizing_lookback,
+                )
+            sorted_dates, n_dates, arrays = filter_valid_dates(sorted_dates, arrays, n_dates)
 
-        state = self._run_simulation(
-            sorted_dates, n_dates, tickers, n_tickers, arrays, ticker_historical_data
-        )
+        with profiler.span("backtest.simulation"):
+            state = self._run_simulation(sorted_dates, n_dates, tickers, n_tickers, arrays)
 
-        return build_backtest_result(strategy, state, sorted_dates, self.config)
+        if state.pruned_at is not None:
+            sorted_dates = sorted_dates[: state.pruned_at + 1]
+            logger.info(f"Pruned {strategy.name} at {sorted_dates[-1]} ({state.prune_reason})")
+
+        with profiler.span("backtest.metrics"):
+            return build_backtest_result(strategy, state, sorted_dates, self.config)
 
     def _load_all_ticker_data(
         self,
@@ -104,7 +198,7 @@ class VectorizedBacktestEngine:
                 if hist_df is not None:
                     ticker_historical_data[ticker] = hist_df
             except Exception as e:
-                logger.error(f"Error processing {ticker}: {e}", exc_info=True)
+                logger.error("Error processing %s: %s", ticker, e, exc_info=True)
 
         return ticker_data, ticker_historical_data
 
@@ -115,12 +209,17 @@ class VectorizedBacktestEngine:
         tickers: list[str],
         n_tickers: int,
         arrays: dict[str, np.ndarray],
-        ticker_historical_data: dict[str, pd.DataFrame],
     ) -> SimulationState:
         """Run the main simulation loop."""
         state = initialize_simulation_state(
             self.config.initial_capital, n_tickers, n_dates, tickers
         )
+        pruning_monitor = create_pruning_monitor(self.config)
+        sizing_method = self.config.portfolio_optimization_method or self.config.position_sizing
+        if sizing_method in ("mpt", "risk_parity") and self.config.position_sizing_lookback >= 2:
+            state.rolling_returns = RollingReturnWindow(
+                n_tickers, self.config.position_sizing_lookback
+            )
 
         for d_idx in range(n_dates):
             current_date = sorted_dates[d_idx]
@@ -164,14 +263,25 @@ class VectorizedBacktestEngine:
                 n_tickers,
                 arrays,
                 valid_data,
-                ticker_historical_data,
             )
 
             calculate_daily_equity(state, d_idx, n_tickers, arrays["closes"], valid_data)
 
-        finalize_open_positions(
-            state, sorted_dates, tickers, n_tickers, arrays["closes"], self.config
-        )
+            if pruning_monitor is not None:
+                reason = pruning_monitor.check(state, d_idx)
+                if reason is not None:
+                    state.pruned_at = d_idx
+                    state.prune_reason = reason
+                    break
+
+        closes = arrays["closes"]
+        if state.pruned_at is not None:
+            # Mark open positions to market at the pruning bar, not the end of data
+            end = state.pruned_at + 1
+            sorted_dates, closes = sorted_dates[:end], closes[:, :end]
+            state.equity_curve = state.equity_curve[:end]
+
+        finalize_open_positions(state, sorted_dates, tickers, n_tickers, closes, self.config)
         return state
 
 
@@ -5,11 +5,12 @@ Generates interactive HTML reports with performance metrics,
 charts, and trade statistics.
 """
 
-from datetime import date
+import json
 from pathlib import Path
-from typing import Any
+from typing import Any, Literal
 
 import numpy as np
+import pandas as pd
 
 from src.backtester.html.html_report_charts import get_chart_js
 from src.backtester.html.html_report_templates import (
@@ -24,10 +25,14 @@ from src.backtester.html.html_utils import (
     generate_risk_metrics_html,
 )
 from src.backtester.report_pkg.report import BacktestReport
+from src.utils.downsampling import downsample_indices
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum points per time series chart in the report
+_MAX_CHART_POINTS = 5000
+
 
 def generate_html_report(
     report: BacktestReport,
@@ -78,30 +83,35 @@ def generate_html_report(
 
 
 def _prepare_chart_data(report: BacktestReport) -> dict[str, Any]:
-    """Prepare data for charts."""
-    dates_list = [d.isoformat() if isinstance(d, date) else str(d) for d in report.dates]
-    dates_str = "[" + ", ".join([f"'{d}'" for d in dates_list]) + "]"
-    equity_values = report.equity_curve.tolist()
+    """Prepare (downsampled) data for charts."""
+    n_points = min(len(report.dates), len(report.equity_curve))
+    equity = np.asarray(report.equity_curve, dtype=np.float64)[:n_points]
 
     # Clean drawdown values
-    dd_clean = report.metrics.drawdown_curve.copy()
-    dd_clean = np.where(np.isnan(dd_clean), 0.0, dd_clean)
-    dd_clean = np.where(np.isinf(dd_clean), 0.0, dd_clean)
-    drawdown_values = (-dd_clean).tolist()
-    drawdown_values = [v if np.isfinite(v) else 0.0 for v in drawdown_values]
+    dd_clean = np.asarray(report.metrics.drawdown_curve, dtype=np.float64)[:n_points]
+    dd_clean = np.nan_to_num(dd_clean, nan=0.0, posinf=0.0, neginf=0.0)
+
+    # Equity and drawdown share the x axis: keep the LTTB picks of the equity
+    # curve, the min-max picks of the drawdown curve and the MDD point itself
+    mdd_idx = int(np.argmax(dd_clean)) if len(dd_clean) > 0 else 0
+    indices = np.union1d(
+        downsample_indices(equity, _MAX_CHART_POINTS),
+        downsample_indices(dd_clean, _MAX_CHART_POINTS, method="minmax"),
+    )
+    if len(dd_clean) > 0:
+        indices = np.union1d(indices, [mdd_idx])
 
-    # Find MDD point
-    mdd_idx = int(np.argmax(dd_clean))
-    mdd_date = dates_list[mdd_idx] if mdd_idx < len(dates_list) else dates_list[-1]
-    mdd_value = dd_clean[mdd_idx] if mdd_idx < len(dd_clean) else report.metrics.mdd_pct
+    date_labels = _format_dates(np.asarray(report.dates)[indices])
+    mdd_date = date_labels[int(np.searchsorted(indices, mdd_idx))] if date_labels else ""
+    mdd_value = dd_clean[mdd_idx] if len(dd_clean) > 0 else report.metrics.mdd_pct
 
     # Monthly returns data
     monthly_returns = calculate_monthly_returns_for_html(report.equity_curve, report.dates)
 
     return {
-        "dates_str": dates_str,
-        "equity_values": equity_values,
-        "drawdown_values": drawdown_values,
+        "dates_str": json.dumps(date_labels),
+        "equity_values": equity[indices].tolist(),
+        "drawdown_values": (-dd_clean[indices]).tolist(),
         "mdd_pct": report.metrics.mdd_pct,
         "mdd_date": mdd_date,
         "mdd_value": mdd_value,
@@ -109,6 +119,16 @@ def _prepare_chart_data(report: BacktestReport) -> dict[str, Any]:
     }
 
 
+def _format_dates(dates: np.ndarray) -> list[str]:
+    """Format dates as ISO strings (date only when every value is at midnight)."""
+    if len(dates) == 0:
+        return []
+    times = pd.to_datetime(dates).to_numpy(dtype="datetime64[ns]")
+    unit: Literal["D", "s"] = "D" if np.all(times == times.astype("datetime64[D]")) else "s"
+    labels = np.char.replace(np.datetime_as_string(times, unit=unit), "T", " ")
+    return [str(label) for label in labels]
+
+
 def _build_html(
     report: BacktestReport,
     m: Any,
@@ -7,11 +7,7 @@ Performance metrics for strategy evaluation.
 import numpy as np
 import pandas as pd
 
-from src.backtester.metrics_helpers import (
-    calculate_return_metrics,
-    calculate_risk_metrics_from_equity,
-    calculate_trade_stats,
-)
+from src.backtester.metrics_kernel import compute_metrics
 from src.backtester.models import BacktestConfig, BacktestResult, Trade
 from src.risk.metrics import calculate_portfolio_risk_metrics
 from src.utils.logger import get_logger
@@ -55,23 +51,22 @@ def calculate_metrics(
     initial = config.initial_capital
     final = equity_curve[-1]
 
-    # Calculate return metrics
-    result.total_return, result.cagr = calculate_return_metrics(equity_curve, dates, initial)
-
-    # Calculate risk metrics
-    result.mdd, result.calmar_ratio, result.sharpe_ratio = calculate_risk_metrics_from_equity(
-        equity_curve, result.cagr
-    )
-
-    # Calculate trade statistics
+    # Return, risk and trade statistics in one pass
+    pnl = np.fromiter((t.pnl for t in trades), dtype=np.float64, count=len(trades))
+    pnl_pct = np.fromiter((t.pnl_pct for t in trades), dtype=np.float64, count=len(trades))
+    metrics = compute_metrics(equity_curve, dates, initial, pnl, pnl_pct).row(0)
+    result.total_return = metrics["total_return"]
+    result.cagr = metrics["cagr"]
+    result.mdd = metrics["mdd"]
+    result.calmar_ratio = metrics["calmar_ratio"]
+    result.sharpe_ratio = metrics["sharpe_ratio"]
     if trades:
-        trade_stats = calculate_trade_stats(trades)
-        result.total_trades = int(trade_stats["total_trades"])
-        result.winning_trades = int(trade_stats["winning_trades"])
-        result.losing_trades = int(trade_stats["losing_trades"])
-        result.win_rate = trade_stats["win_rate"]
-        result.profit_factor = trade_stats["profit_factor"]
-        result.avg_trade_return = trade_stats["avg_trade_return"]
+        result.total_trades = int(metrics["total_trades"])
+        result.winning_trades = int(metrics["winning_trades"])
+        result.losing_trades = int(metrics["losing_trades"])
+        result.win_rate = metrics["win_rate"]
+        result.profit_factor = metrics["profit_factor"]
+        result.avg_trade_return = metrics["avg_trade_return"]
 
     # Portfolio risk metrics
     if asset_returns:
@@ -4,9 +4,12 @@ Metrics calculation helpers.
 Helper functions for performance metrics calculation.
 """
 
+from collections.abc import Sequence
+
 import numpy as np
 
 from src.backtester.models import Trade
+from src.backtester.trade_ledger import TradeLedger
 
 __all__ = [
     "calculate_return_metrics",
@@ -81,17 +84,17 @@ def calculate_risk_metrics_from_equity(
     return mdd, calmar_ratio, sharpe_ratio
 
 
-def calculate_trade_stats(trades: list[Trade]) -> dict[str, float]:
+def calculate_trade_stats(trades: Sequence[Trade] | TradeLedger) -> dict[str, float]:
     """
     Calculate trade statistics.
 
     Args:
-        trades: List of trades
+        trades: List of trades, or a TradeLedger (read column-wise)
 
     Returns:
         Dictionary with trade stats
     """
-    if not trades:
+    if not len(trades):
         return {
             "total_trades": 0,
             "winning_trades": 0,
@@ -101,22 +104,28 @@ def calculate_trade_stats(trades: list[Trade]) -> dict[str, float]:
             "avg_trade_return": 0.0,
         }
 
-    winning = [t for t in trades if t.pnl > 0]
-    losing = [t for t in trades if t.pnl < 0]
-
-    total_trades = len(trades)
-    winning_trades = len(winning)
-    losing_trades = len(losing)
+    if isinstance(trades, TradeLedger):
+        pnl = trades.column("pnl")
+        pnl_pct = trades.column("pnl_pct")
+    else:
+        pnl = np.fromiter((t.pnl for t in trades), dtype=np.float64, count=len(trades))
+        pnl_pct = np.fromiter((t.pnl_pct for t in trades), dtype=np.float64, count=len(trades))
+
+    winning = pnl > 0
+    losing = pnl < 0
+    total_trades = len(pnl)
+    winning_trades = int(np.count_nonzero(winning))
+    losing_trades = int(np.count_nonzero(losing))
     win_rate = winning_trades / total_trades * 100
 
-    if winning and losing:
-        total_profit = sum(t.pnl for t in winning)
-        total_loss = abs(sum(t.pnl for t in losing))
+    if winning_trades and losing_trades:
+        total_profit = float(pnl[winning].sum())
+        total_loss = abs(float(pnl[losing].sum()))
         profit_factor = total_profit / total_loss if total_loss > 0 else 0.0
     else:
         profit_factor = 0.0
 
-    avg_trade_return = sum(t.pnl_pct for t in trades) / total_trades
+    avg_trade_return = float(pnl_pct.mean())
 
     return {
         "total_trades": float(total_trades),
@@ -0,0 +1,231 @@
+"""
+Vectorized metrics kernel.
+
+Computes the headline performance metrics for one equity curve or a batch
+of them (a 2-D runs x periods matrix) in a single pass: the period returns,
+running peak and return percentile are derived once and shared by every
+metric, and per-run trade statistics are segmented reductions over flat
+trade columns. Results are a struct of arrays with one entry per run.
+
+Curves of different lengths are batched by NaN-padding them at the end
+(stack_curves); padded batches switch to NaN-aware reductions.
+
+Values match calculate_return_metrics, calculate_risk_metrics_from_equity,
+calculate_trade_stats, calculate_sortino_ratio and calculate_var /
+calculate_cvar to floating-point tolerance.
+"""
+
+from __future__ import annotations
+
+import warnings
+from collections.abc import Sequence
+from dataclasses import dataclass, fields
+
+import numpy as np
+
+__all__ = ["MetricsArrays", "compute_metrics", "stack_curves"]
+
+# Sharpe/Sortino annualization used for BacktestResult metrics
+TRADING_DAYS_PER_YEAR = 252
+
+
+@dataclass(frozen=True)
+class MetricsArrays:
+    """Metrics for a batch of runs, one array element per run."""
+
+    total_return: np.ndarray
+    cagr: np.ndarray
+    mdd: np.ndarray
+    calmar_ratio: np.ndarray
+    sharpe_ratio: np.ndarray
+    sortino_ratio: np.ndarray
+    var: np.ndarray  # Historical VaR of period returns (positive = loss)
+    cvar: np.ndarray
+    total_trades: np.ndarray
+    winning_trades: np.ndarray
+    losing_trades: np.ndarray
+    win_rate: np.ndarray
+    profit_factor: np.ndarray
+    avg_trade_return: np.ndarray
+    gross_profit: np.ndarray  # Sum of winning trade P&L
+    gross_loss: np.ndarray  # Absolute sum of losing trade P&L
+
+    def __len__(self) -> int:
+        return len(self.total_return)
+
+    def row(self, i: int) -> dict[str, float]:
+        """Metrics of run i as plain floats."""
+        return {f.name: float(getattr(self, f.name)[i]) for f in fields(self)}
+
+
+def stack_curves(curves: Sequence[np.ndarray]) -> np.ndarray:
+    """NaN-pad equity curves of different lengths into a runs x periods batch."""
+    width = max((len(curve) for curve in curves), default=0)
+    batch = np.full((len(curves), width), np.nan)
+    for i, curve in enumerate(curves):
+        batch[i, : len(curve)] = curve
+    return batch
+
+
+def _calendar_days(dates: np.ndarray) -> int:
+    """Days between the first and last date (date objects or datetime64)."""
+    if len(dates) < 2:
+        return 0
+    if np.issubdtype(np.asarray(dates).dtype, np.datetime64):
+        return int((dates[-1] - dates[0]) // np.timedelta64(1, "D"))
+    return int((dates[-1] - dates[0]).days)
+
+
+def _trade_stats(
+    n_runs: int,
+    pnl: np.ndarray | None,
+    pnl_pct: np.ndarray | None,
+    trade_run: np.ndarray | None,
+) -> dict[str, np.ndarray]:
+    """Per-run win/loss statistics as segmented sums over the trade columns."""
+    if pnl is None or len(pnl) == 0:
+        zeros = np.zeros(n_runs)
+        return {
+            "total_trades": np.zeros(n_runs, dtype=np.int64),
+            "winning_trades": np.zeros(n_runs, dtype=np.int64),
+            "losing_trades": np.zeros(n_runs, dtype=np.int64),
+            "win_rate": zeros,
+            "profit_factor": zeros.copy(),
+            "avg_trade_return": zeros.copy(),
+            "gross_profit": zeros.copy(),
+            "gross_loss": zeros.copy(),
+        }
+
+    pnl = np.asarray(pnl, dtype=np.float64)
+    pnl_pct = np.zeros_like(pnl) if pnl_pct is None else np.asarray(pnl_pct, dtype=np.float64)
+    runs = np.zeros(len(pnl), dtype=np.intp) if trade_run is None else np.asarray(trade_run)
+
+    winning = pnl > 0
+    losing = pnl < 0
+    count = np.bincount(runs, minlength=n_runs)
+    n_win = np.bincount(runs, weights=winning, minlength=n_runs).astype(np.int64)
+    n_loss = np.bincount(runs, weights=losing, minlength=n_runs).astype(np.int64)
+    profit = np.bincount(runs, weights=np.where(winning, pnl, 0.0), minlength=n_runs)
+    loss = np.abs(np.bincount(runs, weights=np.where(losing, pnl, 0.0), minlength=n_runs))
+    pct_sum = np.bincount(runs, weights=pnl_pct, minlength=n_runs)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        traded = count > 0
+        return {
+            "total_trades": count.astype(np.int64),
+            "winning_trades": n_win,
+            "losing_trades": n_loss,
+            "win_rate": np.where(traded, n_win / count * 100, 0.0),
+            "profit_factor": np.where((n_win > 0) & (n_loss > 0) & (loss > 0), profit / loss, 0.0),
+            "avg_trade_return": np.where(traded, pct_sum / count, 0.0),
+            "gross_profit": profit,
+            "gross_loss": loss,
+        }
+
+
+def compute_metrics(
+    equity: np.ndarray,
+    dates: np.ndarray,
+    initial_capital: float,
+    pnl: np.ndarray | None = None,
+    pnl_pct: np.ndarray | None = None,
+    trade_run: np.ndarray | None = None,
+    confidence_level: float = 0.95,
+    annualization: float = TRADING_DAYS_PER_YEAR,
+) -> MetricsArrays:
+    """
+    Compute performance metrics for one or many equity curves.
+
+    Args:
+        equity: Equity curve (periods,) or batch (runs x periods); shorter
+            runs are NaN-padded at the end (see stack_curves)
+        dates: Dates of the periods (shared by all runs; CAGR is zero when
+            fewer than two are given)
+        initial_capital: Starting capital of every run
+        pnl: Trade P&L column (all runs concatenated)
+        pnl_pct: Trade return column in percent, aligned with pnl
+        trade_run: Run index of each trade (None: all trades belong to run 0)
+        confidence_level: VaR/CVaR confidence level
+        annualization: Periods per year for Sharpe and Sortino
+
+    Returns:
+        MetricsArrays with one element per run (all zero for curves
+        shorter than two periods)
+    """
+    curves = np.atleast_2d(np.asarray(equity, dtype=np.float64))
+    n_runs, n_periods = curves.shape
+    trades = _trade_stats(n_runs, pnl, pnl_pct, trade_run)
+
+    if n_periods < 2:
+        zeros = np.zeros(n_runs)
+        return MetricsArrays(
+            total_return=zeros,
+            cagr=zeros,
+            mdd=zeros,
+            calmar_ratio=zeros,
+            sharpe_ratio=zeros,
+            sortino_ratio=zeros,
+            var=zeros,
+            cvar=zeros,
+            **trades,
+        )
+
+    padded = bool(np.isnan(curves).any())
+    if padded:
+        n_valid = (~np.isnan(curves)).sum(axis=1)
+        final = curves[np.arange(n_runs), np.maximum(n_valid, 1) - 1]
+        mean_of, std_of, percentile_of = np.nanmean, np.nanstd, np.nanpercentile
+    else:
+        final = curves[:, -1]
+        mean_of, std_of, percentile_of = np.mean, np.std, np.percentile
+    days = _calendar_days(dates)
+    sqrt_ann = np.sqrt(annualization)
+
+    with (
+        np.errstate(divide="ignore", invalid="ignore", over="ignore"),
+        warnings.catch_warnings(),
+    ):
+        # All-NaN rows of a padded batch are zeroed below
+        warnings.simplefilter("ignore", RuntimeWarning)
+        total_return = (final / initial_capital - 1) * 100
+        if days > 0 and initial_capital > 0:
+            growth = (final / initial_capital) ** (365.0 / days) - 1
+            cagr = np.where(final > 0, growth * 100, 0.0)
+        else:
+            cagr = np.zeros(n_runs)
+
+        peak = np.maximum.accumulate(curves, axis=1)
+        mdd = np.nanmax((peak - curves) / peak, axis=1) * 100
+        calmar = np.where(mdd > 0, cagr / mdd, 0.0)
+
+        returns = np.diff(curves, axis=1) / curves[:, :-1]
+        mean = mean_of(returns, axis=1)
+        std = std_of(returns, axis=1)
+        sharpe = np.where(std > 0, mean / std * sqrt_ann, 0.0)
+        downside_std = std_of(np.minimum(returns, 0.0), axis=1)
+        sortino = np.where(downside_std > 0, mean / downside_std * sqrt_ann, 0.0)
+
+        var = -percentile_of(returns, (1 - confidence_level) * 100, axis=1)
+        tail = returns <= -var[:, None]
+        tail_count = tail.sum(axis=1)
+        tail_mean = np.where(tail, returns, 0.0).sum(axis=1) / tail_count
+        cvar = np.where(tail_count > 0, -tail_mean, var)
+
+    if padded:
+        short = n_valid < 2
+        total_return, cagr, mdd, calmar, sharpe, sortino, var, cvar = (
+            np.where(short, 0.0, values)
+            for values in (total_return, cagr, mdd, calmar, sharpe, sortino, var, cvar)
+        )
+
+    return MetricsArrays(
+        total_return=total_return,
+        cagr=cagr,
+        mdd=mdd,
+        calmar_ratio=calmar,
+        sharpe_ratio=sharpe,
+        sortino_ratio=sortino,
+        var=var,
+        cvar=cvar,
+        **trades,
+    )
@@ -4,8 +4,10 @@ Backtesting data models.
 Common data structures used across backtesting engines.
 """
 
+from collections.abc import Callable
 from dataclasses import dataclass, field
 from datetime import date
+from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
@@ -17,6 +19,9 @@ from src.config import (
 )
 from src.risk.metrics import PortfolioRiskMetrics
 
+if TYPE_CHECKING:
+    from src.backtester.trade_ledger import TradeLedger
+
 
 @dataclass
 class BacktestConfig:
@@ -42,6 +47,16 @@ class BacktestConfig:
     )
     risk_free_rate: float = 0.0  # Risk-free rate for MPT (annualized)
     max_kelly: float = 0.25  # Maximum Kelly percentage (fractional Kelly)
+    # Re-solve MPT/risk parity weights every N bars while the candidate set is unchanged
+    portfolio_rebalance_bars: int = 1
+
+    # Early pruning settings (abort hopeless runs, e.g. during optimization)
+    prune_max_drawdown: float | None = None  # Abort once drawdown exceeds this (0.5 = 50%)
+    prune_min_trades: int | None = None  # Abort if fewer entries than this by prune_min_trades_bar
+    prune_min_trades_bar: int = 365  # Bar index at which prune_min_trades is enforced
+    # Caller predicate (equity_so_far, n_entries) -> True to abort; must be picklable
+    prune_predicate: Callable[[np.ndarray, int], bool] | None = None
+    prune_check_every: int = 1  # Evaluate pruning conditions every K bars
 
 
 @dataclass
@@ -101,6 +116,30 @@ class BacktestResult:
     # Portfolio risk metrics
     risk_metrics: PortfolioRiskMetrics | None = None
 
+    # Early pruning (metrics cover only the simulated prefix when pruned)
+    pruned: bool = False
+    prune_reason: str | None = None
+
+    # Per-stage timing profile ({stage: {count, total_ms, ...}}), set when profiling is enabled
+    profile: dict[str, dict[str, float]] | None = None
+
+    # Columnar trade storage backing `trades` (vectorized engine)
+    trade_ledger: "TradeLedger | None" = None
+
+    def attach_ledger(self, ledger: "TradeLedger") -> None:
+        """Back `trades` by a ledger; Trade objects are built on first access."""
+        self.trade_ledger = ledger
+        self.__dict__.pop("trades", None)
+
+    def __getattr__(self, name: str) -> Any:
+        # Only reached for attributes missing from the instance: `trades` after attach_ledger()
+        ledger = self.__dict__.get("trade_ledger")
+        if name == "trades" and ledger is not None:
+            trades = ledger.to_trades(self.dates)
+            self.__dict__["trades"] = trades
+            return trades
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
     def summary(self) -> str:
         """Generate summary string.
 
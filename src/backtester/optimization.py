@@ -1,13 +1,16 @@
 """
 Parameter optimization for trading strategies.
 
-Provides grid search and random search optimization methods.
+Provides grid search, random search, successive halving and
+model-based (Bayesian) optimization methods.
 """
 
 from collections.abc import Callable
 from typing import Any
 
-from src.backtester.models import BacktestConfig
+from src.backtester.models import BacktestConfig, BacktestResult
+from src.backtester.optimization_bayesian import bayesian_search
+from src.backtester.optimization_halving import successive_halving_search
 from src.backtester.optimization_models import OptimizationResult
 from src.backtester.optimization_search import grid_search, random_search
 from src.strategies.base import Strategy
@@ -23,6 +26,8 @@ class ParameterOptimizer:
     Supports:
     - Grid Search: Test all parameter combinations (thorough but slow)
     - Random Search: Sample random combinations (fast but may miss optimum)
+    - Successive Halving: Screen all combinations on recent data, promote the best
+    - Bayesian (TPE): Propose promising combinations in batches from past scores
 
     Example:
         >>> optimizer = ParameterOptimizer(
@@ -65,6 +70,10 @@ class ParameterOptimizer:
         maximize: bool = True,
         method: str = "grid",
         n_iter: int = 100,
+        eta: int = 3,
+        min_window_months: int = 6,
+        batch_size: int | None = None,
+        progress_callback: Callable[[str, BacktestResult], None] | None = None,
     ) -> OptimizationResult:
         """
         Optimize parameters using specified method.
@@ -73,8 +82,12 @@ class ParameterOptimizer:
             param_grid: Parameter names to value lists mapping
             metric: Metric to optimize (sharpe_ratio, cagr, calmar_ratio, etc.)
             maximize: If True, maximize metric; if False, minimize
-            method: Optimization method ('grid' or 'random')
-            n_iter: Number of iterations for random search
+            method: Optimization method ('grid', 'random', 'halving' or 'bayesian')
+            n_iter: Number of iterations for random and bayesian search
+            eta: Reduction factor between successive halving rungs
+            min_window_months: First successive halving window in months
+            batch_size: Proposals per batch for bayesian search
+            progress_callback: Called with (task_name, result) as each backtest finishes
 
         Returns:
             OptimizationResult with best parameters and results
@@ -89,6 +102,7 @@ class ParameterOptimizer:
                 metric=metric,
                 maximize=maximize,
                 n_workers=self.n_workers,
+                progress_callback=progress_callback,
             )
         elif method == "random":
             return random_search(
@@ -101,6 +115,35 @@ class ParameterOptimizer:
                 maximize=maximize,
                 n_iter=n_iter,
                 n_workers=self.n_workers,
+                progress_callback=progress_callback,
+            )
+        elif method == "halving":
+            return successive_halving_search(
+                strategy_factory=self.strategy_factory,
+                param_grid=param_grid,
+                tickers=self.tickers,
+                interval=self.interval,
+                config=self.config,
+                metric=metric,
+                maximize=maximize,
+                eta=eta,
+                min_window_months=min_window_months,
+                n_workers=self.n_workers,
+                progress_callback=progress_callback,
+            )
+        elif method == "bayesian":
+            return bayesian_search(
+                strategy_factory=self.strategy_factory,
+                param_grid=param_grid,
+                tickers=self.tickers,
+                interval=self.interval,
+                config=self.config,
+                metric=metric,
+                maximize=maximize,
+                n_iter=n_iter,
+                n_workers=self.n_workers,
+                progress_callback=progress_callback,
+                batch_size=batch_size,
             )
         else:
             raise ValueError(f"Unknown optimization method: {method}")
@@ -117,6 +160,10 @@ def optimize_strategy_parameters(
     method: str = "grid",
     n_iter: int = 100,
     n_workers: int | None = None,
+    eta: int = 3,
+    min_window_months: int = 6,
+    batch_size: int | None = None,
+    progress_callback: Callable[[str, BacktestResult], None] | None = None,
 ) -> OptimizationResult:
     """
     Optimize strategy parameters (convenience function).
@@ -129,9 +176,13 @@ def optimize_strategy_parameters(
         config: Backtest configuration
         metric: Metric to optimize
         maximize: If True, maximize metric
-        method: Optimization method ('grid' or 'random')
-        n_iter: Number of iterations for random search
+        method: Optimization method ('grid', 'random', 'halving' or 'bayesian')
+        n_iter: Number of iterations for random and bayesian search
         n_workers: Number of parallel workers
+        eta: Reduction factor between successive halving rungs
+        min_window_months: First successive halving window in months
+        batch_size: Proposals per batch for bayesian search
+        progress_callback: Called with (task_name, result) as each backtest finishes
 
     Returns:
         OptimizationResult with best parameters
@@ -150,6 +201,10 @@ def optimize_strategy_parameters(
         maximize=maximize,
         method=method,
         n_iter=n_iter,
+        eta=eta,
+        min_window_months=min_window_months,
+        batch_size=batch_size,
+        progress_callback=progress_callback,
     )
 
 
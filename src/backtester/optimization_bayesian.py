@@ -0,0 +1,200 @@
+"""
+Model-based (Bayesian) search for parameter optimization.
+
+Uses a Tree-structured Parzen Estimator over the discrete parameter grid:
+observed scores are split into a "good" and a "bad" group, per-parameter
+value densities are estimated for each group, and the unevaluated
+combinations with the highest good/bad likelihood ratio are proposed next.
+Proposals are made in batches so that each batch fills the parallel runner.
+"""
+
+import math
+import random
+from collections.abc import Callable
+from itertools import product
+from typing import Any
+
+from src.backtester.models import BacktestConfig, BacktestResult
+from src.backtester.optimization_models import OptimizationResult
+from src.backtester.optimization_search import collect_results, extract_metric
+from src.backtester.parallel import ParallelBacktestRunner, ParallelBacktestTask
+from src.strategies.base import Strategy
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Fraction of observations treated as "good" when fitting the densities
+TPE_GAMMA = 0.25
+# Number of samples drawn from the "good" density per proposed combination
+TPE_CANDIDATES_PER_PROPOSAL = 24
+
+
+def bayesian_search(
+    strategy_factory: Callable[[dict[str, Any]], Strategy],
+    param_grid: dict[str, list[Any]],
+    tickers: list[str],
+    interval: str,
+    config: BacktestConfig,
+    metric: str,
+    maximize: bool,
+    n_iter: int,
+    n_workers: int | None = None,
+    batch_size: int | None = None,
+    n_initial: int | None = None,
+    seed: int | None = None,
+    progress_callback: Callable[[str, BacktestResult], None] | None = None,
+) -> OptimizationResult:
+    """Perform TPE-based search over parameter space.
+
+    Starts with ``n_initial`` random combinations, then repeatedly proposes
+    ``batch_size`` unevaluated combinations from the fitted model until
+    ``n_iter`` backtests have run or the grid is exhausted.
+
+    Args:
+        strategy_factory: Function that creates a strategy from parameters
+        param_grid: Parameter names to value lists mapping
+        tickers: List of tickers to backtest
+        interval: Data interval
+        config: Backtest configuration
+        metric: Metric to optimize
+        maximize: If True, maximize metric
+        n_iter: Total number of backtests to run
+        n_workers: Number of parallel workers
+        batch_size: Proposals per batch (defaults to the runner's worker count)
+        n_initial: Random warm-up evaluations (defaults to max(batch_size, 10))
+        seed: Random seed for reproducible proposals
+        progress_callback: Called with (task_name, result) as each backtest finishes
+
+    Returns:
+        OptimizationResult over all evaluated combinations
+    """
+    rng = random.Random(seed)
+    param_names = list(param_grid.keys())
+    n_choices = [len(values) for values in param_grid.values()]
+    budget = min(n_iter, math.prod(n_choices))
+
+    runner = ParallelBacktestRunner(n_workers=n_workers)
+    batch_size = max(1, batch_size or runner.n_workers)
+    n_initial = min(budget, n_initial or max(batch_size, 10))
+
+    logger.info(f"Bayesian search: {budget} evaluations in batches of {batch_size}")
+
+    observed: dict[tuple[int, ...], float] = {}
+    all_tasks: list[ParallelBacktestTask] = []
+    all_results: dict[str, BacktestResult] = {}
+
+    while len(observed) < budget:
+        n_batch = (
+            n_initial - len(observed)
+            if len(observed) < n_initial
+            else min(batch_size, budget - len(observed))
+        )
+        if len(observed) < n_initial:
+            batch = _sample_random(n_choices, observed, n_batch, rng)
+        else:
+            batch = _propose_batch(n_choices, observed, n_batch, rng)
+
+        tasks: list[ParallelBacktestTask] = []
+        for combo in batch:
+            params = {name: param_grid[name][i] for name, i in zip(param_names, combo, strict=True)}
+            strategy = strategy_factory(params)
+            tasks.append(
+                ParallelBacktestTask(
+                    name=f"{strategy.name}_bo{len(all_tasks) + len(tasks)}",
+                    strategy=strategy,
+                    tickers=tickers,
+                    interval=interval,
+                    config=config,
+                    params=params,
+                )
+            )
+
+        batch_results = runner.run(tasks, progress_callback=progress_callback)
+        for combo, task in zip(batch, tasks, strict=True):
+            result = batch_results.get(task.name)
+            if result is None or result.pruned:
+                # Failed and pruned runs rank worst; a pruned run's partial
+                # score would otherwise steer the densities
+                observed[combo] = -math.inf
+                continue
+            score = extract_metric(result, metric)
+            observed[combo] = score if maximize else -score
+
+        all_tasks.extend(tasks)
+        all_results.update(batch_results)
+
+    return collect_results(all_tasks, all_results, metric, maximize)
+
+
+def _sample_random(
+    n_choices: list[int],
+    observed: dict[tuple[int, ...], float],
+    n: int,
+    rng: random.Random,
+) -> list[tuple[int, ...]]:
+    """Sample up to n distinct, unevaluated combinations uniformly."""
+    batch: list[tuple[int, ...]] = []
+    attempts = 0
+    while len(batch) < n and attempts < n * 100:
+        combo = tuple(rng.randrange(k) for k in n_choices)
+        if combo not in observed and combo not in batch:
+            batch.append(combo)
+        attempts += 1
+
+    if len(batch) < n:
+        # Dense grid: enumerate remaining combinations instead of rejection sampling
+        remaining = [
+            c for c in product(*map(range, n_choices)) if c not in observed and c not in batch
+        ]
+        rng.shuffle(remaining)
+        batch.extend(remaining[: n - len(batch)])
+
+    return batch
+
+
+def _propose_batch(
+    n_choices: list[int],
+    observed: dict[tuple[int, ...], float],
+    n: int,
+    rng: random.Random,
+) -> list[tuple[int, ...]]:
+    """Propose n unevaluated combinations with the best good/bad density ratio."""
+    ranked = sorted(observed.items(), key=lambda item: item[1], reverse=True)
+    n_good = max(1, math.ceil(TPE_GAMMA * len(ranked)))
+    good = [combo for combo, _ in ranked[:n_good]]
+    bad = [combo for combo, _ in ranked[n_good:]]
+
+    good_density = _fit_density(n_choices, good)
+    bad_density = _fit_density(n_choices, bad)
+
+    scored: dict[tuple[int, ...], float] = {}
+    for _ in range(n * TPE_CANDIDATES_PER_PROPOSAL):
+        combo = tuple(
+            rng.choices(range(k), weights=good_density[p])[0] for p, k in enumerate(n_choices)
+        )
+        if combo in observed or combo in scored:
+            continue
+        scored[combo] = sum(
+            math.log(good_density[p][i]) - math.log(bad_density[p][i]) for p, i in enumerate(combo)
+        )
+
+    batch = sorted(scored, key=lambda c: scored[c], reverse=True)[:n]
+    if len(batch) < n:
+        taken = {**observed, **dict.fromkeys(batch, 0.0)}
+        batch.extend(_sample_random(n_choices, taken, n - len(batch), rng))
+    return batch
+
+
+def _fit_density(n_choices: list[int], combos: list[tuple[int, ...]]) -> list[list[float]]:
+    """Estimate per-parameter categorical densities with add-one smoothing."""
+    density: list[list[float]] = []
+    for p, k in enumerate(n_choices):
+        counts = [1.0] * k
+        for combo in combos:
+            counts[combo[p]] += 1.0
+        total = sum(counts)
+        density.append([c / total for c in counts])
+    return density
+
+
+__all__ = ["bayesian_search"]
@@ -0,0 +1,204 @@
+"""
+Successive halving search for parameter optimization.
+
+Evaluates every combination on a short, recent time window first and
+promotes only the top 1/eta fraction to progressively longer windows.
+Survivors of the last rung are re-run on the full history, so the final
+ranking is comparable with grid search.
+"""
+
+import math
+from collections.abc import Callable
+from datetime import date
+from itertools import product
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from src.backtester.models import BacktestConfig, BacktestResult
+from src.backtester.optimization_models import OptimizationResult
+from src.backtester.optimization_search import collect_results
+from src.backtester.parallel import ParallelBacktestRunner, ParallelBacktestTask
+from src.config import RAW_DATA_DIR
+from src.strategies.base import Strategy
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+def successive_halving_search(
+    strategy_factory: Callable[[dict[str, Any]], Strategy],
+    param_grid: dict[str, list[Any]],
+    tickers: list[str],
+    interval: str,
+    config: BacktestConfig,
+    metric: str,
+    maximize: bool,
+    eta: int = 3,
+    min_window_months: int = 6,
+    n_workers: int | None = None,
+    data_dir: Path | None = None,
+    progress_callback: Callable[[str, BacktestResult], None] | None = None,
+) -> OptimizationResult:
+    """Perform successive halving over time-window budgets.
+
+    Rung k backtests the surviving candidates on the last
+    ``min_window_months * eta**k`` months of data and keeps the best
+    ``ceil(n / eta)``. Rungs stop once the window would cover the full
+    history; the remaining candidates are then evaluated on all data.
+
+    Args:
+        strategy_factory: Function that creates a strategy from parameters
+        param_grid: Parameter names to value lists mapping
+        tickers: List of tickers to backtest
+        interval: Data interval
+        config: Backtest configuration
+        metric: Metric to optimize
+        maximize: If True, maximize metric
+        eta: Reduction factor between rungs (keep top 1/eta)
+        min_window_months: Window length of the first rung in months
+        n_workers: Number of parallel workers
+        data_dir: Directory with raw parquet files (defaults to RAW_DATA_DIR)
+        progress_callback: Called with (task_name, result) as each backtest finishes
+
+    Returns:
+        OptimizationResult ranked on full-history results of the finalists
+    """
+    if eta < 2:
+        raise ValueError(f"eta must be >= 2, got {eta}")
+    if min_window_months < 1:
+        raise ValueError(f"min_window_months must be >= 1, got {min_window_months}")
+
+    param_names = list(param_grid.keys())
+    candidates = [
+        dict(zip(param_names, combo, strict=False)) for combo in product(*param_grid.values())
+    ]
+    data_dir = data_dir or RAW_DATA_DIR
+    windows = _build_window_starts(tickers, interval, data_dir, eta, min_window_months)
+
+    logger.info(
+        f"Successive halving: {len(candidates)} combinations, "
+        f"{len(windows)} partial rung(s), eta={eta}"
+    )
+
+    runner = ParallelBacktestRunner(n_workers=n_workers)
+
+    for rung, window_start in enumerate(windows):
+        if len(candidates) <= 1:
+            break
+
+        tasks = _build_tasks(
+            strategy_factory, candidates, tickers, interval, config, rung, data_dir
+        )
+        for task in tasks:
+            task.start_date = window_start
+
+        rung_result = collect_results(
+            tasks, runner.run(tasks, progress_callback=progress_callback), metric, maximize
+        )
+        n_keep = max(1, math.ceil(len(candidates) / eta))
+        candidates = [params for params, _, _ in rung_result.all_results[:n_keep]]
+
+        logger.info(
+            f"Rung {rung} (from {window_start}): promoted {len(candidates)} "
+            f"of {len(tasks)} combinations"
+        )
+
+    tasks = _build_tasks(
+        strategy_factory, candidates, tickers, interval, config, len(windows), data_dir
+    )
+    return collect_results(
+        tasks, runner.run(tasks, progress_callback=progress_callback), metric, maximize
+    )
+
+
+def _build_tasks(
+    strategy_factory: Callable[[dict[str, Any]], Strategy],
+    candidates: list[dict[str, Any]],
+    tickers: list[str],
+    interval: str,
+    config: BacktestConfig,
+    rung: int,
+    data_dir: Path,
+) -> list[ParallelBacktestTask]:
+    """Create backtest tasks for one rung with rung-unique task names."""
+    tasks = []
+    for params in candidates:
+        strategy = strategy_factory(params)
+        task_name = f"{strategy.name}_r{rung}_{'_'.join(str(v) for v in params.values())}"
+        tasks.append(
+            ParallelBacktestTask(
+                name=task_name,
+                strategy=strategy,
+                tickers=tickers,
+                interval=interval,
+                config=config,
+                params=params,
+                data_dir=data_dir,
+            )
+        )
+    return tasks
+
+
+def _build_window_starts(
+    tickers: list[str],
+    interval: str,
+    data_dir: Path,
+    eta: int,
+    min_window_months: int,
+) -> list[date]:
+    """Compute start dates of the partial rungs, shortest window first.
+
+    Returns an empty list when the data range cannot be determined, which
+    degrades the search to a single full-history evaluation.
+    """
+    date_range = _get_data_date_range(tickers, interval, data_dir)
+    if date_range is None:
+        logger.warning("Could not determine data range; skipping partial rungs")
+        return []
+
+    first, last = date_range
+    starts: list[date] = []
+    months = min_window_months
+    while True:
+        start = (pd.Timestamp(last) - pd.DateOffset(months=months)).date()
+        if start <= first:
+            break
+        starts.append(start)
+        months *= eta
+
+    return starts
+
+
+def _get_data_date_range(
+    tickers: list[str],
+    interval: str,
+    data_dir: Path,
+) -> tuple[date, date] | None:
+    """Get the (earliest, latest) date covered by the tickers' data files."""
+    first: date | None = None
+    last: date | None = None
+
+    for ticker in tickers:
+        filepath = data_dir / f"{ticker}_{interval}.parquet"
+        if not filepath.exists():
+            continue
+        try:
+            index = pd.DatetimeIndex(pd.read_parquet(filepath, columns=[]).index)
+        except Exception as e:
+            logger.warning(f"Failed to read date range from {filepath}: {e}")
+            continue
+        if len(index) == 0:
+            continue
+
+        ticker_first, ticker_last = index.min().date(), index.max().date()
+        first = ticker_first if first is None else min(first, ticker_first)
+        last = ticker_last if last is None else max(last, ticker_last)
+
+    if first is None or last is None:
+        return None
+    return first, last
+
+
+__all__ = ["successive_halving_search"]
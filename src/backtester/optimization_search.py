@@ -2,6 +2,7 @@
 Search algorithms for parameter optimization.
 
 Contains grid search and random search implementations.
+Adaptive methods live in optimization_halving and optimization_bayesian.
 """
 
 import random
@@ -30,6 +31,7 @@ def grid_search(
     metric: str,
     maximize: bool,
     n_workers: int | None = None,
+    progress_callback: Callable[[str, BacktestResult], None] | None = None,
 ) -> OptimizationResult:
     """Perform grid search over parameter space.
 
@@ -44,6 +46,7 @@ def grid_search(
         metric: Metric to optimize
         maximize: If True, maximize metric
         n_workers: Number of parallel workers
+        progress_callback: Called with (task_name, result) as each backtest finishes
 
     Returns:
         OptimizationResult with best parameters
@@ -71,9 +74,9 @@ def grid_search(
         )
 
     runner = ParallelBacktestRunner(n_workers=n_workers)
-    results = runner.run(tasks)
+    results = runner.run(tasks, progress_callback=progress_callback)
 
-    return _collect_results(tasks, results, metric, maximize)
+    return collect_results(tasks, results, metric, maximize)
 
 
 def random_search(
@@ -86,6 +89,7 @@ def random_search(
     maximize: bool,
     n_iter: int,
     n_workers: int | None = None,
+    progress_callback: Callable[[str, BacktestResult], None] | None = None,
 ) -> OptimizationResult:
     """Perform random search over parameter space.
 
@@ -101,6 +105,7 @@ def random_search(
         maximize: If True, maximize metric
         n_iter: Number of random iterations
         n_workers: Number of parallel workers
+        progress_callback: Called with (task_name, result) as each backtest finishes
 
     Returns:
         OptimizationResult with best parameters
@@ -124,12 +129,12 @@ def random_search(
         )
 
     runner = ParallelBacktestRunner(n_workers=n_workers)
-    results = runner.run(tasks)
+    results = runner.run(tasks, progress_callback=progress_callback)
 
-    return _collect_results(tasks, results, metric, maximize)
+    return collect_results(tasks, results, metric, maximize)
 
 
-def _collect_results(
+def collect_results(
     tasks: list[ParallelBacktestTask],
     results: dict[str, BacktestResult],
     metric: str,
@@ -141,10 +146,12 @@ def _collect_results(
     for task in tasks:
         result = results.get(task.name)
         if result and task.params:
-            score = _extract_metric(result, metric)
+            score = extract_metric(result, metric)
             all_results.append((task.params, result, score))
 
     all_results.sort(key=lambda x: x[2], reverse=maximize)
+    # Stable sort: pruned (partial) runs rank below every completed run
+    all_results.sort(key=lambda x: x[1].pruned)
 
     best_params, best_result, best_score = (
         all_results[0] if all_results else ({}, BacktestResult(), 0.0)
@@ -159,7 +166,7 @@ def _collect_results(
     )
 
 
-def _extract_metric(result: BacktestResult, metric: str) -> float:
+def extract_metric(result: BacktestResult, metric: str) -> float:
     """Extract metric value from backtest result."""
     metric_map = {
         "sharpe_ratio": "sharpe_ratio",
@@ -173,4 +180,4 @@ def _extract_metric(result: BacktestResult, metric: str) -> float:
     return getattr(result, attr, 0.0)
 
 
-__all__ = ["grid_search", "random_search"]
+__all__ = ["grid_search", "random_search", "collect_results", "extract_metric"]
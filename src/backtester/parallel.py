@@ -11,9 +11,12 @@ import multiprocessing as mp
 from collections.abc import Callable
 from dataclasses import dataclass
 from datetime import date
+from pathlib import Path
 from typing import Any
 
-from src.backtester.engine import run_backtest
+import pandas as pd
+
+from src.backtester.engine import VectorizedBacktestEngine, run_backtest
 from src.backtester.models import BacktestConfig, BacktestResult
 from src.backtester.parallel_utils import compare_strategies as compare_strategies
 from src.backtester.parallel_utils import optimize_parameters as optimize_parameters
@@ -35,6 +38,7 @@ class ParallelBacktestTask:
     params: dict[str, Any] | None = None  # Store parameters for optimization
     start_date: date | None = None  # Start date for date filtering
     end_date: date | None = None  # End date for date filtering
+    data_dir: Path | None = None  # Raw data directory (defaults to RAW_DATA_DIR)
 
     def __repr__(self) -> str:
         return f"ParallelBacktestTask(name={self.name}, tickers={self.tickers})"
@@ -51,25 +55,52 @@ def _run_single_backtest(task: ParallelBacktestTask) -> tuple[str, BacktestResul
         Tuple of (task_name, BacktestResult)
     """
     try:
-        logger.info(f"Starting backtest: {task.name}")
+        logger.info("Starting backtest: %s", task.name)
         result = run_backtest(
             strategy=task.strategy,
             tickers=task.tickers,
             interval=task.interval,
+            data_dir=task.data_dir,
             config=task.config,
             start_date=task.start_date,
             end_date=task.end_date,
         )
-        logger.info(f"Completed backtest: {task.name}")
+        logger.info("Completed backtest: %s", task.name)
         return (task.name, result)
     except Exception as e:
-        logger.error(f"Error in backtest {task.name}: {e}", exc_info=True)
+        logger.error("Error in backtest %s: %s", task.name, e, exc_info=True)
         # Return empty result on error
         empty_result = BacktestResult()
         empty_result.strategy_name = task.name
         return (task.name, empty_result)
 
 
+# Per-process data for run_on_data (set once per worker by the pool initializer)
+_shared_data: dict[str, pd.DataFrame] = {}
+_shared_config: BacktestConfig | None = None
+
+
+def _init_shared_data(raw_data: dict[str, pd.DataFrame], config: BacktestConfig | None) -> None:
+    """Pool initializer: keep the shared OHLCV data in the worker process."""
+    global _shared_data, _shared_config
+    _shared_data = raw_data
+    _shared_config = config
+
+
+def _run_on_shared_data(
+    item: tuple[str, Callable[..., Strategy], dict[str, Any]],
+) -> tuple[str, BacktestResult]:
+    """Run one parameter set against the worker's shared data."""
+    name, strategy_factory, params = item
+    try:
+        strategy = strategy_factory(**params)
+        result = VectorizedBacktestEngine(_shared_config).run_on_data(strategy, _shared_data)
+        return (name, result)
+    except Exception as e:
+        logger.error("Error in backtest %s: %s", name, e, exc_info=True)
+        return (name, BacktestResult(strategy_name=name))
+
+
 class ParallelBacktestRunner:
     """
     Runs multiple backtests in parallel.
@@ -99,7 +130,7 @@ class ParallelBacktestRunner:
 
         Args:
             tasks: List of backtest tasks to execute
-            progress_callback: Optional callback function called after each task completes
+            progress_callback: Optional callback function called as each task completes
                               Signature: (task_name: str, result: BacktestResult) -> None
 
         Returns:
@@ -111,17 +142,73 @@ class ParallelBacktestRunner:
 
         logger.info(f"Running {len(tasks)} backtests with {self.n_workers} workers")
 
-        # Use multiprocessing Pool for parallel execution
+        # Use multiprocessing Pool for parallel execution; results stream in as they finish
+        results_dict: dict[str, BacktestResult] = {}
         with mp.Pool(processes=self.n_workers) as pool:
-            results = pool.map(_run_single_backtest, tasks)
+            for task_name, result in pool.imap_unordered(_run_single_backtest, tasks):
+                results_dict[task_name] = result
+                if progress_callback:
+                    progress_callback(task_name, result)
+
+        logger.info(f"Completed {len(results_dict)} backtests")
+        return results_dict
+
+    def run_on_data(
+        self,
+        strategy_factory: Callable[..., Strategy],
+        param_sets: dict[str, dict[str, Any]],
+        raw_data: dict[str, pd.DataFrame],
+        config: BacktestConfig | None = None,
+        progress_callback: Callable[[str, BacktestResult], None] | None = None,
+    ) -> dict[str, BacktestResult]:
+        """
+        Run parameter sets against OHLCV data loaded once.
+
+        The data is sent to each worker once (pool initializer) instead of
+        being re-read from parquet for every task.
+
+        Args:
+            strategy_factory: Picklable callable building a strategy from params
+                              (e.g. a Strategy subclass)
+            param_sets: {task name: strategy keyword arguments}
+            raw_data: {ticker: OHLCV DataFrame}
+            config: Backtest configuration shared by all tasks
+            progress_callback: Optional callback called as each task completes
+
+        Returns:
+            Dictionary mapping task names to BacktestResult objects
+        """
+        if not param_sets:
+            logger.warning("No parameter sets provided to parallel backtest runner")
+            return {}
+
+        items = [(name, strategy_factory, params) for name, params in param_sets.items()]
+        n_workers = min(self.n_workers, len(items))
+        logger.info(f"Running {len(items)} backtests on shared data with {n_workers} workers")
 
-        # Convert to dictionary
         results_dict: dict[str, BacktestResult] = {}
-        for task_name, result in results:
+
+        def collect(task_name: str, result: BacktestResult) -> None:
             results_dict[task_name] = result
             if progress_callback:
                 progress_callback(task_name, result)
 
+        if n_workers == 1:
+            # In-process: no pool start-up or data pickling
+            _init_shared_data(raw_data, config)
+            try:
+                for item in items:
+                    collect(*_run_on_shared_data(item))
+            finally:
+                # Do not keep the caller's data alive in module globals
+                _init_shared_data({}, None)
+        else:
+            with mp.Pool(
+                processes=n_workers, initializer=_init_shared_data, initargs=(raw_data, config)
+            ) as pool:
+                for task_name, result in pool.imap_unordered(_run_on_shared_data, items):
+                    collect(task_name, result)
+
         logger.info(f"Completed {len(results_dict)} backtests")
         return results_dict
 
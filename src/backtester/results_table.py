@@ -0,0 +1,132 @@
+"""
+Partitioned backtest results table.
+
+Scheduled backtests (airflow/dags/backtest_dag.py) write one row per
+(param set, symbol) to a parquet table partitioned by run date, which the
+dbt model stg_backtest_results reads directly:
+
+    {results_dir}/run_date=YYYYMMDD/results.parquet
+
+Return and drawdown columns are fractions (0.12 = 12%); max_drawdown is
+negative, matching the warehouse convention.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.backtester.models import BacktestResult
+
+__all__ = [
+    "PORTFOLIO_SYMBOL",
+    "RESULT_COLUMNS",
+    "buy_and_hold_return",
+    "result_row",
+    "write_results_table",
+]
+
+# Symbol value of rows describing a multi-asset portfolio run
+PORTFOLIO_SYMBOL = "PORTFOLIO"
+
+RESULT_COLUMNS: tuple[str, ...] = (
+    "symbol",
+    "strategy",
+    "param_set",
+    "params",
+    "status",
+    "total_return",
+    "buy_hold_return",
+    "sharpe_ratio",
+    "max_drawdown",
+    "cagr",
+    "trade_count",
+    "data_rows",
+    "backtest_date",
+)
+
+_RESULTS_FILE = "results.parquet"
+
+
+def buy_and_hold_return(df: pd.DataFrame) -> float:
+    """Return of holding from the first to the last close (fraction)."""
+    closes = df["close"].dropna().to_numpy(dtype=np.float64)
+    if len(closes) < 2 or closes[0] == 0:
+        return 0.0
+    return float(closes[-1] / closes[0] - 1)
+
+
+def result_row(
+    result: BacktestResult,
+    symbol: str,
+    strategy: str,
+    param_set: str = "default",
+    params: dict[str, Any] | None = None,
+    buy_hold_return: float = 0.0,
+    data_rows: int | None = None,
+    backtest_date: datetime | None = None,
+) -> dict[str, Any]:
+    """
+    Convert a BacktestResult into a results table row.
+
+    Args:
+        result: Engine result (percent-based metrics)
+        symbol: Symbol, or PORTFOLIO_SYMBOL for multi-asset runs
+        strategy: Strategy identifier
+        param_set: Parameter set name ("default" for the standard run)
+        params: Strategy parameters (stored as JSON)
+        buy_hold_return: Buy-and-hold return over the same data (fraction)
+        data_rows: Number of input rows (default: equity curve length)
+        backtest_date: Run timestamp (default: now)
+
+    Returns:
+        Row dictionary with RESULT_COLUMNS keys
+    """
+    return {
+        "symbol": symbol,
+        "strategy": strategy,
+        "param_set": param_set,
+        "params": json.dumps(params or {}, sort_keys=True, default=str),
+        "status": "success" if len(result.equity_curve) else "no_data",
+        "total_return": result.total_return / 100,
+        "buy_hold_return": buy_hold_return,
+        "sharpe_ratio": result.sharpe_ratio,
+        "max_drawdown": -result.mdd / 100,
+        "cagr": result.cagr / 100,
+        "trade_count": result.total_trades,
+        "data_rows": len(result.equity_curve) if data_rows is None else data_rows,
+        "backtest_date": (backtest_date or datetime.now()).isoformat(),
+    }
+
+
+def write_results_table(
+    rows: list[dict[str, Any]],
+    results_dir: Path | str,
+    run_date: str,
+) -> Path:
+    """
+    Write a run's rows to its date partition (replacing an earlier write).
+
+    Args:
+        rows: Rows from result_row (or dicts with the same keys)
+        results_dir: Results table root directory
+        run_date: Partition value (YYYYMMDD)
+
+    Returns:
+        Path of the written partition file
+    """
+    table = pd.DataFrame(rows, columns=list(RESULT_COLUMNS))
+    path = Path(results_dir) / f"run_date={run_date}" / _RESULTS_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    # Hidden temporary name: partition readers skip it until the rename
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    table.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+    return path
@@ -0,0 +1,269 @@
+"""
+Columnar trade ledger for vectorized backtesting.
+
+Trades are appended to preallocated, typed NumPy columns (amortized
+doubling growth) instead of one dict per trade. Tickers, dates and exit
+reasons are stored as integer codes into the ticker list, the simulation's
+date array and EXIT_REASONS. Statistics read the columns directly;
+DataFrame and Arrow views wrap them without copying numeric data, and
+Trade objects are only built when a caller asks for them.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+import pandas as pd
+
+from src.backtester.models import Trade
+
+if TYPE_CHECKING:
+    import pyarrow as pa
+
+__all__ = ["EXIT_REASONS", "TRADE_DTYPE", "TradeLedger"]
+
+# Codes of the exit_reason column
+EXIT_REASONS: tuple[str, ...] = (
+    "signal",
+    "stop_loss",
+    "take_profit",
+    "trailing_stop",
+    "whipsaw",
+    "open",
+)
+_REASON_CODES = {reason: code for code, reason in enumerate(EXIT_REASONS)}
+
+# Column schema (also the dtype of to_records())
+TRADE_DTYPE = np.dtype(
+    [
+        ("ticker_id", np.int32),
+        ("entry_idx", np.int32),
+        ("exit_idx", np.int32),
+        ("entry_price", np.float64),
+        ("exit_price", np.float64),
+        ("amount", np.float64),
+        ("pnl", np.float64),
+        ("pnl_pct", np.float64),
+        ("commission_cost", np.float64),
+        ("slippage_cost", np.float64),
+        ("exit_reason", np.int8),
+    ]
+)
+
+DEFAULT_CAPACITY = 256
+
+
+def _take_dates(dates: np.ndarray, idx: np.ndarray) -> list[Any]:
+    """Dates at indices as Python objects (date/Timestamp, like the date array holds)."""
+    taken = dates[idx]
+    if taken.dtype.kind == "M":
+        return list(pd.DatetimeIndex(taken))
+    return list(taken.tolist())
+
+
+class TradeLedger:
+    """
+    Growable columnar store of closed trades.
+
+    Columns are contiguous arrays (struct of arrays, schema TRADE_DTYPE), so
+    column() slices, Arrow buffers and DataFrame columns share memory with
+    the ledger.
+    """
+
+    def __init__(self, tickers: Sequence[str], capacity: int = DEFAULT_CAPACITY) -> None:
+        """
+        Initialize an empty ledger.
+
+        Args:
+            tickers: Ticker symbols; ticker_id indexes this list
+            capacity: Initial number of preallocated rows
+        """
+        self.tickers = list(tickers)
+        self._size = 0
+        self._columns: dict[str, np.ndarray] = {
+            name: np.empty(max(1, capacity), dtype=TRADE_DTYPE[name])
+            for name in TRADE_DTYPE.names or ()
+        }
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def capacity(self) -> int:
+        """Rows allocated."""
+        return len(self._columns["pnl"])
+
+    def _grow(self) -> None:
+        new_capacity = self.capacity * 2
+        for name, col in self._columns.items():
+            grown = np.empty(new_capacity, dtype=col.dtype)
+            grown[: self._size] = col[: self._size]
+            self._columns[name] = grown
+
+    def append(
+        self,
+        ticker_id: int,
+        entry_idx: int,
+        exit_idx: int,
+        entry_price: float,
+        exit_price: float,
+        amount: float,
+        pnl: float,
+        pnl_pct: float,
+        commission_cost: float = 0.0,
+        slippage_cost: float = 0.0,
+        exit_reason: str = "signal",
+    ) -> None:
+        """
+        Record a closed trade.
+
+        Args:
+            ticker_id: Index into tickers
+            entry_idx: Date index of the entry
+            exit_idx: Date index of the exit
+            entry_price: Entry price
+            exit_price: Exit price
+            amount: Position size in units
+            pnl: Profit and loss
+            pnl_pct: Return in percent
+            commission_cost: Commission paid
+            slippage_cost: Slippage cost
+            exit_reason: One of EXIT_REASONS
+        """
+        if self._size == self.capacity:
+            self._grow()
+        i = self._size
+        cols = self._columns
+        cols["ticker_id"][i] = ticker_id
+        cols["entry_idx"][i] = entry_idx
+        cols["exit_idx"][i] = exit_idx
+        cols["entry_price"][i] = entry_price
+        cols["exit_price"][i] = exit_price
+        cols["amount"][i] = amount
+        cols["pnl"][i] = pnl
+        cols["pnl_pct"][i] = pnl_pct
+        cols["commission_cost"][i] = commission_cost
+        cols["slippage_cost"][i] = slippage_cost
+        cols["exit_reason"][i] = _REASON_CODES[exit_reason]
+        self._size = i + 1
+
+    def column(self, name: str) -> np.ndarray:
+        """View of one column (valid until the next append that grows the ledger)."""
+        return self._columns[name][: self._size]
+
+    def to_records(self) -> np.ndarray:
+        """Copy of all trades as a structured array (dtype TRADE_DTYPE)."""
+        records = np.empty(self._size, dtype=TRADE_DTYPE)
+        for name in TRADE_DTYPE.names or ():
+            records[name] = self.column(name)
+        return records
+
+    def to_frame(self, dates: np.ndarray) -> pd.DataFrame:
+        """
+        Trades as a DataFrame with the legacy trade columns.
+
+        Numeric columns wrap the ledger arrays without copying; tickers,
+        dates and exit reasons are decoded from their integer codes.
+
+        Args:
+            dates: Simulation date array the entry/exit indices refer to
+
+        Returns:
+            DataFrame (empty when there are no trades)
+        """
+        if not self._size:
+            return pd.DataFrame()
+        dates = np.asarray(dates)
+        reasons = self.column("exit_reason")
+        data: dict[str, Any] = {
+            "ticker": np.asarray(self.tickers, dtype=object)[self.column("ticker_id")],
+            "entry_date": dates[self.column("entry_idx")],
+            "entry_price": self.column("entry_price"),
+            "exit_date": dates[self.column("exit_idx")],
+            "exit_price": self.column("exit_price"),
+            "amount": self.column("amount"),
+            "pnl": self.column("pnl"),
+            "pnl_pct": self.column("pnl_pct"),
+            "is_whipsaw": reasons == _REASON_CODES["whipsaw"],
+            "commission_cost": self.column("commission_cost"),
+            "slippage_cost": self.column("slippage_cost"),
+            "is_stop_loss": reasons == _REASON_CODES["stop_loss"],
+            "is_take_profit": reasons == _REASON_CODES["take_profit"],
+            "exit_reason": np.asarray(EXIT_REASONS, dtype=object)[reasons],
+        }
+        return pd.DataFrame(data, copy=False)
+
+    def to_arrow(self) -> pa.Table:
+        """
+        Trades as a pyarrow Table over the ledger buffers.
+
+        Numeric columns are zero-copy; ticker_id and exit_reason become
+        dictionary arrays over the ticker list and EXIT_REASONS.
+        """
+        import pyarrow as pa
+
+        arrays: dict[str, pa.Array] = {}
+        for name in TRADE_DTYPE.names or ():
+            col = self.column(name)
+            if name == "ticker_id":
+                arrays["ticker"] = pa.DictionaryArray.from_arrays(
+                    pa.array(col), pa.array(self.tickers, type=pa.string())
+                )
+            elif name == "exit_reason":
+                arrays[name] = pa.DictionaryArray.from_arrays(
+                    pa.array(col), pa.array(EXIT_REASONS, type=pa.string())
+                )
+            else:
+                arrays[name] = pa.array(col)
+        return pa.table(arrays)
+
+    def to_trades(self, dates: np.ndarray) -> list[Trade]:
+        """
+        Materialize all trades as Trade objects.
+
+        Args:
+            dates: Simulation date array the entry/exit indices refer to
+
+        Returns:
+            Trades in the order they were recorded
+        """
+        if not self._size:
+            return []
+        dates = np.asarray(dates)
+        tickers = [self.tickers[i] for i in self.column("ticker_id").tolist()]
+        reasons = [EXIT_REASONS[r] for r in self.column("exit_reason").tolist()]
+        entry_dates = _take_dates(dates, self.column("entry_idx"))
+        exit_dates = _take_dates(dates, self.column("exit_idx"))
+        floats = {
+            name: self.column(name).tolist()
+            for name in (
+                "entry_price",
+                "exit_price",
+                "amount",
+                "pnl",
+                "pnl_pct",
+                "commission_cost",
+                "slippage_cost",
+            )
+        }
+        return [
+            Trade(
+                ticker=tickers[i],
+                entry_date=entry_dates[i],
+                entry_price=floats["entry_price"][i],
+                exit_date=exit_dates[i],
+                exit_price=floats["exit_price"][i],
+                amount=floats["amount"][i],
+                pnl=floats["pnl"][i],
+                pnl_pct=floats["pnl_pct"][i],
+                is_whipsaw=reasons[i] == "whipsaw",
+                commission_cost=floats["commission_cost"][i],
+                slippage_cost=floats["slippage_cost"][i],
+                is_stop_loss=reasons[i] == "stop_loss",
+                is_take_profit=reasons[i] == "take_profit",
+                exit_reason=reasons[i],
+            )
+            for i in range(self._size)
+        ]
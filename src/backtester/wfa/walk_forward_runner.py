@@ -133,8 +133,9 @@ def optimize_period(
                 score = extract_metric(result, metric)
                 all_results.append((task.params, result, score))
 
-        # Sort by score
+        # Sort by score, pruned (partial) runs last
         all_results.sort(key=lambda x: x[2], reverse=True)
+        all_results.sort(key=lambda x: x[1].pruned)
 
         if not all_results:
             return None
@@ -30,6 +30,28 @@ def simple_backtest(
     Returns:
         BacktestResult 객체
     """
+    trades, equity = simulate_backtest(data, strategy, initial_capital)
+    return _calculate_metrics(trades, equity, initial_capital)
+
+
+def simulate_backtest(
+    data: pd.DataFrame,
+    strategy: Strategy,
+    initial_capital: float = 10000000,
+) -> tuple[list[float], list[float]]:
+    """
+    전략 신호로 포지션을 시뮬레이션 (메트릭 계산 제외).
+
+    여러 실행의 메트릭을 compute_metrics로 한 번에 계산하려는 호출자용.
+
+    Args:
+        data: OHLCV 데이터
+        strategy: 트레이딩 전략
+        initial_capital: 초기 자본금
+
+    Returns:
+        (거래별 수익률 리스트, 자산 곡선) - 실패 시 거래 없음
+    """
     try:
         # 데이터 복사
         df = data.copy()
@@ -40,17 +62,14 @@ def simple_backtest(
 
         # 신호 확인
         if "signal" not in df.columns:
-            return _create_empty_result()
+            return [], [initial_capital]
 
         # 포지션 시뮬레이션
-        trades, equity = _simulate_positions(df, initial_capital)
-
-        # 메트릭 계산
-        return _calculate_metrics(trades, equity, initial_capital)
+        return _simulate_positions(df, initial_capital)
 
     except Exception as e:
         logger.error(f"Simple backtest error: {e}")
-        return _create_empty_result()
+        return [], [initial_capital]
 
 
 def _simulate_positions(
@@ -157,15 +176,3 @@ def _calculate_win_rate(trades: list[float]) -> tuple[int, float]:
 
     winning = sum(1 for t in trades if t > 0)
     return winning, winning / len(trades)
-
-
-def _create_empty_result() -> BacktestResult:
-    """빈 결과 생성."""
-    result = BacktestResult()
-    result.total_return = 0.0
-    result.sharpe_ratio = 0.0
-    result.mdd = 0.0
-    result.total_trades = 0
-    result.winning_trades = 0
-    result.win_rate = 0.0
-    return result
@@ -8,6 +8,7 @@ from src.config.constants import (
     DEFAULT_INITIAL_CAPITAL,
     DEFAULT_MAX_SLOTS,
     DEFAULT_SLIPPAGE_RATE,
+    JOBS_DIR,
     LOG_DATE_FORMAT,
     LOG_FORMAT,
     PROCESSED_DATA_DIR,
@@ -30,6 +31,7 @@ __all__ = [
     "DEFAULT_INITIAL_CAPITAL",
     "DEFAULT_MAX_SLOTS",
     "DEFAULT_SLIPPAGE_RATE",
+    "JOBS_DIR",
     "LOG_DATE_FORMAT",
     "LOG_FORMAT",
     "PROCESSED_DATA_DIR",
@@ -15,6 +15,10 @@ DATA_DIR: Final[Path] = PROJECT_ROOT / "data"
 RAW_DATA_DIR: Final[Path] = DATA_DIR / "raw"
 PROCESSED_DATA_DIR: Final[Path] = DATA_DIR / "processed"
 REPORTS_DIR: Final[Path] = PROJECT_ROOT / "reports"
+JOBS_DIR: Final[Path] = DATA_DIR / "jobs"  # Dashboard background job registry
+GCS_CACHE_DIR: Final[Path] = DATA_DIR / "gcs_cache"  # Local copies of GCS bot logs
+BACKTEST_RESULTS_DIR: Final[Path] = DATA_DIR / "backtest_results"  # Partitioned results table
+RESULT_CACHE_DIR: Final[Path] = DATA_DIR / "result_cache"  # Dashboard backtest result cache
 
 # API Configuration
 UPBIT_MAX_CANDLES_PER_REQUEST: Final[int] = 200
@@ -98,6 +98,8 @@ def get_bot_config(loader: "ConfigLoader") -> dict[str, Any]:
         "daily_reset_minute",
         "websocket_reconnect_delay",
         "api_retry_delay",
+        "api_rate_limit",
+        "target_workers",
     ]
 
     for key in bot_keys:
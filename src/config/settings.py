@@ -74,8 +74,19 @@ class Settings(BaseSettings):
         default=3.0, description="WebSocket reconnect delay in seconds"
     )
     bot_api_retry_delay: float = Field(default=0.5, description="API retry delay in seconds")
+    bot_api_rate_limit: float = Field(
+        default=8.0, description="Maximum REST requests per second (shared by all threads)"
+    )
+    bot_target_workers: int = Field(
+        default=4, description="Threads used to calculate targets at startup and daily reset"
+    )
 
-    @field_validator("trading_fee_rate", "bot_websocket_reconnect_delay", "bot_api_retry_delay")
+    @field_validator(
+        "trading_fee_rate",
+        "bot_websocket_reconnect_delay",
+        "bot_api_retry_delay",
+        "bot_api_rate_limit",
+    )
     @classmethod
     def validate_positive_float(cls, v: float) -> float:
         """Validate that float values are positive."""
@@ -83,7 +94,12 @@ class Settings(BaseSettings):
             raise ValueError(f"Value must be positive, got {v}")
         return v
 
-    @field_validator("trading_max_slots", "strategy_sma_period", "strategy_trend_sma_period")
+    @field_validator(
+        "trading_max_slots",
+        "strategy_sma_period",
+        "strategy_trend_sma_period",
+        "bot_target_workers",
+    )
     @classmethod
     def validate_positive_int(cls, v: int) -> int:
         """Validate that int values are positive."""
@@ -189,6 +205,8 @@ class Settings(BaseSettings):
             "daily_reset_minute": self.bot_daily_reset_minute,
             "websocket_reconnect_delay": self.bot_websocket_reconnect_delay,
             "api_retry_delay": self.bot_api_retry_delay,
+            "api_rate_limit": self.bot_api_rate_limit,
+            "target_workers": self.bot_target_workers,
         }
 
 
@@ -0,0 +1,289 @@
+"""
+Incremental feature engineering for the feature store.
+
+Computes the price and volume features served by feature_store/features.py
+with the shared indicator library (src.utils.indicators), for all symbols at
+once as date x symbol DataFrames.
+
+Runs are incremental: the last WARMUP_ROWS raw rows of every symbol are kept
+as rolling state, so a run only computes features for rows newer than the
+state and appends them to a store partitioned by month:
+
+    {store_dir}/
+    ├── month=2024-01/features.parquet   (timestamp, symbol, features...)
+    └── month=2024-02/features.parquet
+
+Rolling-window features are exact. RSI (Wilder EWM) is seeded from the
+warmup window only; the truncated weight (13/14)^256 is below 1e-8.
+"""
+
+from __future__ import annotations
+
+import os
+from datetime import datetime
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.utils.indicators import atr, bollinger_bands, rsi, sma
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "FEATURE_COLUMNS",
+    "WARMUP_ROWS",
+    "compute_features",
+    "read_feature_store",
+    "update_feature_store",
+]
+
+# Raw rows kept per symbol; must cover the longest lookback (61 closes for volatility_60d)
+WARMUP_ROWS = 256
+
+FEATURE_COLUMNS: tuple[str, ...] = (
+    "return_1d",
+    "return_5d",
+    "return_20d",
+    "ma_5",
+    "ma_20",
+    "ma_60",
+    "ma_5_20_ratio",
+    "ma_20_60_ratio",
+    "price_ma_20_ratio",
+    "volatility_20d",
+    "volatility_60d",
+    "rsi_14",
+    "volume_ma_20",
+    "volume_ratio",
+    "atr_14",
+    "atr_ratio",
+    "bb_upper",
+    "bb_lower",
+    "bb_width",
+    "bb_position",
+    "ma_alignment",
+)
+
+_OHLCV_COLUMNS = ("open", "high", "low", "close", "volume")
+_PARTITION_FILE = "features.parquet"
+
+
+def compute_features(ohlcv: dict[str, pd.DataFrame]) -> dict[str, pd.DataFrame]:
+    """
+    Calculate features for all symbols at once.
+
+    Args:
+        ohlcv: {column: DataFrame of dates x symbols} for open/high/low/close/volume
+
+    Returns:
+        {feature name: DataFrame of dates x symbols}
+    """
+    close, high, low, volume = ohlcv["close"], ohlcv["high"], ohlcv["low"], ohlcv["volume"]
+    f: dict[str, pd.DataFrame] = {}
+
+    # Returns
+    f["return_1d"] = close.pct_change(1, fill_method=None)
+    f["return_5d"] = close.pct_change(5, fill_method=None)
+    f["return_20d"] = close.pct_change(20, fill_method=None)
+
+    # Moving averages and ratios
+    f["ma_5"] = sma(close, 5)
+    f["ma_20"] = sma(close, 20)
+    f["ma_60"] = sma(close, 60)
+    f["ma_5_20_ratio"] = f["ma_5"] / f["ma_20"]
+    f["ma_20_60_ratio"] = f["ma_20"] / f["ma_60"]
+    f["price_ma_20_ratio"] = close / f["ma_20"]
+
+    # Volatility of daily returns
+    f["volatility_20d"] = f["return_1d"].rolling(window=20, min_periods=20).std()
+    f["volatility_60d"] = f["return_1d"].rolling(window=60, min_periods=60).std()
+
+    f["rsi_14"] = rsi(close, 14)
+
+    # Volume
+    f["volume_ma_20"] = sma(volume, 20)
+    f["volume_ratio"] = volume / f["volume_ma_20"]
+
+    # ATR
+    f["atr_14"] = atr(high, low, close, 14)
+    f["atr_ratio"] = f["atr_14"] / close
+
+    # Bollinger Bands
+    upper, middle, lower = bollinger_bands(close, 20, 2.0)
+    f["bb_upper"] = upper
+    f["bb_lower"] = lower
+    f["bb_width"] = (upper - lower) / middle
+    f["bb_position"] = (close - lower) / (upper - lower)
+
+    # MA alignment (trend strength)
+    f["ma_alignment"] = (
+        (f["ma_5"] > f["ma_20"]).astype(int) + (f["ma_20"] > f["ma_60"]).astype(int)
+    ) / 2
+
+    return f
+
+
+def _normalize_ohlcv(df: pd.DataFrame) -> pd.DataFrame:
+    """Sorted float OHLCV frame with a unique DatetimeIndex."""
+    frame = df.loc[:, list(_OHLCV_COLUMNS)].astype(np.float64)
+    frame.index = pd.DatetimeIndex(frame.index)
+    frame = frame[~frame.index.duplicated(keep="last")]
+    return frame.sort_index()
+
+
+def _load_state(state_path: Path) -> dict[str, pd.DataFrame]:
+    """Load per-symbol warmup buffers."""
+    if not state_path.exists():
+        return {}
+    state = pd.read_parquet(state_path)
+    return {
+        str(symbol): group.set_index("timestamp")[list(_OHLCV_COLUMNS)].rename_axis(None)
+        for symbol, group in state.groupby("symbol", sort=False)
+    }
+
+
+def _atomic_to_parquet(df: pd.DataFrame, path: Path) -> None:
+    """Write parquet via a hidden temporary sibling so readers never see partial files."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+
+def _save_state(state: dict[str, pd.DataFrame], state_path: Path) -> None:
+    """Persist the last WARMUP_ROWS raw rows of every symbol."""
+    frames = [
+        buffer.iloc[-WARMUP_ROWS:].rename_axis("timestamp").reset_index().assign(symbol=symbol)
+        for symbol, buffer in state.items()
+        if len(buffer)
+    ]
+    if frames:
+        _atomic_to_parquet(pd.concat(frames, ignore_index=True), state_path)
+
+
+def _append_partitions(rows: pd.DataFrame, store_dir: Path) -> None:
+    """Merge rows into their month partitions (re-written rows replace old ones)."""
+    months = rows["timestamp"].dt.strftime("%Y-%m")
+    for month, part in rows.groupby(months, sort=True):
+        path = store_dir / f"month={month}" / _PARTITION_FILE
+        if path.exists():
+            part = pd.concat([pd.read_parquet(path), part], ignore_index=True)
+            part = part.drop_duplicates(["timestamp", "symbol"], keep="last")
+        _atomic_to_parquet(part.sort_values(["timestamp", "symbol"]), path)
+
+
+def update_feature_store(
+    raw: dict[str, pd.DataFrame],
+    store_dir: Path | str,
+    state_path: Path | str | None = None,
+    calculated_at: datetime | None = None,
+) -> pd.DataFrame:
+    """
+    Compute features for new raw rows and append them to the store.
+
+    A re-sent copy of the last stored row whose OHLCV values changed (a
+    candle fetched while still open) replaces it in the warmup state and
+    its features are rewritten.
+
+    Args:
+        raw: {symbol: OHLCV DataFrame indexed by datetime} (full or tail history)
+        store_dir: Partitioned feature store directory
+        state_path: Warmup state file (default: "{store_dir}_state.parquet")
+        calculated_at: Timestamp recorded on new rows (default: now)
+
+    Returns:
+        Newly appended feature rows (timestamp, symbol, features..., calculated_at)
+    """
+    store_dir = Path(store_dir)
+    state_file = (
+        Path(state_path)
+        if state_path is not None
+        else store_dir.with_name(f"{store_dir.name}_state.parquet")
+    )
+    state = _load_state(state_file)
+
+    combined: dict[str, pd.DataFrame] = {}
+    emit_from: dict[str, pd.Timestamp | None] = {}
+    for symbol, df in raw.items():
+        frame = _normalize_ohlcv(df)
+        buffer = state.get(symbol)
+        if buffer is not None and len(buffer):
+            # The last stored candle may have been fetched while still open:
+            # a revised copy replaces it and its features are recomputed
+            last = buffer.index[-1]
+            new = frame[frame.index >= last]
+            revised = len(new) > 0 and new.index[0] == last
+            if revised and new.iloc[0].equals(buffer.iloc[-1]):
+                new, revised = new.iloc[1:], False
+            frame = pd.concat([buffer.iloc[:-1] if revised else buffer, new])
+            first = new.index[0] if len(new) else None
+        else:
+            first = frame.index[0] if len(frame) else None
+        if len(frame):
+            combined[symbol] = frame
+            emit_from[symbol] = first
+
+    if not combined:
+        return pd.DataFrame(columns=["timestamp", "symbol", *FEATURE_COLUMNS])
+
+    symbols = list(combined)
+    wide = {col: pd.DataFrame({s: combined[s][col] for s in symbols}) for col in _OHLCV_COLUMNS}
+    features = compute_features(wide)
+
+    # Emit only rows the symbol actually has that are new or revised since its state
+    index = wide["close"].index
+    mask = wide["close"].notna().to_numpy()
+    for j, symbol in enumerate(symbols):
+        first = emit_from[symbol]
+        if first is None:
+            mask[:, j] = False
+        else:
+            mask[:, j] &= index >= first
+    rows, cols = np.nonzero(mask)
+
+    values = np.stack([features[name].to_numpy(dtype=np.float64) for name in FEATURE_COLUMNS], -1)
+    new_rows = pd.DataFrame(values[rows, cols], columns=list(FEATURE_COLUMNS))
+    new_rows.insert(0, "timestamp", index[rows])
+    new_rows.insert(1, "symbol", np.asarray(symbols, dtype=object)[cols])
+    new_rows["calculated_at"] = calculated_at or datetime.now()
+
+    if len(new_rows):
+        _append_partitions(new_rows, store_dir)
+    state.update(combined)
+    _save_state(state, state_file)
+
+    logger.info(f"Appended {len(new_rows)} feature rows for {len(symbols)} symbols")
+    return new_rows
+
+
+def read_feature_store(
+    store_dir: Path | str,
+    symbols: list[str] | None = None,
+    start: datetime | None = None,
+) -> pd.DataFrame:
+    """
+    Read features, pruning month partitions before start.
+
+    Args:
+        store_dir: Partitioned feature store directory
+        symbols: Symbols to read (default: all)
+        start: Earliest timestamp to read (default: full history)
+
+    Returns:
+        Features indexed by timestamp with a symbol column (empty if no store)
+    """
+    store_dir = Path(store_dir)
+    if not any(store_dir.glob(f"month=*/{_PARTITION_FILE}")):
+        return pd.DataFrame()
+
+    filters: list[tuple[str, str, object]] = []
+    if start is not None:
+        filters.append(("month", ">=", pd.Timestamp(start).strftime("%Y-%m")))
+        filters.append(("timestamp", ">=", pd.Timestamp(start)))
+    if symbols is not None:
+        filters.append(("symbol", "in", list(symbols)))
+
+    df = pd.read_parquet(store_dir, filters=filters or None)
+    return df.drop(columns="month").set_index("timestamp").sort_index()
@@ -0,0 +1,629 @@
+"""
+DuckDB query service over the local parquet layout.
+
+Registers the on-disk data as views in one embedded DuckDB database and
+answers typed queries with filters and aggregations pushed into the scan,
+so callers receive only the rows (or summary rows) they asked for instead
+of materializing whole files in pandas:
+
+    ohlcv_{interval}   {RAW_DATA_DIR}/{ticker}_{interval}.parquet
+    indicators         {PROCESSED_DATA_DIR}/{ticker}_{interval}_{key}.parquet
+    backtest_results   {BACKTEST_RESULTS_DIR}/run_date=YYYYMMDD/results.parquet
+
+Views are rebuilt whenever the set (or mtime) of files changes. Queries run
+on cursors drawn from a fixed-size pool, so dashboard threads can query
+concurrently without sharing a connection.
+
+duckdb is an optional dependency (``analysis`` / ``web`` extras);
+get_query_service() returns None when it is not installed.
+"""
+
+from __future__ import annotations
+
+import queue
+import re
+import threading
+import time
+from collections.abc import Generator, Sequence
+from contextlib import contextmanager
+from datetime import date, datetime
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Literal
+
+import pandas as pd
+
+from src.config.constants import BACKTEST_RESULTS_DIR, PROCESSED_DATA_DIR, RAW_DATA_DIR
+from src.utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from duckdb import DuckDBPyConnection
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "DuckDBQueryService",
+    "QueryServiceError",
+    "TradeGrouping",
+    "get_query_service",
+    "is_duckdb_available",
+]
+
+TradeGrouping = Literal["ticker", "month", "exit_reason"]
+
+# Column names pandas uses for a DatetimeIndex, in order of preference
+_TIME_COLUMNS = ("datetime", "timestamp", "date", "__index_level_0__")
+
+_RAW_FILE = re.compile(r"^(?P<ticker>[^_]+)_(?P<interval>[^_]+)\.parquet$")
+_PROCESSED_FILE = re.compile(r"^(?P<ticker>[^_]+)_(?P<interval>[^_]+)_(?P<key>[^_]+)\.parquet$")
+
+_TRADE_BUCKETS: dict[str, str] = {
+    "ticker": "ticker",
+    "month": "strftime(CAST(entry_date AS TIMESTAMP), '%Y-%m')",
+    "exit_reason": "coalesce(CAST(exit_reason AS VARCHAR), 'signal')",
+}
+
+
+class QueryServiceError(Exception):
+    """Exception raised for query service errors."""
+
+
+def _import_duckdb() -> Any:
+    """Import duckdb lazily."""
+    try:
+        import duckdb
+
+        return duckdb
+    except ImportError as e:
+        raise QueryServiceError(
+            "duckdb not installed. Install with: pip install 'crypto-quant-system[analysis]'"
+        ) from e
+
+
+def is_duckdb_available() -> bool:
+    """Check if duckdb can be imported."""
+    try:
+        _import_duckdb()
+    except QueryServiceError:
+        return False
+    return True
+
+
+def _literal(value: str | Path) -> str:
+    """Quote a string (e.g. a file path) as a SQL literal."""
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _identifier(name: str) -> str:
+    """Quote a SQL identifier."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+class DuckDBQueryService:
+    """
+    Embedded DuckDB over the raw, processed and backtest result parquet files.
+
+    Usage:
+        service = DuckDBQueryService()
+        df = service.ohlcv_range("KRW-BTC", "day", start=date(2024, 1, 1))
+        summary = service.cross_ticker_summary("day", start=date(2024, 1, 1))
+    """
+
+    def __init__(
+        self,
+        raw_dir: Path | str = RAW_DATA_DIR,
+        processed_dir: Path | str = PROCESSED_DATA_DIR,
+        results_dir: Path | str = BACKTEST_RESULTS_DIR,
+        pool_size: int = 4,
+        memory_limit: str = "512MB",
+    ) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            raw_dir: Raw OHLCV directory ({ticker}_{interval}.parquet)
+            processed_dir: Indicator cache directory ({ticker}_{interval}_{key}.parquet)
+            results_dir: Partitioned backtest results table
+            pool_size: Number of pooled cursors (concurrent queries)
+            memory_limit: DuckDB memory limit for the embedded database
+        """
+        duckdb = _import_duckdb()
+        self.raw_dir = Path(raw_dir)
+        self.processed_dir = Path(processed_dir)
+        self.results_dir = Path(results_dir)
+
+        self._db: DuckDBPyConnection = duckdb.connect(
+            ":memory:", config={"memory_limit": memory_limit}
+        )
+        self._pool: queue.Queue[DuckDBPyConnection] = queue.Queue(maxsize=pool_size)
+        for _ in range(pool_size):
+            self._pool.put(self._db.cursor())
+
+        self._lock = threading.RLock()
+        self._layout: tuple[tuple[str, int], ...] | None = None
+        self._time_columns: dict[tuple[str, int], str | None] = {}
+        self._intervals: set[str] = set()
+        self._has_indicators = False
+        self._has_results = False
+
+    # ------------------------------------------------------------------
+    # Connection pool and view registration
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def connection(self, timeout: float = 30.0) -> Generator[DuckDBPyConnection, None, None]:
+        """
+        Borrow a pooled cursor with views registered for the current files.
+
+        Args:
+            timeout: Seconds to wait for a free cursor
+
+        Yields:
+            DuckDB cursor (returned to the pool on exit)
+        """
+        self._ensure_views()
+        with self._borrow(timeout) as conn:
+            yield conn
+
+    @contextmanager
+    def _borrow(self, timeout: float = 30.0) -> Generator[DuckDBPyConnection, None, None]:
+        """Borrow a pooled cursor without refreshing views (single-file reads)."""
+        try:
+            conn = self._pool.get(timeout=timeout)
+        except queue.Empty as e:
+            raise QueryServiceError(f"No free DuckDB connection after {timeout}s") from e
+        try:
+            yield conn
+        finally:
+            self._pool.put(conn)
+
+    def close(self) -> None:
+        """Close pooled cursors and the database."""
+        while not self._pool.empty():
+            self._pool.get_nowait().close()
+        self._db.close()
+
+    def _scan_layout(self) -> tuple[tuple[str, int], ...]:
+        """Every registered file with its mtime; a change triggers a view rebuild."""
+        files = [
+            *self.raw_dir.glob("*.parquet"),
+            *self.processed_dir.glob("*.parquet"),
+            *self.results_dir.glob("run_date=*/*.parquet"),
+        ]
+        return tuple(sorted((str(f), f.stat().st_mtime_ns) for f in files if f.exists()))
+
+    def _time_column(self, path: Path, mtime_ns: int) -> str | None:
+        """Name of the stored DatetimeIndex column of a parquet file."""
+        key = (str(path), mtime_ns)
+        with self._lock:
+            if key not in self._time_columns:
+                described = self._db.execute(
+                    f"DESCRIBE SELECT * FROM read_parquet({_literal(path)})"
+                ).fetchall()
+                names = {row[0] for row in described}
+                self._time_columns[key] = next((c for c in _TIME_COLUMNS if c in names), None)
+            return self._time_columns[key]
+
+    def _ensure_views(self) -> None:
+        """(Re)create views when the files on disk changed."""
+        layout = self._scan_layout()
+        if layout == self._layout:
+            return
+        with self._lock:
+            if layout == self._layout:
+                return
+            mtimes = dict(layout)
+            self._register_ohlcv(mtimes)
+            self._register_indicators(mtimes)
+            self._register_results()
+            self._layout = layout
+            logger.debug(f"Registered DuckDB views over {len(layout)} parquet files")
+
+    def _file_select(self, path: Path, mtime_ns: int, **labels: str) -> str | None:
+        """SELECT of one file with its time column renamed to datetime and label columns."""
+        time_col = self._time_column(path, mtime_ns)
+        if time_col is None:
+            logger.debug(f"Skipping {path.name}: no datetime column")
+            return None
+        label_sql = "".join(f"{_literal(v)} AS {k}, " for k, v in labels.items())
+        return (
+            f"SELECT {label_sql}{_identifier(time_col)} AS datetime, "
+            f"* EXCLUDE ({_identifier(time_col)}) FROM read_parquet({_literal(path)})"
+        )
+
+    def _register_ohlcv(self, mtimes: dict[str, int]) -> None:
+        """One view per interval over the raw files (ticker, datetime, open...volume)."""
+        by_interval: dict[str, list[str]] = {}
+        for path in sorted(self.raw_dir.glob("*.parquet")):
+            match = _RAW_FILE.match(path.name)
+            if match is None or str(path) not in mtimes:
+                continue
+            select = self._file_select(path, mtimes[str(path)], ticker=match["ticker"])
+            if select is not None:
+                by_interval.setdefault(match["interval"], []).append(select)
+
+        for interval in self._intervals - set(by_interval):
+            self._db.execute(f"DROP VIEW IF EXISTS {_identifier(f'ohlcv_{interval}')}")
+        for interval, selects in by_interval.items():
+            self._db.execute(
+                f"CREATE OR REPLACE VIEW {_identifier(f'ohlcv_{interval}')} AS "
+                + " UNION ALL BY NAME ".join(selects)
+            )
+        self._intervals = set(by_interval)
+
+    def _register_indicators(self, mtimes: dict[str, int]) -> None:
+        """View over the indicator cache (ticker, interval, cache_key, datetime, ...)."""
+        selects = []
+        for path in sorted(self.processed_dir.glob("*.parquet")):
+            match = _PROCESSED_FILE.match(path.name)
+            if match is None or str(path) not in mtimes:
+                continue
+            select = self._file_select(
+                path,
+                mtimes[str(path)],
+                ticker=match["ticker"],
+                interval=match["interval"],
+                cache_key=match["key"],
+            )
+            if select is not None:
+                selects.append(select)
+
+        self._has_indicators = bool(selects)
+        if selects:
+            self._db.execute(
+                "CREATE OR REPLACE VIEW indicators AS " + " UNION ALL BY NAME ".join(selects)
+            )
+        else:
+            self._db.execute("DROP VIEW IF EXISTS indicators")
+
+    def _register_results(self) -> None:
+        """View over the run_date-partitioned backtest results table."""
+        self._has_results = any(self.results_dir.glob("run_date=*/*.parquet"))
+        if self._has_results:
+            pattern = self.results_dir / "run_date=*" / "*.parquet"
+            self._db.execute(
+                "CREATE OR REPLACE VIEW backtest_results AS SELECT * FROM "
+                f"read_parquet({_literal(pattern)}, hive_partitioning = true, "
+                "hive_types = {'run_date': VARCHAR})"
+            )
+        else:
+            self._db.execute("DROP VIEW IF EXISTS backtest_results")
+
+    def query(self, sql: str, params: Sequence[Any] | None = None) -> pd.DataFrame:
+        """
+        Run ad hoc SQL against the registered views.
+
+        Args:
+            sql: Query text (views: ohlcv_{interval}, indicators, backtest_results)
+            params: Positional parameters for ``?`` placeholders
+
+        Returns:
+            Result DataFrame
+        """
+        start = time.perf_counter()
+        with self.connection() as conn:
+            df = conn.execute(sql, list(params or [])).df()
+        logger.debug(f"DuckDB query: {len(df)} rows in {time.perf_counter() - start:.3f}s")
+        return df
+
+    # ------------------------------------------------------------------
+    # OHLCV
+    # ------------------------------------------------------------------
+
+    def intervals(self) -> list[str]:
+        """Intervals with at least one raw file."""
+        self._ensure_views()
+        return sorted(self._intervals)
+
+    def ohlcv_range(
+        self,
+        ticker: str,
+        interval: str,
+        start: date | datetime | None = None,
+        end: date | datetime | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> pd.DataFrame | None:
+        """
+        Read one ticker's candles between two dates (inclusive).
+
+        Args:
+            ticker: Ticker symbol (e.g., KRW-BTC)
+            interval: Candle interval
+            start: Start date (optional)
+            end: End date (optional)
+            columns: Columns to read (default: all)
+
+        Returns:
+            DataFrame indexed by datetime, or None if the file does not exist
+        """
+        return self.read_range(self.raw_dir / f"{ticker}_{interval}.parquet", start, end, columns)
+
+    def read_range(
+        self,
+        path: Path | str,
+        start: date | datetime | None = None,
+        end: date | datetime | None = None,
+        columns: Sequence[str] | None = None,
+    ) -> pd.DataFrame | None:
+        """
+        Read a time-indexed parquet file between two dates (inclusive).
+
+        Only the requested columns and the row groups overlapping the range
+        are read.
+
+        Args:
+            path: Parquet file written from a DatetimeIndex-ed DataFrame
+            start: Start date (optional)
+            end: End date (optional)
+            columns: Columns to read (default: all)
+
+        Returns:
+            DataFrame with the file's DatetimeIndex, or None if the file does not exist
+        """
+        path = Path(path)
+        if not path.exists():
+            return None
+        time_col = self._time_column(path, path.stat().st_mtime_ns)
+        if time_col is None:
+            raise QueryServiceError(f"No datetime column in {path}")
+
+        time_sql = _identifier(time_col)
+        where, params = self._time_filter(time_sql, start, end)
+        select = (
+            ", ".join(_identifier(c) for c in columns)
+            if columns is not None
+            else f"* EXCLUDE ({time_sql})"
+        )
+        with self._borrow() as conn:
+            df = conn.execute(
+                f"SELECT {time_sql}, {select} FROM read_parquet({_literal(path)}){where} "
+                "ORDER BY 1",
+                params,
+            ).df()
+        # Same index name pandas would restore (unnamed indexes are stored as __index_level_0__)
+        df = df.set_index(time_col)
+        return df.rename_axis(None) if time_col == "__index_level_0__" else df
+
+    def date_range(self, interval: str) -> tuple[date | None, date | None]:
+        """
+        Earliest and latest candle date over all tickers of an interval.
+
+        Args:
+            interval: Candle interval
+
+        Returns:
+            (start_date, end_date) tuple, or (None, None) if no data
+        """
+        if interval not in self.intervals():
+            return None, None
+        row = self.query(
+            f"SELECT min(datetime) AS first, max(datetime) AS last "
+            f"FROM {_identifier(f'ohlcv_{interval}')}"
+        ).iloc[0]
+        if pd.isna(row["first"]):
+            return None, None
+        return pd.Timestamp(row["first"]).date(), pd.Timestamp(row["last"]).date()
+
+    def cross_ticker_summary(
+        self,
+        interval: str,
+        start: date | datetime | None = None,
+        end: date | datetime | None = None,
+        tickers: Sequence[str] | None = None,
+    ) -> pd.DataFrame:
+        """
+        Per-ticker return, volatility and volume over a date range.
+
+        Args:
+            interval: Candle interval
+            start: Start date (optional)
+            end: End date (optional)
+            tickers: Tickers to include (default: all)
+
+        Returns:
+            One row per ticker: ticker, bars, first, last, first_close,
+            last_close, total_return, volatility (stdev of bar log returns),
+            avg_volume, avg_turnover
+        """
+        if interval not in self.intervals():
+            return pd.DataFrame()
+        where, params = self._time_filter("datetime", start, end)
+        if tickers is not None:
+            placeholders = ", ".join("?" for _ in tickers)
+            where += f"{' AND' if where else ' WHERE'} ticker IN ({placeholders})"
+            params.extend(tickers)
+        return self.query(
+            f"""
+            WITH bars AS (
+                SELECT ticker, datetime, close, volume,
+                       ln(close / lag(close) OVER (PARTITION BY ticker ORDER BY datetime))
+                           AS log_return
+                FROM {_identifier(f"ohlcv_{interval}")}{where}
+            )
+            SELECT ticker,
+                   count(*) AS bars,
+                   min(datetime) AS first,
+                   max(datetime) AS last,
+                   arg_min(close, datetime) AS first_close,
+                   arg_max(close, datetime) AS last_close,
+                   arg_max(close, datetime) / arg_min(close, datetime) - 1 AS total_return,
+                   stddev_samp(log_return) AS volatility,
+                   avg(volume) AS avg_volume,
+                   avg(close * volume) AS avg_turnover
+            FROM bars
+            GROUP BY ticker
+            ORDER BY ticker
+            """,
+            params,
+        )
+
+    def close_matrix(
+        self,
+        interval: str,
+        tickers: Sequence[str],
+        start: date | datetime | None = None,
+        end: date | datetime | None = None,
+    ) -> pd.DataFrame:
+        """
+        Close prices as a dates x tickers frame (pivoted inside DuckDB).
+
+        Args:
+            interval: Candle interval
+            tickers: Tickers (columns)
+            start: Start date (optional)
+            end: End date (optional)
+
+        Returns:
+            DataFrame indexed by datetime with one column per ticker
+        """
+        if interval not in self.intervals() or not tickers:
+            return pd.DataFrame()
+        where, params = self._time_filter("datetime", start, end)
+        placeholders = ", ".join("?" for _ in tickers)
+        where += f"{' AND' if where else ' WHERE'} ticker IN ({placeholders})"
+        params.extend(tickers)
+        long = self.query(
+            f"SELECT datetime, ticker, close FROM {_identifier(f'ohlcv_{interval}')}{where}",
+            params,
+        )
+        wide = long.pivot(index="datetime", columns="ticker", values="close").sort_index()
+        return wide.reindex(columns=[t for t in tickers if t in wide.columns])
+
+    # ------------------------------------------------------------------
+    # Backtest results and trades
+    # ------------------------------------------------------------------
+
+    def backtest_results(
+        self,
+        strategy: str | None = None,
+        param_set: str | None = "default",
+        since: str | None = None,
+        latest_only: bool = False,
+    ) -> pd.DataFrame:
+        """
+        Rows of the scheduled backtest results table.
+
+        Args:
+            strategy: Strategy filter (optional)
+            param_set: Parameter set filter (None: all sets)
+            since: Earliest run_date partition (YYYYMMDD, optional)
+            latest_only: Keep only the newest run per (strategy, param_set, symbol)
+
+        Returns:
+            Results rows with a run_date column (empty if no results)
+        """
+        self._ensure_views()
+        if not self._has_results:
+            return pd.DataFrame()
+        conditions: list[str] = []
+        params: list[Any] = []
+        for column, value in (("strategy", strategy), ("param_set", param_set)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                params.append(value)
+        if since is not None:
+            conditions.append("run_date >= ?")
+            params.append(since)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        qualify = (
+            " QUALIFY row_number() OVER "
+            "(PARTITION BY strategy, param_set, symbol ORDER BY run_date DESC) = 1"
+            if latest_only
+            else ""
+        )
+        return self.query(
+            f"SELECT * FROM backtest_results{where}{qualify} ORDER BY run_date, strategy, symbol",
+            params,
+        )
+
+    def trade_summary(
+        self,
+        trades: pd.DataFrame | Path | str,
+        by: TradeGrouping = "ticker",
+    ) -> pd.DataFrame:
+        """
+        Aggregate trade statistics per ticker, entry month or exit reason.
+
+        Args:
+            trades: Trades DataFrame, or a CSV/parquet file of trades with
+                ticker, entry_date, exit_date, pnl and pnl_pct columns
+            by: Grouping
+
+        Returns:
+            One row per group: trades, closed, wins, win_rate (%),
+            total_pnl, avg_pnl_pct, avg_holding_days, profit_factor
+        """
+        bucket = _TRADE_BUCKETS[by]
+        with self.connection() as conn:
+            source = self._trade_source(conn, trades)
+            try:
+                return conn.execute(
+                    f"""
+                    SELECT {bucket} AS {by},
+                           count(*) AS trades,
+                           count(exit_date) AS closed,
+                           count(*) FILTER (WHERE pnl > 0) AS wins,
+                           100.0 * count(*) FILTER (WHERE pnl > 0)
+                               / nullif(count(exit_date), 0) AS win_rate,
+                           sum(pnl) AS total_pnl,
+                           avg(pnl_pct) AS avg_pnl_pct,
+                           avg(date_diff('second', CAST(entry_date AS TIMESTAMP),
+                                         CAST(exit_date AS TIMESTAMP))) / 86400.0
+                               AS avg_holding_days,
+                           sum(pnl) FILTER (WHERE pnl > 0)
+                               / nullif(-sum(pnl) FILTER (WHERE pnl < 0), 0) AS profit_factor
+                    FROM {source}
+                    GROUP BY 1
+                    ORDER BY 1
+                    """
+                ).df()
+            finally:
+                if isinstance(trades, pd.DataFrame):
+                    conn.unregister("_trades")
+
+    @staticmethod
+    def _trade_source(conn: DuckDBPyConnection, trades: pd.DataFrame | Path | str) -> str:
+        """FROM clause for a trades frame or file."""
+        if isinstance(trades, pd.DataFrame):
+            conn.register("_trades", trades)
+            return "_trades"
+        path = Path(trades)
+        if not path.exists():
+            raise QueryServiceError(f"Trades file not found: {path}")
+        if path.suffix == ".csv":
+            return f"read_csv_auto({_literal(path)})"
+        return f"read_parquet({_literal(path)})"
+
+    @staticmethod
+    def _time_filter(
+        column: str,
+        start: date | datetime | None,
+        end: date | datetime | None,
+    ) -> tuple[str, list[Any]]:
+        """WHERE clause bounding a timestamp column (end inclusive, like the pandas loaders)."""
+        conditions: list[str] = []
+        params: list[Any] = []
+        if start is not None:
+            conditions.append(f"{column} >= ?")
+            params.append(pd.Timestamp(start).to_pydatetime())
+        if end is not None:
+            conditions.append(f"{column} <= ?")
+            params.append(pd.Timestamp(end).to_pydatetime())
+        return (f" WHERE {' AND '.join(conditions)}" if conditions else ""), params
+
+
+@lru_cache(maxsize=1)
+def get_query_service() -> DuckDBQueryService | None:
+    """
+    Get the shared query service over the default data directories.
+
+    Returns None if duckdb is not installed.
+
+    Returns:
+        DuckDBQueryService instance or None
+    """
+    try:
+        return DuckDBQueryService()
+    except QueryServiceError as e:
+        logger.debug(f"Query service unavailable: {e}")
+        return None
@@ -2,7 +2,7 @@
 GCS (Google Cloud Storage) Integration Module.
 
 Provides storage abstraction for the Crypto Quant Ecosystem:
-- Bot log retrieval from GCS
+- Bot log retrieval from GCS (batched, with a local generation-validated cache)
 - Model storage and loading
 - Processed data sync
 
@@ -12,17 +12,21 @@ Part of: crypto-quant-system -> crypto-bot -> crypto-regime-classifier-ml
 from __future__ import annotations
 
 import json
-from datetime import datetime
+import os
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
 from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 
+from src.config.constants import GCS_CACHE_DIR
 from src.utils.logger import get_logger
 
 if TYPE_CHECKING:
-    from google.cloud.storage import Bucket, Client  # type: ignore[import-untyped]
+    from google.cloud.storage import Blob, Bucket, Client  # type: ignore[import-untyped]
 
 logger = get_logger(__name__)
 
@@ -45,6 +49,35 @@ def _get_gcs_client() -> Client:
         raise GCSStorageError(f"Failed to create GCS client: {e}") from e
 
 
+def _date_str(date: str | datetime) -> str:
+    """Normalize a date argument to YYYY-MM-DD."""
+    return date.strftime("%Y-%m-%d") if isinstance(date, datetime) else date
+
+
+def _is_settled(date_str: str) -> bool:
+    """Whether a day's log can no longer change.
+
+    Days before yesterday are settled; the extra day of margin covers the
+    bot writing logs in a different timezone than the dashboard.
+    """
+    return date_str < (datetime.now() - timedelta(days=1)).strftime("%Y-%m-%d")
+
+
+def _read_log_csv(path: Path) -> pd.DataFrame:
+    """Parse a cached trade log, treating an empty file as no trades."""
+    if path.stat().st_size == 0:
+        return pd.DataFrame()
+    return pd.read_csv(path)
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    """Write a file via a temporary sibling so readers never see partial content."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
 class GCSStorage:
     """
     Google Cloud Storage interface for the Crypto Quant Ecosystem.
@@ -67,6 +100,8 @@ class GCSStorage:
         self,
         bucket_name: str | None = None,
         project: str | None = None,
+        cache_dir: Path | str | None = None,
+        client: Client | None = None,
     ) -> None:
         """
         Initialize GCS storage.
@@ -74,9 +109,9 @@ class GCSStorage:
         Args:
             bucket_name: GCS bucket name (reads from GCS_BUCKET env if not provided)
             project: GCP project ID (optional, uses default if not provided)
+            cache_dir: Local cache directory for bot logs (default: data/gcs_cache)
+            client: Pre-built storage client (e.g. a fake bucket in tests)
         """
-        import os
-
         self.bucket_name = bucket_name or os.getenv("GCS_BUCKET")
         if not self.bucket_name:
             raise GCSStorageError(
@@ -85,7 +120,8 @@ class GCSStorage:
             )
 
         self.project = project
-        self._client: Client | None = None
+        self.cache_dir = Path(cache_dir) if cache_dir is not None else GCS_CACHE_DIR
+        self._client: Client | None = client
         self._bucket: Bucket | None = None
 
     @property
@@ -121,26 +157,99 @@ class GCSStorage:
         Returns:
             DataFrame with trade logs
         """
-        date_str = date.strftime("%Y-%m-%d") if isinstance(date, datetime) else date
+        date_str = _date_str(date)
 
         blob_path = f"logs/{account}/trades_{date_str}.csv"
 
         try:
-            blob = self.bucket.blob(blob_path)
+            cached = self._read_settled(blob_path)
+            if cached is not None:
+                return _read_log_csv(cached)
 
-            if not blob.exists():
+            blob = self.bucket.get_blob(blob_path)
+
+            if blob is None:
                 logger.warning(f"No logs found for {account} on {date_str}")
                 return pd.DataFrame()
 
-            content = blob.download_as_text()
-            from io import StringIO
-
-            return pd.read_csv(StringIO(content))
+            return _read_log_csv(self._fetch_cached(blob, date_str))
 
         except Exception as e:
             logger.error(f"Error reading bot logs: {e}")
             raise GCSStorageError(f"Failed to read bot logs: {e}") from e
 
+    def get_bot_logs_batch(
+        self,
+        dates: Sequence[str | datetime],
+        account: str = "Main",
+        max_workers: int = 8,
+    ) -> dict[str, pd.DataFrame]:
+        """
+        Get bot trade logs for several dates at once.
+
+        Settled days already in the local cache are read without any request.
+        The remaining dates are resolved with a single listing bounded to their
+        date range; blobs whose cached generation/etag still match are read
+        locally and the rest are downloaded concurrently.
+
+        Args:
+            dates: Date strings (YYYY-MM-DD) or datetime objects
+            account: Account name (default: "Main")
+            max_workers: Maximum concurrent downloads
+
+        Returns:
+            {date_str: DataFrame} in date order, with an empty DataFrame for
+            dates without logs. Dates whose download failed are omitted.
+        """
+        date_strs = sorted({_date_str(d) for d in dates})
+        prefix = f"logs/{account}/trades_"
+        results: dict[str, pd.DataFrame] = {}
+
+        pending = []
+        for date_str in date_strs:
+            cached = self._read_settled(f"{prefix}{date_str}.csv")
+            if cached is not None:
+                results[date_str] = _read_log_csv(cached)
+            else:
+                pending.append(date_str)
+
+        if pending:
+            try:
+                # "~" sorts after ".csv", so the exclusive end offset keeps the last date
+                listed = self.client.list_blobs(
+                    self.bucket_name,
+                    prefix=prefix,
+                    start_offset=f"{prefix}{pending[0]}",
+                    end_offset=f"{prefix}{pending[-1]}~",
+                )
+                blobs = {blob.name: blob for blob in listed}
+            except Exception as e:
+                logger.error(f"Error listing bot logs: {e}")
+                raise GCSStorageError(f"Failed to list bot logs: {e}") from e
+
+            to_fetch = []
+            for date_str in pending:
+                blob = blobs.get(f"{prefix}{date_str}.csv")
+                if blob is None:
+                    results[date_str] = pd.DataFrame()
+                else:
+                    to_fetch.append((date_str, blob))
+
+            if to_fetch:
+                workers = max(1, min(max_workers, len(to_fetch)))
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    futures = {
+                        date_str: executor.submit(self._fetch_cached, blob, date_str)
+                        for date_str, blob in to_fetch
+                    }
+                for date_str, future in futures.items():
+                    try:
+                        results[date_str] = _read_log_csv(future.result())
+                    except Exception as e:
+                        logger.warning(f"Failed to read bot logs for {date_str}: {e}")
+
+        return {d: results[d] for d in date_strs if d in results}
+
     def get_bot_positions(self, account: str = "Main") -> dict:
         """
         Get current bot positions.
@@ -237,6 +346,61 @@ class GCSStorage:
             logger.error(f"Error listing accounts: {e}")
             return []
 
+    # =========================================================================
+    # Local Cache
+    # =========================================================================
+
+    def _cache_paths(self, blob_name: str) -> tuple[Path, Path]:
+        """Return (content path, metadata path) of a cached blob."""
+        path = self.cache_dir / str(self.bucket_name) / blob_name
+        return path, path.with_name(f"{path.name}.meta.json")
+
+    def _read_meta(self, blob_name: str) -> dict[str, Any] | None:
+        """Return metadata of a cached blob, or None if it is not cached."""
+        path, meta_path = self._cache_paths(blob_name)
+        try:
+            meta: dict[str, Any] = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            return None
+        return meta if path.exists() else None
+
+    def _read_settled(self, blob_name: str) -> Path | None:
+        """Return the cached copy of a blob that was stored after its day settled."""
+        meta = self._read_meta(blob_name)
+        if meta is None or not meta.get("settled"):
+            return None
+        return self._cache_paths(blob_name)[0]
+
+    def _fetch_cached(self, blob: Blob, date_str: str) -> Path:
+        """
+        Return a local copy of a blob, downloading it unless the cached
+        generation and etag still match.
+
+        Args:
+            blob: Blob with loaded metadata (from a listing or get_blob)
+            date_str: Log date, used to mark settled days
+
+        Returns:
+            Path to the cached content
+        """
+        path, meta_path = self._cache_paths(blob.name)
+        meta = self._read_meta(blob.name)
+        if meta is not None and (meta.get("generation"), meta.get("etag")) == (
+            blob.generation,
+            blob.etag,
+        ):
+            return path
+
+        _atomic_write(path, blob.download_as_bytes())
+        meta = {
+            "generation": blob.generation,
+            "etag": blob.etag,
+            "settled": _is_settled(date_str),
+        }
+        _atomic_write(meta_path, json.dumps(meta).encode())
+        logger.debug(f"Cached gs://{self.bucket_name}/{blob.name} (generation {blob.generation})")
+        return path
+
     # =========================================================================
     # Models
     # =========================================================================
@@ -460,8 +624,6 @@ def get_gcs_storage() -> GCSStorage | None:
     Returns:
         GCSStorage instance or None
     """
-    import os
-
     if not os.getenv("GCS_BUCKET"):
         return None
 
@@ -13,13 +13,24 @@ from src.exceptions.exchange import (
 )
 from src.exchange.base import Exchange
 from src.exchange.factory import ExchangeFactory, ExchangeName
+from src.exchange.market_data_cache import MarketDataCache
 from src.exchange.protocols import (
     BalanceService,
+    LiveMarketData,
     MarketDataService,
     OrderExecutionService,
     PriceService,
 )
-from src.exchange.types import Balance, Order, OrderSide, OrderStatus, OrderType, Ticker
+from src.exchange.rate_limiter import RateLimiter
+from src.exchange.types import (
+    Balance,
+    IntradayBar,
+    Order,
+    OrderSide,
+    OrderStatus,
+    OrderType,
+    Ticker,
+)
 from src.exchange.upbit import UpbitExchange
 
 __all__ = [
@@ -27,13 +38,17 @@ __all__ = [
     "UpbitExchange",
     "ExchangeFactory",
     "ExchangeName",
+    "MarketDataCache",
+    "RateLimiter",
     # Protocol interfaces
     "PriceService",
     "MarketDataService",
     "OrderExecutionService",
     "BalanceService",
+    "LiveMarketData",
     # Types
     "Balance",
+    "IntradayBar",
     "Order",
     "OrderSide",
     "OrderStatus",
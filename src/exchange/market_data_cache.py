@@ -0,0 +1,196 @@
+"""
+In-process cache of live market data.
+
+The bot's WebSocket loop feeds every ticker message into MarketDataCache,
+which keeps the last price and a running intraday OHLCV bar per symbol.
+Tick handlers read prices and bars from it (LiveMarketData protocol)
+instead of making REST round trips, so tick-to-decision latency does not
+depend on the exchange API and request volume stays flat as the number of
+tickers grows.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+from src.exchange.protocols import PriceService
+from src.exchange.types import IntradayBar
+
+__all__ = ["DEFAULT_MAX_AGE_SECONDS", "MarketDataCache"]
+
+# Entries older than this are treated as unknown (WebSocket stalled)
+DEFAULT_MAX_AGE_SECONDS = 30.0
+
+
+@dataclass(slots=True)
+class _SymbolState:
+    """Mutable per-symbol state (guarded by the cache lock)."""
+
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float
+    updated_at: float  # time.monotonic()
+
+
+class MarketDataCache:
+    """
+    Last price and running intraday bar per symbol, fed by live ticks.
+
+    Usage:
+        cache = MarketDataCache(fallback=exchange)
+        cache.on_ticker(websocket_message)
+        cache.get_last_price("KRW-BTC")      # None if unknown or stale
+        cache.get_current_price("KRW-BTC")   # Falls back to REST (PriceService)
+    """
+
+    def __init__(
+        self,
+        fallback: PriceService | None = None,
+        max_age_seconds: float | None = DEFAULT_MAX_AGE_SECONDS,
+    ) -> None:
+        """
+        Initialize cache.
+
+        Args:
+            fallback: REST price service used by get_current_price on a miss
+            max_age_seconds: Age after which entries are ignored (None: never stale)
+        """
+        self.fallback = fallback
+        self.max_age_seconds = max_age_seconds
+        self._states: dict[str, _SymbolState] = {}
+        self._lock = threading.Lock()
+
+    def update(
+        self,
+        symbol: str,
+        price: float,
+        volume: float = 0.0,
+        open_price: float | None = None,
+        high_price: float | None = None,
+        low_price: float | None = None,
+        day_volume: float | None = None,
+    ) -> None:
+        """
+        Record a trade tick.
+
+        Args:
+            symbol: Trading pair symbol
+            price: Last traded price
+            volume: Traded volume of this tick
+            open_price: Exchange day open (replaces the observed open when given)
+            high_price: Exchange day high (merged with observed ticks)
+            low_price: Exchange day low (merged with observed ticks)
+            day_volume: Exchange accumulated day volume (replaces the running sum)
+        """
+        now = time.monotonic()
+        with self._lock:
+            state = self._states.get(symbol)
+            if state is None:
+                self._states[symbol] = _SymbolState(
+                    open=open_price if open_price is not None else price,
+                    high=max(price, high_price) if high_price is not None else price,
+                    low=min(price, low_price) if low_price is not None else price,
+                    close=price,
+                    volume=day_volume if day_volume is not None else volume,
+                    updated_at=now,
+                )
+                return
+
+            if open_price is not None:
+                state.open = open_price
+            state.high = max(state.high, price, high_price if high_price is not None else price)
+            state.low = min(state.low, price, low_price if low_price is not None else price)
+            state.close = price
+            state.volume = day_volume if day_volume is not None else state.volume + volume
+            state.updated_at = now
+
+    def on_ticker(self, message: Mapping[str, Any]) -> None:
+        """
+        Record an Upbit WebSocket ticker message.
+
+        Uses trade_price and, when present, the exchange day's opening/high/low
+        prices and accumulated volume, so bars are complete from the first
+        message even if the bot started mid-day.
+
+        Args:
+            message: Ticker message ("code", "trade_price", ...)
+        """
+        price = message.get("trade_price")
+        symbol = message.get("code")
+        if price is None or symbol is None:
+            return
+        self.update(
+            symbol,
+            float(price),
+            open_price=_optional_float(message.get("opening_price")),
+            high_price=_optional_float(message.get("high_price")),
+            low_price=_optional_float(message.get("low_price")),
+            day_volume=_optional_float(message.get("acc_trade_volume")),
+        )
+
+    def _fresh(self, symbol: str) -> _SymbolState | None:
+        """State of a symbol if present and not stale (call with the lock held)."""
+        state = self._states.get(symbol)
+        if state is None:
+            return None
+        if (
+            self.max_age_seconds is not None
+            and time.monotonic() - state.updated_at > self.max_age_seconds
+        ):
+            return None
+        return state
+
+    def get_last_price(self, symbol: str) -> float | None:
+        """Get the last traded price, or None if unknown or stale."""
+        with self._lock:
+            state = self._fresh(symbol)
+            return state.close if state is not None else None
+
+    def get_intraday_bar(self, symbol: str) -> IntradayBar | None:
+        """Get the running OHLCV bar of the current day, or None if unknown or stale."""
+        with self._lock:
+            state = self._fresh(symbol)
+            if state is None:
+                return None
+            return IntradayBar(state.open, state.high, state.low, state.close, state.volume)
+
+    def get_current_price(self, symbol: str) -> float:
+        """
+        Get current price (PriceService), using REST only on a cache miss.
+
+        Raises:
+            KeyError: If the price is not cached and there is no fallback
+        """
+        price = self.get_last_price(symbol)
+        if price is not None:
+            return price
+        if self.fallback is None:
+            raise KeyError(f"No live price for {symbol}")
+        return self.fallback.get_current_price(symbol)
+
+    def reset_bars(self) -> None:
+        """Start new intraday bars at the last prices (call at the daily reset)."""
+        with self._lock:
+            for state in self._states.values():
+                state.open = state.high = state.low = state.close
+                state.volume = 0.0
+
+    def symbols(self) -> list[str]:
+        """Symbols with cached data."""
+        with self._lock:
+            return list(self._states)
+
+    def clear(self) -> None:
+        """Drop all cached data."""
+        with self._lock:
+            self._states.clear()
+
+
+def _optional_float(value: Any) -> float | None:
+    return None if value is None else float(value)
@@ -9,7 +9,7 @@ from typing import Protocol
 
 import pandas as pd
 
-from src.exchange.types import Balance, Order
+from src.exchange.types import Balance, IntradayBar, Order
 
 
 class PriceService(Protocol):
@@ -43,6 +43,21 @@ class MarketDataService(Protocol):
         ...
 
 
+class LiveMarketData(Protocol):
+    """Protocol for locally cached live market data (fed by the WebSocket).
+
+    Used by: PositionManager, OrderManager, check_advanced_orders
+    """
+
+    def get_last_price(self, symbol: str) -> float | None:
+        """Get the last traded price, or None if unknown or stale."""
+        ...
+
+    def get_intraday_bar(self, symbol: str) -> IntradayBar | None:
+        """Get the running OHLCV bar of the current day, or None if unknown or stale."""
+        ...
+
+
 class OrderExecutionService(Protocol):
     """Protocol for order execution.
 
@@ -0,0 +1,73 @@
+"""
+Client-side rate limiting for exchange REST calls.
+
+Upbit throttles quotation endpoints per second; when several threads fetch
+data at once (e.g. target initialization fanned out over a thread pool)
+they share one RateLimiter so that the combined request rate stays under
+the exchange quota instead of tripping 429 responses and retries.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+
+__all__ = ["DEFAULT_REQUESTS_PER_SECOND", "RateLimiter"]
+
+# Below Upbit's 10 req/s quotation limit, leaving room for other callers
+DEFAULT_REQUESTS_PER_SECOND = 8.0
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket.
+
+    Usage:
+        limiter = RateLimiter(rate=8.0)
+        limiter.acquire()  # Blocks until a request may be sent
+        exchange.get_ohlcv(...)
+    """
+
+    def __init__(
+        self,
+        rate: float = DEFAULT_REQUESTS_PER_SECOND,
+        burst: int | None = None,
+    ) -> None:
+        """
+        Initialize rate limiter.
+
+        Args:
+            rate: Sustained requests per second
+            burst: Bucket size (default: one second worth of requests)
+        """
+        if rate <= 0:
+            raise ValueError(f"rate must be positive, got {rate}")
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1, int(rate))
+        if self.burst < 1:
+            raise ValueError(f"burst must be at least 1, got {self.burst}")
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Take a token; return how long the caller must wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+            # A negative balance is a queue of callers, each waiting its turn
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+    def acquire(self) -> float:
+        """
+        Block until a request may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self._reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
@@ -56,6 +56,17 @@ class Ticker:
     timestamp: datetime | None = None
 
 
+@dataclass(frozen=True)
+class IntradayBar:
+    """Running OHLCV bar of the current trading day (from live ticks)."""
+
+    open: float
+    high: float
+    low: float
+    close: float
+    volume: float = 0.0
+
+
 @dataclass
 class Order:
     """Order information."""
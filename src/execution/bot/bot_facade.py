@@ -1,5 +1,8 @@
 """TradingBot Facade - Simplified interface for trading operations."""
 
+import datetime
+import threading
+import time
 from pathlib import Path
 
 from src.exchange import Exchange
@@ -14,9 +17,13 @@ from src.execution.signal_handler import SignalHandler
 from src.strategies.volatility_breakout import VanillaVBO
 from src.utils.logger import get_logger, setup_logging
 
-setup_logging()
+# Background writer: log I/O stays off the tick path; repeated loop errors are rate-limited
+setup_logging(use_queue=True, rate_limit_seconds=60.0)
 logger = get_logger(__name__)
 
+# Wait after a failed target refresh before the tick loop retries it
+TARGET_REFRESH_RETRY_SECONDS = 60.0
+
 
 class TradingBotFacade:
     """Facade for trading bot operations."""
@@ -54,7 +61,16 @@ class TradingBotFacade:
         self.trade_handler = components.trade_handler
         self.notification_handler = components.notification_handler
         self.event_bus = components.event_bus
+        self.market_data = components.market_data
+        self.rate_limiter = components.rate_limiter
+        # Replaced as a whole (never mutated), so readers always see a complete set
         self.target_info: dict[str, dict[str, float]] = {}
+        # Trading date target_info was calculated for (entries are blocked once it is past)
+        self.target_date: datetime.date | None = None
+        # Trading date whose reset (exits, bar reset) has run, and last refresh failure
+        self._reset_date: datetime.date | None = None
+        self._refresh_failed_at: float | None = None
+        self._reset_thread: threading.Thread | None = None
 
     def get_krw_balance(self) -> float:
         """Get KRW balance."""
@@ -65,13 +81,29 @@ class TradingBotFacade:
             logger.error(f"Error getting KRW balance: {e}", exc_info=True)
             return 0.0
 
+    def trading_date(self, now: datetime.datetime | None = None) -> datetime.date:
+        """Trading date at now; the day rolls over at the daily reset time."""
+        now = now or datetime.datetime.now()
+        reset = datetime.time(
+            self.bot_config["daily_reset_hour"], self.bot_config["daily_reset_minute"]
+        )
+        if now.time() >= reset:
+            return now.date()
+        return now.date() - datetime.timedelta(days=1)
+
+    def targets_current(self, now: datetime.datetime | None = None) -> bool:
+        """Whether target_info belongs to the current trading date (unstamped = current)."""
+        return self.target_date is None or self.target_date >= self.trading_date(now)
+
     def initialize_targets(self) -> None:
         """Initialize target prices and metrics for all tickers."""
+        self.target_date = self.trading_date()
         self.target_info = initialize_targets(
             tickers=self.tickers,
             signal_handler=self.signal_handler,
             strategy_config=self.strategy_config,
             bot_config=self.bot_config,
+            rate_limiter=self.rate_limiter,
         )
 
     def check_existing_holdings(self) -> None:
@@ -88,8 +120,90 @@ class TradingBotFacade:
         from src.execution.bot.bot_reset import process_exits, recalculate_targets
 
         logger.info("Performing daily reset...")
+        trading_date = self.trading_date()
+        self._reset_date = trading_date
+        self.market_data.reset_bars()
         process_exits(self)
         self.target_info = recalculate_targets(self)
+        self.target_date = trading_date
+
+    def start_daily_reset(self) -> threading.Thread | None:
+        """
+        Perform daily reset without blocking the tick loop.
+
+        Exits are processed immediately; targets are recalculated in a
+        background thread and the new set is swapped in at once when
+        complete. Until then the previous targets belong to the previous
+        trading date, so ticks only run exit checks (no entries, so a ticker
+        sold at the reset cannot be bought back on yesterday's target).
+
+        Returns:
+            The target refresh thread, or None if a reset is already running
+        """
+        from src.execution.bot.bot_reset import process_exits
+
+        if self._reset_running():
+            logger.warning("Daily reset already in progress, skipping")
+            return None
+
+        logger.info("Performing daily reset (background target refresh)...")
+        trading_date = self.trading_date()
+        self._reset_date = trading_date
+        self.market_data.reset_bars()
+        process_exits(self)
+        return self._start_refresh(trading_date)
+
+    def ensure_current_targets(
+        self, now: datetime.datetime | None = None
+    ) -> threading.Thread | None:
+        """
+        Start the daily reset, or retry its target refresh, while targets are stale.
+
+        Called on every tick: the reset starts on the first tick of a new
+        trading date, and a failed refresh is retried after
+        TARGET_REFRESH_RETRY_SECONDS (exits are not processed again).
+
+        Returns:
+            The started thread, or None if targets are current, a refresh
+            is running or the retry backoff has not elapsed
+        """
+        now = now or datetime.datetime.now()
+        if self.targets_current(now) or self._reset_running():
+            return None
+        failed_at = self._refresh_failed_at
+        if failed_at is not None and time.monotonic() - failed_at < TARGET_REFRESH_RETRY_SECONDS:
+            return None
+
+        trading_date = self.trading_date(now)
+        if self._reset_date != trading_date:
+            return self.start_daily_reset()
+        logger.info(f"Retrying target refresh for {trading_date}...")
+        return self._start_refresh(trading_date)
+
+    def _reset_running(self) -> bool:
+        return self._reset_thread is not None and self._reset_thread.is_alive()
+
+    def _start_refresh(self, trading_date: datetime.date) -> threading.Thread:
+        self._reset_thread = threading.Thread(
+            target=self._refresh_targets, args=(trading_date,), name="daily-reset", daemon=True
+        )
+        self._reset_thread.start()
+        return self._reset_thread
+
+    def _refresh_targets(self, trading_date: datetime.date) -> None:
+        """Recalculate targets and swap them in (entries stay blocked on failure)."""
+        from src.execution.bot.bot_reset import recalculate_targets
+
+        try:
+            self.target_info = recalculate_targets(self)
+            self.target_date = trading_date
+            self._refresh_failed_at = None
+        except Exception as e:
+            self._refresh_failed_at = time.monotonic()
+            logger.error(
+                f"Target refresh failed, entries blocked until targets are recalculated: {e}",
+                exc_info=True,
+            )
 
     def _calculate_buy_amount(self) -> float:
         """Calculate buy amount based on available cash and slots."""
@@ -159,6 +273,8 @@ class TradingBotFacade:
             telegram=self.telegram,
             calculate_buy_amount_fn=self._calculate_buy_amount,
             execute_buy_fn=self._execute_buy_order,
+            market_data=self.market_data,
+            allow_entry=self.targets_current(),
         )
 
     def run(self) -> None:
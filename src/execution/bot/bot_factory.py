@@ -10,7 +10,8 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
 from src.config.loader import get_config
-from src.exchange import Exchange, ExchangeFactory
+from src.exchange import Exchange, ExchangeFactory, MarketDataCache, RateLimiter
+from src.exchange.rate_limiter import DEFAULT_REQUESTS_PER_SECOND
 from src.execution.event_bus import get_event_bus
 from src.execution.handlers.notification_handler import NotificationHandler
 from src.execution.handlers.trade_handler import TradeHandler
@@ -45,6 +46,8 @@ class BotComponents:
         trade_handler: TradeHandler,
         notification_handler: NotificationHandler,
         event_bus: EventBus,
+        market_data: MarketDataCache | None = None,
+        rate_limiter: RateLimiter | None = None,
     ) -> None:
         """Initialize bot components."""
         self.exchange = exchange
@@ -57,6 +60,8 @@ class BotComponents:
         self.trade_handler = trade_handler
         self.notification_handler = notification_handler
         self.event_bus = event_bus
+        self.market_data = market_data or MarketDataCache(fallback=exchange)
+        self.rate_limiter = rate_limiter or RateLimiter()
 
 
 class BotComponentFactory:
@@ -107,8 +112,15 @@ class BotComponentFactory:
         trade_handler = TradeHandler()
         notification_handler = NotificationHandler(telegram)
 
-        position_manager = position_manager or PositionManager(exchange, publish_events=True)
-        order_manager = order_manager or OrderManager(exchange, publish_events=True)
+        # Fed by the WebSocket loop; replaces per-tick REST price/candle calls
+        market_data = MarketDataCache(fallback=exchange)
+
+        position_manager = position_manager or PositionManager(
+            exchange, publish_events=True, market_data=market_data
+        )
+        order_manager = order_manager or OrderManager(
+            exchange, publish_events=True, market_data=market_data
+        )
         signal_handler = signal_handler or SignalHandler(
             strategy=strategy,
             exchange=exchange,
@@ -116,6 +128,10 @@ class BotComponentFactory:
             publish_events=True,
         )
         advanced_order_manager = AdvancedOrderManager()
+        # Shared by concurrent REST fetches (target initialization / daily reset)
+        rate_limiter = RateLimiter(
+            self.bot_config.get("api_rate_limit", DEFAULT_REQUESTS_PER_SECOND)
+        )
 
         return BotComponents(
             exchange=exchange,
@@ -128,6 +144,8 @@ class BotComponentFactory:
             trade_handler=trade_handler,
             notification_handler=notification_handler,
             event_bus=event_bus,
+            market_data=market_data,
+            rate_limiter=rate_limiter,
         )
 
     def _create_exchange(self, exchange: Exchange | None) -> Exchange:
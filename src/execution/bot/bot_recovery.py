@@ -6,56 +6,56 @@ Separates initialization/recovery logic from component creation (SRP).
 
 from __future__ import annotations
 
-import time
 from typing import Any
 
-from src.exchange import Exchange
+from src.exchange import Exchange, RateLimiter
+from src.execution.bot.bot_targets import DEFAULT_TARGET_WORKERS, compute_targets
 from src.execution.position_manager import PositionManager
 from src.execution.signal_handler import SignalHandler
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
-API_RETRY_ATTEMPTS = 3
-
 
 def initialize_targets(
     tickers: list[str],
     signal_handler: SignalHandler,
     strategy_config: dict[str, Any],
     bot_config: dict[str, Any],
+    rate_limiter: RateLimiter | None = None,
 ) -> dict[str, dict[str, float]]:
     """
     Initialize target prices and metrics for all tickers.
 
+    Tickers are processed concurrently (bot_config["target_workers"]).
+
     Args:
         tickers: List of trading pair tickers
         signal_handler: Signal handler instance
         strategy_config: Strategy configuration
         bot_config: Bot configuration
+        rate_limiter: Limiter shared by all REST calls (None: unlimited)
 
     Returns:
         Dictionary of ticker -> metrics
     """
     logger.info("Initializing targets...")
-    target_info: dict[str, dict[str, float]] = {}
-    required_period = strategy_config["trend_sma_period"]
-
-    for ticker in tickers:
-        for attempt in range(API_RETRY_ATTEMPTS):
-            metrics = signal_handler.calculate_metrics(ticker, required_period)
-            if metrics:
-                target_info[ticker] = metrics
-                logger.info(
-                    f"[{ticker}] Target: {metrics['target']:.0f} | "
-                    f"K: {metrics['k']:.2f} vs Base: {metrics['long_noise']:.2f} | "
-                    f"SMA: {metrics['sma']:.0f} Trend: {metrics['sma_trend']:.0f}"
-                )
-                break
-            if attempt < API_RETRY_ATTEMPTS - 1:
-                time.sleep(bot_config["api_retry_delay"])
-
-    return target_info
+    refresh = compute_targets(
+        tickers,
+        signal_handler,
+        required_period=strategy_config["trend_sma_period"],
+        retry_delay=bot_config["api_retry_delay"],
+        max_workers=bot_config.get("target_workers", DEFAULT_TARGET_WORKERS),
+        rate_limiter=rate_limiter,
+    )
+
+    for ticker, metrics in refresh.targets.items():
+        logger.info(
+            f"[{ticker}] Target: {metrics['target']:.0f} | "
+            f"K: {metrics['k']:.2f} vs Base: {metrics['long_noise']:.2f} | "
+            f"SMA: {metrics['sma']:.0f} Trend: {metrics['sma_trend']:.0f}"
+        )
+    return refresh.targets
 
 
 def check_existing_holdings(
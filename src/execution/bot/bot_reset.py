@@ -1,10 +1,10 @@
 """Daily reset operations for trading bot."""
 
-import time
 from typing import TYPE_CHECKING, Any
 
 import pandas as pd
 
+from src.execution.bot.bot_targets import DEFAULT_TARGET_WORKERS, TargetRefresh, compute_targets
 from src.utils.logger import get_logger
 
 if TYPE_CHECKING:
@@ -15,7 +15,6 @@ logger = get_logger(__name__)
 # Constants
 YESTERDAY_INDEX = -2
 SMA_EXIT_PERIOD = 5
-API_RETRY_ATTEMPTS = 3
 
 
 def calculate_sma_exit(df: pd.DataFrame | None) -> float | None:
@@ -66,29 +65,30 @@ def recalculate_targets(bot: "TradingBotFacade") -> dict[str, dict[str, float]]:
     Returns:
         Updated target_info dictionary
     """
-    target_info: dict[str, dict[str, float]] = {}
+    refresh = refresh_targets(bot)
     msg = "[DAILY UPDATE]\n"
-    required_period: Any = bot.strategy_config["trend_sma_period"]
-
-    for ticker in bot.tickers:
-        metrics = _calculate_metrics_with_retry(bot, ticker, required_period)
-        if metrics:
-            target_info[ticker] = metrics
-            msg += f"{ticker}: Target {metrics['target']:.0f}, K {metrics['k']:.2f}\n"
+    for ticker, metrics in refresh.targets.items():
+        msg += f"{ticker}: Target {metrics['target']:.0f}, K {metrics['k']:.2f}\n"
 
     bot.telegram.send(msg)
     logger.info(msg)
-    return target_info
-
-
-def _calculate_metrics_with_retry(
-    bot: "TradingBotFacade", ticker: str, required_period: int
-) -> dict[str, float] | None:
-    """Calculate metrics with retry on failure."""
-    for attempt in range(API_RETRY_ATTEMPTS):
-        metrics = bot.signal_handler.calculate_metrics(ticker, required_period)
-        if metrics:
-            return metrics
-        if attempt < API_RETRY_ATTEMPTS - 1:
-            time.sleep(bot.bot_config["api_retry_delay"])
-    return None
+    return refresh.targets
+
+
+def refresh_targets(bot: "TradingBotFacade") -> TargetRefresh:
+    """
+    Calculate targets for all tickers concurrently, with per-ticker timings.
+
+    Uses bot_config["target_workers"] threads and the bot's shared rate
+    limiter (if any). Does not touch bot.target_info; the caller swaps the
+    result in.
+    """
+    required_period: Any = bot.strategy_config["trend_sma_period"]
+    return compute_targets(
+        bot.tickers,
+        bot.signal_handler,
+        required_period=required_period,
+        retry_delay=bot.bot_config["api_retry_delay"],
+        max_workers=bot.bot_config.get("target_workers", DEFAULT_TARGET_WORKERS),
+        rate_limiter=bot.rate_limiter,
+    )
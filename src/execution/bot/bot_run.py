@@ -16,9 +16,6 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
-# Constants
-DAILY_RESET_WINDOW_SECONDS = 10
-
 
 def run_trading_loop(bot: "TradingBotFacade") -> None:
     """
@@ -48,7 +45,12 @@ def run_trading_loop(bot: "TradingBotFacade") -> None:
     if wm is None:
         return  # pragma: no cover
 
-    _main_loop(bot, wm)  # pragma: no cover
+    # Best-effort handlers (notifications) move to worker threads
+    bot.event_bus.start()  # pragma: no cover
+    try:  # pragma: no cover
+        _main_loop(bot, wm)
+    finally:  # pragma: no cover
+        bot.event_bus.stop()
 
 
 def _should_block_in_test(bot: "TradingBotFacade") -> bool:
@@ -108,34 +110,20 @@ def _main_loop(bot: "TradingBotFacade", wm: Any) -> None:  # pragma: no cover
         try:
             data = wm.get()
             if data["type"] == "ticker":
+                bot.market_data.on_ticker(data)
                 ticker = data["code"]
                 current_price = data["trade_price"]
-                now = datetime.datetime.now()
-
-                reset_hour = bot.bot_config["daily_reset_hour"]
-                reset_minute = bot.bot_config["daily_reset_minute"]
 
-                if _is_daily_reset_time(now, reset_hour, reset_minute):
-                    wm.terminate()
-                    bot.daily_reset()
-                    time.sleep(6)
-                    wm = pyupbit.WebSocketManager("ticker", bot.tickers)
-                    continue
+                # Targets refresh in the background once they belong to a past
+                # trading date (retried after failures); the WebSocket stays
+                # connected and ticks only run exit checks until the swap
+                bot.ensure_current_targets(datetime.datetime.now())
 
                 bot.process_ticker_update(ticker, current_price)
 
         except Exception as e:
-            logger.error(f"Loop Error: {e}", exc_info=True)
+            logger.error("Loop Error: %s", e, exc_info=True)
             time.sleep(bot.bot_config["websocket_reconnect_delay"])
             with contextlib.suppress(Exception):
                 wm.terminate()
             wm = pyupbit.WebSocketManager("ticker", bot.tickers)
-
-
-def _is_daily_reset_time(now: datetime.datetime, reset_hour: int, reset_minute: int) -> bool:
-    """Check if current time is daily reset time."""
-    return (
-        now.hour == reset_hour
-        and now.minute == reset_minute
-        and now.second <= DAILY_RESET_WINDOW_SECONDS
-    )
@@ -0,0 +1,158 @@
+"""
+Concurrent target calculation for bot startup and daily reset.
+
+Each ticker needs an OHLCV fetch, indicator computation and target
+calculation. Done one ticker at a time (with REST retries) the wall time
+grows linearly with the universe; here the per-ticker work is fanned out
+over a bounded thread pool whose REST calls share one RateLimiter, so the
+combined request rate stays within the exchange quota.
+"""
+
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+
+from src.exchange.rate_limiter import RateLimiter
+from src.execution.signal_handler import SignalHandler
+from src.utils.logger import get_logger
+
+__all__ = [
+    "API_RETRY_ATTEMPTS",
+    "DEFAULT_TARGET_WORKERS",
+    "TargetRefresh",
+    "TargetTiming",
+    "compute_targets",
+]
+
+logger = get_logger(__name__)
+
+API_RETRY_ATTEMPTS = 3
+DEFAULT_TARGET_WORKERS = 4
+
+# Slowest tickers named in the summary log line
+_SLOWEST_REPORTED = 3
+
+
+@dataclass(frozen=True)
+class TargetTiming:
+    """Outcome and wall time of one ticker's target calculation."""
+
+    ticker: str
+    seconds: float
+    attempts: int
+    ok: bool
+    error: str | None = None
+
+
+@dataclass
+class TargetRefresh:
+    """Result of a target calculation run."""
+
+    targets: dict[str, dict[str, float]] = field(default_factory=dict)
+    timings: list[TargetTiming] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    @property
+    def failed(self) -> list[str]:
+        """Tickers without a target."""
+        return [t.ticker for t in self.timings if not t.ok]
+
+    def summary(self) -> str:
+        """One-line report with the slowest tickers."""
+        slowest = sorted(self.timings, key=lambda t: t.seconds, reverse=True)[:_SLOWEST_REPORTED]
+        text = f"Targets for {len(self.targets)}/{len(self.timings)} tickers in {self.elapsed:.2f}s"
+        if slowest:
+            text += " (slowest: " + ", ".join(f"{t.ticker} {t.seconds:.2f}s" for t in slowest) + ")"
+        if self.failed:
+            text += f" | failed: {', '.join(self.failed)}"
+        return text
+
+
+def _compute_one(
+    ticker: str,
+    signal_handler: SignalHandler,
+    required_period: int,
+    retry_delay: float,
+    rate_limiter: RateLimiter | None,
+    attempts: int,
+) -> tuple[dict[str, float] | None, TargetTiming]:
+    """Calculate one ticker's metrics with retries (runs in a worker thread)."""
+    start = time.perf_counter()
+    error: str | None = None
+    for attempt in range(1, attempts + 1):
+        if rate_limiter is not None:
+            rate_limiter.acquire()
+        try:
+            metrics = signal_handler.calculate_metrics(ticker, required_period)
+        except Exception as e:
+            metrics = None
+            error = f"{type(e).__name__}: {e}"
+        if metrics:
+            return metrics, TargetTiming(ticker, time.perf_counter() - start, attempt, True)
+        if attempt < attempts:
+            time.sleep(retry_delay)
+    return None, TargetTiming(ticker, time.perf_counter() - start, attempts, False, error)
+
+
+def compute_targets(
+    tickers: list[str],
+    signal_handler: SignalHandler,
+    required_period: int,
+    retry_delay: float,
+    max_workers: int = DEFAULT_TARGET_WORKERS,
+    rate_limiter: RateLimiter | None = None,
+    attempts: int = API_RETRY_ATTEMPTS,
+) -> TargetRefresh:
+    """
+    Calculate target metrics for all tickers concurrently.
+
+    A ticker whose calculation keeps failing (or raising) is left out of the
+    targets and reported in the timings; it never aborts the others.
+
+    Args:
+        tickers: Trading pair tickers
+        signal_handler: Signal handler used to calculate metrics
+        required_period: Data period required by the strategy
+        retry_delay: Seconds to wait between attempts
+        max_workers: Maximum number of tickers processed at once
+        rate_limiter: Limiter shared by all REST calls (None: unlimited)
+        attempts: Attempts per ticker
+
+    Returns:
+        TargetRefresh with targets in ticker order and per-ticker timings
+    """
+    refresh = TargetRefresh()
+    if not tickers:
+        return refresh
+
+    start = time.perf_counter()
+    workers = max(1, min(max_workers, len(tickers)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="targets") as executor:
+        results = list(
+            executor.map(
+                lambda ticker: _compute_one(
+                    ticker, signal_handler, required_period, retry_delay, rate_limiter, attempts
+                ),
+                tickers,
+            )
+        )
+    refresh.elapsed = time.perf_counter() - start
+
+    for ticker, (metrics, timing) in zip(tickers, results, strict=True):
+        refresh.timings.append(timing)
+        if metrics is not None:
+            refresh.targets[ticker] = metrics
+        logger.debug(
+            "[%s] target calculation %s in %.3fs (%d attempt(s))",
+            ticker,
+            "ok" if timing.ok else "failed",
+            timing.seconds,
+            timing.attempts,
+        )
+        if timing.error is not None:
+            logger.error("[%s] target calculation failed: %s", ticker, timing.error)
+
+    logger.info(refresh.summary())
+    return refresh
@@ -2,12 +2,21 @@
 Event bus for event-driven architecture.
 
 Provides publish-subscribe pattern for loose coupling between components.
+
+Handlers are CRITICAL (default) or BEST_EFFORT. Critical handlers (order and
+position state) always run synchronously inside publish(). Once the bus is
+started, best-effort handlers (notifications, metrics, persistence) are
+handed to bounded EventQueues drained by worker threads, so a slow
+Telegram or storage endpoint never adds latency to the trading thread.
+Until start() is called every handler runs synchronously.
 """
 
 from collections import defaultdict
 from collections.abc import Callable
+from enum import Enum
 from typing import TypeVar, overload
 
+from src.execution.event_queue import DEFAULT_QUEUE_SIZE, EventQueue, QueueStats
 from src.execution.events import Event, EventType
 from src.utils.logger import get_logger
 
@@ -16,6 +25,18 @@ logger = get_logger(__name__)
 # Type variable for event handlers
 T = TypeVar("T", bound=Event)
 
+DEFAULT_QUEUE = "default"
+
+# High-frequency events coalesced per ticker in best-effort queues
+COALESCED_EVENT_TYPES = frozenset({EventType.PRICE_UPDATE, EventType.TICKER_UPDATE})
+
+
+class Priority(str, Enum):
+    """Dispatch priority of an event handler."""
+
+    CRITICAL = "critical"  # Runs synchronously in publish()
+    BEST_EFFORT = "best_effort"  # Queued to a worker thread once the bus is started
+
 
 class EventBus:
     """
@@ -24,16 +45,28 @@ class EventBus:
     Implements publish-subscribe pattern for decoupled communication.
     """
 
-    def __init__(self) -> None:
-        """Initialize event bus."""
+    def __init__(self, queue_size: int = DEFAULT_QUEUE_SIZE) -> None:
+        """
+        Initialize event bus.
+
+        Args:
+            queue_size: Capacity of each best-effort queue
+        """
         self._subscribers: dict[EventType, list[Callable[[Event], None]]] = defaultdict(list)
         self._global_subscribers: list[Callable[[Event], None]] = []
+        # (event type or None for global, handler) -> queue name of best-effort handlers
+        self._routes: dict[tuple[EventType | None, Callable[[Event], None]], str] = {}
+        self._queues: dict[str, EventQueue] = {}
+        self.queue_size = queue_size
+        self._running = False
 
     @overload
     def subscribe(
         self,
         event_type: EventType | None = None,
         handler: None = None,
+        priority: Priority = Priority.CRITICAL,
+        queue: str | None = None,
     ) -> Callable[[Callable[[Event], None]], Callable[[Event], None]]: ...
 
     @overload
@@ -41,12 +74,16 @@ class EventBus:
         self,
         event_type: EventType | None = None,
         handler: Callable[[Event], None] = ...,
+        priority: Priority = Priority.CRITICAL,
+        queue: str | None = None,
     ) -> Callable[[Event], None]: ...
 
     def subscribe(
         self,
         event_type: EventType | None = None,
         handler: Callable[[Event], None] | None = None,
+        priority: Priority = Priority.CRITICAL,
+        queue: str | None = None,
     ) -> Callable[[Event], None] | Callable[[Callable[[Event], None]], Callable[[Event], None]]:
         """
         Subscribe to events.
@@ -56,6 +93,9 @@ class EventBus:
         Args:
             event_type: Specific event type to subscribe to (None for all events)
             handler: Handler function (required if not used as decorator)
+            priority: CRITICAL (synchronous) or BEST_EFFORT (queued once started)
+            queue: Name of the best-effort queue (handlers sharing a queue share
+                a worker thread; default "default")
 
         Returns:
             Decorator function if used as decorator, handler otherwise
@@ -70,25 +110,46 @@ class EventBus:
             Direct call::
 
                 event_bus.subscribe(EventType.ORDER_PLACED, handle_order)
+
+            Best-effort (off the trading thread once started)::
+
+                event_bus.subscribe(
+                    EventType.ORDER_PLACED, notify, priority=Priority.BEST_EFFORT
+                )
         """
         if handler is None:
             # Used as decorator
             def decorator(func: Callable[[Event], None]) -> Callable[[Event], None]:
-                if event_type is None:
-                    self._global_subscribers.append(func)
-                else:
-                    self._subscribers[event_type].append(func)
+                self._add(event_type, func, priority, queue)
                 return func
 
             return decorator
         else:
             # Direct call
-            if event_type is None:
-                self._global_subscribers.append(handler)
-            else:
-                self._subscribers[event_type].append(handler)
+            self._add(event_type, handler, priority, queue)
             return handler
 
+    def _add(
+        self,
+        event_type: EventType | None,
+        handler: Callable[[Event], None],
+        priority: Priority,
+        queue: str | None,
+    ) -> None:
+        """Register a handler and, if best-effort, its queue."""
+        if event_type is None:
+            self._global_subscribers.append(handler)
+        else:
+            self._subscribers[event_type].append(handler)
+
+        if priority == Priority.BEST_EFFORT:
+            name = queue or DEFAULT_QUEUE
+            self._routes[(event_type, handler)] = name
+            if name not in self._queues:
+                self._queues[name] = EventQueue(name, self.queue_size, COALESCED_EVENT_TYPES)
+                if self._running:
+                    self._queues[name].start()
+
     def unsubscribe(
         self,
         event_type: EventType,
@@ -106,6 +167,7 @@ class EventBus:
         """
         if handler in self._subscribers[event_type]:
             self._subscribers[event_type].remove(handler)
+            self._routes.pop((event_type, handler), None)
             return True
         return False
 
@@ -113,12 +175,17 @@ class EventBus:
         """
         Publish an event to all subscribers.
 
+        Critical handlers run before this returns; best-effort handlers are
+        queued if the bus is started.
+
         Args:
             event: Event to publish
         """
         # Notify specific subscribers
         handlers = self._subscribers.get(event.event_type, [])
         for handler in handlers:
+            if self._dispatch(event.event_type, handler, event):
+                continue
             try:
                 handler(event)
             except Exception as e:
@@ -129,6 +196,8 @@ class EventBus:
 
         # Notify global subscribers
         for handler in self._global_subscribers:
+            if self._dispatch(None, handler, event):
+                continue
             try:
                 handler(event)
             except Exception as e:
@@ -137,10 +206,63 @@ class EventBus:
                     exc_info=True,
                 )
 
+    def _dispatch(
+        self,
+        event_type: EventType | None,
+        handler: Callable[[Event], None],
+        event: Event,
+    ) -> bool:
+        """Queue a best-effort handler call; False if it must run inline."""
+        if not self._running or not self._routes:
+            return False
+        name = self._routes.get((event_type, handler))
+        if name is None:
+            return False
+        self._queues[name].put(handler, event)
+        return True
+
+    @property
+    def is_running(self) -> bool:
+        """Whether best-effort handlers are dispatched to worker threads."""
+        return self._running
+
+    def start(self) -> None:
+        """Start worker threads; best-effort handlers run off the publishing thread."""
+        for queue in self._queues.values():
+            queue.start()
+        self._running = True
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """
+        Stop worker threads after draining queued events.
+
+        Best-effort handlers run synchronously again afterwards.
+
+        Args:
+            timeout: Seconds to wait for each worker
+        """
+        self._running = False
+        for queue in self._queues.values():
+            queue.stop(timeout)
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """
+        Wait until all queued events have been handled.
+
+        Returns:
+            False if a queue did not drain within the timeout
+        """
+        return all(queue.join(timeout) for queue in self._queues.values())
+
+    def queue_stats(self) -> dict[str, QueueStats]:
+        """Depth and counters (processed, coalesced, dropped) of each best-effort queue."""
+        return {name: queue.stats() for name, queue in self._queues.items()}
+
     def clear(self) -> None:
-        """Clear all subscribers."""
+        """Clear all subscribers (queues already holding events still drain them)."""
         self._subscribers.clear()
         self._global_subscribers.clear()
+        self._routes.clear()
 
     def get_subscriber_count(self, event_type: EventType | None = None) -> int:
         """
@@ -0,0 +1,224 @@
+"""
+Bounded dispatch queue for best-effort event handlers.
+
+Used by EventBus once started: handlers subscribed as best-effort
+(notifications, metrics, persistence) are called from a worker thread
+that drains an EventQueue, so a slow endpoint never delays the trading
+thread. publish() never blocks on a full queue:
+
+- High-frequency events (e.g. PRICE_UPDATE) are coalesced: a pending
+  event for the same handler and ticker is replaced by the newer one.
+- When the queue is full, a pending coalescable event is evicted to make
+  room; if there is none, the new event is dropped and counted.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+from src.execution.events import Event, EventType
+from src.utils.logger import get_logger
+
+__all__ = ["DEFAULT_QUEUE_SIZE", "EventQueue", "QueueStats"]
+
+logger = get_logger(__name__)
+
+DEFAULT_QUEUE_SIZE = 1000
+
+
+@dataclass(frozen=True)
+class QueueStats:
+    """Snapshot of an EventQueue's counters."""
+
+    name: str
+    depth: int
+    capacity: int
+    high_water: int
+    processed: int
+    coalesced: int
+    dropped: int
+
+
+class _Item:
+    """Queued handler call (event is replaced in place when coalesced)."""
+
+    __slots__ = ("event", "handler", "key")
+
+    def __init__(
+        self, handler: Callable[[Event], None], event: Event, key: Hashable | None
+    ) -> None:
+        self.handler = handler
+        self.event = event
+        self.key = key
+
+
+class EventQueue:
+    """
+    Bounded queue of handler calls drained by one worker thread.
+
+    Usage:
+        queue = EventQueue("notifications", capacity=1000)
+        queue.start()
+        queue.put(handler, event)   # Never blocks
+        queue.stop()                # Drains pending calls, then joins
+    """
+
+    def __init__(
+        self,
+        name: str,
+        capacity: int = DEFAULT_QUEUE_SIZE,
+        coalesce_types: frozenset[EventType] = frozenset(),
+    ) -> None:
+        """
+        Initialize queue.
+
+        Args:
+            name: Queue name (worker thread name, metrics label)
+            capacity: Maximum number of pending handler calls
+            coalesce_types: Event types whose pending calls are replaced by newer events
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be at least 1, got {capacity}")
+        self.name = name
+        self.capacity = capacity
+        self.coalesce_types = coalesce_types
+        self._items: deque[_Item] = deque()
+        self._pending: dict[Hashable, _Item] = {}
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._stopping = False
+        self._busy = False  # Worker is running a handler
+        self._high_water = 0
+        self._processed = 0
+        self._coalesced = 0
+        self._dropped = 0
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the worker thread is alive."""
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the worker thread (no-op if running)."""
+        with self._cond:
+            if self.is_running:
+                return
+            self._stopping = False
+            self._thread = threading.Thread(
+                target=self._run, name=f"event-queue-{self.name}", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Stop the worker after it has drained the pending calls."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _coalesce_key(self, handler: Callable[[Event], None], event: Event) -> Hashable | None:
+        if event.event_type not in self.coalesce_types:
+            return None
+        return (handler, event.event_type, getattr(event, "ticker", ""))
+
+    def put(self, handler: Callable[[Event], None], event: Event) -> bool:
+        """
+        Queue a handler call without blocking.
+
+        Returns:
+            False if the event was dropped because the queue is full
+        """
+        key = self._coalesce_key(handler, event)
+        with self._cond:
+            if key is not None:
+                pending = self._pending.get(key)
+                if pending is not None:
+                    pending.event = event
+                    self._coalesced += 1
+                    return True
+
+            if len(self._items) >= self.capacity and not self._evict():
+                self._dropped += 1
+                dropped = self._dropped
+                accepted = False
+            else:
+                item = _Item(handler, event, key)
+                self._items.append(item)
+                if key is not None:
+                    self._pending[key] = item
+                self._high_water = max(self._high_water, len(self._items))
+                self._cond.notify()
+                accepted = True
+
+        if not accepted:
+            logger.warning(
+                "Event queue %s full, dropped %s (%d dropped so far)",
+                self.name,
+                event.event_type.value,
+                dropped,
+            )
+        return accepted
+
+    def _evict(self) -> bool:
+        """Drop the oldest pending coalescable call (call with the lock held)."""
+        for item in self._items:
+            if item.key is not None:
+                self._items.remove(item)
+                del self._pending[item.key]
+                self._dropped += 1
+                return True
+        return False
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._items and not self._stopping:
+                    self._cond.wait()
+                if not self._items:
+                    return
+                item = self._items.popleft()
+                if item.key is not None:
+                    del self._pending[item.key]
+                self._busy = True
+
+            try:
+                item.handler(item.event)
+            except Exception as e:
+                logger.error(
+                    "Error in queued event handler for %s: %s",
+                    item.event.event_type,
+                    e,
+                    exc_info=True,
+                )
+            with self._cond:
+                self._busy = False
+                self._processed += 1
+                self._cond.notify_all()
+
+    def join(self, timeout: float | None = None) -> bool:
+        """
+        Wait until every queued call has been processed.
+
+        Returns:
+            False on timeout
+        """
+        with self._cond:
+            return self._cond.wait_for(lambda: not self._items and not self._busy, timeout)
+
+    def stats(self) -> QueueStats:
+        """Current depth and counters."""
+        with self._cond:
+            return QueueStats(
+                name=self.name,
+                depth=len(self._items),
+                capacity=self.capacity,
+                high_water=self._high_water,
+                processed=self._processed,
+                coalesced=self._coalesced,
+                dropped=self._dropped,
+            )
@@ -6,7 +6,7 @@ Handles events for sending notifications (e.g., Telegram).
 
 from typing import TYPE_CHECKING
 
-from src.execution.event_bus import get_event_bus
+from src.execution.event_bus import Priority, get_event_bus
 from src.execution.events import (
     ErrorEvent,
     Event,
@@ -23,6 +23,9 @@ if TYPE_CHECKING:
 
 logger = get_logger(__name__)
 
+# Best-effort queue (worker thread) of the notification handlers
+NOTIFICATION_QUEUE = "notifications"
+
 
 class NotificationHandler:
     """
@@ -43,14 +46,20 @@ class NotificationHandler:
         self._register_handlers()
 
     def _register_handlers(self) -> None:
-        """Register event handlers."""
-        self.event_bus.subscribe(EventType.ENTRY_SIGNAL, self._handle_entry_signal)
-        self.event_bus.subscribe(EventType.EXIT_SIGNAL, self._handle_exit_signal)
-        self.event_bus.subscribe(EventType.ORDER_PLACED, self._handle_order_placed)
-        self.event_bus.subscribe(EventType.POSITION_OPENED, self._handle_position_opened)
-        self.event_bus.subscribe(EventType.POSITION_CLOSED, self._handle_position_closed)
-        self.event_bus.subscribe(EventType.ERROR, self._handle_error)
-        self.event_bus.subscribe(EventType.DAILY_RESET, self._handle_daily_reset)
+        """Register event handlers (best-effort: Telegram calls never block trading)."""
+        subscriptions = {
+            EventType.ENTRY_SIGNAL: self._handle_entry_signal,
+            EventType.EXIT_SIGNAL: self._handle_exit_signal,
+            EventType.ORDER_PLACED: self._handle_order_placed,
+            EventType.POSITION_OPENED: self._handle_position_opened,
+            EventType.POSITION_CLOSED: self._handle_position_closed,
+            EventType.ERROR: self._handle_error,
+            EventType.DAILY_RESET: self._handle_daily_reset,
+        }
+        for event_type, handler in subscriptions.items():
+            self.event_bus.subscribe(
+                event_type, handler, priority=Priority.BEST_EFFORT, queue=NOTIFICATION_QUEUE
+            )
 
     def _handle_entry_signal(self, event: Event) -> None:
         """Handle entry signal event."""
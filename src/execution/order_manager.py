@@ -4,12 +4,18 @@ Order manager for handling order execution.
 Focuses on order placement (SRP). Order tracking is delegated to OrderTracker.
 """
 
-from src.exchange import ExchangeOrderError, InsufficientBalanceError, OrderExecutionService
+from src.exchange import (
+    ExchangeOrderError,
+    InsufficientBalanceError,
+    LiveMarketData,
+    OrderExecutionService,
+)
 from src.exchange.types import Order
 from src.execution.event_bus import EventBus, get_event_bus
 from src.execution.events import EventType, OrderEvent
 from src.execution.order_tracker import OrderTracker
 from src.utils.logger import get_logger
+from src.utils.profiling import get_profiler
 
 logger = get_logger(__name__)
 
@@ -28,6 +34,7 @@ class OrderManager:
         publish_events: bool = True,
         event_bus: EventBus | None = None,
         order_tracker: OrderTracker | None = None,
+        market_data: LiveMarketData | None = None,
     ) -> None:
         """
         Initialize order manager.
@@ -37,11 +44,13 @@ class OrderManager:
             publish_events: Whether to publish events (default: True)
             event_bus: Optional EventBus instance (uses global if not provided)
             order_tracker: Optional OrderTracker (creates default if not provided)
+            market_data: Optional live price cache (REST is used only on a miss)
         """
         self.exchange = exchange
         self.publish_events = publish_events
         self.event_bus = event_bus if event_bus else (get_event_bus() if publish_events else None)
         self.order_tracker = order_tracker or OrderTracker(exchange, self.event_bus)
+        self.market_data = market_data
 
     @property
     def active_orders(self) -> dict[str, Order]:
@@ -72,9 +81,10 @@ class OrderManager:
             return None
 
         try:
-            order = self.exchange.buy_market_order(ticker, amount)
+            with get_profiler().span("bot.order.buy"):
+                order = self.exchange.buy_market_order(ticker, amount)
             self.order_tracker.add_order(order)
-            logger.info(f"Placed buy order: {order.order_id} for {ticker} @ {amount:.0f}")
+            logger.info("Placed buy order: %s for %s @ %.0f", order.order_id, ticker, amount)
 
             self._publish_order_placed(order, ticker, "buy", amount)
             return order
@@ -106,7 +116,7 @@ class OrderManager:
             Order object if successful, None otherwise
         """
         try:
-            current_price = self.exchange.get_current_price(ticker)
+            current_price = self._current_price(ticker)
             order_value = amount * current_price
 
             if order_value < min_order_amount:
@@ -115,9 +125,10 @@ class OrderManager:
                 )
                 return None
 
-            order = self.exchange.sell_market_order(ticker, amount)
+            with get_profiler().span("bot.order.sell"):
+                order = self.exchange.sell_market_order(ticker, amount)
             self.order_tracker.add_order(order)
-            logger.info(f"Placed sell order: {order.order_id} for {ticker} @ {amount:.6f}")
+            logger.info("Placed sell order: %s for %s @ %.6f", order.order_id, ticker, amount)
 
             self._publish_order_placed(order, ticker, "sell", amount)
             return order
@@ -131,6 +142,14 @@ class OrderManager:
             logger.error(f"Unexpected error placing sell order {ticker}: {e}", exc_info=True)
             return None
 
+    def _current_price(self, ticker: str) -> float:
+        """Current price from the live cache, falling back to a REST call."""
+        if self.market_data is not None:
+            price = self.market_data.get_last_price(ticker)
+            if price is not None:
+                return price
+        return self.exchange.get_current_price(ticker)
+
     def _publish_order_placed(self, order: Order, ticker: str, side: str, amount: float) -> None:
         """Publish order placed event."""
         if not self.event_bus:
@@ -164,7 +183,7 @@ class OrderManager:
             balance = self.exchange.get_balance(currency)
 
             if balance.available <= 0:
-                logger.debug(f"No balance to sell for {ticker}")
+                logger.debug("No balance to sell for %s", ticker)
                 return None
 
             return self.place_sell_order(ticker, balance.available, min_order_amount)
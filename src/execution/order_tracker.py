@@ -4,11 +4,14 @@ Order tracking and status management.
 Separates order tracking responsibility from order execution (SRP).
 """
 
+import time
+
 from src.exchange import OrderExecutionService
 from src.exchange.types import Order
 from src.execution.event_bus import EventBus
 from src.execution.events import EventType, OrderEvent
 from src.utils.logger import get_logger
+from src.utils.profiling import get_profiler
 
 logger = get_logger(__name__)
 
@@ -35,13 +38,18 @@ class OrderTracker:
         self.exchange = exchange
         self.event_bus = event_bus
         self.active_orders: dict[str, Order] = {}
+        # Placement times (perf_counter) of orders awaiting a fill, while profiling
+        self._placed_at: dict[str, float] = {}
 
     def add_order(self, order: Order) -> None:
         """Add an order to tracking."""
         self.active_orders[order.order_id] = order
+        if get_profiler().enabled and not order.is_filled:
+            self._placed_at[order.order_id] = time.perf_counter()
 
     def remove_order(self, order_id: str) -> Order | None:
         """Remove an order from tracking."""
+        self._placed_at.pop(order_id, None)
         return self.active_orders.pop(order_id, None)
 
     def get_order(self, order_id: str) -> Order | None:
@@ -65,6 +73,12 @@ class OrderTracker:
             if order_id in self.active_orders:
                 self.active_orders[order_id] = order
 
+            if order.is_filled and order_id in self._placed_at:
+                # Placement-to-fill latency as seen by status polling
+                get_profiler().record(
+                    "bot.fill", time.perf_counter() - self._placed_at.pop(order_id)
+                )
+
             self._publish_status_change(old_order, order)
             return order
         except Exception as e:
@@ -114,6 +128,7 @@ class OrderTracker:
         filled_ids = [order_id for order_id, order in self.active_orders.items() if order.is_filled]
         for order_id in filled_ids:
             self.active_orders.pop(order_id, None)
+            self._placed_at.pop(order_id, None)
 
         if filled_ids:
             logger.debug(f"Cleared {len(filled_ids)} filled orders")
@@ -123,3 +138,4 @@ class OrderTracker:
     def clear_all(self) -> None:
         """Clear all tracked orders."""
         self.active_orders.clear()
+        self._placed_at.clear()
@@ -14,6 +14,7 @@ from src.execution.orders.advanced_orders_models import (
     AdvancedOrder,
     OrderType,
 )
+from src.execution.orders.order_book import TickerOrderBook
 
 __all__ = [
     "AdvancedOrderManager",
@@ -22,4 +23,5 @@ __all__ = [
     "create_trailing_stop_order",
     "AdvancedOrder",
     "OrderType",
+    "TickerOrderBook",
 ]
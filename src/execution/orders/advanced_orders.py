@@ -6,12 +6,17 @@ Supports:
 - Take Profit: Automatically sell when price reaches target
 - Trailing Stop: Automatically adjust stop loss as price moves favorably
 
-Uses specialized handlers for each order type (SRP).
+Uses specialized handlers for each order type (SRP). Active orders are
+indexed per ticker (TickerOrderBook), so a tick only touches the orders of
+its own ticker; finished orders move to a bounded archive.
 """
 
+import logging
+from collections import OrderedDict
 from datetime import date
 
 from src.execution.orders.advanced_orders_models import AdvancedOrder, OrderType
+from src.execution.orders.order_book import TickerOrderBook
 from src.execution.orders.order_handlers import (
     StopLossHandler,
     TakeProfitHandler,
@@ -23,6 +28,7 @@ __all__ = [
     "OrderType",
     "AdvancedOrder",
     "AdvancedOrderManager",
+    "DEFAULT_ARCHIVE_SIZE",
     "StopLossHandler",
     "TakeProfitHandler",
     "TrailingStopHandler",
@@ -37,6 +43,9 @@ __all__ = [
 
 logger = get_logger(__name__)
 
+# Finished (triggered or cancelled) orders kept for lookup by ID
+DEFAULT_ARCHIVE_SIZE = 1000
+
 # Backward compatibility aliases
 create_stop_loss_order = StopLossHandler.create
 create_take_profit_order = TakeProfitHandler.create
@@ -50,7 +59,9 @@ class AdvancedOrderManager:
     """
     Manages advanced orders (stop loss, take profit, trailing stop).
 
-    Uses specialized handlers for each order type.
+    Uses specialized handlers for each order type. `orders` holds the
+    active orders only; triggered and cancelled orders are moved to
+    `archive`, which keeps the most recent `archive_size` of them.
     """
 
     def __init__(
@@ -58,12 +69,51 @@ class AdvancedOrderManager:
         stop_loss_handler: StopLossHandler | None = None,
         take_profit_handler: TakeProfitHandler | None = None,
         trailing_stop_handler: TrailingStopHandler | None = None,
+        archive_size: int = DEFAULT_ARCHIVE_SIZE,
     ) -> None:
-        """Initialize advanced order manager with handlers."""
+        """
+        Initialize advanced order manager with handlers.
+
+        Args:
+            stop_loss_handler: Stop loss handler
+            take_profit_handler: Take profit handler
+            trailing_stop_handler: Trailing stop handler
+            archive_size: Maximum number of finished orders kept in the archive
+        """
         self.orders: dict[str, AdvancedOrder] = {}
+        self.archive: OrderedDict[str, AdvancedOrder] = OrderedDict()
+        self.archive_size = archive_size
         self.stop_loss = stop_loss_handler or StopLossHandler()
         self.take_profit = take_profit_handler or TakeProfitHandler()
         self.trailing_stop = trailing_stop_handler or TrailingStopHandler()
+        self._books: dict[str, TickerOrderBook] = {}
+        self._order_count = 0  # Monotonic, keeps order IDs unique after pruning
+
+    def _register(self, order: AdvancedOrder) -> AdvancedOrder:
+        """Add a new order to the active set and its ticker book."""
+        self._order_count += 1
+        self.orders[order.order_id] = order
+        book = self._books.get(order.ticker)
+        if book is None:
+            book = self._books[order.ticker] = TickerOrderBook(order.ticker)
+        book.add(order)
+        return order
+
+    def _retire(self, book: TickerOrderBook, positions: list[int]) -> list[AdvancedOrder]:
+        """Move orders from a ticker book to the archive."""
+        removed = book.remove(positions)
+        for order in removed:
+            self.orders.pop(order.order_id, None)
+            self.archive[order.order_id] = order
+        while len(self.archive) > self.archive_size:
+            self.archive.popitem(last=False)
+        if not book:
+            del self._books[book.ticker]
+        return removed
+
+    def get_order(self, order_id: str) -> AdvancedOrder | None:
+        """Get an active or archived order by ID."""
+        return self.orders.get(order_id) or self.archive.get(order_id)
 
     def create_stop_loss(
         self,
@@ -80,12 +130,11 @@ class AdvancedOrderManager:
             entry_price=entry_price,
             entry_date=entry_date,
             amount=amount,
-            order_count=len(self.orders),
+            order_count=self._order_count,
             stop_loss_price=stop_loss_price,
             stop_loss_pct=stop_loss_pct,
         )
-        self.orders[order.order_id] = order
-        return order
+        return self._register(order)
 
     def create_take_profit(
         self,
@@ -102,12 +151,11 @@ class AdvancedOrderManager:
             entry_price=entry_price,
             entry_date=entry_date,
             amount=amount,
-            order_count=len(self.orders),
+            order_count=self._order_count,
             take_profit_price=take_profit_price,
             take_profit_pct=take_profit_pct,
         )
-        self.orders[order.order_id] = order
-        return order
+        return self._register(order)
 
     def create_trailing_stop(
         self,
@@ -124,12 +172,11 @@ class AdvancedOrderManager:
             entry_price=entry_price,
             entry_date=entry_date,
             amount=amount,
-            order_count=len(self.orders),
+            order_count=self._order_count,
             trailing_stop_pct=trailing_stop_pct,
             initial_stop_loss_pct=initial_stop_loss_pct,
         )
-        self.orders[order.order_id] = order
-        return order
+        return self._register(order)
 
     def check_orders(
         self,
@@ -142,6 +189,11 @@ class AdvancedOrderManager:
         """
         Check if any orders should be triggered.
 
+        Trailing stops of the ticker are raised and all of its orders are
+        tested in one vectorized pass over the ticker's book; the stop loss
+        and take profit handlers then apply the triggers. Triggered orders
+        are moved to the archive.
+
         Args:
             ticker: Trading pair symbol
             current_price: Current market price
@@ -152,50 +204,82 @@ class AdvancedOrderManager:
         Returns:
             List of triggered orders
         """
-        triggered_orders: list[AdvancedOrder] = []
+        book = self._books.get(ticker)
+        if book is None:
+            return []
 
         check_low = low_price if low_price is not None else current_price
         check_high = high_price if high_price is not None else current_price
 
-        for order in self.orders.values():
-            if not order.is_active or order.is_triggered or order.ticker != ticker:
-                continue
+        raised = book.update_trailing(check_high)
+        if len(raised) and logger.isEnabledFor(logging.DEBUG):
+            for pos in raised:
+                order = book.orders[pos]
+                logger.debug(
+                    "Updated trailing stop for %s: high=%.0f, stop=%.0f",
+                    ticker,
+                    order.highest_price,
+                    order.stop_loss_price if order.stop_loss_price is not None else float("nan"),
+                )
 
-            self.trailing_stop.update(order, check_high)
+        positions, stop_hit = book.scan(check_low, check_high)
+        if not len(positions):
+            return []
 
-            if self.stop_loss.check(order, check_low, current_date):
-                triggered_orders.append(order)
+        triggered_orders: list[AdvancedOrder] = []
+        for pos, is_stop in zip(positions.tolist(), stop_hit.tolist(), strict=True):
+            order = book.orders[pos]
+            # Cancelled or triggered outside the manager: just prune it
+            if not order.is_active or order.is_triggered:
                 continue
-
-            if self.take_profit.check(order, check_high, current_date):
+            if is_stop:
+                fired = self.stop_loss.check(order, check_low, current_date)
+            else:
+                fired = self.take_profit.check(order, check_high, current_date)
+            if fired:
                 triggered_orders.append(order)
 
+        self._retire(book, [p for p in positions.tolist() if not book.orders[p].is_active])
         return triggered_orders
 
     def get_active_orders(self, ticker: str | None = None) -> list[AdvancedOrder]:
         """Get active orders, optionally filtered by ticker."""
-        orders = [o for o in self.orders.values() if o.is_active and not o.is_triggered]
         if ticker:
-            orders = [o for o in orders if o.ticker == ticker]
-        return orders
+            book = self._books.get(ticker)
+            candidates = book.orders if book is not None else []
+        else:
+            candidates = list(self.orders.values())
+        return [o for o in candidates if o.is_active and not o.is_triggered]
 
     def cancel_order(self, order_id: str) -> bool:
         """Cancel an advanced order by ID."""
-        if order_id in self.orders:
-            self.orders[order_id].is_active = False
-            logger.info(f"Cancelled advanced order: {order_id}")
-            return True
-        return False
+        order = self.orders.get(order_id)
+        if order is None:
+            # Already finished: cancelling is a no-op
+            return order_id in self.archive
+
+        order.is_active = False
+        book = self._books[order.ticker]
+        position = book.position_of(order_id)
+        if position is not None:
+            self._retire(book, [position])
+        logger.info(f"Cancelled advanced order: {order_id}")
+        return True
 
     def cancel_all_orders(self, ticker: str | None = None) -> int:
         """Cancel all orders, optionally filtered by ticker."""
+        if ticker:
+            books = [self._books[ticker]] if ticker in self._books else []
+        else:
+            books = list(self._books.values())
+
         count = 0
-        for order in self.orders.values():
-            if ticker and order.ticker != ticker:
-                continue
-            if order.is_active:
-                order.is_active = False
-                count += 1
+        for book in books:
+            for order in book.orders:
+                if order.is_active:
+                    order.is_active = False
+                    count += 1
+            self._retire(book, list(range(len(book))))
 
         if count > 0:
             logger.info(
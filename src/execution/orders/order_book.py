@@ -0,0 +1,127 @@
+"""
+Per-ticker book of active advanced orders.
+
+Trigger levels of a ticker's active orders are kept in parallel NumPy
+arrays (stop loss, take profit, trailing percentage, trailing peak), so a
+tick updates every trailing stop and finds every triggered order of the
+ticker in a handful of vectorized operations. Orders of other tickers and
+orders that already finished are never visited.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+from src.execution.orders.advanced_orders_models import AdvancedOrder, OrderType
+
+__all__ = ["TickerOrderBook"]
+
+
+def _level(value: float | None) -> float:
+    return np.nan if value is None else float(value)
+
+
+class TickerOrderBook:
+    """
+    Active orders of one ticker with their trigger levels as arrays.
+
+    Levels are snapshotted from the AdvancedOrder when it is added; trailing
+    updates are written back to the order so that order.highest_price and
+    order.stop_loss_price stay current. Missing levels are NaN, which never
+    compares true, so no per-type branching is needed in scan().
+    """
+
+    def __init__(self, ticker: str) -> None:
+        """Initialize an empty book for a ticker."""
+        self.ticker = ticker
+        self.orders: list[AdvancedOrder] = []
+        self.stop = np.empty(0)
+        self.take = np.empty(0)
+        self.trail_pct = np.empty(0)
+        self.highest = np.empty(0)
+        self.trailing = np.empty(0, dtype=bool)
+
+    def __len__(self) -> int:
+        return len(self.orders)
+
+    def add(self, order: AdvancedOrder) -> None:
+        """Append an order (insertion order is kept for trigger reporting)."""
+        is_trailing = order.order_type == OrderType.TRAILING_STOP
+        # -inf: a trailing stop without a peak takes the first price seen
+        highest = -np.inf if order.highest_price is None else order.highest_price
+        self.orders.append(order)
+        self.stop = np.append(self.stop, _level(order.stop_loss_price))
+        self.take = np.append(self.take, _level(order.take_profit_price))
+        self.trail_pct = np.append(self.trail_pct, _level(order.trailing_stop_pct))
+        self.highest = np.append(self.highest, highest if is_trailing else np.nan)
+        self.trailing = np.append(self.trailing, is_trailing)
+
+    def update_trailing(self, check_high: float) -> np.ndarray:
+        """
+        Raise trailing peaks and stop levels to a new high.
+
+        Args:
+            check_high: High price of the period
+
+        Returns:
+            Positions of the orders whose peak was raised
+        """
+        raised = self.trailing & (check_high > self.highest)
+        if not raised.any():
+            return np.empty(0, dtype=np.intp)
+
+        self.highest[raised] = check_high
+        moved = raised & ~np.isnan(self.trail_pct)
+        self.stop[moved] = check_high * (1 - self.trail_pct[moved])
+
+        positions = np.flatnonzero(raised)
+        for pos in positions:
+            order = self.orders[pos]
+            order.highest_price = check_high
+            if moved[pos]:
+                order.stop_loss_price = float(self.stop[pos])
+        return positions
+
+    def scan(self, check_low: float, check_high: float) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Find triggered orders; a stop loss takes precedence over a take profit.
+
+        Args:
+            check_low: Low price of the period
+            check_high: High price of the period
+
+        Returns:
+            (positions of triggered orders in insertion order,
+             matching mask that is True where the stop loss fired)
+        """
+        stop_hit = check_low <= self.stop
+        hit = stop_hit | (check_high >= self.take)
+        positions = np.flatnonzero(hit)
+        return positions, stop_hit[positions]
+
+    def remove(self, positions: np.ndarray | list[int]) -> list[AdvancedOrder]:
+        """
+        Remove orders by position.
+
+        Returns:
+            The removed orders
+        """
+        if len(positions) == 0:
+            return []
+        keep = np.ones(len(self.orders), dtype=bool)
+        keep[positions] = False
+        removed = [o for o, k in zip(self.orders, keep, strict=True) if not k]
+        self.orders = [o for o, k in zip(self.orders, keep, strict=True) if k]
+        self.stop = self.stop[keep]
+        self.take = self.take[keep]
+        self.trail_pct = self.trail_pct[keep]
+        self.highest = self.highest[keep]
+        self.trailing = self.trailing[keep]
+        return removed
+
+    def position_of(self, order_id: str) -> int | None:
+        """Position of an order in the book, or None."""
+        for pos, order in enumerate(self.orders):
+            if order.order_id == order_id:
+                return pos
+        return None
@@ -5,7 +5,7 @@ Focuses on position lifecycle management (SRP).
 PnL calculations are delegated to PnLCalculator.
 """
 
-from src.exchange import PriceService
+from src.exchange import LiveMarketData, PriceService
 from src.execution.event_bus import EventBus, get_event_bus
 from src.execution.events import EventType, PositionEvent
 from src.execution.pnl_calculator import PnLCalculator
@@ -32,6 +32,7 @@ class PositionManager:
         publish_events: bool = True,
         event_bus: EventBus | None = None,
         pnl_calculator: PnLCalculator | None = None,
+        market_data: LiveMarketData | None = None,
     ) -> None:
         """
         Initialize position manager.
@@ -41,12 +42,14 @@ class PositionManager:
             publish_events: Whether to publish events (default: True)
             event_bus: Optional EventBus instance (uses global if not provided)
             pnl_calculator: Optional PnLCalculator (creates default if not provided)
+            market_data: Optional live price cache (REST is used only on a miss)
         """
         self.exchange = exchange
         self.positions: dict[str, Position] = {}
         self.publish_events = publish_events
         self.event_bus = event_bus if event_bus else (get_event_bus() if publish_events else None)
         self.pnl_calculator = pnl_calculator or PnLCalculator()
+        self.market_data = market_data
 
     def has_position(self, ticker: str) -> bool:
         """Check if a position exists for a ticker."""
@@ -140,7 +143,11 @@ class PositionManager:
         return position
 
     def get_current_price(self, ticker: str) -> float:
-        """Get current market price for a ticker."""
+        """Get current market price for a ticker (live cache first, then REST)."""
+        if self.market_data is not None:
+            price = self.market_data.get_last_price(ticker)
+            if price is not None:
+                return price
         try:
             return self.exchange.get_current_price(ticker)
         except Exception as e:
@@ -115,7 +115,7 @@ class SignalHandler:
 
             return entry_signal
         except Exception as e:
-            logger.error(f"Error checking entry signal for {ticker}: {e}", exc_info=True)
+            logger.error("Error checking entry signal for %s: %s", ticker, e, exc_info=True)
             return False
 
     def check_exit_signal(self, ticker: str) -> bool:
@@ -154,11 +154,11 @@ class SignalHandler:
                     )
                     self.event_bus.publish(event)
                 except Exception as e:
-                    logger.error(f"Error getting price for exit signal event: {e}", exc_info=True)
+                    logger.error("Error getting price for exit signal event: %s", e, exc_info=True)
 
             return exit_signal
         except Exception as e:
-            logger.error(f"Error checking exit signal for {ticker}: {e}", exc_info=True)
+            logger.error("Error checking exit signal for %s: %s", ticker, e, exc_info=True)
             return False
 
     def calculate_metrics(
@@ -13,9 +13,10 @@ from typing import TYPE_CHECKING, Any
 from src.execution.trade_executor_orders import check_advanced_orders
 from src.execution.trade_executors import BuyExecutor, SellExecutor
 from src.utils.logger import get_logger
+from src.utils.profiling import get_profiler
 
 if TYPE_CHECKING:
-    from src.exchange import Exchange
+    from src.exchange import Exchange, LiveMarketData
     from src.execution.order_manager import OrderManager
     from src.execution.orders.advanced_orders import AdvancedOrderManager
     from src.execution.position_manager import PositionManager
@@ -78,12 +79,48 @@ def process_ticker_update(
     telegram: TelegramNotifier,
     calculate_buy_amount_fn: Callable[[], float],
     execute_buy_fn: Callable[[str, float, float], bool],
+    market_data: LiveMarketData | None = None,
+    allow_entry: bool = True,
 ) -> None:
     """
     Process real-time ticker update and check for entry signals.
 
     Coordinates advanced order checking and entry signal processing.
+    market_data (the WebSocket-fed cache) replaces per-tick REST candle calls.
+    allow_entry=False (e.g. targets not yet refreshed) runs exit checks only.
     """
+    with get_profiler().span("bot.tick"):
+        _handle_tick(
+            ticker,
+            current_price,
+            position_manager,
+            order_manager,
+            advanced_order_manager,
+            signal_handler,
+            trading_config,
+            target_info,
+            calculate_buy_amount_fn,
+            execute_buy_fn,
+            market_data,
+            allow_entry,
+        )
+
+
+def _handle_tick(
+    ticker: str,
+    current_price: float,
+    position_manager: PositionManager,
+    order_manager: OrderManager,
+    advanced_order_manager: AdvancedOrderManager,
+    signal_handler: SignalHandler,
+    trading_config: dict[str, Any],
+    target_info: dict[str, dict[str, float]],
+    calculate_buy_amount_fn: Callable[[], float],
+    execute_buy_fn: Callable[[str, float, float], bool],
+    market_data: LiveMarketData | None = None,
+    allow_entry: bool = True,
+) -> None:
+    """Body of process_ticker_update (timed as the bot.tick span)."""
     # Check advanced orders first
     if position_manager.has_position(ticker):
         triggered = check_advanced_orders(
@@ -94,18 +131,21 @@ def process_ticker_update(
             advanced_order_manager,
             signal_handler,
             trading_config,
+            market_data,
         )
         if triggered:
             return
 
-    # Skip if already holding (after advanced order check)
-    if position_manager.has_position(ticker):
+    # Skip if already holding (after advanced order check) or entries are blocked
+    if not allow_entry or position_manager.has_position(ticker):
         return
 
     # Check entry conditions
     metrics = target_info.get(ticker)
     target_price = metrics.get("target") if metrics else None
-    if not signal_handler.check_entry_signal(ticker, current_price, target_price):
+    with get_profiler().span("bot.signal"):
+        entry = signal_handler.check_entry_signal(ticker, current_price, target_price)
+    if not entry:
         return
 
     # Calculate and validate buy amount
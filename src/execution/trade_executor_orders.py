@@ -8,6 +8,7 @@ from typing import TYPE_CHECKING, Any
 from src.utils.logger import get_logger
 
 if TYPE_CHECKING:
+    from src.exchange import LiveMarketData
     from src.execution.order_manager import OrderManager
     from src.execution.orders.advanced_orders import AdvancedOrderManager
     from src.execution.position_manager import PositionManager
@@ -73,10 +74,14 @@ def check_advanced_orders(
     advanced_order_manager: AdvancedOrderManager,
     signal_handler: SignalHandler,
     trading_config: dict[str, Any],
+    market_data: LiveMarketData | None = None,
 ) -> bool:
     """
     Check and execute advanced orders.
 
+    Today's low/high come from the live market data cache; the REST candle
+    request is only made when the cache has no fresh bar for the ticker.
+
     Args:
         ticker: Trading pair ticker
         current_price: Current market price
@@ -85,17 +90,15 @@ def check_advanced_orders(
         advanced_order_manager: Advanced order manager instance
         signal_handler: Signal handler instance
         trading_config: Trading configuration
+        market_data: Optional live market data cache
 
     Returns:
         True if order triggered
     """
     try:
-        ohlcv_data = signal_handler.get_ohlcv_data(ticker, count=1)
-        if ohlcv_data is not None and len(ohlcv_data) > 0:
-            latest = ohlcv_data.iloc[-1]
-            low_price = latest.get("low", current_price)
-            high_price = latest.get("high", current_price)
-
+        price_range = _intraday_range(ticker, current_price, signal_handler, market_data)
+        if price_range is not None:
+            low_price, high_price = price_range
             triggered = advanced_order_manager.check_orders(
                 ticker=ticker,
                 current_price=current_price,
@@ -121,6 +124,25 @@ def check_advanced_orders(
     return False
 
 
+def _intraday_range(
+    ticker: str,
+    current_price: float,
+    signal_handler: SignalHandler,
+    market_data: LiveMarketData | None,
+) -> tuple[float, float] | None:
+    """Today's (low, high): live cache first, REST candle as fallback."""
+    if market_data is not None:
+        bar = market_data.get_intraday_bar(ticker)
+        if bar is not None:
+            return bar.low, bar.high
+
+    ohlcv_data = signal_handler.get_ohlcv_data(ticker, count=1)
+    if ohlcv_data is None or len(ohlcv_data) == 0:
+        return None
+    latest = ohlcv_data.iloc[-1]
+    return latest.get("low", current_price), latest.get("high", current_price)
+
+
 def _execute_triggered_order(
     ticker: str,
     position_manager: PositionManager,
@@ -6,106 +6,27 @@ Provides consistent, structured logging across all services with support for:
 - Correlation IDs for request tracing
 - Context enrichment
 - Multiple output handlers (console, file, remote)
+- Optional background writer (QueueHandler/QueueListener) for hot loops
 """
 
 from __future__ import annotations
 
-import json
 import logging
 import sys
-import traceback
-from datetime import datetime, timezone
 from functools import wraps
+from logging.handlers import QueueListener
 from pathlib import Path
 from typing import Any, Callable
 
-# =============================================================================
-# JSON Formatter
-# =============================================================================
-
-
-class JSONFormatter(logging.Formatter):
-    """Format log records as JSON for structured logging."""
-
-    def __init__(
-        self,
-        include_timestamp: bool = True,
-        include_level: bool = True,
-        include_logger: bool = True,
-        include_pathname: bool = False,
-        extra_fields: dict[str, Any] | None = None,
-    ):
-        super().__init__()
-        self.include_timestamp = include_timestamp
-        self.include_level = include_level
-        self.include_logger = include_logger
-        self.include_pathname = include_pathname
-        self.extra_fields = extra_fields or {}
-
-    def format(self, record: logging.LogRecord) -> str:
-        """Format the log record as JSON."""
-        log_data: dict[str, Any] = {}
-
-        # Core fields
-        if self.include_timestamp:
-            log_data["timestamp"] = datetime.now(timezone.utc).isoformat()
-
-        if self.include_level:
-            log_data["level"] = record.levelname
-
-        if self.include_logger:
-            log_data["logger"] = record.name
-
-        # Message
-        log_data["message"] = record.getMessage()
-
-        # Location (optional)
-        if self.include_pathname:
-            log_data["pathname"] = record.pathname
-            log_data["lineno"] = record.lineno
-            log_data["funcname"] = record.funcName
-
-        # Exception info
-        if record.exc_info:
-            log_data["exception"] = {
-                "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
-                "message": str(record.exc_info[1]) if record.exc_info[1] else None,
-                "traceback": "".join(traceback.format_exception(*record.exc_info)),
-            }
-
-        # Extra fields from record
-        for key, value in record.__dict__.items():
-            if key not in {
-                "name",
-                "msg",
-                "args",
-                "created",
-                "filename",
-                "funcName",
-                "levelname",
-                "levelno",
-                "lineno",
-                "module",
-                "msecs",
-                "pathname",
-                "process",
-                "processName",
-                "relativeCreated",
-                "stack_info",
-                "exc_info",
-                "exc_text",
-                "message",
-                "thread",
-                "threadName",
-                "taskName",
-            }:
-                log_data[key] = value
-
-        # Static extra fields
-        log_data.update(self.extra_fields)
-
-        return json.dumps(log_data, default=str, ensure_ascii=False)
+from src.utils.logger import (
+    DEFAULT_QUEUE_SIZE,
+    JSONFormatter,
+    RateLimitFilter,
+    start_queue_logging,
+    stop_queue_logging,
+)
 
+__all__ = ["JSONFormatter", "StructuredLogger", "get_logger", "log_execution"]
 
 # =============================================================================
 # Structured Logger
@@ -133,16 +54,21 @@ class StructuredLogger:
         json_output: bool = True,
         log_file: str | Path | None = None,
         extra_fields: dict[str, Any] | None = None,
+        use_queue: bool = False,
+        rate_limit_seconds: float | None = None,
     ):
         self.name = name
         self._context: dict[str, Any] = {}
         self._extra_fields = extra_fields or {}
+        self._listener: QueueListener | None = None
 
         # Create logger
         self._logger = logging.getLogger(name)
         self._logger.setLevel(level)
         self._logger.handlers.clear()
 
+        handlers: list[logging.Handler] = []
+
         # Console handler
         console_handler = logging.StreamHandler(sys.stdout)
         if json_output:
@@ -155,7 +81,7 @@ class StructuredLogger:
                     "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
                 )
             )
-        self._logger.addHandler(console_handler)
+        handlers.append(console_handler)
 
         # File handler (optional)
         if log_file:
@@ -165,10 +91,34 @@ class StructuredLogger:
             file_handler.setFormatter(
                 JSONFormatter(extra_fields={"service": name, **self._extra_fields})
             )
-            self._logger.addHandler(file_handler)
+            handlers.append(file_handler)
+
+        rate_filter = RateLimitFilter(rate_limit_seconds) if rate_limit_seconds else None
+        if use_queue:
+            # Formatting and I/O on a background thread
+            self._listener = start_queue_logging(
+                self._logger, handlers, DEFAULT_QUEUE_SIZE, rate_filter
+            )
+        else:
+            for handler in handlers:
+                if rate_filter is not None:
+                    handler.addFilter(rate_filter)
+                self._logger.addHandler(handler)
+
+    def is_enabled_for(self, level: int) -> bool:
+        """Whether messages at level are emitted (guard for expensive arguments)."""
+        return self._logger.isEnabledFor(level)
+
+    def close(self) -> None:
+        """Flush and stop the background writer (use_queue only)."""
+        if self._listener is not None:
+            stop_queue_logging(self._listener)
+            self._listener = None
 
     def _log(self, level: int, message: str, **kwargs: Any) -> None:
         """Log a message with context and extra fields."""
+        if not self._logger.isEnabledFor(level):
+            return
         extra = {**self._context, **kwargs}
         self._logger.log(level, message, extra=extra)
 
@@ -194,6 +144,8 @@ class StructuredLogger:
 
     def exception(self, message: str, **kwargs: Any) -> None:
         """Log exception with traceback."""
+        if not self._logger.isEnabledFor(logging.ERROR):
+            return
         extra = {**self._context, **kwargs}
         self._logger.exception(message, extra=extra)
 
@@ -242,6 +194,8 @@ def get_logger(
     json_output: bool = True,
     log_file: str | Path | None = None,
     extra_fields: dict[str, Any] | None = None,
+    use_queue: bool = False,
+    rate_limit_seconds: float | None = None,
 ) -> StructuredLogger:
     """
     Get or create a structured logger.
@@ -252,6 +206,8 @@ def get_logger(
         json_output: Use JSON formatting
         log_file: Optional file path for logging
         extra_fields: Extra fields to include in all log records
+        use_queue: Format and write records on a background thread
+        rate_limit_seconds: Suppress identical messages repeated within this window
 
     Returns:
         StructuredLogger instance
@@ -263,6 +219,8 @@ def get_logger(
             json_output=json_output,
             log_file=log_file,
             extra_fields=extra_fields,
+            use_queue=use_queue,
+            rate_limit_seconds=rate_limit_seconds,
         )
     return _loggers[name]
 
@@ -291,6 +249,8 @@ def log_execution(
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
             _logger = logger or get_logger(func.__module__)
+            if not _logger.is_enabled_for(level):
+                return func(*args, **kwargs)
             func_name = func.__qualname__
 
             # Log entry
@@ -13,7 +13,7 @@ from __future__ import annotations
 import time
 from contextlib import contextmanager
 from functools import wraps
-from typing import Any, Callable, Generator
+from typing import TYPE_CHECKING, Any, Callable, Generator
 
 from prometheus_client import (
     REGISTRY,
@@ -26,6 +26,11 @@ from prometheus_client import (
     start_http_server,
 )
 
+from src.utils.profiling import Profiler, get_profiler
+
+if TYPE_CHECKING:
+    from src.execution.event_bus import EventBus
+
 # =============================================================================
 # Metrics Exporter Base
 # =============================================================================
@@ -170,6 +175,37 @@ class TradingMetrics(MetricsExporter):
             registry=self.registry,
         )
 
+        # Instrumented stage durations (src.utils.profiling spans)
+        self.stage_duration = Histogram(
+            self._make_name("stage_duration_seconds"),
+            "Duration of instrumented bot/backtest stages in seconds",
+            ["stage"],
+            buckets=[0.0005, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0],
+            registry=self.registry,
+        )
+
+        # Best-effort event dispatch queues (src.execution.event_bus)
+        self.event_queue_depth = Gauge(
+            self._make_name("event_queue_depth"),
+            "Pending handler calls in a best-effort event queue",
+            ["queue"],
+            registry=self.registry,
+        )
+
+        self.event_queue_dropped = Gauge(
+            self._make_name("event_queue_dropped"),
+            "Events dropped by a full best-effort event queue (cumulative)",
+            ["queue"],
+            registry=self.registry,
+        )
+
+        self.event_queue_coalesced = Gauge(
+            self._make_name("event_queue_coalesced"),
+            "High-frequency events merged into a pending one (cumulative)",
+            ["queue"],
+            registry=self.registry,
+        )
+
         # Bot status
         self.bot_active = Gauge(
             self._make_name("bot_active"),
@@ -194,6 +230,27 @@ class TradingMetrics(MetricsExporter):
         if latency is not None:
             self.order_latency.labels(action=action).observe(latency)
 
+    def observe_span(self, name: str, seconds: float) -> None:
+        """Record a finished profiling span (bot.order.<action> also feeds order_latency)."""
+        self.stage_duration.labels(stage=name).observe(seconds)
+        if name.startswith("bot.order."):
+            self.order_latency.labels(action=name.rsplit(".", 1)[1]).observe(seconds)
+
+    def attach_profiler(self, profiler: Profiler | None = None) -> None:
+        """Export every span of the (global) profiler through observe_span."""
+        (profiler or get_profiler()).add_sink(self.observe_span)
+
+    def attach_event_bus(self, event_bus: EventBus) -> None:
+        """Export depth and drop/coalesce counts of the bus's queues (read at scrape time)."""
+        for name in event_bus.queue_stats():
+
+            def stat(field: str, queue: str = name) -> Callable[[], float]:
+                return lambda: float(getattr(event_bus.queue_stats()[queue], field))
+
+            self.event_queue_depth.labels(queue=name).set_function(stat("depth"))
+            self.event_queue_dropped.labels(queue=name).set_function(stat("dropped"))
+            self.event_queue_coalesced.labels(queue=name).set_function(stat("coalesced"))
+
     def update_position(
         self,
         symbol: str,
@@ -17,6 +17,11 @@ from src.risk.position_sizing import (
     calculate_multi_asset_position_sizes,
     calculate_position_size,
 )
+from src.risk.rolling_risk import (
+    RollingRiskArrays,
+    RollingRiskEngine,
+    calculate_rolling_risk,
+)
 
 __all__ = [
     # Metrics
@@ -25,6 +30,9 @@ __all__ = [
     "calculate_cvar",
     "calculate_portfolio_volatility",
     "calculate_portfolio_correlation",
+    "RollingRiskArrays",
+    "RollingRiskEngine",
+    "calculate_rolling_risk",
     # Position sizing
     "PositionSizingMethod",
     "calculate_position_size",
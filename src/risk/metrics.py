@@ -122,8 +122,8 @@ def calculate_portfolio_risk_metrics(
     # VaR and CVaR
     var_95 = calculate_var(daily_returns, 0.95)
     var_99 = calculate_var(daily_returns, 0.99)
-    cvar_95 = calculate_cvar(daily_returns, 0.95)
-    cvar_99 = calculate_cvar(daily_returns, 0.99)
+    cvar_95 = calculate_cvar(daily_returns, 0.95, var=var_95)
+    cvar_99 = calculate_cvar(daily_returns, 0.99, var=var_99)
 
     # Portfolio volatility
     portfolio_volatility = calculate_portfolio_volatility(daily_returns, annualization_factor)
@@ -36,6 +36,7 @@ def calculate_var(
 def calculate_cvar(
     returns: np.ndarray,
     confidence_level: float = 0.95,
+    var: float | None = None,
 ) -> float:
     """
     Calculate Conditional Value at Risk (CVaR) using historical simulation.
@@ -46,6 +47,7 @@ def calculate_cvar(
     Args:
         returns: Array of portfolio returns
         confidence_level: Confidence level (e.g., 0.95 for 95% CVaR)
+        var: VaR at the same confidence level, if already calculated
 
     Returns:
         CVaR value (negative value representing expected loss)
@@ -53,7 +55,8 @@ def calculate_cvar(
     if len(returns) == 0:
         return 0.0
 
-    var = calculate_var(returns, confidence_level)
+    if var is None:
+        var = calculate_var(returns, confidence_level)
     threshold = -var
     tail_losses = returns[returns <= threshold]
 
@@ -0,0 +1,131 @@
+"""
+Kelly Criterion portfolio sizing.
+
+Contains single-asset Kelly fraction and per-ticker Kelly allocation.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+import pandas as pd
+
+
+def calculate_kelly_criterion(
+    win_rate: float, avg_win: float, avg_loss: float, max_kelly: float = 0.25
+) -> float:
+    """Calculate Kelly Criterion for optimal position sizing."""
+    if not 0.0 <= win_rate <= 1.0:
+        raise ValueError(f"Win rate must be between 0 and 1, got {win_rate}")
+    if avg_loss <= 0:
+        raise ValueError(f"Average loss must be positive, got {avg_loss}")
+    if avg_win <= 0:
+        return 0.0
+
+    payoff_ratio = avg_win / avg_loss
+    kelly = (win_rate * payoff_ratio - (1 - win_rate)) / payoff_ratio
+
+    if kelly <= 0:
+        return 0.0
+    return min(kelly, max_kelly)
+
+
+def optimize_kelly_portfolio(
+    trades: pd.DataFrame, available_cash: float, max_kelly: float = 0.25
+) -> dict[str, float]:
+    """Calculate portfolio allocation using Kelly Criterion for each asset."""
+    if trades.empty:
+        raise ValueError("Trades DataFrame is empty")
+    if "ticker" not in trades.columns:
+        raise ValueError("Trades DataFrame must have 'ticker' column")
+
+    return_col = None
+    for col in ["pnl_pct", "return", "return_pct"]:
+        if col in trades.columns:
+            return_col = col
+            break
+    if return_col is None:
+        raise ValueError("Trades DataFrame must have return column")
+
+    returns = trades[return_col].to_numpy(dtype=float) / 100.0
+    grouped = pd.DataFrame(
+        {
+            "ticker": trades["ticker"].to_numpy(),
+            "win": np.where(returns > 0, returns, 0.0),
+            "loss": np.where(returns < 0, returns, 0.0),
+            "is_win": returns > 0,
+            "is_loss": returns < 0,
+        }
+    ).groupby("ticker", sort=False)
+    stats = grouped.sum()
+    return kelly_allocations_from_stats(
+        tickers=list(stats.index),
+        n_trades=grouped.size().to_numpy(),
+        n_wins=stats["is_win"].to_numpy(),
+        n_losses=stats["is_loss"].to_numpy(),
+        sum_wins=stats["win"].to_numpy(),
+        sum_losses=stats["loss"].to_numpy(),
+        available_cash=available_cash,
+        max_kelly=max_kelly,
+    )
+
+
+def kelly_allocations_from_stats(
+    tickers: Sequence[str],
+    n_trades: np.ndarray,
+    n_wins: np.ndarray,
+    n_losses: np.ndarray,
+    sum_wins: np.ndarray,
+    sum_losses: np.ndarray,
+    available_cash: float,
+    max_kelly: float = 0.25,
+) -> dict[str, float]:
+    """
+    Calculate Kelly allocations from per-ticker trade accumulators.
+
+    Vectorized over tickers, so callers that keep running counts and sums
+    pay O(n_tickers) instead of regrouping the full trade history.
+
+    Args:
+        tickers: Ticker symbols (same order as the arrays)
+        n_trades: Closed trade count per ticker
+        n_wins: Winning trade count per ticker
+        n_losses: Losing trade count per ticker
+        sum_wins: Sum of winning returns (fraction) per ticker
+        sum_losses: Sum of losing returns (fraction, negative) per ticker
+        available_cash: Cash to allocate
+        max_kelly: Cap on the Kelly fraction per ticker
+
+    Returns:
+        Dictionary mapping eligible tickers to allocation
+    """
+    n_trades = np.asarray(n_trades, dtype=float)
+    n_wins = np.asarray(n_wins, dtype=float)
+    n_losses = np.asarray(n_losses, dtype=float)
+
+    eligible = (n_trades >= 2) & (n_wins > 0) & (n_losses > 0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        avg_win = np.asarray(sum_wins, dtype=float) / n_wins
+        avg_loss = -np.asarray(sum_losses, dtype=float) / n_losses
+        eligible &= avg_loss > 0
+        win_rate = n_wins / n_trades
+        payoff_ratio = avg_win / avg_loss
+        kelly = (win_rate * payoff_ratio - (1 - win_rate)) / payoff_ratio
+    kelly = np.clip(np.where(eligible, kelly, 0.0), 0.0, max_kelly)
+
+    allocations = {
+        ticker: available_cash * float(kelly[i]) for i, ticker in enumerate(tickers) if eligible[i]
+    }
+
+    total = sum(allocations.values())
+    if total > available_cash:
+        scale = available_cash / total
+        allocations = {t: a * scale for t, a in allocations.items()}
+
+    return allocations
+
+
+__all__ = [
+    "calculate_kelly_criterion",
+    "optimize_kelly_portfolio",
+    "kelly_allocations_from_stats",
+]
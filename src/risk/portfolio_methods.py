@@ -1,21 +1,31 @@
 """
 Portfolio optimization methods implementation.
 
-Contains MPT, Risk Parity, and Kelly Criterion implementations.
+Contains MPT and Risk Parity implementations. Each method has a
+DataFrame-based entry point and a moment-based solver that accepts
+precomputed (annualized) mean/covariance and optional warm-start weights,
+so callers that maintain rolling statistics can skip the DataFrame round trip.
 """
 
 from typing import Any
 
 import numpy as np
 import pandas as pd
-from scipy.optimize import minimize
 
+from src.risk.portfolio_kelly import calculate_kelly_criterion, optimize_kelly_portfolio
 from src.risk.portfolio_models import PortfolioWeights
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
 
+def minimize(*args: Any, **kwargs: Any) -> Any:
+    """scipy.optimize.minimize, imported on first call (scipy is slow to import)."""
+    from scipy.optimize import minimize as scipy_minimize
+
+    return scipy_minimize(*args, **kwargs)
+
+
 def optimize_mpt(
     returns: pd.DataFrame,
     risk_free_rate: float = 0.0,
@@ -27,12 +37,30 @@ def optimize_mpt(
     if returns.empty or len(returns.columns) == 0:
         raise ValueError("Returns DataFrame is empty or has no columns")
 
-    tickers = list(returns.columns)
+    return solve_mpt(
+        tickers=list(returns.columns),
+        mean_returns=returns.mean().to_numpy() * 252,
+        cov_matrix=returns.cov().to_numpy() * 252,
+        risk_free_rate=risk_free_rate,
+        target_return=target_return,
+        max_weight=max_weight,
+        min_weight=min_weight,
+    )
+
+
+def solve_mpt(
+    tickers: list[str],
+    mean_returns: np.ndarray,
+    cov_matrix: np.ndarray,
+    risk_free_rate: float = 0.0,
+    target_return: float | None = None,
+    max_weight: float = 1.0,
+    min_weight: float = 0.0,
+    initial_weights: np.ndarray | None = None,
+) -> PortfolioWeights:
+    """Maximize Sharpe ratio from annualized mean returns and covariance matrix."""
     n_assets = len(tickers)
 
-    mean_returns = returns.mean() * 252
-    cov_matrix = returns.cov() * 252
-
     def objective(weights: np.ndarray) -> float:
         port_ret: float = float(np.dot(weights, mean_returns))
         port_vol: float = float(np.sqrt(np.dot(weights, np.dot(cov_matrix, weights))))
@@ -45,7 +73,9 @@ def optimize_mpt(
         "fun": lambda w: np.sum(w) - 1.0,
     }
     bounds = tuple((min_weight, max_weight) for _ in range(n_assets))
-    initial_weights = np.array([1.0 / n_assets] * n_assets)
+    equal_weights = np.array([1.0 / n_assets] * n_assets)
+    if initial_weights is None:
+        initial_weights = equal_weights
 
     if target_return is not None:
         constraints = [
@@ -62,7 +92,7 @@ def optimize_mpt(
             constraints=constraints,
             options={"maxiter": 1000},
         )
-        weights = result.x if result.success else np.array([1.0 / n_assets] * n_assets)
+        weights = result.x if result.success else equal_weights
         weights = weights / np.sum(weights)
 
         port_ret = np.dot(weights, mean_returns)
@@ -91,9 +121,25 @@ def optimize_risk_parity(
     if returns.empty or len(returns.columns) == 0:
         raise ValueError("Returns DataFrame is empty or has no columns")
 
-    tickers = list(returns.columns)
+    return solve_risk_parity(
+        tickers=list(returns.columns),
+        mean_returns=returns.mean().to_numpy() * 252,
+        cov_matrix=returns.cov().to_numpy() * 252,
+        max_weight=max_weight,
+        min_weight=min_weight,
+    )
+
+
+def solve_risk_parity(
+    tickers: list[str],
+    mean_returns: np.ndarray,
+    cov_matrix: np.ndarray,
+    max_weight: float = 1.0,
+    min_weight: float = 0.0,
+    initial_weights: np.ndarray | None = None,
+) -> PortfolioWeights:
+    """Equalize risk contributions from annualized mean returns and covariance matrix."""
     n_assets = len(tickers)
-    cov_matrix = returns.cov() * 252
 
     def objective(weights: np.ndarray) -> float:
         port_vol = float(np.sqrt(np.dot(weights, np.dot(cov_matrix, weights))))
@@ -108,7 +154,9 @@ def optimize_risk_parity(
     bounds = tuple((min_weight, max_weight) for _ in range(n_assets))
     vols = np.sqrt(np.diag(cov_matrix))
     inv_vols = 1.0 / (vols + 1e-8)
-    initial_weights = inv_vols / np.sum(inv_vols)
+    inv_vol_weights = inv_vols / np.sum(inv_vols)
+    if initial_weights is None:
+        initial_weights = inv_vol_weights
 
     try:
         result = minimize(
@@ -119,10 +167,9 @@ def optimize_risk_parity(
             constraints=constraints,
             options={"maxiter": 1000},
         )
-        weights = result.x if result.success else initial_weights
+        weights = result.x if result.success else inv_vol_weights
         weights = weights / np.sum(weights)
 
-        mean_returns = returns.mean() * 252
         port_ret = np.dot(weights, mean_returns)
         port_vol = np.sqrt(np.dot(weights, np.dot(cov_matrix, weights)))
         sharpe = port_ret / port_vol if port_vol > 0 else 0.0
@@ -137,85 +184,17 @@ def optimize_risk_parity(
         )
     except Exception as e:
         logger.error(f"Risk parity optimization error: {e}")
-        vols = np.sqrt(np.diag(cov_matrix))
-        inv_vols = 1.0 / (vols + 1e-8)
-        weights = inv_vols / np.sum(inv_vols)
         return PortfolioWeights(
-            weights={t: float(w) for t, w in zip(tickers, weights, strict=False)},
+            weights={t: float(w) for t, w in zip(tickers, inv_vol_weights, strict=False)},
             method="risk_parity",
         )
 
 
-def calculate_kelly_criterion(
-    win_rate: float, avg_win: float, avg_loss: float, max_kelly: float = 0.25
-) -> float:
-    """Calculate Kelly Criterion for optimal position sizing."""
-    if not 0.0 <= win_rate <= 1.0:
-        raise ValueError(f"Win rate must be between 0 and 1, got {win_rate}")
-    if avg_loss <= 0:
-        raise ValueError(f"Average loss must be positive, got {avg_loss}")
-    if avg_win <= 0:
-        return 0.0
-
-    payoff_ratio = avg_win / avg_loss
-    kelly = (win_rate * payoff_ratio - (1 - win_rate)) / payoff_ratio
-
-    if kelly <= 0:
-        return 0.0
-    return min(kelly, max_kelly)
-
-
-def optimize_kelly_portfolio(
-    trades: pd.DataFrame, available_cash: float, max_kelly: float = 0.25
-) -> dict[str, float]:
-    """Calculate portfolio allocation using Kelly Criterion for each asset."""
-    if trades.empty:
-        raise ValueError("Trades DataFrame is empty")
-    if "ticker" not in trades.columns:
-        raise ValueError("Trades DataFrame must have 'ticker' column")
-
-    return_col = None
-    for col in ["pnl_pct", "return", "return_pct"]:
-        if col in trades.columns:
-            return_col = col
-            break
-    if return_col is None:
-        raise ValueError("Trades DataFrame must have return column")
-
-    allocations: dict[str, float] = {}
-
-    for ticker in trades["ticker"].unique():
-        ticker_trades = trades[trades["ticker"] == ticker]
-        if len(ticker_trades) < 2:
-            continue
-
-        returns = ticker_trades[return_col].values / 100.0
-        wins, losses = returns[returns > 0], returns[returns < 0]
-
-        if len(wins) == 0 or len(losses) == 0:
-            continue
-
-        win_rate = len(wins) / len(returns)
-        avg_win = float(np.mean(wins))
-        avg_loss = abs(float(np.mean(losses)))
-
-        if avg_loss == 0:
-            continue
-
-        kelly_pct = calculate_kelly_criterion(win_rate, avg_win, avg_loss, max_kelly)
-        allocations[ticker] = available_cash * kelly_pct
-
-    total = sum(allocations.values())
-    if total > available_cash:
-        scale = available_cash / total
-        allocations = {t: a * scale for t, a in allocations.items()}
-
-    return allocations
-
-
 __all__ = [
     "optimize_mpt",
     "optimize_risk_parity",
+    "solve_mpt",
+    "solve_risk_parity",
     "calculate_kelly_criterion",
     "optimize_kelly_portfolio",
 ]
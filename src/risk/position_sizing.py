@@ -80,6 +80,45 @@ def calculate_position_size(
         return _equal_sizing(available_cash, available_slots)
 
 
+def calculate_position_size_from_volatility(
+    method: PositionSizingMethod,
+    available_cash: float,
+    available_slots: int,
+    current_price: float,
+    volatility: float,
+    target_risk_pct: float = 0.02,
+) -> float:
+    """
+    Calculate position size from a precomputed volatility.
+
+    Array-based variant of calculate_position_size for callers that maintain
+    rolling volatility themselves (e.g. the vectorized backtest engine).
+
+    Args:
+        method: Position sizing method
+        available_cash: Available cash for investment
+        available_slots: Number of available position slots
+        current_price: Current price of the asset
+        volatility: Std of daily returns over the lookback (NaN if insufficient data)
+        target_risk_pct: Target risk percentage per position (for fixed-risk method)
+
+    Returns:
+        Position size in base currency (KRW for KRW pairs)
+    """
+    if available_slots <= 0:
+        return 0.0
+
+    if method == "volatility":
+        return _volatility_based_size(available_cash, available_slots, volatility)
+    elif method == "fixed-risk":
+        return _fixed_risk_size(
+            available_cash, available_slots, current_price, volatility, target_risk_pct
+        )
+    elif method == "inverse-volatility":
+        return _inverse_volatility_size(available_cash, available_slots, volatility)
+    return _equal_sizing(available_cash, available_slots)
+
+
 def _equal_sizing(available_cash: float, available_slots: int) -> float:
     """Equal allocation among available slots."""
     if available_slots <= 0:
@@ -87,6 +126,13 @@ def _equal_sizing(available_cash: float, available_slots: int) -> float:
     return available_cash / available_slots
 
 
+def _returns_volatility(historical_data: pd.DataFrame, lookback_period: int) -> float:
+    """Standard deviation of close-to-close returns over the lookback period."""
+    recent_data = historical_data.tail(lookback_period)
+    returns = recent_data["close"].pct_change().dropna()
+    return float(returns.std())
+
+
 def _volatility_based_sizing(
     available_cash: float,
     available_slots: int,
@@ -102,11 +148,12 @@ def _volatility_based_sizing(
     if len(historical_data) < lookback_period:
         return _equal_sizing(available_cash, available_slots)
 
-    # Calculate volatility (standard deviation of returns)
-    recent_data = historical_data.tail(lookback_period)
-    returns = recent_data["close"].pct_change().dropna()
-    volatility = float(returns.std())
+    volatility = _returns_volatility(historical_data, lookback_period)
+    return _volatility_based_size(available_cash, available_slots, volatility)
 
+
+def _volatility_based_size(available_cash: float, available_slots: int, volatility: float) -> float:
+    """Volatility-based position size from a precomputed volatility."""
     if volatility <= 0 or np.isnan(volatility):
         return _equal_sizing(available_cash, available_slots)
 
@@ -136,11 +183,20 @@ def _fixed_risk_sizing(
     if len(historical_data) < lookback_period:
         return _equal_sizing(available_cash, available_slots)
 
-    # Calculate volatility
-    recent_data = historical_data.tail(lookback_period)
-    returns = recent_data["close"].pct_change().dropna()
-    volatility = float(returns.std())
+    volatility = _returns_volatility(historical_data, lookback_period)
+    return _fixed_risk_size(
+        available_cash, available_slots, current_price, volatility, target_risk_pct
+    )
+
 
+def _fixed_risk_size(
+    available_cash: float,
+    available_slots: int,
+    current_price: float,
+    volatility: float,
+    target_risk_pct: float,
+) -> float:
+    """Fixed-risk position size from a precomputed volatility."""
     if volatility <= 0 or np.isnan(volatility) or current_price <= 0:
         return _equal_sizing(available_cash, available_slots)
 
@@ -172,11 +228,14 @@ def _inverse_volatility_sizing(
     if len(historical_data) < lookback_period:
         return _equal_sizing(available_cash, available_slots)
 
-    # Calculate volatility
-    recent_data = historical_data.tail(lookback_period)
-    returns = recent_data["close"].pct_change().dropna()
-    volatility = returns.std()
+    volatility = _returns_volatility(historical_data, lookback_period)
+    return _inverse_volatility_size(available_cash, available_slots, volatility)
 
+
+def _inverse_volatility_size(
+    available_cash: float, available_slots: int, volatility: float
+) -> float:
+    """Inverse volatility position size from a precomputed volatility."""
     if volatility <= 0 or np.isnan(volatility):
         return _equal_sizing(available_cash, available_slots)
 
@@ -190,13 +249,37 @@ def _inverse_volatility_sizing(
     return base_size * weight
 
 
+def rolling_volatility(closes: pd.Series, lookback_period: int) -> pd.Series:
+    """
+    Rolling volatility matching the lookback used by the sizing methods.
+
+    Value at each row equals ``tail(lookback_period).pct_change().std()`` of
+    the history up to and including that row (NaN until enough data).
+
+    Args:
+        closes: Close price series
+        lookback_period: Lookback period for volatility calculation
+
+    Returns:
+        Rolling volatility series aligned to closes
+    """
+    window = max(lookback_period - 1, 1)
+    return closes.pct_change().rolling(window, min_periods=window).std()
+
+
 # Re-export from position_sizing_multi for backward compatibility
 from src.risk.position_sizing_multi import (  # noqa: E402
     calculate_multi_asset_position_sizes as calculate_multi_asset_position_sizes,
 )
+from src.risk.position_sizing_multi import (  # noqa: E402
+    calculate_multi_asset_position_sizes_from_volatility as calculate_multi_asset_position_sizes_from_volatility,
+)
 
 __all__ = [
     "PositionSizingMethod",
     "calculate_position_size",
+    "calculate_position_size_from_volatility",
+    "rolling_volatility",
     "calculate_multi_asset_position_sizes",
+    "calculate_multi_asset_position_sizes_from_volatility",
 ]
@@ -9,7 +9,10 @@ import pandas as pd
 
 from src.risk.position_sizing import PositionSizingMethod
 
-__all__ = ["calculate_multi_asset_position_sizes"]
+__all__ = [
+    "calculate_multi_asset_position_sizes",
+    "calculate_multi_asset_position_sizes_from_volatility",
+]
 
 
 def calculate_multi_asset_position_sizes(
@@ -42,46 +45,80 @@ def calculate_multi_asset_position_sizes(
         size_per_ticker = available_cash / len(tickers)
         return dict.fromkeys(tickers, size_per_ticker)
 
+    if method in ("volatility", "inverse-volatility", "fixed-risk"):
+        volatilities = {
+            ticker: _historical_volatility(historical_data.get(ticker), lookback_period)
+            for ticker in tickers
+        }
+        return calculate_multi_asset_position_sizes_from_volatility(
+            method, available_cash, tickers, current_prices, volatilities, target_risk_pct
+        )
+
+    # Fallback to equal
+    size_per_ticker = available_cash / len(tickers)
+    return dict.fromkeys(tickers, size_per_ticker)
+
+
+def calculate_multi_asset_position_sizes_from_volatility(
+    method: PositionSizingMethod,
+    available_cash: float,
+    tickers: list[str],
+    current_prices: Mapping[str, float],
+    volatilities: Mapping[str, float],
+    target_risk_pct: float = 0.02,
+) -> dict[str, float]:
+    """
+    Calculate position sizes for multiple assets from precomputed volatilities.
+
+    Array-based variant of calculate_multi_asset_position_sizes; a missing or
+    NaN volatility means insufficient history for that ticker.
+
+    Args:
+        method: Position sizing method
+        available_cash: Total available cash
+        tickers: List of tickers to size positions for
+        current_prices: Current prices for each ticker
+        volatilities: Std of daily returns over the lookback for each ticker
+        target_risk_pct: Target risk per position (for fixed-risk)
+
+    Returns:
+        Dictionary mapping ticker to position size
+    """
     if method == "volatility" or method == "inverse-volatility":
-        return _inverse_volatility_multi(available_cash, tickers, historical_data, lookback_period)
+        return _inverse_volatility_multi(available_cash, tickers, volatilities)
 
     if method == "fixed-risk":
         return _fixed_risk_multi(
-            available_cash,
-            tickers,
-            current_prices,
-            historical_data,
-            target_risk_pct,
-            lookback_period,
+            available_cash, tickers, current_prices, volatilities, target_risk_pct
         )
 
-    # Fallback to equal
     size_per_ticker = available_cash / len(tickers)
     return dict.fromkeys(tickers, size_per_ticker)
 
 
+def _historical_volatility(historical_data: pd.DataFrame | None, lookback_period: int) -> float:
+    """Volatility over the lookback, or NaN if history is missing or too short."""
+    if historical_data is None or len(historical_data) < lookback_period:
+        return float("nan")
+    recent_data = historical_data.tail(lookback_period)
+    return float(recent_data["close"].pct_change().dropna().std())
+
+
 def _inverse_volatility_multi(
     available_cash: float,
     tickers: list[str],
-    historical_data: dict[str, pd.DataFrame],
-    lookback_period: int,
+    volatilities: Mapping[str, float],
 ) -> dict[str, float]:
     """Calculate inverse volatility weights for multiple assets."""
     weights: dict[str, float] = {}
     total_weight = 0.0
 
     for ticker in tickers:
-        if ticker not in historical_data or len(historical_data[ticker]) < lookback_period:
+        volatility = volatilities.get(ticker, np.nan)
+        if np.isnan(volatility) or volatility <= 0:
             weights[ticker] = 1.0
         else:
-            recent_data = historical_data[ticker].tail(lookback_period)
-            returns = recent_data["close"].pct_change().dropna()
-            volatility = returns.std()
-
-            if volatility <= 0 or np.isnan(volatility):
-                weights[ticker] = 1.0
-            else:
-                weights[ticker] = 1.0 / volatility
+            weights[ticker] = 1.0 / volatility
 
         total_weight += weights[ticker]
 
@@ -94,15 +131,15 @@ def _fixed_risk_multi(
     available_cash: float,
     tickers: list[str],
     current_prices: Mapping[str, float],
-    historical_data: dict[str, pd.DataFrame],
+    volatilities: Mapping[str, float],
     target_risk_pct: float,
-    lookback_period: int,
 ) -> dict[str, float]:
     """Calculate fixed risk position sizes for multiple assets."""
     position_values: dict[str, float] = {}
 
     for ticker in tickers:
-        if ticker not in historical_data or len(historical_data[ticker]) < lookback_period:
+        volatility = volatilities.get(ticker, np.nan)
+        if np.isnan(volatility):
             position_values[ticker] = available_cash / len(tickers)
             continue
 
@@ -110,11 +147,7 @@ def _fixed_risk_multi(
             position_values[ticker] = 0.0
             continue
 
-        recent_data = historical_data[ticker].tail(lookback_period)
-        returns = recent_data["close"].pct_change().dropna()
-        volatility = returns.std()
-
-        if volatility <= 0 or np.isnan(volatility):
+        if volatility <= 0:
             position_values[ticker] = available_cash / len(tickers)
         else:
             target_risk_amount = available_cash * target_risk_pct
@@ -0,0 +1,319 @@
+"""
+Rolling portfolio risk engine.
+
+Maintains exponentially weighted (EW) asset means and covariance
+incrementally: each step is one O(n_tickers²) rank-one update instead of
+rebuilding a returns DataFrame and a full correlation matrix. Every step
+appends a row of portfolio risk metrics (EW volatility, rolling
+historical VaR/CVaR, correlation summary, concentration) so the whole
+history is available as arrays.
+
+The same object serves the backtest loop (one update per simulated date,
+or calculate_rolling_risk over a returns matrix) and the live bot (one
+update per daily reset, snapshot() for the current PortfolioRiskMetrics).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+
+from src.risk.metrics import PortfolioRiskMetrics
+
+__all__ = [
+    "RollingRiskArrays",
+    "RollingRiskEngine",
+    "calculate_rolling_risk",
+]
+
+# Row layout of the engine's history buffer
+_FIELDS = (
+    "portfolio_return",
+    "portfolio_volatility",
+    "var_95",
+    "var_99",
+    "cvar_95",
+    "cvar_99",
+    "avg_correlation",
+    "max_correlation",
+    "min_correlation",
+    "max_position_pct",
+    "position_concentration",
+)
+_COLUMN = {name: i for i, name in enumerate(_FIELDS)}
+
+DEFAULT_CAPACITY = 256
+
+
+@dataclass(frozen=True)
+class RollingRiskArrays:
+    """Risk metrics over time, one element per update (NaN until warmed up)."""
+
+    portfolio_return: np.ndarray
+    portfolio_volatility: np.ndarray  # Annualized EW volatility
+    var_95: np.ndarray  # Historical VaR over the trailing window (positive = loss)
+    var_99: np.ndarray
+    cvar_95: np.ndarray
+    cvar_99: np.ndarray
+    avg_correlation: np.ndarray  # Over pairs of warmed-up assets
+    max_correlation: np.ndarray
+    min_correlation: np.ndarray
+    max_position_pct: np.ndarray  # NaN on steps without position values
+    position_concentration: np.ndarray  # Herfindahl-Hirschman Index
+
+    def __len__(self) -> int:
+        return len(self.portfolio_return)
+
+
+def _optional(value: float) -> float | None:
+    return None if np.isnan(value) else float(value)
+
+
+class RollingRiskEngine:
+    """
+    Incremental EW covariance/correlation with rolling risk metrics.
+
+    Usage (live bot, once per day):
+        engine = RollingRiskEngine(tickers)
+        engine.update(asset_returns, portfolio_return, position_values, equity)
+        metrics = engine.snapshot()
+    """
+
+    def __init__(
+        self,
+        tickers: Sequence[str],
+        halflife: float = 30.0,
+        var_window: int = 250,
+        min_periods: int = 20,
+        annualization_factor: int = 365,
+        capacity: int = DEFAULT_CAPACITY,
+    ) -> None:
+        """
+        Initialize engine.
+
+        Args:
+            tickers: Asset order of every returns / position vector
+            halflife: EW half-life in steps for means and covariance
+            var_window: Trailing portfolio returns used for VaR/CVaR
+            min_periods: Observations required before metrics are reported
+            annualization_factor: Steps per year for volatility
+            capacity: Initial number of preallocated history rows
+        """
+        if halflife <= 0:
+            raise ValueError(f"halflife must be positive, got {halflife}")
+        if var_window < 1:
+            raise ValueError(f"var_window must be at least 1, got {var_window}")
+
+        n = len(tickers)
+        self.tickers = list(tickers)
+        self.alpha = 1.0 - 0.5 ** (1.0 / halflife)
+        self.var_window = var_window
+        self.min_periods = max(1, min_periods)
+        self.annualization_factor = annualization_factor
+
+        self._mean = np.zeros(n)
+        self._cov = np.zeros((n, n))
+        self._n_obs = np.zeros(n, dtype=np.int64)
+        self._pairs = np.triu_indices(n, k=1)
+
+        self._port_mean = 0.0
+        self._port_var = 0.0
+        self._window = np.empty(var_window)
+        self._steps = 0
+
+        self._history = np.empty((max(1, capacity), len(_FIELDS)))
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def covariance(self) -> np.ndarray:
+        """Current EW covariance matrix (copy)."""
+        return self._cov.copy()
+
+    def correlation(self) -> np.ndarray:
+        """Current EW correlation matrix (NaN for assets without variance)."""
+        std = np.sqrt(np.diag(self._cov))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            corr: np.ndarray = self._cov / np.outer(std, std)
+        corr[~np.isfinite(corr)] = np.nan
+        return corr
+
+    def portfolio_variance(self, weights: np.ndarray) -> float:
+        """Per-step variance w'Σw of a weighted portfolio under the current covariance."""
+        w = np.asarray(weights, dtype=np.float64)
+        return float(w @ self._cov @ w)
+
+    def _update_covariance(self, returns: np.ndarray) -> None:
+        """Masked EW mean/covariance update: S <- (1-a)(S + a d d') with d = r - mean."""
+        valid = ~np.isnan(returns)
+        first = valid & (self._n_obs == 0)
+        self._mean[first] = returns[first]
+
+        alpha = self.alpha
+        if valid.all():
+            diff = returns - self._mean
+            self._mean += alpha * diff
+            self._cov += alpha * np.multiply.outer(diff, diff)
+            self._cov *= 1.0 - alpha
+        elif valid.any():
+            idx = np.flatnonzero(valid)
+            block = np.ix_(idx, idx)
+            diff = returns[idx] - self._mean[idx]
+            self._mean[idx] += alpha * diff
+            self._cov[block] = (1.0 - alpha) * (
+                self._cov[block] + alpha * np.multiply.outer(diff, diff)
+            )
+        self._n_obs += valid
+
+    def _correlation_stats(self) -> tuple[float, float, float]:
+        """Average, max and min correlation over warmed-up asset pairs."""
+        i, j = self._pairs
+        std = np.sqrt(np.diag(self._cov))
+        ready = (self._n_obs >= self.min_periods) & (std > 0)
+        usable = ready[i] & ready[j]
+        if not usable.any():
+            return np.nan, np.nan, np.nan
+        i, j = i[usable], j[usable]
+        corr = self._cov[i, j] / (std[i] * std[j])
+        return float(corr.mean()), float(corr.max()), float(corr.min())
+
+    def _tail_risk(self) -> tuple[float, float, float, float]:
+        """Historical VaR/CVaR at 95% and 99% over the trailing window."""
+        if self._steps < self.min_periods:
+            return np.nan, np.nan, np.nan, np.nan
+        window = self._window[: min(self._steps, self.var_window)]
+        var_95, var_99 = -np.percentile(window, [5.0, 1.0])
+        tail_95 = window[window <= -var_95]
+        tail_99 = window[window <= -var_99]
+        cvar_95 = -float(tail_95.mean()) if len(tail_95) else float(var_95)
+        cvar_99 = -float(tail_99.mean()) if len(tail_99) else float(var_99)
+        return float(var_95), float(var_99), cvar_95, cvar_99
+
+    def update(
+        self,
+        asset_returns: np.ndarray,
+        portfolio_return: float,
+        position_values: np.ndarray | None = None,
+        total_value: float | None = None,
+    ) -> None:
+        """
+        Add one step of returns and record its risk metrics.
+
+        Args:
+            asset_returns: Per-asset returns in ticker order (NaN = no data)
+            portfolio_return: Portfolio return of the step
+            position_values: Per-asset position values (for concentration)
+            total_value: Portfolio value the positions are measured against
+        """
+        returns = np.asarray(asset_returns, dtype=np.float64)
+        if returns.shape != self._mean.shape:
+            raise ValueError(f"Expected {len(self._mean)} asset returns, got shape {returns.shape}")
+        self._update_covariance(returns)
+
+        diff = portfolio_return - self._port_mean
+        self._port_mean += self.alpha * diff
+        self._port_var = (1.0 - self.alpha) * (self._port_var + self.alpha * diff * diff)
+        self._window[self._steps % self.var_window] = portfolio_return
+        self._steps += 1
+
+        if self._size == len(self._history):
+            grown = np.empty((len(self._history) * 2, len(_FIELDS)))
+            grown[: self._size] = self._history
+            self._history = grown
+        row = self._history[self._size]
+        row[:] = np.nan
+        row[_COLUMN["portfolio_return"]] = portfolio_return
+
+        if self._steps >= self.min_periods:
+            row[_COLUMN["portfolio_volatility"]] = np.sqrt(
+                self._port_var * self.annualization_factor
+            )
+        row[_COLUMN["var_95"] : _COLUMN["cvar_99"] + 1] = self._tail_risk()
+        row[_COLUMN["avg_correlation"] : _COLUMN["min_correlation"] + 1] = self._correlation_stats()
+
+        if position_values is not None and total_value:
+            pcts = np.asarray(position_values, dtype=np.float64) / total_value
+            if len(pcts):
+                row[_COLUMN["max_position_pct"]] = pcts.max()
+                row[_COLUMN["position_concentration"]] = float(pcts @ pcts)
+
+        self._size += 1
+
+    def history(self) -> RollingRiskArrays:
+        """Metrics of every update so far (column views, no copies)."""
+        rows = self._history[: self._size]
+        return RollingRiskArrays(**{name: rows[:, i] for i, name in enumerate(_FIELDS)})
+
+    def snapshot(self) -> PortfolioRiskMetrics:
+        """
+        Latest step as PortfolioRiskMetrics.
+
+        Raises:
+            ValueError: If no update has been made
+        """
+        if self._size == 0:
+            raise ValueError("No risk updates recorded")
+        last = self._history[self._size - 1]
+        values = {name: float(last[_COLUMN[name]]) for name in _FIELDS}
+        return PortfolioRiskMetrics(
+            var_95=float(np.nan_to_num(values["var_95"])),
+            var_99=float(np.nan_to_num(values["var_99"])),
+            cvar_95=float(np.nan_to_num(values["cvar_95"])),
+            cvar_99=float(np.nan_to_num(values["cvar_99"])),
+            portfolio_volatility=float(np.nan_to_num(values["portfolio_volatility"])),
+            avg_correlation=_optional(values["avg_correlation"]),
+            max_correlation=_optional(values["max_correlation"]),
+            min_correlation=_optional(values["min_correlation"]),
+            max_position_pct=_optional(values["max_position_pct"]),
+            position_concentration=_optional(values["position_concentration"]),
+        )
+
+
+def calculate_rolling_risk(
+    tickers: Sequence[str],
+    asset_returns: np.ndarray,
+    portfolio_returns: np.ndarray,
+    position_values: np.ndarray | None = None,
+    total_values: np.ndarray | None = None,
+    halflife: float = 30.0,
+    var_window: int = 250,
+    min_periods: int = 20,
+    annualization_factor: int = 365,
+) -> RollingRiskArrays:
+    """
+    Run the rolling risk engine over a whole backtest.
+
+    Args:
+        tickers: Asset order of the columns
+        asset_returns: Returns matrix (n_dates x n_tickers, NaN = no data)
+        portfolio_returns: Portfolio return per date
+        position_values: Position values (n_dates x n_tickers), optional
+        total_values: Portfolio value per date (required with position_values)
+        halflife: EW half-life in dates
+        var_window: Trailing dates used for VaR/CVaR
+        min_periods: Observations required before metrics are reported
+        annualization_factor: Dates per year for volatility
+
+    Returns:
+        RollingRiskArrays with one element per date
+    """
+    n_dates = len(portfolio_returns)
+    engine = RollingRiskEngine(
+        tickers,
+        halflife=halflife,
+        var_window=var_window,
+        min_periods=min_periods,
+        annualization_factor=annualization_factor,
+        capacity=max(1, n_dates),
+    )
+    for d in range(n_dates):
+        engine.update(
+            asset_returns[d],
+            float(portfolio_returns[d]),
+            None if position_values is None else position_values[d],
+            None if total_values is None else float(total_values[d]),
+        )
+    return engine.history()
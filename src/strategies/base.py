@@ -11,6 +11,7 @@ This module re-exports all base components for backward compatibility:
 """
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 import pandas as pd
 
@@ -18,6 +19,9 @@ import pandas as pd
 from src.strategies.base_conditions import CompositeCondition, Condition, Filter
 from src.strategies.base_models import OHLCV, Position, Signal, SignalType
 
+if TYPE_CHECKING:
+    from src.strategies.expressions import Expr
+
 __all__ = [
     # Models
     "SignalType",
@@ -205,6 +209,19 @@ class Strategy(ABC):
 
         return df
 
+    def signal_expressions(self) -> tuple["Expr", "Expr"] | None:
+        """
+        Entry and exit rules as condition expressions.
+
+        Strategies whose generate_signals evaluates compiled expressions
+        return them here so caches can key on the rules themselves
+        (including thresholds) rather than on condition names.
+
+        Returns:
+            (entry expression, exit expression), or None
+        """
+        return None
+
     def check_entry(
         self,
         current: OHLCV,
@@ -8,11 +8,15 @@ Contains condition abstractions for composable entry/exit logic:
 """
 
 from abc import ABC, abstractmethod
+from typing import TYPE_CHECKING
 
 import pandas as pd
 
 from src.strategies.base_models import OHLCV
 
+if TYPE_CHECKING:
+    from src.strategies.expressions import Expr
+
 
 class Condition(ABC):
     """
@@ -51,6 +55,16 @@ class Condition(ABC):
         """
         pass
 
+    def expression(self) -> "Expr | None":
+        """
+        Vectorized form of this condition for expression-based signal builders.
+
+        Returns:
+            Condition expression over indicator columns, or None if the
+            signal builder should look the condition up by name
+        """
+        return None
+
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}(name={self.name!r})"
 
@@ -0,0 +1,420 @@
+"""
+Condition expressions for vectorized signal generation.
+
+A small typed AST of column references, constants, arithmetic,
+comparisons and boolean combinators:
+
+    entry = all_of(col("high") >= col("target"), col("target") > col("sma"))
+
+Expressions compile once (cached by canonical form) into a flat program of
+NumPy ufunc calls that write into reused buffers, so evaluating a whole
+entry or exit rule costs a few preallocated arrays instead of one pandas
+Series per condition. Programs evaluate over any mapping of equally shaped
+(or broadcastable) arrays: a ticker's DataFrame columns or the
+(n_tickers, n_dates) grid from build_numpy_arrays.
+
+NaN semantics match pandas: comparisons involving NaN are False.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+from collections.abc import Mapping
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+__all__ = [
+    "And",
+    "Arith",
+    "Column",
+    "Compare",
+    "CompiledExpression",
+    "Constant",
+    "Expr",
+    "Not",
+    "Or",
+    "all_of",
+    "any_of",
+    "canonical",
+    "col",
+    "compile_expression",
+    "condition_expression",
+    "evaluate_frame",
+    "expression_hash",
+    "lit",
+]
+
+_ARITH_UFUNCS: dict[str, np.ufunc] = {
+    "+": np.add,
+    "-": np.subtract,
+    "*": np.multiply,
+    "/": np.true_divide,
+}
+
+_COMPARE_UFUNCS: dict[str, np.ufunc] = {
+    "<": np.less,
+    "<=": np.less_equal,
+    ">": np.greater,
+    ">=": np.greater_equal,
+    "==": np.equal,
+    "!=": np.not_equal,
+}
+
+# a > b is written b < a (and a >= b as b <= a) in canonical form
+_MIRRORED = {">": "<", ">=": "<="}
+
+
+class Expr:
+    """Base class of expression nodes (supports <, <=, >, >=, + - * /, &, |, ~)."""
+
+    def __lt__(self, other: object) -> Compare:
+        return Compare("<", self, _wrap(other))
+
+    def __le__(self, other: object) -> Compare:
+        return Compare("<=", self, _wrap(other))
+
+    def __gt__(self, other: object) -> Compare:
+        return Compare(">", self, _wrap(other))
+
+    def __ge__(self, other: object) -> Compare:
+        return Compare(">=", self, _wrap(other))
+
+    def __add__(self, other: object) -> Arith:
+        return Arith("+", self, _wrap(other))
+
+    def __sub__(self, other: object) -> Arith:
+        return Arith("-", self, _wrap(other))
+
+    def __mul__(self, other: object) -> Arith:
+        return Arith("*", self, _wrap(other))
+
+    def __truediv__(self, other: object) -> Arith:
+        return Arith("/", self, _wrap(other))
+
+    def __and__(self, other: Expr) -> And:
+        return And((self, other))
+
+    def __or__(self, other: Expr) -> Or:
+        return Or((self, other))
+
+    def __invert__(self) -> Not:
+        return Not(self)
+
+
+@dataclass(frozen=True, eq=True)
+class Column(Expr):
+    """Reference to an indicator or OHLCV column."""
+
+    name: str
+
+
+@dataclass(frozen=True, eq=True)
+class Constant(Expr):
+    """Numeric or boolean literal."""
+
+    value: float | bool
+
+
+@dataclass(frozen=True, eq=True)
+class Arith(Expr):
+    """Binary arithmetic (+, -, *, /)."""
+
+    op: str
+    left: Expr
+    right: Expr
+
+    def __post_init__(self) -> None:
+        if self.op not in _ARITH_UFUNCS:
+            raise ValueError(f"Unknown arithmetic operator: {self.op}")
+
+
+@dataclass(frozen=True, eq=True)
+class Compare(Expr):
+    """Comparison (<, <=, >, >=, ==, !=)."""
+
+    op: str
+    left: Expr
+    right: Expr
+
+    def __post_init__(self) -> None:
+        if self.op not in _COMPARE_UFUNCS:
+            raise ValueError(f"Unknown comparison operator: {self.op}")
+
+
+@dataclass(frozen=True, eq=True)
+class And(Expr):
+    """Conjunction (True when empty)."""
+
+    terms: tuple[Expr, ...]
+
+
+@dataclass(frozen=True, eq=True)
+class Or(Expr):
+    """Disjunction (False when empty)."""
+
+    terms: tuple[Expr, ...]
+
+
+@dataclass(frozen=True, eq=True)
+class Not(Expr):
+    """Negation."""
+
+    term: Expr
+
+
+def _wrap(value: object) -> Expr:
+    if isinstance(value, Expr):
+        return value
+    if isinstance(value, bool | int | float | np.number):
+        return Constant(value if isinstance(value, bool) else float(value))
+    raise TypeError(f"Cannot use {type(value).__name__} in an expression")
+
+
+def col(name: str) -> Column:
+    """Column reference."""
+    return Column(name)
+
+
+def lit(value: float | bool) -> Constant:
+    """Literal constant."""
+    return Constant(value if isinstance(value, bool) else float(value))
+
+
+def all_of(*terms: Expr) -> Expr:
+    """AND of terms (a single term is returned as is)."""
+    return terms[0] if len(terms) == 1 else And(terms)
+
+
+def any_of(*terms: Expr) -> Expr:
+    """OR of terms (a single term is returned as is)."""
+    return terms[0] if len(terms) == 1 else Or(terms)
+
+
+def condition_expression(condition: object) -> Expr | None:
+    """Expression a condition supplies through Condition.expression, if any."""
+    hook = getattr(condition, "expression", None)
+    expr = hook() if callable(hook) else None
+    return expr if isinstance(expr, Expr) else None
+
+
+# =========================================================================
+# Canonical form
+# =========================================================================
+
+
+def _flatten(node: Expr, kind: type[And] | type[Or]) -> list[Expr]:
+    if isinstance(node, kind):
+        return [leaf for term in node.terms for leaf in _flatten(term, kind)]
+    return [node]
+
+
+def canonical(expr: Expr) -> str:
+    """
+    Canonical text of an expression.
+
+    Equivalent spellings share one form: AND/OR are flattened, deduplicated
+    and sorted, + and * operands are sorted, and > / >= are mirrored to
+    < / <=.
+    """
+    if isinstance(expr, Column):
+        return expr.name
+    if isinstance(expr, Constant):
+        return repr(expr.value) if isinstance(expr.value, bool) else repr(float(expr.value))
+    if isinstance(expr, Arith):
+        lhs, rhs = canonical(expr.left), canonical(expr.right)
+        if expr.op in "+*" and rhs < lhs:
+            lhs, rhs = rhs, lhs
+        return f"({lhs} {expr.op} {rhs})"
+    if isinstance(expr, Compare):
+        op, left, right = expr.op, expr.left, expr.right
+        if op in _MIRRORED:
+            op, left, right = _MIRRORED[op], right, left
+        return f"({canonical(left)} {op} {canonical(right)})"
+    if isinstance(expr, And | Or):
+        kind = type(expr)
+        parts = sorted({canonical(t) for t in _flatten(expr, kind)})
+        if len(parts) == 1:
+            return parts[0]
+        return f"{'and' if kind is And else 'or'}({', '.join(parts)})"
+    if isinstance(expr, Not):
+        return f"not({canonical(expr.term)})"
+    raise TypeError(f"Unknown expression node: {type(expr).__name__}")
+
+
+def expression_hash(expr: Expr) -> str:
+    """Stable hash of the canonical form (cache key for compiled programs and data)."""
+    return hashlib.sha256(canonical(expr).encode()).hexdigest()[:16]
+
+
+# =========================================================================
+# Compilation
+# =========================================================================
+
+# Operand: ("col", name) | ("const", value) | ("slot", index)
+_Operand = tuple[str, Any]
+
+
+class _Emitter:
+    """Lowers an AST to ufunc instructions over a pool of reusable slots."""
+
+    def __init__(self) -> None:
+        self.program: list[tuple[np.ufunc, tuple[_Operand, ...], int]] = []
+        self.slot_kinds: list[str] = []
+        self._free: dict[str, list[int]] = {"float": [], "bool": []}
+        self.columns: set[str] = set()
+
+    def _alloc(self, kind: str) -> int:
+        if self._free[kind]:
+            return self._free[kind].pop()
+        self.slot_kinds.append(kind)
+        return len(self.slot_kinds) - 1
+
+    def _release(self, operand: _Operand) -> None:
+        if operand[0] == "slot":
+            self._free[self.slot_kinds[operand[1]]].append(operand[1])
+
+    def _apply(self, ufunc: np.ufunc, kind: str, *args: _Operand) -> _Operand:
+        for arg in args:
+            self._release(arg)
+        out = self._alloc(kind)
+        self.program.append((ufunc, args, out))
+        return ("slot", out)
+
+    def _as_bool_slot(self, operand: _Operand) -> _Operand:
+        if operand[0] == "slot" and self.slot_kinds[operand[1]] == "bool":
+            return operand
+        return self._apply(np.logical_and, "bool", operand, ("const", True))
+
+    def emit(self, expr: Expr) -> _Operand:
+        if isinstance(expr, Column):
+            self.columns.add(expr.name)
+            return ("col", expr.name)
+        if isinstance(expr, Constant):
+            return ("const", expr.value)
+        if isinstance(expr, Arith):
+            left, right = self.emit(expr.left), self.emit(expr.right)
+            return self._apply(_ARITH_UFUNCS[expr.op], "float", left, right)
+        if isinstance(expr, Compare):
+            left, right = self.emit(expr.left), self.emit(expr.right)
+            return self._apply(_COMPARE_UFUNCS[expr.op], "bool", left, right)
+        if isinstance(expr, And | Or):
+            if not expr.terms:
+                return ("const", isinstance(expr, And))
+            combine = np.logical_and if isinstance(expr, And) else np.logical_or
+            acc = self._as_bool_slot(self.emit(expr.terms[0]))
+            for term in expr.terms[1:]:
+                operand = self.emit(term)
+                self.program.append((combine, (acc, operand), acc[1]))
+                self._release(operand)
+            return acc
+        if isinstance(expr, Not):
+            return self._apply(np.logical_not, "bool", self.emit(expr.term))
+        raise TypeError(f"Unknown expression node: {type(expr).__name__}")
+
+
+class CompiledExpression:
+    """
+    Expression lowered to a flat ufunc program.
+
+    Usage:
+        program = compile_expression(col("close") < col("sma"))
+        mask = program({"close": closes, "sma": smas})
+    """
+
+    def __init__(self, expr: Expr) -> None:
+        """
+        Compile an expression.
+
+        Args:
+            expr: Expression to compile
+        """
+        emitter = _Emitter()
+        result = emitter.emit(expr)
+        self.expression = expr
+        self.key = expression_hash(expr)
+        self.columns = frozenset(emitter.columns)
+        self._program = tuple(emitter.program)
+        self._slot_kinds = tuple(emitter.slot_kinds)
+        self._result = result
+
+    def __call__(
+        self,
+        columns: Mapping[str, np.ndarray],
+        shape: tuple[int, ...] | None = None,
+    ) -> np.ndarray:
+        """
+        Evaluate over column arrays.
+
+        Args:
+            columns: Column name -> array (all broadcastable to one shape)
+            shape: Output shape when the expression references no columns
+
+        Returns:
+            Boolean array of the broadcast shape
+
+        Raises:
+            KeyError: If a referenced column is missing
+        """
+        inputs = {name: np.asarray(columns[name]) for name in self.columns}
+        if inputs:
+            shape = np.broadcast_shapes(*(a.shape for a in inputs.values()))
+        elif shape is None:
+            raise ValueError("shape is required for expressions without columns")
+        floats = [a.dtype for a in inputs.values() if a.dtype.kind == "f"]
+        float_dtype = np.result_type(*floats) if floats else np.dtype(np.float64)
+
+        slots: list[np.ndarray] = [
+            np.empty(shape, dtype=bool if kind == "bool" else float_dtype)
+            for kind in self._slot_kinds
+        ]
+
+        def value(operand: _Operand) -> Any:
+            kind, ref = operand
+            if kind == "slot":
+                return slots[ref]
+            return inputs[ref] if kind == "col" else ref
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            for ufunc, args, out in self._program:
+                ufunc(*(value(arg) for arg in args), out=slots[out])
+
+        if self._result[0] == "slot":
+            return slots[self._result[1]]
+        return np.broadcast_to(np.asarray(value(self._result), dtype=bool), shape).copy()
+
+    def __repr__(self) -> str:
+        return f"CompiledExpression({canonical(self.expression)})"
+
+
+_compiled: dict[str, CompiledExpression] = {}
+_compiled_lock = threading.Lock()
+
+
+def compile_expression(expr: Expr) -> CompiledExpression:
+    """Compile an expression, reusing the program of any equivalent expression."""
+    key = canonical(expr)
+    with _compiled_lock:
+        program = _compiled.get(key)
+        if program is None:
+            program = _compiled[key] = CompiledExpression(expr)
+    return program
+
+
+def evaluate_frame(expr: Expr, df: pd.DataFrame) -> pd.Series:
+    """
+    Evaluate an expression over DataFrame columns.
+
+    Args:
+        expr: Expression to evaluate
+        df: DataFrame holding every referenced column
+
+    Returns:
+        Boolean Series aligned with df
+    """
+    program = compile_expression(expr)
+    columns = {name: df[name].to_numpy() for name in program.columns}
+    return pd.Series(program(columns, shape=(len(df),)), index=df.index)
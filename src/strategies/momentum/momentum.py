@@ -10,6 +10,14 @@ from typing import Any
 import pandas as pd
 
 from src.strategies.base import Condition, Strategy
+from src.strategies.expressions import (
+    Expr,
+    all_of,
+    any_of,
+    col,
+    condition_expression,
+    evaluate_frame,
+)
 from src.strategies.momentum.conditions import (
     MACDBearishCondition,
     MACDBullishCondition,
@@ -129,6 +137,15 @@ class MomentumStrategy(Strategy):
 
         return df
 
+    def signal_expressions(self) -> tuple[Expr, Expr]:
+        """Entry (all conditions) and exit (any condition) expressions."""
+        entry = [_entry_expression(c) for c in self.entry_conditions.conditions]
+        exit_ = [_exit_expression(c) for c in self.exit_conditions.conditions]
+        return (
+            all_of(*(e for e in entry if e is not None)),
+            any_of(*(e for e in exit_ if e is not None)),
+        )
+
     def generate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Generate entry/exit signals using vectorized operations.
@@ -141,36 +158,41 @@ class MomentumStrategy(Strategy):
         """
         df = df.copy()
 
-        # Build entry signal based on configured conditions
-        entry_signal = pd.Series(True, index=df.index)
-
-        # Check each entry condition
-        for condition in self.entry_conditions.conditions:
-            if condition.name == "PriceAboveSMA":
-                entry_signal = entry_signal & (df["close"] > df["sma"])
-            elif condition.name == "MACDBullish":
-                # MACD above signal line
-                entry_signal = entry_signal & (df["macd"] > df["macd_signal"])
-
-        # Build exit signal based on configured conditions
-        exit_signal = pd.Series(False, index=df.index)
-
-        for condition in self.exit_conditions.conditions:
-            if condition.name == "PriceBelowSMA":
-                exit_signal = exit_signal | (df["close"] < df["sma"])
-            elif condition.name == "RSIOverbought":
-                overbought_threshold = getattr(condition, "overbought_threshold", 70.0)
-                exit_signal = exit_signal | (df["rsi"] > overbought_threshold)
-            elif condition.name == "MACDBearish":
-                # MACD below signal line
-                exit_signal = exit_signal | (df["macd"] < df["macd_signal"])
-
-        df["entry_signal"] = entry_signal
-        df["exit_signal"] = exit_signal
+        entry, exit_ = self.signal_expressions()
+        df["entry_signal"] = evaluate_frame(entry, df)
+        df["exit_signal"] = evaluate_frame(exit_, df)
 
         return df
 
 
+def _entry_expression(condition: Condition) -> Expr | None:
+    """Expression for a momentum entry condition (None if unsupported)."""
+    expr = condition_expression(condition)
+    if expr is not None:
+        return expr
+    if condition.name == "PriceAboveSMA":
+        return col("close") > col("sma")
+    if condition.name == "MACDBullish":
+        # MACD above signal line
+        return col("macd") > col("macd_signal")
+    return None
+
+
+def _exit_expression(condition: Condition) -> Expr | None:
+    """Expression for a momentum exit condition (None if unsupported)."""
+    expr = condition_expression(condition)
+    if expr is not None:
+        return expr
+    if condition.name == "PriceBelowSMA":
+        return col("close") < col("sma")
+    if condition.name == "RSIOverbought":
+        return col("rsi") > getattr(condition, "overbought_threshold", 70.0)
+    if condition.name == "MACDBearish":
+        # MACD below signal line
+        return col("macd") < col("macd_signal")
+    return None
+
+
 class SimpleMomentumStrategy(MomentumStrategy):
     """
     Simplified momentum strategy with only price above SMA condition.
@@ -11,6 +11,7 @@ from typing import Any
 import pandas as pd
 
 from src.strategies.base import Condition, Strategy
+from src.strategies.expressions import Expr, evaluate_frame
 from src.strategies.volatility_breakout.conditions import (  # Backward compatibility aliases
     BreakoutCondition,
     NoiseCondition,
@@ -20,8 +21,8 @@ from src.strategies.volatility_breakout.conditions import (  # Backward compatib
 )
 from src.strategies.volatility_breakout.vbo_indicators import calculate_vbo_indicators
 from src.strategies.volatility_breakout.vbo_signals import (
-    build_entry_signal,
-    build_exit_signal,
+    entry_expression,
+    exit_expression,
 )
 
 
@@ -165,11 +166,18 @@ class VanillaVBO(Strategy):
             base_k=self.base_k,
         )
 
+    def signal_expressions(self) -> tuple[Expr, Expr]:
+        """Entry and exit expressions built by the vbo_signals module."""
+        return (
+            entry_expression(list(self.entry_conditions.conditions)),
+            exit_expression(list(self.exit_conditions.conditions)),
+        )
+
     def generate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Generate entry/exit signals using vectorized operations.
 
-        Uses modular signal builders from vbo_signals module.
+        Uses modular signal expressions from vbo_signals module.
 
         Args:
             df: DataFrame with OHLCV and indicators
@@ -179,8 +187,9 @@ class VanillaVBO(Strategy):
         """
         df = df.copy()
 
-        df["entry_signal"] = build_entry_signal(df, list(self.entry_conditions.conditions))
-        df["exit_signal"] = build_exit_signal(df, list(self.exit_conditions.conditions))
+        entry, exit_ = self.signal_expressions()
+        df["entry_signal"] = evaluate_frame(entry, df)
+        df["exit_signal"] = evaluate_frame(exit_, df)
 
         return df
 
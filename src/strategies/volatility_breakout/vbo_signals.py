@@ -10,16 +10,26 @@ from typing import TYPE_CHECKING
 
 import pandas as pd
 
+from src.strategies.expressions import (
+    Expr,
+    all_of,
+    any_of,
+    col,
+    condition_expression,
+    evaluate_frame,
+)
+
 if TYPE_CHECKING:
     from src.strategies.base import Condition
 
 
-def build_entry_signal(
-    df: pd.DataFrame,
-    conditions: list[Condition],
-) -> pd.Series[bool]:
+def _range_pct() -> Expr:
+    return col("prev_range") / col("open")
+
+
+def entry_condition_expression(condition: Condition) -> Expr | None:
     """
-    Build entry signal based on configured conditions.
+    Expression for a single entry condition.
 
     Conditions logic:
     - Breakout: high >= target (volatility breakout)
@@ -28,56 +38,93 @@ def build_entry_signal(
     - NoiseCondition: short_noise < long_noise (volatility stability)
 
     Args:
-        df: DataFrame with OHLCV and indicators
-        conditions: List of entry conditions to evaluate
+        condition: Entry condition
 
     Returns:
-        Boolean Series indicating entry signals
+        Condition expression, or None for conditions without a vectorized form
     """
-    entry_signal = pd.Series(True, index=df.index)
-
-    for condition in conditions:
-        entry_signal = _apply_entry_condition(df, condition, entry_signal)
-
-    return entry_signal
-
+    expr = condition_expression(condition)
+    if expr is not None:
+        return expr
 
-def _apply_entry_condition(
-    df: pd.DataFrame,
-    condition: Condition,
-    signal: pd.Series[bool],
-) -> pd.Series[bool]:
-    """Apply a single entry condition to the signal."""
     name = condition.name
 
     if name == "Breakout":
-        return signal & (df["high"] >= df["target"])
+        return col("high") >= col("target")
 
     if name == "SMABreakout":
-        return signal & (df["target"] > df["sma"])
+        return col("target") > col("sma")
 
     if name == "TrendCondition":
-        return signal & (df["target"] > df["sma_trend"])
+        return col("target") > col("sma_trend")
 
     if name == "NoiseCondition":
-        return signal & (df["short_noise"] < df["long_noise"])
+        return col("short_noise") < col("long_noise")
 
     if name == "NoiseThresholdCondition":
-        max_noise = getattr(condition, "max_noise", 0.7)
-        return signal & (df["short_noise"] <= max_noise)
+        return col("short_noise") <= getattr(condition, "max_noise", 0.7)
 
     if name == "VolatilityRangeCondition":
         min_vol = getattr(condition, "min_volatility_pct", 0.005)
         max_vol = getattr(condition, "max_volatility_pct", 0.15)
-        range_pct = df["prev_range"] / df["open"]
-        return signal & (range_pct >= min_vol) & (range_pct <= max_vol)
+        return all_of(_range_pct() >= min_vol, _range_pct() <= max_vol)
 
     if name == "VolatilityThreshold":
-        min_range_pct = getattr(condition, "min_range_pct", 0.01)
-        range_pct = df["prev_range"] / df["open"]
-        return signal & (range_pct >= min_range_pct)
+        return _range_pct() >= getattr(condition, "min_range_pct", 0.01)
+
+    return None
+
+
+def exit_condition_expression(condition: Condition) -> Expr | None:
+    """
+    Expression for a single exit condition.
+
+    Exit logic:
+    - PriceBelowSMA: close < SMA (trend reversal)
+
+    Args:
+        condition: Exit condition
+
+    Returns:
+        Condition expression, or None for conditions without a vectorized form
+    """
+    expr = condition_expression(condition)
+    if expr is not None:
+        return expr
+
+    if condition.name == "PriceBelowSMA":
+        return col("close") < col("sma")
+
+    return None
+
+
+def entry_expression(conditions: list[Condition]) -> Expr:
+    """AND of all entry condition expressions (always true when none apply)."""
+    exprs = [entry_condition_expression(c) for c in conditions]
+    return all_of(*(e for e in exprs if e is not None))
+
+
+def exit_expression(conditions: list[Condition]) -> Expr:
+    """OR of all exit condition expressions (never true when none apply)."""
+    exprs = [exit_condition_expression(c) for c in conditions]
+    return any_of(*(e for e in exprs if e is not None))
 
-    return signal
+
+def build_entry_signal(
+    df: pd.DataFrame,
+    conditions: list[Condition],
+) -> pd.Series[bool]:
+    """
+    Build entry signal based on configured conditions.
+
+    Args:
+        df: DataFrame with OHLCV and indicators
+        conditions: List of entry conditions to evaluate
+
+    Returns:
+        Boolean Series indicating entry signals
+    """
+    return evaluate_frame(entry_expression(conditions), df)
 
 
 def build_exit_signal(
@@ -87,9 +134,6 @@ def build_exit_signal(
     """
     Build exit signal based on configured conditions.
 
-    Exit logic:
-    - PriceBelowSMA: close < SMA (trend reversal)
-
     Args:
         df: DataFrame with OHLCV and indicators
         conditions: List of exit conditions to evaluate
@@ -97,16 +141,14 @@ def build_exit_signal(
     Returns:
         Boolean Series indicating exit signals
     """
-    exit_signal = pd.Series(False, index=df.index)
-
-    for condition in conditions:
-        if condition.name == "PriceBelowSMA":
-            exit_signal = exit_signal | (df["close"] < df["sma"])
-
-    return exit_signal
+    return evaluate_frame(exit_expression(conditions), df)
 
 
 __all__ = [
     "build_entry_signal",
     "build_exit_signal",
+    "entry_condition_expression",
+    "entry_expression",
+    "exit_condition_expression",
+    "exit_expression",
 ]
@@ -0,0 +1,121 @@
+"""
+Shape-preserving downsampling for chart payloads.
+
+Selects a subset of point indices so charts of long series (e.g. minute
+interval equity curves) stay small while keeping their visual shape:
+
+- LTTB (Largest-Triangle-Three-Buckets): one point per bucket, chosen to
+  maximize the triangle area with the previous pick and the next bucket
+  average. Best general-purpose choice for line charts.
+- Min-max: the minimum and maximum of every bucket, fully vectorized.
+  Guarantees that peaks and troughs (e.g. maximum drawdown) survive.
+
+Both return sorted index arrays that always include the first and last
+point, so the same indices can be applied to dates and any aligned series.
+"""
+
+from typing import Literal
+
+import numpy as np
+
+__all__ = ["DownsampleMethod", "downsample_indices", "lttb_indices", "minmax_indices"]
+
+DownsampleMethod = Literal["lttb", "minmax"]
+
+
+def lttb_indices(values: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Select point indices with the LTTB algorithm.
+
+    Args:
+        values: 1-D array of y values (x is the point index)
+        max_points: Number of points to keep (>= 3)
+
+    Returns:
+        Sorted index array of length min(len(values), max_points)
+    """
+    y = np.asarray(values, dtype=np.float64)
+    n = len(y)
+    if n <= max_points or max_points < 3:
+        return np.arange(n) if n <= max_points else np.array([0, n - 1])
+
+    y = np.nan_to_num(y, nan=0.0, posinf=0.0, neginf=0.0)
+    n_buckets = max_points - 2
+    # Bucket b covers [edges[b], edges[b + 1]) over the interior points 1..n-2
+    edges = np.floor(np.arange(n_buckets + 1) * ((n - 2) / n_buckets)).astype(np.int64) + 1
+    edges[-1] = n - 1
+
+    # Average point of every bucket (the last bucket looks ahead to the final point)
+    sums = np.add.reduceat(y[1 : n - 1], edges[:-1] - 1)
+    counts = np.diff(edges)
+    avg_y = np.append(sums / counts, y[-1])
+    avg_x = np.append((edges[:-1] + edges[1:] - 1) / 2.0, float(n - 1))
+
+    selected = np.empty(max_points, dtype=np.int64)
+    selected[0] = 0
+    selected[-1] = n - 1
+    a = 0
+    for b in range(n_buckets):
+        start, end = edges[b], edges[b + 1]
+        ax, ay = float(a), y[a]
+        bx, by = avg_x[b + 1], avg_y[b + 1]
+        xs = np.arange(start, end)
+        # Twice the triangle area (the constant factor does not change the argmax)
+        areas = np.abs((ax - bx) * (y[start:end] - ay) - (ax - xs) * (by - ay))
+        a = start + int(np.argmax(areas))
+        selected[b + 1] = a
+    return selected
+
+
+def minmax_indices(values: np.ndarray, max_points: int) -> np.ndarray:
+    """
+    Select the minimum and maximum point of each bucket.
+
+    Args:
+        values: 1-D array of y values
+        max_points: Approximate number of points to keep (>= 4)
+
+    Returns:
+        Sorted unique index array of at most max_points indices
+    """
+    y = np.asarray(values, dtype=np.float64)
+    n = len(y)
+    if n <= max_points:
+        return np.arange(n)
+
+    n_buckets = max(1, (max_points - 2) // 2)
+    bucket_size = -(-n // n_buckets)  # ceil
+    padded = np.full(n_buckets * bucket_size, np.nan)
+    padded[:n] = y
+    buckets = padded.reshape(n_buckets, bucket_size)
+    offsets = np.arange(n_buckets) * bucket_size
+
+    valid = ~np.all(np.isnan(buckets), axis=1)
+    filled_low = np.where(np.isnan(buckets), np.inf, buckets)
+    filled_high = np.where(np.isnan(buckets), -np.inf, buckets)
+    lows = offsets[valid] + np.argmin(filled_low[valid], axis=1)
+    highs = offsets[valid] + np.argmax(filled_high[valid], axis=1)
+    return np.unique(np.concatenate(([0, n - 1], lows, highs)))
+
+
+def downsample_indices(
+    values: np.ndarray,
+    max_points: int,
+    method: DownsampleMethod = "lttb",
+) -> np.ndarray:
+    """
+    Select indices of the points to plot.
+
+    Args:
+        values: 1-D array of y values
+        max_points: Maximum number of points
+        method: "lttb" (default) or "minmax"
+
+    Returns:
+        Sorted index array (all indices when the series is already small)
+    """
+    if len(values) <= max_points:
+        return np.arange(len(values))
+    if method == "minmax":
+        return minmax_indices(values, max_points)
+    return lttb_indices(values, max_points)
@@ -15,6 +15,8 @@ VBO 지표 (indicators_vbo):
     - rsi, bollinger_bands, macd, stochastic
 """
 
+from typing import TypeVar, cast
+
 import numpy as np
 import pandas as pd
 
@@ -65,8 +67,11 @@ __all__ = [
     "calculate_sma",
 ]
 
+# Rolling indicators accept a Series or a date x symbol DataFrame
+_SeriesOrFrame = TypeVar("_SeriesOrFrame", pd.Series, pd.DataFrame)
+
 
-def sma(series: pd.Series, period: int, exclude_current: bool = False) -> pd.Series:
+def sma(series: _SeriesOrFrame, period: int, exclude_current: bool = False) -> _SeriesOrFrame:
     """
     Simple Moving Average.
 
@@ -101,11 +106,11 @@ def ema(series: pd.Series, period: int) -> pd.Series:
 
 
 def atr(
-    high: pd.Series,
-    low: pd.Series,
-    close: pd.Series,
+    high: _SeriesOrFrame,
+    low: _SeriesOrFrame,
+    close: _SeriesOrFrame,
     period: int = 14,
-) -> pd.Series:
+) -> _SeriesOrFrame:
     """
     Average True Range.
 
@@ -116,13 +121,14 @@ def atr(
         period: Lookback period
 
     Returns:
-        ATR series
+        ATR series (a DataFrame when given date x symbol DataFrames)
     """
     prev_close = close.shift(1)
     tr1 = high - low
     tr2 = (high - prev_close).abs()
     tr3 = (low - prev_close).abs()
-    true_range = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
+    # Element-wise NaN-skipping max, so 2-D inputs keep one column per symbol
+    true_range = cast(_SeriesOrFrame, np.fmax(np.fmax(tr1, tr2), tr3))
     return true_range.rolling(window=period, min_periods=period).mean()
 
 
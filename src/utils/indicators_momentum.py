@@ -4,10 +4,15 @@
 RSI, Bollinger Bands, MACD, Stochastic 등의 모멘텀 지표.
 """
 
+from typing import TypeVar
+
 import pandas as pd
 
+# Rolling indicators accept a Series or a date x symbol DataFrame
+_SeriesOrFrame = TypeVar("_SeriesOrFrame", pd.Series, pd.DataFrame)
+
 
-def _sma_local(series: pd.Series, period: int) -> pd.Series:
+def _sma_local(series: _SeriesOrFrame, period: int) -> _SeriesOrFrame:
     """Local SMA to avoid circular imports."""
     return series.rolling(window=period, min_periods=period).mean()
 
@@ -17,7 +22,7 @@ def _ema_local(series: pd.Series, period: int) -> pd.Series:
     return series.ewm(span=period, adjust=False).mean()
 
 
-def rsi(series: pd.Series, period: int = 14) -> pd.Series:
+def rsi(series: _SeriesOrFrame, period: int = 14) -> _SeriesOrFrame:
     """
     Relative Strength Index.
 
@@ -40,10 +45,10 @@ def rsi(series: pd.Series, period: int = 14) -> pd.Series:
 
 
 def bollinger_bands(
-    series: pd.Series,
+    series: _SeriesOrFrame,
     period: int = 20,
     std_dev: float = 2.0,
-) -> tuple[pd.Series, pd.Series, pd.Series]:
+) -> tuple[_SeriesOrFrame, _SeriesOrFrame, _SeriesOrFrame]:
     """
     Bollinger Bands.
 
@@ -6,13 +6,28 @@ Provides consistent logging setup across the entire application with:
 - Performance logging
 - File and console output separation
 - Configurable log levels
+- Non-blocking output: records are queued by the logging thread and
+  formatted/written by a background QueueListener
+- JSON lines output and rate limiting of repeated messages
+
+Hot paths should pass arguments lazily (logger.debug("x=%s", x)) and guard
+expensive arguments with logger.isEnabledFor(level), so disabled levels
+cost a single check.
 """
 
+import atexit
+import json
 import logging
+import queue
 import sys
+import threading
 import time
+import traceback
 from collections.abc import MutableMapping
 from contextlib import contextmanager
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Any
 
@@ -20,6 +35,247 @@ from typing import Any
 LOG_FORMAT: str = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 LOG_DATE_FORMAT: str = "%Y-%m-%d %H:%M:%S"
 
+# Capacity of the background logging queue (records)
+DEFAULT_QUEUE_SIZE: int = 10_000
+
+# Attributes of every LogRecord; anything else was passed via extra=
+_RECORD_ATTRS: frozenset[str] = frozenset(
+    logging.LogRecord("", 0, "", 0, "", None, None).__dict__
+) | {"message", "asctime", "taskName"}
+
+
+class JSONFormatter(logging.Formatter):
+    """Format log records as JSON for structured logging."""
+
+    def __init__(
+        self,
+        include_timestamp: bool = True,
+        include_level: bool = True,
+        include_logger: bool = True,
+        include_pathname: bool = False,
+        extra_fields: dict[str, Any] | None = None,
+    ):
+        super().__init__()
+        self.include_timestamp = include_timestamp
+        self.include_level = include_level
+        self.include_logger = include_logger
+        self.include_pathname = include_pathname
+        self.extra_fields = extra_fields or {}
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Format the log record as JSON."""
+        log_data: dict[str, Any] = {}
+
+        # Core fields (the record's creation time: formatting may run later
+        # on the queue listener thread)
+        if self.include_timestamp:
+            log_data["timestamp"] = datetime.fromtimestamp(record.created, UTC).isoformat()
+
+        if self.include_level:
+            log_data["level"] = record.levelname
+
+        if self.include_logger:
+            log_data["logger"] = record.name
+
+        # Message
+        log_data["message"] = record.getMessage()
+
+        # Location (optional)
+        if self.include_pathname:
+            log_data["pathname"] = record.pathname
+            log_data["lineno"] = record.lineno
+            log_data["funcname"] = record.funcName
+
+        # Exception info
+        if record.exc_info:
+            log_data["exception"] = {
+                "type": record.exc_info[0].__name__ if record.exc_info[0] else None,
+                "message": str(record.exc_info[1]) if record.exc_info[1] else None,
+                "traceback": "".join(traceback.format_exception(*record.exc_info)),
+            }
+
+        # Extra fields from record
+        for key, value in record.__dict__.items():
+            if key not in _RECORD_ATTRS and not key.startswith("_"):
+                log_data[key] = value
+
+        # Static extra fields
+        log_data.update(self.extra_fields)
+
+        return json.dumps(log_data, default=str, ensure_ascii=False)
+
+
+@dataclass(slots=True)
+class _RateWindow:
+    start: float
+    passed: int = 1
+    suppressed: int = 0
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Suppress identical messages repeated within a time window.
+
+    Records are keyed by logger, level and rendered message. The first
+    `burst` records of a window pass; the first record after the window
+    reports how many repeats were dropped (also as record.suppressed).
+
+    Usage:
+        handler.addFilter(RateLimitFilter(interval=60.0))
+    """
+
+    def __init__(self, interval: float = 60.0, burst: int = 1, max_keys: int = 1024) -> None:
+        """
+        Initialize filter.
+
+        Args:
+            interval: Window length in seconds
+            burst: Records passed per window
+            max_keys: Tracked messages before expired windows are pruned
+        """
+        super().__init__()
+        self.interval = interval
+        self.burst = burst
+        self.max_keys = max_keys
+        self._windows: dict[tuple[str, int, str], _RateWindow] = {}
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Return whether the record passes (decided once per record)."""
+        decided: bool | None = getattr(record, "_rate_limit_pass", None)
+        if decided is not None:
+            return decided
+
+        key = (record.name, record.levelno, record.getMessage())
+        now = record.created
+        with self._lock:
+            window = self._windows.get(key)
+            if window is None or now - window.start >= self.interval:
+                if window is not None and window.suppressed:
+                    record.suppressed = window.suppressed
+                    record.msg = (
+                        f"{record.getMessage()} "
+                        f"(suppressed {window.suppressed} repeats in {self.interval:g}s)"
+                    )
+                    record.args = None
+                if window is None and len(self._windows) >= self.max_keys:
+                    self._prune(now)
+                self._windows[key] = _RateWindow(now)
+                passed = True
+            elif window.passed < self.burst:
+                window.passed += 1
+                passed = True
+            else:
+                window.suppressed += 1
+                passed = False
+
+        record._rate_limit_pass = passed
+        return passed
+
+    def _prune(self, now: float) -> None:
+        """Forget expired windows (all windows if none expired)."""
+        expired = [k for k, w in self._windows.items() if now - w.start >= self.interval]
+        for key in expired:
+            del self._windows[key]
+        if not expired:
+            self._windows.clear()
+
+
+class BackgroundQueueHandler(QueueHandler):
+    """
+    QueueHandler that leaves formatting to the listener thread.
+
+    Only the message arguments are merged on the logging thread (they may
+    be mutated after the call); formatting, tracebacks, JSON serialization
+    and I/O run in the QueueListener. When the queue is full, records below
+    WARNING are dropped (counted in `dropped`) instead of blocking.
+    """
+
+    def __init__(self, log_queue: "queue.Queue[logging.LogRecord]", block_timeout: float = 1.0):
+        """
+        Initialize handler.
+
+        Args:
+            log_queue: Queue shared with the QueueListener
+            block_timeout: Seconds WARNING+ records wait for space before being dropped
+        """
+        super().__init__(log_queue)
+        self._log_queue = log_queue
+        self.block_timeout = block_timeout
+        self.dropped = 0
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        """Merge message arguments; keep exc_info for the listener's formatter."""
+        if record.args:
+            record.msg = record.getMessage()
+            record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        """Enqueue without blocking the hot path on a full queue."""
+        try:
+            if record.levelno >= logging.WARNING:
+                self._log_queue.put(record, timeout=self.block_timeout)
+            else:
+                self._log_queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+_listeners: list[QueueListener] = []
+_listeners_lock = threading.Lock()
+_root_listener: QueueListener | None = None  # Listener installed by setup_logging
+
+
+def start_queue_logging(
+    logger: logging.Logger,
+    handlers: list[logging.Handler],
+    queue_size: int = DEFAULT_QUEUE_SIZE,
+    log_filter: logging.Filter | None = None,
+) -> QueueListener:
+    """
+    Route a logger's records through a queue to handlers on a background thread.
+
+    Args:
+        logger: Logger receiving a BackgroundQueueHandler
+        handlers: Output handlers run by the listener thread
+        queue_size: Queue capacity in records
+        log_filter: Optional filter applied before enqueueing (e.g. RateLimitFilter)
+
+    Returns:
+        Started QueueListener (stopped at interpreter exit or by stop_queue_logging)
+    """
+    log_queue: queue.Queue[logging.LogRecord] = queue.Queue(queue_size)
+    queue_handler = BackgroundQueueHandler(log_queue)
+    if log_filter is not None:
+        queue_handler.addFilter(log_filter)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    logger.addHandler(queue_handler)
+    listener.start()
+    with _listeners_lock:
+        _listeners.append(listener)
+    return listener
+
+
+def stop_queue_logging(listener: QueueListener | None = None) -> None:
+    """
+    Flush and stop queue listeners.
+
+    Args:
+        listener: Listener to stop (default: all started listeners)
+    """
+    with _listeners_lock:
+        targets = [listener] if listener is not None else list(_listeners)
+        for target in targets:
+            if target in _listeners:
+                _listeners.remove(target)
+    for target in targets:
+        if target._thread is not None:  # Not already stopped
+            target.stop()
+
+
+atexit.register(stop_queue_logging)
+
 
 class ContextLogger(logging.LoggerAdapter[logging.Logger]):
     """
@@ -97,6 +353,10 @@ def setup_logging(
     log_file: Path | None = None,
     format_string: str | None = None,
     enable_performance_logging: bool = False,
+    use_queue: bool = False,
+    json_format: bool = False,
+    rate_limit_seconds: float | None = None,
+    queue_size: int = DEFAULT_QUEUE_SIZE,
 ) -> None:
     """
     Configure application-wide logging.
@@ -106,9 +366,19 @@ def setup_logging(
         log_file: Optional file path for logging
         format_string: Custom format string (uses default if None)
         enable_performance_logging: Enable performance logging at DEBUG level
+        use_queue: Format and write records on a background thread
+        json_format: Write one JSON object per record (JSONFormatter)
+        rate_limit_seconds: Suppress identical messages repeated within this window
+        queue_size: Queue capacity in records (use_queue only)
     """
+    global _root_listener
     format_string = format_string or LOG_FORMAT
 
+    # Stop the previous configuration's listener (it owns the old handlers)
+    if _root_listener is not None:
+        stop_queue_logging(_root_listener)
+        _root_listener = None
+
     handlers: list[logging.Handler] = [
         logging.StreamHandler(sys.stdout),
     ]
@@ -116,24 +386,35 @@ def setup_logging(
     if log_file:
         log_file.parent.mkdir(parents=True, exist_ok=True)
         file_handler = logging.FileHandler(log_file, encoding="utf-8")
-        file_handler.setFormatter(logging.Formatter(format_string, datefmt=LOG_DATE_FORMAT))
         handlers.append(file_handler)
 
-    # Set up console handler with formatter
-    console_handler = handlers[0]
-    console_handler.setFormatter(logging.Formatter(format_string, datefmt=LOG_DATE_FORMAT))
+    formatter: logging.Formatter = (
+        JSONFormatter()
+        if json_format
+        else logging.Formatter(format_string, datefmt=LOG_DATE_FORMAT)
+    )
+    for handler in handlers:
+        handler.setFormatter(formatter)
 
     # Adjust level for performance logging
     effective_level = logging.DEBUG if enable_performance_logging else level
+    rate_filter = RateLimitFilter(rate_limit_seconds) if rate_limit_seconds else None
 
     logging.basicConfig(
         level=effective_level,
         format=format_string,
         datefmt=LOG_DATE_FORMAT,
-        handlers=handlers,
+        handlers=[] if use_queue else handlers,
         force=True,  # Override any existing configuration
     )
 
+    root = logging.getLogger()
+    if use_queue:
+        _root_listener = start_queue_logging(root, handlers, queue_size, rate_filter)
+    elif rate_filter is not None:
+        for handler in handlers:
+            handler.addFilter(rate_filter)
+
 
 def get_logger(name: str) -> logging.Logger:
     """
@@ -0,0 +1,72 @@
+"""
+Vectorized calendar-period returns.
+
+Monthly and yearly returns of an equity curve computed with NumPy period
+boundaries instead of resample/groupby round trips or per-cell Python loops.
+Each period's return runs from the previous period's last value (the first
+value of the curve for the first period) to the period's last value, so
+monthly returns compound exactly to the yearly returns.
+"""
+
+import numpy as np
+import pandas as pd
+
+__all__ = ["monthly_return_grid", "period_returns"]
+
+
+def period_returns(
+    dates: np.ndarray | pd.DatetimeIndex,
+    equity: np.ndarray,
+    freq: str = "M",
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate returns per calendar period.
+
+    Args:
+        dates: Date array (any type accepted by pandas.to_datetime)
+        equity: Portfolio value array aligned with dates
+        freq: NumPy datetime unit of the period ("M" monthly, "Y" yearly)
+
+    Returns:
+        Tuple of (period labels as datetime64[freq], returns in percent)
+    """
+    equity = np.asarray(equity, dtype=np.float64)
+    if len(equity) == 0:
+        return np.array([], dtype=f"datetime64[{freq}]"), np.array([], dtype=np.float64)
+
+    times = pd.to_datetime(np.asarray(dates)).to_numpy(dtype="datetime64[ns]")
+    if len(times) > 1 and np.any(times[1:] < times[:-1]):
+        order = np.argsort(times, kind="stable")
+        times, equity = times[order], equity[order]
+
+    periods = times.astype(f"datetime64[{freq}]")
+    last = np.flatnonzero(np.append(periods[1:] != periods[:-1], True))
+    end_values = equity[last]
+    start_values = np.append(equity[0], end_values[:-1])
+    with np.errstate(divide="ignore", invalid="ignore"):
+        returns = (end_values / start_values - 1) * 100
+    return periods[last], returns
+
+
+def monthly_return_grid(
+    dates: np.ndarray | pd.DatetimeIndex,
+    equity: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Calculate monthly returns as a year x month grid (heatmap layout).
+
+    Args:
+        dates: Date array
+        equity: Portfolio value array aligned with dates
+
+    Returns:
+        Tuple of (years array, grid of shape (n_years, 12) with NaN for missing months)
+    """
+    periods, returns = period_returns(dates, equity, "M")
+    months_since_epoch = periods.astype(np.int64)
+    years_all = months_since_epoch // 12 + 1970
+    years, year_idx = np.unique(years_all, return_inverse=True)
+
+    grid = np.full((len(years), 12), np.nan)
+    grid[year_idx, months_since_epoch % 12] = returns
+    return years, grid
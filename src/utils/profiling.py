@@ -0,0 +1,257 @@
+"""
+Hot-path instrumentation with named spans.
+
+Wraps pipeline stages in named spans and aggregates per-stage timing (and,
+optionally, net allocation) statistics:
+
+    from src.utils.profiling import get_profiler
+
+    profiler = get_profiler()
+    with profiler.span("backtest.simulation"):
+        ...
+
+Spans are free when profiling is disabled (the default): span() returns a
+shared no-op context manager after a single flag check. Enable with
+enable_profiling() or the CQS_PROFILE=1 environment variable
+(CQS_PROFILE=alloc also tracks allocations via tracemalloc).
+
+Statistics are kept process-wide and, inside collect(), per thread for one
+unit of work (e.g. a single backtest, attached to BacktestResult.profile).
+Sinks receive every finished span, which is how TradingMetrics exports
+stage durations to Prometheus.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+import tracemalloc
+from collections.abc import Callable, Generator, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import dataclass
+
+__all__ = [
+    "PROFILE_ENV_VAR",
+    "Profiler",
+    "SpanSink",
+    "StageStats",
+    "disable_profiling",
+    "enable_profiling",
+    "get_profiler",
+]
+
+PROFILE_ENV_VAR = "CQS_PROFILE"
+
+# Called with (span name, duration seconds) for every finished span
+SpanSink = Callable[[str, float], None]
+
+_NULL_SPAN: AbstractContextManager[None] = nullcontext()
+
+
+@dataclass(slots=True)
+class StageStats:
+    """Aggregated statistics of one named span."""
+
+    count: int = 0
+    total_s: float = 0.0
+    min_s: float = float("inf")
+    max_s: float = 0.0
+    alloc_bytes: int = 0  # Net bytes still allocated when spans ended (tracemalloc)
+
+    def add(self, seconds: float, alloc_bytes: int = 0) -> None:
+        """Fold one span into the aggregate."""
+        self.count += 1
+        self.total_s += seconds
+        self.min_s = min(self.min_s, seconds)
+        self.max_s = max(self.max_s, seconds)
+        self.alloc_bytes += alloc_bytes
+
+    def to_dict(self) -> dict[str, float]:
+        """JSON-serializable summary (durations in milliseconds)."""
+        return {
+            "count": self.count,
+            "total_ms": self.total_s * 1000,
+            "mean_ms": self.total_s * 1000 / self.count if self.count else 0.0,
+            "min_ms": self.min_s * 1000 if self.count else 0.0,
+            "max_ms": self.max_s * 1000,
+            "alloc_kb": self.alloc_bytes / 1024,
+        }
+
+
+class Profiler:
+    """
+    Thread-safe aggregator of named span timings.
+
+    Usage:
+        profiler = Profiler(enabled=True)
+        with profiler.collect() as run:
+            with profiler.span("stage"):
+                ...
+        run["stage"].count  # 1
+    """
+
+    def __init__(self, enabled: bool = False, track_allocations: bool = False) -> None:
+        """
+        Initialize profiler.
+
+        Args:
+            enabled: Record spans (disabled spans cost a single flag check)
+            track_allocations: Also record net allocations per span (tracemalloc)
+        """
+        self.enabled = enabled
+        self.track_allocations = track_allocations
+        self._stats: dict[str, StageStats] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._sinks: list[SpanSink] = []
+
+    def span(self, name: str) -> AbstractContextManager[None]:
+        """
+        Time a block under a stage name.
+
+        Args:
+            name: Dotted stage name (e.g. "backtest.signals")
+
+        Returns:
+            Context manager (a shared no-op when disabled)
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return self._timed(name)
+
+    @contextmanager
+    def _timed(self, name: str) -> Generator[None, None, None]:
+        """Enabled span body."""
+        tracing = self.track_allocations and tracemalloc.is_tracing()
+        alloc_start = tracemalloc.get_traced_memory()[0] if tracing else 0
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            alloc = tracemalloc.get_traced_memory()[0] - alloc_start if tracing else 0
+            self.record(name, elapsed, alloc)
+
+    def record(self, name: str, seconds: float, alloc_bytes: int = 0) -> None:
+        """
+        Record a duration measured elsewhere (e.g. order placement to fill).
+
+        Args:
+            name: Stage name
+            seconds: Duration in seconds
+            alloc_bytes: Net allocated bytes
+        """
+        if not self.enabled:
+            return
+        with self._lock:
+            self._stats.setdefault(name, StageStats()).add(seconds, alloc_bytes)
+        for collector in getattr(self._local, "collectors", ()):
+            collector.setdefault(name, StageStats()).add(seconds, alloc_bytes)
+        for sink in self._sinks:
+            sink(name, seconds)
+
+    @contextmanager
+    def collect(self) -> Iterator[dict[str, StageStats] | None]:
+        """
+        Collect the spans recorded by this thread within the block.
+
+        Yields:
+            {stage: StageStats} filled as spans finish, or None when disabled
+        """
+        if not self.enabled:
+            yield None
+            return
+        collectors: list[dict[str, StageStats]] = self._local.__dict__.setdefault("collectors", [])
+        collected: dict[str, StageStats] = {}
+        collectors.append(collected)
+        try:
+            yield collected
+        finally:
+            # By identity: equal-looking collectors may be nested
+            del collectors[next(i for i, c in enumerate(collectors) if c is collected)]
+
+    def add_sink(self, sink: SpanSink) -> None:
+        """Forward every finished span to sink(name, seconds)."""
+        self._sinks.append(sink)
+
+    def remove_sink(self, sink: SpanSink) -> None:
+        """Stop forwarding spans to sink."""
+        if sink in self._sinks:
+            self._sinks.remove(sink)
+
+    def stats(self) -> dict[str, StageStats]:
+        """Copy of the process-wide statistics."""
+        with self._lock:
+            return {
+                name: StageStats(s.count, s.total_s, s.min_s, s.max_s, s.alloc_bytes)
+                for name, s in self._stats.items()
+            }
+
+    def reset(self) -> None:
+        """Clear the process-wide statistics."""
+        with self._lock:
+            self._stats.clear()
+
+    @staticmethod
+    def to_profile(stats: dict[str, StageStats]) -> dict[str, dict[str, float]]:
+        """Convert statistics into a JSON-serializable profile."""
+        return {name: stats[name].to_dict() for name in sorted(stats)}
+
+    def to_json(self, indent: int | None = 2) -> str:
+        """Process-wide statistics as a JSON profile."""
+        return json.dumps(self.to_profile(self.stats()), indent=indent)
+
+
+def _profiler_from_env() -> Profiler:
+    """Create the global profiler from CQS_PROFILE (unset/0: off, 1: on, alloc: on + allocations)."""
+    value = os.getenv(PROFILE_ENV_VAR, "").strip().lower()
+    profiler = Profiler(enabled=value not in ("", "0", "false"))
+    if value == "alloc":
+        enable_profiling(track_allocations=True, profiler=profiler)
+    return profiler
+
+
+def enable_profiling(track_allocations: bool = False, profiler: Profiler | None = None) -> None:
+    """
+    Turn on span recording.
+
+    Args:
+        track_allocations: Also record net allocations (starts tracemalloc,
+            which slows allocation-heavy code noticeably)
+        profiler: Profiler to enable (default: global)
+    """
+    target = profiler or get_profiler()
+    if track_allocations and not tracemalloc.is_tracing():
+        tracemalloc.start()
+    target.track_allocations = track_allocations
+    target.enabled = True
+
+
+def disable_profiling(profiler: Profiler | None = None) -> None:
+    """Turn off span recording (statistics are kept)."""
+    target = profiler or get_profiler()
+    target.enabled = False
+    if target.track_allocations and tracemalloc.is_tracing():
+        tracemalloc.stop()
+    target.track_allocations = False
+
+
+_default_profiler: Profiler | None = None
+_default_lock = threading.Lock()
+
+
+def get_profiler() -> Profiler:
+    """
+    Get the global profiler instance.
+
+    Returns:
+        Global Profiler (configured from CQS_PROFILE on first use)
+    """
+    global _default_profiler
+    if _default_profiler is None:
+        with _default_lock:
+            if _default_profiler is None:
+                _default_profiler = _profiler_from_env()
+    return _default_profiler
@@ -9,7 +9,7 @@ import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 
-from src.web.utils.chart_utils import downsample_timeseries
+from src.utils.downsampling import downsample_indices
 
 __all__ = ["render_equity_curve"]
 
@@ -38,18 +38,14 @@ def render_equity_curve(
         st.warning("📊 No data to display.")
         return
 
-    # Downsample data (improve performance for large datasets)
+    # Downsample data (improve performance for large datasets); the same
+    # indices are applied to every series so they stay aligned
     if len(dates) > max_points:
-        downsampled_dates, downsampled_equity = downsample_timeseries(
-            dates, equity, max_points=max_points
-        )
-        dates = downsampled_dates  # type: ignore[assignment]
-        equity = downsampled_equity
-        if benchmark is not None:
-            _, downsampled_benchmark = downsample_timeseries(
-                dates, benchmark, max_points=max_points
-            )
-            benchmark = downsampled_benchmark
+        indices = downsample_indices(equity, max_points)
+        if benchmark is not None and len(benchmark) == len(equity):
+            benchmark = benchmark[indices]
+        dates = dates[indices]
+        equity = equity[indices]
 
     # Normalize equity to start at 1
     initial_value = equity[0] if equity[0] != 0 else 1.0
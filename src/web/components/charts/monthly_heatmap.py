@@ -8,6 +8,8 @@ import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
+from src.utils.period_returns import monthly_return_grid, period_returns
+
 __all__ = ["render_monthly_heatmap", "calculate_monthly_returns"]
 
 
@@ -27,36 +29,17 @@ def calculate_monthly_returns(
     if len(dates) == 0 or len(equity) == 0:
         return pd.DataFrame(columns=["year", "month", "return_pct"])
 
-    # Create DataFrame with date index
-    df = pd.DataFrame({"date": pd.to_datetime(dates), "equity": equity})
-    df = df.set_index("date").sort_index()
-
-    # Resample to get end-of-month values (forward fill to handle missing dates)
-    monthly_equity = df["equity"].resample("ME").last()
-
-    # Calculate monthly returns
-    monthly_returns = monthly_equity.pct_change() * 100
-
-    # Create result DataFrame
-    idx = pd.to_datetime(monthly_equity.index)
-    result = pd.DataFrame(
-        {"year": idx.year, "month": idx.month, "return_pct": monthly_returns.values}
+    # First month runs from the first data point, later months from the previous month end
+    periods, returns = period_returns(dates, equity, "M")
+    months_since_epoch = periods.astype(np.int64)
+    return pd.DataFrame(
+        {
+            "year": months_since_epoch // 12 + 1970,
+            "month": months_since_epoch % 12 + 1,
+            "return_pct": returns,
+        }
     )
 
-    # For the first month, calculate return from start to end of that month
-    if len(result) > 0 and len(df) > 0:
-        first_month_start_equity = df["equity"].iloc[0]
-        first_month_end_equity = monthly_equity.iloc[0]
-        first_month_start_date = df.index[0]
-        first_month_end_date = monthly_equity.index[0]
-
-        if first_month_start_date.month == first_month_end_date.month:
-            # Both in same month - calculate from first data point to month end
-            first_return = (first_month_end_equity / first_month_start_equity - 1) * 100
-            result.loc[0, "return_pct"] = first_return
-
-    return result
-
 
 def render_monthly_heatmap(
     dates: np.ndarray,
@@ -72,23 +55,13 @@ def render_monthly_heatmap(
         st.warning("📊 No data to display.")
         return
 
-    # Calculate monthly returns
-    monthly = calculate_monthly_returns(dates, equity)
+    # Calculate monthly returns (year x month grid)
+    years, z_data = monthly_return_grid(dates, equity)
 
-    if monthly.empty:
+    if len(years) == 0:
         st.warning("📊 No monthly data available.")
         return
 
-    # Create pivot table (rows: year, columns: month)
-    pivot = monthly.pivot(index="year", columns="month", values="return_pct")
-
-    # Fill empty months
-    all_months = list(range(1, 13))
-    for month in all_months:
-        if month not in pivot.columns:
-            pivot[month] = np.nan
-    pivot = pivot[all_months]
-
     # Month names
     month_names = [
         "Jan",
@@ -105,35 +78,28 @@ def render_monthly_heatmap(
         "Dec",
     ]
 
-    # Heatmap data
-    z_data = pivot.values
-    years = pivot.index.tolist()
-
-    # Annotation text (return values)
-    annotations = []
-    for i, year in enumerate(years):
-        for j, _month in enumerate(all_months):
-            value = z_data[i, j]
-            if not np.isnan(value):
-                annotations.append(
-                    {
-                        "x": month_names[j],
-                        "y": str(year),
-                        "text": f"{value:.1f}%",
-                        "showarrow": False,
-                        "font": {
-                            "color": "white" if abs(value) > 5 else "black",
-                            "size": 10,
-                        },
-                    }
-                )
+    # Annotation text (return values) for every non-empty cell
+    year_idx, month_idx = np.nonzero(~np.isnan(z_data))
+    cell_values = z_data[year_idx, month_idx]
+    annotations = [
+        {
+            "x": month_names[j],
+            "y": str(years[i]),
+            "text": f"{value:.1f}%",
+            "showarrow": False,
+            "font": {"color": "white" if abs(value) > 5 else "black", "size": 10},
+        }
+        for i, j, value in zip(
+            year_idx.tolist(), month_idx.tolist(), cell_values.tolist(), strict=True
+        )
+    ]
 
     # Heatmap
     fig = go.Figure(
         data=go.Heatmap(
             z=z_data,
             x=month_names,
-            y=[str(y) for y in years],
+            y=[str(y) for y in years.tolist()],
             colorscale=[
                 [0.0, "rgb(165, 0, 38)"],  # Dark red (large loss)
                 [0.25, "rgb(215, 48, 39)"],  # Red
@@ -176,15 +142,12 @@ def render_monthly_heatmap(
     st.plotly_chart(fig, use_container_width=True)
 
     # Display yearly totals (compounded returns, not summed)
-    yearly_data = []
-    for year, group in monthly.groupby("year"):
-        compounded_return = (np.prod(1 + group["return_pct"] / 100) - 1) * 100
-        yearly_data.append({"year": year, "return_pct": compounded_return})
-
-    yearly_returns = pd.DataFrame(yearly_data).set_index("year")["return_pct"]
-    if not yearly_returns.empty:
+    periods, yearly_returns = period_returns(dates, equity, "Y")
+    if len(yearly_returns) > 0:
         cols = st.columns(len(yearly_returns))
-        for i, (year, ret) in enumerate(yearly_returns.items()):
+        for i, (year, ret) in enumerate(
+            zip(periods.astype(np.int64) + 1970, yearly_returns, strict=True)
+        ):
             with cols[i]:
                 st.metric(
                     label=f"{year}",
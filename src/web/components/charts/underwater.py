@@ -7,18 +7,22 @@ import numpy as np
 import plotly.graph_objects as go
 import streamlit as st
 
+from src.utils.downsampling import downsample_indices
+
 __all__ = ["render_underwater_curve"]
 
 
 def render_underwater_curve(
     dates: np.ndarray,
     equity: np.ndarray,
+    max_points: int = 2000,
 ) -> None:
     """Render underwater (drawdown) curve.
 
     Args:
         dates: Date array
         equity: Portfolio value array
+        max_points: Maximum chart points (min-max downsampling keeps every trough)
     """
     if len(dates) == 0 or len(equity) == 0:
         st.warning("📊 No data to display.")
@@ -33,6 +37,12 @@ def render_underwater_curve(
     mdd_value = drawdown[mdd_idx]
     mdd_date = dates[mdd_idx]
 
+    # Downsample after locating the MDD so the marker uses full-resolution data
+    if len(drawdown) > max_points:
+        indices = downsample_indices(drawdown, max_points, method="minmax")
+        dates = dates[indices]
+        drawdown = drawdown[indices]
+
     fig = go.Figure()
 
     # Drawdown area chart
@@ -82,7 +92,7 @@ def render_underwater_curve(
             "showgrid": True,
             "gridcolor": "rgba(128, 128, 128, 0.2)",
             "ticksuffix": "%",
-            "range": [min(drawdown) * 1.1, 5],  # Slight margin
+            "range": [mdd_value * 1.1, 5],  # Slight margin
         },
         hovermode="x unified",
         template="plotly_white",
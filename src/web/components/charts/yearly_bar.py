@@ -8,6 +8,8 @@ import pandas as pd
 import plotly.graph_objects as go
 import streamlit as st
 
+from src.utils.period_returns import period_returns
+
 __all__ = ["render_yearly_bar_chart", "calculate_yearly_returns"]
 
 
@@ -27,24 +29,10 @@ def calculate_yearly_returns(
     if len(dates) == 0 or len(equity) == 0:
         return pd.DataFrame(columns=["year", "return_pct"])
 
-    # Create DataFrame
-    df = pd.DataFrame({"date": pd.to_datetime(dates), "equity": equity})
-    df["year"] = df["date"].dt.year
-
-    # Calculate first/last day values for each year
-    yearly = (
-        df.groupby("year")
-        .agg(
-            first_equity=("equity", "first"),
-            last_equity=("equity", "last"),
-        )
-        .reset_index()
-    )
-
-    # Calculate yearly returns
-    yearly["return_pct"] = (yearly["last_equity"] / yearly["first_equity"] - 1) * 100
-
-    return yearly[["year", "return_pct"]]
+    # Chained yearly returns (first year from the first value), so they
+    # match the compounded monthly returns shown in the heatmap
+    periods, returns = period_returns(dates, equity, "Y")
+    return pd.DataFrame({"year": periods.astype(np.int64) + 1970, "return_pct": returns})
 
 
 def render_yearly_bar_chart(
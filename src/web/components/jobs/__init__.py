@@ -0,0 +1,13 @@
+"""Background job components package."""
+
+from src.web.components.jobs.job_monitor import (
+    last_job_params,
+    render_job_monitor,
+    submit_job,
+)
+
+__all__ = [
+    "last_job_params",
+    "render_job_monitor",
+    "submit_job",
+]
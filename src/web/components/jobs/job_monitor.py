@@ -0,0 +1,153 @@
+"""Background job monitor component.
+
+Tracks the job a session submitted, shows live progress, streamed partial
+results and a cancel button, and lets users reopen earlier finished runs.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Callable
+from typing import Any
+
+import pandas as pd
+import streamlit as st
+
+from src.web.services.job_runner import COMPLETED, FAILED, JobRunner, get_job_runner
+
+__all__ = ["last_job_params", "render_job_monitor", "submit_job"]
+
+# Maximum number of finished jobs offered for reopening
+_MAX_HISTORY = 20
+
+# Maximum number of streamed partial rows shown while a job runs
+_MAX_PARTIAL_ROWS = 200
+
+
+def _session_key(kind: str) -> str:
+    return f"{kind}_job_id"
+
+
+def _params_key(kind: str) -> str:
+    return f"{kind}_job_params"
+
+
+def last_job_params(kind: str) -> dict[str, Any]:
+    """Input summary (submit params) of the job render_job_monitor last returned."""
+    params: dict[str, Any] = st.session_state.get(_params_key(kind), {})
+    return params
+
+
+def submit_job(
+    kind: str,
+    fn: Callable[..., Any],
+    label: str = "",
+    params: dict[str, Any] | None = None,
+    **kwargs: Any,
+) -> None:
+    """Submit a background job, track it in the session and rerun the page.
+
+    Args:
+        kind: Job category (one tracked job per category and session)
+        fn: Module-level job function from src.web.services.jobs
+        label: Human-readable description
+        params: JSON-serializable summary of inputs
+        **kwargs: Arguments passed to fn
+    """
+    job_id = get_job_runner().submit(kind, fn, label=label, params=params, **kwargs)
+    st.session_state[_session_key(kind)] = job_id
+    st.rerun()
+
+
+def render_job_monitor(kind: str) -> Any | None:
+    """Render job progress and history for a job category.
+
+    Args:
+        kind: Job category
+
+    Returns:
+        Result of a job that just finished or was reopened from history
+        (returned once, for the page to store), otherwise None
+    """
+    runner = get_job_runner()
+    key = _session_key(kind)
+    job_id = st.session_state.get(key)
+    result = None
+
+    if job_id is not None:
+        record = runner.get(job_id)
+        if record is None:
+            del st.session_state[key]
+        elif record.is_active:
+            _render_active_job(job_id)
+        else:
+            del st.session_state[key]
+            if record.status == COMPLETED:
+                result = runner.load_result(job_id)
+                st.session_state[_params_key(kind)] = record.params
+            elif record.status == FAILED:
+                st.error(f"❌ {record.label or kind} failed: {record.error}")
+            else:
+                st.warning(f"⚠️ {record.label or kind} was cancelled")
+
+    reopened = _render_job_history(kind, runner)
+    return result if result is not None else reopened
+
+
+@st.fragment(run_every=1.0)
+def _render_active_job(job_id: str) -> None:
+    """Poll and display a running job (reruns the page once it finishes)."""
+    runner = get_job_runner()
+    record = runner.get(job_id)
+    if record is None or not record.is_active:
+        st.rerun()
+        return
+
+    st.subheader(f"🔄 {record.label or record.kind}")
+    message = record.message or "Waiting for a worker..."
+    if record.progress is not None:
+        st.progress(record.progress, text=message)
+    else:
+        st.info(message)
+
+    rows = runner.read_partials(job_id)
+    if rows:
+        st.caption(f"{len(rows):,} partial results")
+        st.dataframe(pd.DataFrame(rows[-_MAX_PARTIAL_ROWS:]), width="stretch", height=250)
+
+    if st.button("⏹️ Cancel", key=f"cancel_{job_id}"):
+        runner.cancel(job_id)
+        st.info("Cancellation requested...")
+
+
+def _render_job_history(kind: str, runner: JobRunner) -> Any | None:
+    """Render finished jobs of a category and load the one the user reopens."""
+    finished = [r for r in runner.list_jobs(kind) if r.status == COMPLETED][:_MAX_HISTORY]
+    if not finished:
+        return None
+
+    labels = {
+        r.job_id: (
+            f"{time.strftime('%Y-%m-%d %H:%M', time.localtime(r.created_at))} - {r.label or r.kind}"
+        )
+        for r in finished
+    }
+
+    with st.expander(f"🗂️ Previous Runs ({len(finished)})", expanded=False):
+        job_id = st.selectbox(
+            "Finished run",
+            options=list(labels),
+            format_func=lambda x: labels[x],
+            key=f"{kind}_job_history",
+        )
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("📂 Open", key=f"{kind}_job_open", width="stretch"):
+                record = runner.get(job_id)
+                st.session_state[_params_key(kind)] = record.params if record else {}
+                return runner.load_result(job_id)
+        with col2:
+            if st.button("🗑️ Delete", key=f"{kind}_job_delete", width="stretch"):
+                runner.delete(job_id)
+                st.rerun()
+    return None
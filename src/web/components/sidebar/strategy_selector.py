@@ -3,14 +3,18 @@
 Strategy selection and dynamic parameter editing UI component.
 """
 
-from typing import Any, cast
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, cast
 
 import streamlit as st
 
-from src.strategies.base import Strategy
 from src.utils.logger import get_logger
 from src.web.services import ParameterSpec, StrategyRegistry
 
+if TYPE_CHECKING:
+    from src.strategies.base import Strategy
+
 logger = get_logger(__name__)
 
 __all__ = ["render_strategy_selector", "create_strategy_instance"]
@@ -21,7 +25,7 @@ def get_cached_registry() -> StrategyRegistry:
     """Return cached strategy registry."""
     logger.info("Creating new StrategyRegistry instance")
     registry = StrategyRegistry()
-    logger.info(f"Registered {len(registry.list_strategies())} strategies")
+    logger.info(f"Registered {len(registry.list_entries())} strategies")
     return registry
 
 
@@ -34,7 +38,7 @@ def render_strategy_selector() -> tuple[str, dict[str, Any]]:
     st.subheader("📈 Strategy Selection")
 
     registry = get_cached_registry()
-    strategies = registry.list_strategies()
+    strategies = registry.list_entries()
 
     if not strategies:
         st.error("⚠️ No strategies registered.")
@@ -170,7 +174,7 @@ def create_strategy_instance(strategy_name: str, parameters: dict[str, Any]) ->
         # Create strategy instance
         strategy = strategy_class(**parameters)
         logger.info(f"Created strategy: {strategy_name} with params: {parameters}")
-        return cast(Strategy, strategy)
+        return cast("Strategy", strategy)
 
     except Exception as e:
         logger.exception(f"Failed to create strategy {strategy_name}: {e}")
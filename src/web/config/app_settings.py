@@ -29,6 +29,9 @@ class WebAppSettings(BaseSettings):
     # Cache settings
     cache_ttl: int = Field(default=3600, description="Cache TTL in seconds (1 hour)")
     enable_caching: bool = Field(default=True, description="Enable caching")
+    result_cache_max_mb: int = Field(
+        default=256, description="Size cap for cached backtest results, memory and disk (MB)"
+    )
 
     # UI settings
     default_theme: str = Field(default="light", description="Default UI theme (light/dark)")
@@ -7,13 +7,12 @@ from typing import Any, cast
 
 import streamlit as st
 
-from src.backtester import BacktestConfig, run_backtest, run_walk_forward_analysis
-from src.backtester.analysis.monte_carlo import run_monte_carlo
 from src.data.collector_fetch import Interval
-from src.strategies.volatility_breakout import create_vbo_strategy
 from src.utils.logger import get_logger
+from src.web.components.jobs import render_job_monitor, submit_job
 from src.web.components.sidebar.strategy_selector import get_cached_registry
 from src.web.services.data_loader import validate_data_availability
+from src.web.services.jobs import monte_carlo_job, walk_forward_job
 
 logger = get_logger(__name__)
 
@@ -50,9 +49,9 @@ def render_analysis_page() -> None:
     analysis_type = st.radio(
         "Select Analysis Type",
         options=["monte_carlo", "walk_forward"],
-        format_func=lambda x: "🎲 Monte Carlo Simulation"
-        if x == "monte_carlo"
-        else "📈 Walk-Forward Analysis",
+        format_func=lambda x: (
+            "🎲 Monte Carlo Simulation" if x == "monte_carlo" else "📈 Walk-Forward Analysis"
+        ),
         horizontal=True,
     )
 
@@ -70,7 +69,7 @@ def _render_monte_carlo() -> None:
 
     # Get available strategies from registry
     registry = get_cached_registry()
-    all_strategies = registry.list_strategies()
+    all_strategies = registry.list_entries()
 
     # Filter for non-bt strategies (bt strategies not supported for Monte Carlo yet)
     available_strategies = [s for s in all_strategies if not s.name.startswith("bt_")]
@@ -136,9 +135,11 @@ def _render_monte_carlo() -> None:
             method = st.radio(
                 "Simulation Method",
                 options=["bootstrap", "parametric"],
-                format_func=lambda x: "Bootstrap (Resampling)"
-                if x == "bootstrap"
-                else "Parametric (Normal Distribution)",
+                format_func=lambda x: (
+                    "Bootstrap (Resampling)"
+                    if x == "bootstrap"
+                    else "Parametric (Normal Distribution)"
+                ),
                 horizontal=True,
                 key="mc_method",
             )
@@ -219,6 +220,11 @@ def _render_monte_carlo() -> None:
             max_slots=max_slots,
         )
 
+    # Background job progress (and results of finished or reopened runs)
+    finished = render_job_monitor("monte_carlo")
+    if finished is not None:
+        st.session_state.monte_carlo_result, st.session_state.backtest_result_for_mc = finished
+
     # Display results
     if "monte_carlo_result" in st.session_state:
         _display_monte_carlo_results()
@@ -256,50 +262,20 @@ def _run_monte_carlo(
     fee_rate: float,
     max_slots: int,
 ) -> None:
-    """Run Monte Carlo simulation."""
-    progress = st.empty()
-    progress.info("Running backtest...")
-
-    try:
-        # Create strategy
-        strategy = _create_strategy(strategy_type)
-
-        # Configuration
-        config = BacktestConfig(
-            initial_capital=initial_capital,
-            fee_rate=fee_rate,
-            slippage_rate=fee_rate,
-            max_slots=max_slots,
-            use_cache=True,
-        )
-
-        # Run backtest
-        result = run_backtest(
-            strategy=strategy,
-            tickers=tickers,
-            interval=interval,
-            config=config,
-        )
-
-        progress.info(f"Running Monte Carlo simulation ({n_simulations:,} iterations)...")
-
-        # Run Monte Carlo
-        mc_result = run_monte_carlo(
-            result=result,
-            n_simulations=n_simulations,
-            method=method,
-            random_seed=seed,
-        )
-
-        # Save results
-        st.session_state.monte_carlo_result = mc_result
-        st.session_state.backtest_result_for_mc = result
-
-        progress.success("✅ Simulation completed!")
-
-    except Exception as e:
-        logger.error(f"Monte Carlo error: {e}", exc_info=True)
-        progress.error(f"❌ Simulation failed: {e}")
+    """Submit Monte Carlo simulation as a background job."""
+    submit_job(
+        "monte_carlo",
+        monte_carlo_job,
+        label=f"Monte Carlo {strategy_type} ({n_simulations:,} x {method})",
+        params={"strategy": strategy_type, "tickers": tickers},
+        strategy_type=strategy_type,
+        tickers=tickers,
+        interval=interval,
+        config_dict=_config_dict(initial_capital, fee_rate, max_slots),
+        n_simulations=n_simulations,
+        method=method,
+        seed=seed,
+    )
 
 
 def _display_monte_carlo_results() -> None:
@@ -350,13 +326,19 @@ def _display_monte_carlo_results() -> None:
 
     # Distribution chart
     st.markdown("### 📊 CAGR Distribution")
+    import numpy as np
     import plotly.graph_objects as go
 
+    # Bin server-side so only 50 bars are sent instead of every simulated value
+    simulated = np.asarray(mc_result.simulated_cagrs, dtype=np.float64)
+    counts, edges = np.histogram(simulated[np.isfinite(simulated)], bins=50)
+
     fig = go.Figure()
     fig.add_trace(
-        go.Histogram(
-            x=mc_result.simulated_cagrs,
-            nbinsx=50,
+        go.Bar(
+            x=(edges[:-1] + edges[1:]) / 2,
+            y=counts,
+            width=np.diff(edges),
             name="Simulated CAGRs",
             marker_color="lightblue",
         )
@@ -386,7 +368,7 @@ def _render_walk_forward() -> None:
 
     # Get available strategies from registry
     registry = get_cached_registry()
-    all_strategies = registry.list_strategies()
+    all_strategies = registry.list_entries()
 
     # Filter for non-bt strategies (Walk-Forward uses internal backtester)
     available_strategies = [s for s in all_strategies if not s.name.startswith("bt_")]
@@ -572,6 +554,11 @@ def _render_walk_forward() -> None:
             workers=workers,
         )
 
+    # Background job progress (and results of finished or reopened runs)
+    finished = render_job_monitor("walk_forward")
+    if finished is not None:
+        st.session_state.walk_forward_result = finished
+
     # Display results
     if "walk_forward_result" in st.session_state:
         _display_walk_forward_results()
@@ -613,59 +600,34 @@ def _run_walk_forward(
     max_slots: int,
     workers: int,
 ) -> None:
-    """Run Walk-Forward analysis."""
-    progress = st.empty()
-    progress.info("Running Walk-Forward analysis... (this may take a while)")
-
-    try:
-        # Strategy factory - takes params dict as argument
-        def create_strategy(params: dict[str, Any]) -> Any:
-            if strategy_type == "vanilla":
-                return create_vbo_strategy(
-                    name="VanillaVBO",
-                    use_trend_filter=False,
-                    use_noise_filter=False,
-                    **params,
-                )
-            else:
-                return create_vbo_strategy(
-                    name="LegacyVBO",
-                    use_trend_filter=True,
-                    use_noise_filter=True,
-                    **params,
-                )
-
-        # Configuration
-        config = BacktestConfig(
-            initial_capital=initial_capital,
-            fee_rate=fee_rate,
-            slippage_rate=fee_rate,
-            max_slots=max_slots,
-            use_cache=True,
-        )
-
-        # Run Walk-Forward
-        result = run_walk_forward_analysis(
-            strategy_factory=create_strategy,
-            param_grid=param_grid,
-            tickers=tickers,
-            interval=interval,
-            config=config,
-            optimization_days=optimization_days,
-            test_days=test_days,
-            step_days=step_days,
-            metric=metric,
-            n_workers=workers,
-        )
-
-        # Save results
-        st.session_state.walk_forward_result = result
+    """Submit Walk-Forward analysis as a background job."""
+    submit_job(
+        "walk_forward",
+        walk_forward_job,
+        label=f"Walk-Forward {strategy_type} ({optimization_days}/{test_days}/{step_days} days)",
+        params={"strategy": strategy_type, "tickers": tickers, "param_grid": param_grid},
+        strategy_type=strategy_type,
+        param_grid=param_grid,
+        tickers=tickers,
+        interval=interval,
+        config_dict=_config_dict(initial_capital, fee_rate, max_slots),
+        optimization_days=optimization_days,
+        test_days=test_days,
+        step_days=step_days,
+        metric=metric,
+        workers=workers,
+    )
 
-        progress.success("✅ Walk-Forward analysis completed!")
 
-    except Exception as e:
-        logger.error(f"Walk-Forward error: {e}", exc_info=True)
-        progress.error(f"❌ Analysis failed: {e}")
+def _config_dict(initial_capital: float, fee_rate: float, max_slots: int) -> dict[str, Any]:
+    """Build BacktestConfig keyword arguments for analysis jobs."""
+    return {
+        "initial_capital": initial_capital,
+        "fee_rate": fee_rate,
+        "slippage_rate": fee_rate,
+        "max_slots": max_slots,
+        "use_cache": True,
+    }
 
 
 def _display_walk_forward_results() -> None:
@@ -818,34 +780,3 @@ def _map_strategy_to_type(strategy_name: str) -> str:
         return "mean-reversion"
     else:
         return "vanilla"  # Default
-
-
-def _create_strategy(strategy_type: str) -> Any:
-    """Create strategy object."""
-    from src.strategies.mean_reversion import MeanReversionStrategy
-    from src.strategies.momentum import MomentumStrategy
-
-    if strategy_type == "vanilla":
-        return create_vbo_strategy(
-            name="VanillaVBO",
-            use_trend_filter=False,
-            use_noise_filter=False,
-        )
-    elif strategy_type == "minimal":
-        return create_vbo_strategy(
-            name="MinimalVBO",
-            use_trend_filter=False,
-            use_noise_filter=False,
-        )
-    elif strategy_type == "legacy":
-        return create_vbo_strategy(
-            name="LegacyVBO",
-            use_trend_filter=True,
-            use_noise_filter=True,
-        )
-    elif strategy_type == "momentum":
-        return MomentumStrategy(name="Momentum")
-    elif strategy_type == "mean-reversion":
-        return MeanReversionStrategy(name="MeanReversion")
-    else:
-        return create_vbo_strategy(name="DefaultVBO")
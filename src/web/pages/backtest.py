@@ -11,7 +11,7 @@ from typing import TYPE_CHECKING
 import numpy as np
 import streamlit as st
 
-from src.backtester.models import BacktestConfig, BacktestResult
+from src.backtester.models import BacktestResult
 from src.utils.logger import get_logger
 
 if TYPE_CHECKING:
@@ -21,6 +21,7 @@ from src.web.components.charts.equity_curve import render_equity_curve
 from src.web.components.charts.monthly_heatmap import render_monthly_heatmap
 from src.web.components.charts.underwater import render_underwater_curve
 from src.web.components.charts.yearly_bar import render_yearly_bar_chart
+from src.web.components.jobs import last_job_params, render_job_monitor, submit_job
 from src.web.components.metrics.metrics_display import (
     render_metrics_cards,
 )
@@ -28,9 +29,10 @@ from src.web.components.sidebar.asset_selector import render_asset_selector
 from src.web.components.sidebar.date_config import render_date_config
 from src.web.components.sidebar.strategy_selector import render_strategy_selector
 from src.web.components.sidebar.trading_config import render_trading_config
-from src.web.services.backtest_runner import run_backtest_service
 from src.web.services.data_loader import get_data_files, validate_data_availability
+from src.web.services.jobs import backtest_job, bt_backtest_job
 from src.web.services.metrics_calculator import calculate_extended_metrics
+from src.web.services.result_cache import clear_result_cache
 
 logger = get_logger(__name__)
 
@@ -44,6 +46,11 @@ def render_backtest_page() -> None:
     # Render settings section
     _render_settings_section()
 
+    # Background job progress (and results of finished or reopened runs)
+    finished = render_job_monitor("backtest")
+    if finished is not None:
+        _store_finished_backtest(finished)
+
     # Display results below settings if available
     if "bt_backtest_result" in st.session_state:
         st.markdown("---")
@@ -96,6 +103,7 @@ def _render_settings_section() -> None:
     with col_right:
         if st.button("🗑️ Clear Cache", width="stretch"):
             st.cache_data.clear()
+            clear_result_cache()
             if "backtest_result" in st.session_state:
                 del st.session_state.backtest_result
             if "bt_backtest_result" in st.session_state:
@@ -161,54 +169,33 @@ def _run_event_driven_backtest(
     start_date: date_type | None,
     end_date: date_type | None,
 ) -> None:
-    """Run backtest using event-driven engine."""
-    with st.spinner("Running backtest..."):
-        # Create BacktestConfig
-        config = BacktestConfig(
-            initial_capital=trading_config.initial_capital,
-            fee_rate=trading_config.fee_rate,
-            slippage_rate=trading_config.slippage_rate,
-            max_slots=trading_config.max_slots,
-            use_cache=False,
-        )
-
-        # Get data file paths
-        data_files = get_data_files(available_tickers, trading_config.interval)
-
-        if not data_files:
-            st.error("Data files not found.")
-            return
+    """Submit backtest on the event-driven engine as a background job."""
+    # Get data file paths
+    data_files = get_data_files(available_tickers, trading_config.interval)
 
-        # Run backtest (convert to serializable types for caching)
-        data_files_dict = {ticker: str(path) for ticker, path in data_files.items()}
-        config_dict = {
-            "initial_capital": config.initial_capital,
-            "fee_rate": config.fee_rate,
-            "slippage_rate": config.slippage_rate,
-            "max_slots": config.max_slots,
-            "use_cache": config.use_cache,
-        }
-        start_date_str = start_date.isoformat() if start_date else None
-        end_date_str = end_date.isoformat() if end_date else None
-
-        result = run_backtest_service(
-            strategy_name=strategy_name,
-            strategy_params=strategy_params,
-            data_files_dict=data_files_dict,
-            config_dict=config_dict,
-            start_date_str=start_date_str,
-            end_date_str=end_date_str,
-        )
+    if not data_files:
+        st.error("Data files not found.")
+        return
 
-        if result:
-            # Clear bt result if exists
-            if "bt_backtest_result" in st.session_state:
-                del st.session_state.bt_backtest_result
-            st.session_state.backtest_result = result
-            st.success("Backtest completed!")
-            st.rerun()
-        else:
-            st.error("Backtest execution failed")
+    config_dict = {
+        "initial_capital": trading_config.initial_capital,
+        "fee_rate": trading_config.fee_rate,
+        "slippage_rate": trading_config.slippage_rate,
+        "max_slots": trading_config.max_slots,
+        "use_cache": False,
+    }
+    submit_job(
+        "backtest",
+        backtest_job,
+        label=f"{strategy_name} backtest ({len(data_files)} assets)",
+        params={"strategy": strategy_name, "tickers": list(data_files)},
+        strategy_name=strategy_name,
+        strategy_params=strategy_params,
+        data_files={ticker: str(path) for ticker, path in data_files.items()},
+        config_dict=config_dict,
+        start_date=start_date,
+        end_date=end_date,
+    )
 
 
 def _run_bt_backtest(
@@ -219,15 +206,9 @@ def _run_bt_backtest(
     start_date: date_type | None,
     end_date: date_type | None,
 ) -> None:
-    """Run backtest using bt library."""
-    from src.web.services.bt_backtest_runner import (
-        run_bt_backtest_generic_service,
-        run_bt_backtest_regime_service,
-        run_bt_backtest_service,
-    )
-
+    """Submit backtest using bt library as a background job."""
     # Convert tickers: KRW-BTC -> BTC
-    symbols = [t.replace("KRW-", "") for t in available_tickers]
+    symbols = tuple(t.replace("KRW-", "") for t in available_tickers)
 
     # Strategy name to bt strategy type mapping
     strategy_mapping = {
@@ -239,62 +220,63 @@ def _run_bt_backtest(
         "bt_VBO_Portfolio": ("vbo_portfolio", "bt VBO Portfolio"),
     }
 
-    bt_strategy_type, strategy_display = strategy_mapping.get(
-        strategy_name, ("vbo", "bt VBO")
-    )
+    bt_strategy_type, strategy_display = strategy_mapping.get(strategy_name, ("vbo", "bt VBO"))
 
-    # Run backtest based on strategy type
+    common = {
+        "symbols": symbols,
+        "interval": "day",
+        "initial_cash": int(trading_config.initial_capital),
+        "fee": trading_config.fee_rate,
+        "slippage": trading_config.slippage_rate,
+        "start_date": start_date,
+        "end_date": end_date,
+    }
     if strategy_name == "bt_VBO_Regime":
-        with st.spinner(f"Running {strategy_display} backtest (ML model)..."):
-            result = run_bt_backtest_regime_service(
-                symbols=tuple(symbols),
-                interval="day",
-                initial_cash=int(trading_config.initial_capital),
-                fee=trading_config.fee_rate,
-                slippage=trading_config.slippage_rate,
-                ma_short=strategy_params.get("ma_short", 5),
-                noise_ratio=strategy_params.get("noise_ratio", 0.5),
-                start_date=start_date,
-                end_date=end_date,
-            )
+        service = "regime"
+        kwargs = {
+            **common,
+            "ma_short": strategy_params.get("ma_short", 5),
+            "noise_ratio": strategy_params.get("noise_ratio", 0.5),
+        }
     elif strategy_name == "bt_VBO":
-        with st.spinner(f"Running {strategy_display} backtest..."):
-            result = run_bt_backtest_service(
-                symbols=tuple(symbols),
-                interval="day",
-                initial_cash=int(trading_config.initial_capital),
-                fee=trading_config.fee_rate,
-                slippage=trading_config.slippage_rate,
-                multiplier=strategy_params.get("multiplier", 2),
-                lookback=strategy_params.get("lookback", 5),
-                start_date=start_date,
-                end_date=end_date,
-            )
+        service = "vbo"
+        kwargs = {
+            **common,
+            "multiplier": strategy_params.get("multiplier", 2),
+            "lookback": strategy_params.get("lookback", 5),
+        }
     else:
         # Use generic service for other strategies
-        with st.spinner(f"Running {strategy_display} backtest..."):
-            result = run_bt_backtest_generic_service(
-                strategy_type=bt_strategy_type,
-                symbols=tuple(symbols),
-                interval="day",
-                initial_cash=int(trading_config.initial_capital),
-                fee=trading_config.fee_rate,
-                slippage=trading_config.slippage_rate,
-                start_date=start_date,
-                end_date=end_date,
-                **strategy_params,
-            )
+        service = "generic"
+        kwargs = {**common, "strategy_type": bt_strategy_type, **strategy_params}
+
+    st.session_state.bt_strategy_name = strategy_name
+    submit_job(
+        "backtest",
+        bt_backtest_job,
+        label=f"{strategy_display} backtest ({len(symbols)} assets)",
+        params={"strategy": strategy_name, "symbols": list(symbols)},
+        service=service,
+        **kwargs,
+    )
 
-    if result:
+
+def _store_finished_backtest(result: object) -> None:
+    """Store a finished (or reopened) backtest job result for display."""
+    if isinstance(result, BacktestResult):
+        # Clear bt result if exists
+        if "bt_backtest_result" in st.session_state:
+            del st.session_state.bt_backtest_result
+        st.session_state.backtest_result = result
+    else:
         # Clear event-driven result if exists
         if "backtest_result" in st.session_state:
             del st.session_state.backtest_result
         st.session_state.bt_backtest_result = result
-        st.session_state.bt_strategy_name = strategy_name
-        st.success(f"{strategy_display} Backtest completed!")
-        st.rerun()
-    else:
-        st.error("bt Backtest execution failed")
+        # A reopened run may come from another strategy than the last submit
+        strategy_name = last_job_params("backtest").get("strategy")
+        if strategy_name:
+            st.session_state.bt_strategy_name = strategy_name
 
 
 def _show_config_summary(
@@ -349,7 +331,11 @@ def _display_results(result: BacktestResult) -> None:
 
     # Calculate extended metrics (cached in session state)
     equity = np.array(result.equity_curve)
-    dates = np.array(result.dates) if hasattr(result, "dates") and result.dates else np.arange(len(equity))
+    dates = (
+        np.array(result.dates)
+        if hasattr(result, "dates") and result.dates
+        else np.arange(len(equity))
+    )
 
     # Generate cache key (cache metrics by equity hash)
     cache_key = f"metrics_{hash(equity.tobytes())}"
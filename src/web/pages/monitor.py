@@ -207,32 +207,31 @@ def _calculate_pnl_summary(
     days: int = 30,
 ) -> pd.DataFrame:
     """Calculate PnL summary for the last N days."""
-    summary_data = []
-
-    for i in range(days):
-        date = datetime.now() - timedelta(days=i)
-        date_str = date.strftime("%Y-%m-%d")
-
-        try:
-            trades_df = storage.get_bot_logs(date_str, account)
+    now = datetime.now()
+    dates = [(now - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(days)]
+    logs = storage.get_bot_logs_batch(dates, account)
 
-            if not trades_df.empty and "pnl" in trades_df.columns:
-                daily_pnl = trades_df["pnl"].sum()
-                trade_count = len(trades_df)
-            else:
-                daily_pnl = 0
-                trade_count = 0
-
-            summary_data.append(
-                {
-                    "date": date_str,
-                    "pnl": daily_pnl,
-                    "trades": trade_count,
-                }
-            )
-
-        except Exception as e:
-            logger.debug(f"No data for {date_str}: {e}")
+    summary_data = []
+    for date_str in dates:
+        trades_df = logs.get(date_str)
+        if trades_df is None:
+            logger.debug(f"No data for {date_str}")
+            continue
+
+        if not trades_df.empty and "pnl" in trades_df.columns:
+            daily_pnl = trades_df["pnl"].sum()
+            trade_count = len(trades_df)
+        else:
+            daily_pnl = 0
+            trade_count = 0
+
+        summary_data.append(
+            {
+                "date": date_str,
+                "pnl": daily_pnl,
+                "trades": trade_count,
+            }
+        )
 
     if not summary_data:
         return pd.DataFrame()
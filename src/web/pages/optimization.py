@@ -3,23 +3,16 @@
 Strategy parameter optimization page.
 """
 
-from itertools import product
 from typing import Any, cast
 
 import streamlit as st
 
-from src.backtester import BacktestConfig, optimize_strategy_parameters
 from src.data.collector_fetch import Interval
 from src.utils.logger import get_logger
-from src.web.services.bt_backtest_runner import (
-    BtBacktestResult,
-    get_available_bt_symbols,
-    get_default_model_path,
-    is_bt_available,
-    run_bt_backtest_regime_service,
-    run_bt_backtest_service,
-)
+from src.web.components.jobs import render_job_monitor, submit_job
+from src.web.services.bt_backtest_runner import get_available_bt_symbols, is_bt_available
 from src.web.services.data_loader import validate_data_availability
+from src.web.services.jobs import bt_optimization_job, optimization_job
 from src.web.services.strategy_registry import StrategyRegistry, is_bt_strategy
 
 logger = get_logger(__name__)
@@ -36,6 +29,14 @@ METRICS = [
     ("profit_factor", "Profit Factor"),
 ]
 
+# Search method options
+SEARCH_METHODS = {
+    "grid": "Grid Search (Full exploration)",
+    "random": "Random Search (Random sampling)",
+    "halving": "Successive Halving (Recent data first)",
+    "bayesian": "Bayesian (Model-guided sampling)",
+}
+
 # Default tickers
 DEFAULT_TICKERS = ["KRW-BTC", "KRW-ETH", "KRW-XRP", "KRW-SOL"]
 
@@ -52,7 +53,7 @@ def render_optimization_page() -> None:
 
     # Get strategy registry (same as backtest page)
     registry = _get_cached_registry()
-    all_strategies = registry.list_strategies()
+    all_strategies = registry.list_entries()
 
     # Separate bt and non-bt strategies
     native_strategies = [s for s in all_strategies if not is_bt_strategy(s.name)]
@@ -105,16 +106,16 @@ def render_optimization_page() -> None:
 
         with col2:
             st.subheader("⚙️ Optimization Method")
+            # Adaptive methods run on the native engine only
+            method_options = ["grid", "random"] if is_bt else list(SEARCH_METHODS)
             method = st.radio(
                 "Search Method",
-                options=["grid", "random"],
-                format_func=lambda x: "Grid Search (Full exploration)"
-                if x == "grid"
-                else "Random Search (Random sampling)",
+                options=method_options,
+                format_func=lambda x: SEARCH_METHODS[x],
                 horizontal=True,
             )
 
-            if method == "random":
+            if method in ("random", "bayesian"):
                 n_iter = st.slider(
                     "Number of Iterations", min_value=10, max_value=500, value=100, step=10
                 )
@@ -250,6 +251,12 @@ def render_optimization_page() -> None:
 
     # ===== Main Area =====
 
+    # Background job progress (and results of finished or reopened runs)
+    finished = render_job_monitor("optimization")
+    if finished is not None:
+        st.session_state.optimization_result = finished
+        st.session_state.optimization_metric = finished.metric
+
     # Validation
     if not selected_tickers:
         st.warning("⚠️ Please select at least one ticker.")
@@ -440,7 +447,7 @@ def _show_config_summary(
             st.write(f"- Interval: {interval}")
 
             # Calculate total combinations
-            if method == "grid":
+            if method in ("grid", "halving"):
                 total_combinations = 1
                 for values in param_grid.values():
                     total_combinations *= len(values)
@@ -462,6 +469,8 @@ def _show_help() -> None:
         **2. Search Method**
         - Grid Search: Tests all combinations (accurate but slow)
         - Random Search: Random sampling (fast but may miss optimal solution)
+        - Successive Halving: Screens all combinations on recent months, re-tests the best on full history
+        - Bayesian: Learns from finished runs and proposes promising combinations in batches
 
         **3. Parameter Ranges**
         - Enter comma-separated values for each parameter
@@ -490,56 +499,33 @@ def _run_optimization(
     max_slots: int,
     workers: int,
 ) -> None:
-    """Run optimization."""
-    st.subheader("🔄 Optimization in Progress...")
-
-    # Progress indicator
-    progress_placeholder = st.empty()
-    progress_placeholder.info("Starting optimization...")
-
+    """Submit native optimization as a background job."""
     if strategy_class is None:
-        progress_placeholder.error("❌ Strategy class not found")
+        st.error("❌ Strategy class not found")
         return
 
-    try:
-        # Create strategy factory (receives dict parameter from grid_search)
-        def create_strategy(params: dict[str, Any]) -> Any:
-            return strategy_class(**params)
-
-        # Create configuration
-        config = BacktestConfig(
-            initial_capital=initial_capital,
-            fee_rate=fee_rate,
-            slippage_rate=fee_rate,
-            max_slots=max_slots,
-            use_cache=True,
-        )
-
-        progress_placeholder.info("Running backtests... (this may take a while)")
-
-        # Run optimization
-        result = optimize_strategy_parameters(
-            strategy_factory=create_strategy,
-            param_grid=param_grid,
-            tickers=tickers,
-            interval=interval,
-            config=config,
-            metric=metric,
-            maximize=True,
-            method=method,
-            n_iter=n_iter,
-            n_workers=workers,
-        )
-
-        # Save results
-        st.session_state.optimization_result = result
-        st.session_state.optimization_metric = metric
-
-        progress_placeholder.success("✅ Optimization completed!")
-
-    except Exception as e:
-        logger.error(f"Optimization error: {e}", exc_info=True)
-        progress_placeholder.error(f"❌ Optimization failed: {e}")
+    config_dict = {
+        "initial_capital": initial_capital,
+        "fee_rate": fee_rate,
+        "slippage_rate": fee_rate,
+        "max_slots": max_slots,
+        "use_cache": True,
+    }
+    submit_job(
+        "optimization",
+        optimization_job,
+        label=f"{strategy_name} {method} optimization ({metric})",
+        params={"strategy": strategy_name, "tickers": tickers, "param_grid": param_grid},
+        strategy_class=strategy_class,
+        param_grid=param_grid,
+        tickers=tickers,
+        interval=interval,
+        config_dict=config_dict,
+        metric=metric,
+        method=method,
+        n_iter=n_iter,
+        workers=workers,
+    )
 
 
 def _run_bt_optimization(
@@ -552,7 +538,7 @@ def _run_bt_optimization(
     initial_capital: int,
     fee_rate: float,
 ) -> None:
-    """Run bt strategy optimization.
+    """Submit bt strategy optimization as a background job.
 
     Args:
         strategy_name: bt strategy name (bt_VBO or bt_VBO_Regime)
@@ -564,152 +550,21 @@ def _run_bt_optimization(
         initial_capital: Initial capital in KRW
         fee_rate: Fee rate
     """
-    import random
-
-    st.subheader("🔄 bt Optimization in Progress...")
-
-    progress_placeholder = st.empty()
-    progress_bar = st.progress(0)
-    progress_placeholder.info("Starting bt optimization...")
-
-    # Generate parameter combinations
-    param_names = list(param_grid.keys())
-    param_values = list(param_grid.values())
-
-    if method == "grid":
-        combinations = list(product(*param_values))
-    else:
-        # Random search
-        all_combinations = list(product(*param_values))
-        n_iter = min(n_iter, len(all_combinations))
-        combinations = random.sample(all_combinations, n_iter)
-
-    total = len(combinations)
-    logger.info(f"bt optimization: {total} parameter combinations")
-    progress_placeholder.info(f"Running {total} backtests...")
-
-    # Determine which bt strategy to use
-    is_regime = "Regime" in strategy_name
-
-    # Get model path for regime strategy
-    model_path = str(get_default_model_path()) if is_regime else None
-
-    # Run backtests for each combination
-    all_results: list[tuple[dict[str, Any], BtBacktestResult | None, float]] = []
-
-    for i, combo in enumerate(combinations):
-        params = dict(zip(param_names, combo, strict=False))
-
-        try:
-            if is_regime:
-                # VBO Regime strategy
-                result = run_bt_backtest_regime_service(
-                    symbols=tuple(symbols),
-                    interval="day",
-                    initial_cash=initial_capital,
-                    fee=fee_rate,
-                    slippage=fee_rate,
-                    ma_short=params.get("ma_short", 5),
-                    noise_ratio=params.get("noise_ratio", 0.5),
-                    model_path=model_path,
-                )
-            else:
-                # VBO strategy
-                result = run_bt_backtest_service(
-                    symbols=tuple(symbols),
-                    interval="day",
-                    initial_cash=initial_capital,
-                    fee=fee_rate,
-                    slippage=fee_rate,
-                    multiplier=params.get("multiplier", 2),
-                    lookback=params.get("lookback", 5),
-                )
-
-            if result:
-                score = _extract_bt_metric(result, metric)
-                all_results.append((params, result, score))
-            else:
-                all_results.append((params, None, float("-inf")))
-
-        except Exception as e:
-            logger.warning(f"bt backtest failed for {params}: {e}")
-            all_results.append((params, None, float("-inf")))
-
-        # Update progress
-        progress = (i + 1) / total
-        progress_bar.progress(progress)
-        progress_placeholder.info(f"Running backtests... ({i + 1}/{total})")
-
-    # Sort by score (descending)
-    all_results.sort(key=lambda x: x[2], reverse=True)
-
-    if not all_results or all_results[0][1] is None:
-        progress_placeholder.error("❌ All backtests failed")
-        return
-
-    # Create result object compatible with display function
-    best_params, best_result, best_score = all_results[0]
-
-    # Create a simple result object
-    class BtOptimizationResult:
-        def __init__(
-            self,
-            best_params: dict[str, Any],
-            best_score: float,
-            all_params: list[dict[str, Any]],
-            all_scores: list[float],
-        ):
-            self.best_params = best_params
-            self.best_score = best_score
-            self.all_params = all_params
-            self.all_scores = all_scores
-
-    result_obj = BtOptimizationResult(
-        best_params=best_params,
-        best_score=best_score,
-        all_params=[r[0] for r in all_results if r[1] is not None],
-        all_scores=[r[2] for r in all_results if r[1] is not None],
+    submit_job(
+        "optimization",
+        bt_optimization_job,
+        label=f"{strategy_name} {method} optimization ({metric})",
+        params={"strategy": strategy_name, "symbols": symbols, "param_grid": param_grid},
+        strategy_name=strategy_name,
+        param_grid=param_grid,
+        symbols=symbols,
+        metric=metric,
+        method=method,
+        n_iter=n_iter,
+        initial_capital=initial_capital,
+        fee_rate=fee_rate,
     )
 
-    # Save results
-    st.session_state.optimization_result = result_obj
-    st.session_state.optimization_metric = metric
-
-    progress_bar.progress(1.0)
-    progress_placeholder.success(f"✅ bt Optimization completed! Best {metric}: {best_score:.4f}")
-
-
-def _extract_bt_metric(result: BtBacktestResult, metric: str) -> float:
-    """Extract metric value from bt backtest result.
-
-    Args:
-        result: BtBacktestResult object
-        metric: Metric name
-
-    Returns:
-        Metric value
-    """
-    metric_map = {
-        "sharpe_ratio": "sharpe_ratio",
-        "cagr": "cagr",
-        "total_return": "total_return",
-        "calmar_ratio": None,  # Calculate from cagr/mdd
-        "win_rate": "win_rate",
-        "profit_factor": "profit_factor",
-        "sortino_ratio": "sortino_ratio",
-    }
-
-    if metric == "calmar_ratio":
-        # Calmar = CAGR / |MDD|
-        mdd = abs(result.mdd) if result.mdd != 0 else 1.0
-        return result.cagr / mdd
-
-    attr = metric_map.get(metric, "sharpe_ratio")
-    if attr is None:
-        return result.sharpe_ratio
-
-    return getattr(result, attr, 0.0)
-
 
 def _display_optimization_results() -> None:
     """Display optimization results."""
@@ -1,16 +1,46 @@
-"""Web services package."""
+"""Web services package.
 
-from src.web.services.metrics_calculator import (
-    ExtendedMetrics,
-    calculate_extended_metrics,
-)
-from src.web.services.parameter_models import ParameterSpec, StrategyInfo
-from src.web.services.strategy_registry import StrategyRegistry
+Exports are resolved lazily so that importing one service (e.g. the
+strategy registry) does not pull in the metrics stack and scipy.
+"""
+
+from typing import Any
 
 __all__ = [
     "ExtendedMetrics",
     "calculate_extended_metrics",
     "ParameterSpec",
+    "StrategyEntry",
     "StrategyInfo",
     "StrategyRegistry",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy import to avoid loading scipy and strategy modules at startup."""
+    if name == "ExtendedMetrics":
+        from src.web.services.metrics_calculator import ExtendedMetrics
+
+        return ExtendedMetrics
+    elif name == "calculate_extended_metrics":
+        from src.web.services.metrics_calculator import calculate_extended_metrics
+
+        return calculate_extended_metrics
+    elif name == "ParameterSpec":
+        from src.web.services.parameter_models import ParameterSpec
+
+        return ParameterSpec
+    elif name == "StrategyEntry":
+        from src.web.services.parameter_models import StrategyEntry
+
+        return StrategyEntry
+    elif name == "StrategyInfo":
+        from src.web.services.parameter_models import StrategyInfo
+
+        return StrategyInfo
+    elif name == "StrategyRegistry":
+        from src.web.services.strategy_registry import StrategyRegistry
+
+        return StrategyRegistry
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
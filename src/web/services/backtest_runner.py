@@ -8,8 +8,6 @@ from __future__ import annotations
 from datetime import date
 from pathlib import Path
 
-import streamlit as st
-
 from src.backtester.engine import (
     BacktestEngine,
     EventDrivenBacktestEngine,
@@ -18,6 +16,11 @@ from src.backtester.engine import (
 from src.backtester.models import BacktestConfig, BacktestResult
 from src.strategies.base import Strategy
 from src.utils.logger import get_logger
+from src.web.services.result_cache import (
+    CompactBacktestResult,
+    backtest_cache_key,
+    get_result_cache,
+)
 
 logger = get_logger(__name__)
 
@@ -94,7 +97,6 @@ class BacktestService:
             return None
 
 
-@st.cache_data(show_spinner="Running backtest...")
 def run_backtest_service(
     strategy_name: str,
     strategy_params: dict,
@@ -103,9 +105,11 @@ def run_backtest_service(
     start_date_str: str | None,
     end_date_str: str | None,
 ) -> BacktestResult | None:
-    """Cacheable backtest execution wrapper.
+    """Cached backtest execution wrapper.
 
-    Convert all parameters to serializable types for Streamlit caching.
+    Results are cached in compact form, keyed on the arguments plus the
+    mtime/size of every data file, so rewritten data invalidates only the
+    affected entries.
 
     Args:
         strategy_name: Strategy name
@@ -118,6 +122,32 @@ def run_backtest_service(
     Returns:
         BacktestResult or None
     """
+    cache = get_result_cache()
+    key = backtest_cache_key(
+        strategy_name, strategy_params, data_files_dict, config_dict, start_date_str, end_date_str
+    )
+    cached = cache.get(key)
+    if cached is not None:
+        logger.info(f"Backtest cache hit: {strategy_name} with {len(data_files_dict)} assets")
+        return cached.to_result()
+
+    result = _execute_backtest(
+        strategy_name, strategy_params, data_files_dict, config_dict, start_date_str, end_date_str
+    )
+    if result is not None:
+        cache.put(key, CompactBacktestResult.from_result(result))
+    return result
+
+
+def _execute_backtest(
+    strategy_name: str,
+    strategy_params: dict,
+    data_files_dict: dict[str, str],
+    config_dict: dict,
+    start_date_str: str | None,
+    end_date_str: str | None,
+) -> BacktestResult | None:
+    """Run a backtest from serializable arguments."""
     try:
         # Create Strategy instance
         from src.web.components.sidebar.strategy_selector import (
@@ -14,6 +14,7 @@ import streamlit as st
 
 from src.config import RAW_DATA_DIR
 from src.data.collector_fetch import Interval
+from src.data.query_service import get_query_service
 from src.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -35,6 +36,10 @@ def load_ticker_data(
 ) -> pd.DataFrame | None:
     """Load OHLCV data (1 hour cache).
 
+    With duckdb installed the date filter is pushed into the parquet scan,
+    so only the requested range is read; otherwise the file is read with
+    pandas and filtered afterwards.
+
     Args:
         ticker: Ticker symbol (e.g., KRW-BTC)
         interval: Candle interval
@@ -52,14 +57,23 @@ def load_ticker_data(
             logger.warning(f"Data file not found: {file_path}")
             return None
 
-        # Load data
-        df = pd.read_parquet(file_path)
+        service = get_query_service()
+        if service is not None:
+            df = service.read_range(file_path, start_date, end_date)
+            if df is None:
+                return None
+        else:
+            df = pd.read_parquet(file_path)
+
+            # Date filtering
+            if start_date:
+                df = df[df.index >= pd.Timestamp(start_date)]
+            if end_date:
+                df = df[df.index <= pd.Timestamp(end_date)]
 
-        # Date filtering
-        if start_date:
-            df = df[df.index >= pd.Timestamp(start_date)]
-        if end_date:
-            df = df[df.index <= pd.Timestamp(end_date)]
+        if df.empty:
+            logger.warning(f"No {ticker} {interval} data in the requested range")
+            return None
 
         logger.info(f"Loaded {ticker} {interval}: {len(df)} rows ({df.index[0]} ~ {df.index[-1]})")
 
@@ -173,7 +187,8 @@ def get_data_date_range(interval: Interval = "day") -> tuple[date | None, date |
     """Get the date range of available data.
 
     Scans all parquet files for the given interval and returns
-    the earliest start date and latest end date.
+    the earliest start date and latest end date. With duckdb installed
+    this is a single min/max aggregate over the timestamp columns.
 
     Args:
         interval: Candle interval
@@ -181,6 +196,13 @@ def get_data_date_range(interval: Interval = "day") -> tuple[date | None, date |
     Returns:
         (start_date, end_date) tuple, or (None, None) if no data
     """
+    service = get_query_service()
+    if service is not None:
+        try:
+            return service.date_range(interval)
+        except Exception as e:
+            logger.warning(f"DuckDB date range query failed, scanning files: {e}")
+
     min_date: date | None = None
     max_date: date | None = None
 
@@ -0,0 +1,374 @@
+"""Background job execution service.
+
+Runs long dashboard workloads (backtests, optimizations, Monte Carlo,
+walk-forward) in a process pool so they do not block the Streamlit script
+thread. Every job has a directory in an on-disk registry:
+
+    <jobs_dir>/<job_id>/meta.json      Status, progress and message
+    <jobs_dir>/<job_id>/partial.jsonl  Streamed partial results (one JSON row per line)
+    <jobs_dir>/<job_id>/result.pkl     Pickled final result
+    <jobs_dir>/<job_id>/cancel         Cancellation flag
+
+Pages submit jobs, poll the registry for progress, and reopen finished
+results across sessions and server restarts without recomputing.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pickle
+import shutil
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Any
+
+import psutil
+
+from src.config.constants import JOBS_DIR
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "JobCancelledError",
+    "JobContext",
+    "JobRecord",
+    "JobRunner",
+    "get_job_runner",
+]
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+ACTIVE_STATUSES = (PENDING, RUNNING)
+
+_META_FILE = "meta.json"
+_PARTIAL_FILE = "partial.jsonl"
+_RESULT_FILE = "result.pkl"
+_CANCEL_FILE = "cancel"
+
+
+class JobCancelledError(Exception):
+    """Raised inside a job when cancellation has been requested."""
+
+
+@dataclass
+class JobRecord:
+    """Registry entry for a background job."""
+
+    job_id: str
+    kind: str
+    label: str
+    status: str = PENDING
+    progress: float | None = None  # 0.0-1.0, None when total work is unknown
+    message: str = ""
+    error: str | None = None
+    params: dict[str, Any] = field(default_factory=dict)
+    owner_pid: int | None = None  # Server process whose pool runs the job
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    @property
+    def is_active(self) -> bool:
+        """Whether the job is still pending or running."""
+        return self.status in ACTIVE_STATUSES
+
+
+def _write_meta(job_dir: Path, record: JobRecord) -> None:
+    """Atomically write job metadata."""
+    record.updated_at = time.time()
+    tmp = job_dir / f"{_META_FILE}.{os.getpid()}.tmp"
+    tmp.write_text(json.dumps(asdict(record), default=str))
+    os.replace(tmp, job_dir / _META_FILE)
+
+
+def _owner_alive(record: JobRecord) -> bool:
+    """Whether the process that submitted the job is still running.
+
+    A process started after the job was created only reuses the PID.
+    """
+    if record.owner_pid is None:
+        return False
+    try:
+        return bool(psutil.Process(record.owner_pid).create_time() <= record.created_at)
+    except (psutil.NoSuchProcess, psutil.AccessDenied):
+        return False
+
+
+def _read_meta(job_dir: Path) -> JobRecord | None:
+    """Read job metadata, or None if missing or unreadable."""
+    try:
+        data = json.loads((job_dir / _META_FILE).read_text())
+        return JobRecord(**data)
+    except (OSError, ValueError, TypeError):
+        return None
+
+
+class JobContext:
+    """Handle passed to job functions for progress reporting and cancellation."""
+
+    def __init__(self, job_dir: Path, record: JobRecord) -> None:
+        """Initialize context.
+
+        Args:
+            job_dir: Registry directory of the job
+            record: Job record (updated in place on report)
+        """
+        self.job_dir = job_dir
+        self.record = record
+        self._last_write = 0.0
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation has been requested."""
+        return (self.job_dir / _CANCEL_FILE).exists()
+
+    def check_cancelled(self) -> None:
+        """Raise JobCancelledError if cancellation has been requested."""
+        if self.cancelled:
+            raise JobCancelledError(self.record.job_id)
+
+    def report(self, progress: float | None = None, message: str | None = None) -> None:
+        """Update progress and message in the registry.
+
+        Writes are throttled to a few per second; the final state is always
+        written when the job finishes.
+
+        Args:
+            progress: Fraction of work done (0.0-1.0), None if unknown
+            message: Human-readable status message
+        """
+        if progress is not None:
+            self.record.progress = min(max(progress, 0.0), 1.0)
+        if message is not None:
+            self.record.message = message
+        now = time.monotonic()
+        if now - self._last_write >= 0.2:
+            self._last_write = now
+            _write_meta(self.job_dir, self.record)
+
+    def emit(self, row: dict[str, Any]) -> None:
+        """Append a partial result row (JSON-serializable) to the stream.
+
+        Args:
+            row: Partial result
+        """
+        with open(self.job_dir / _PARTIAL_FILE, "a", encoding="utf-8") as f:
+            f.write(json.dumps(row, default=str) + "\n")
+
+
+def _execute_job(
+    job_dir: Path,
+    fn: Callable[..., Any],
+    kwargs: dict[str, Any],
+) -> None:
+    """Run a job function in a worker process and persist its outcome."""
+    record = _read_meta(job_dir)
+    if record is None:
+        return
+    if (job_dir / _CANCEL_FILE).exists():
+        record.status = CANCELLED
+        _write_meta(job_dir, record)
+        return
+
+    record.status = RUNNING
+    _write_meta(job_dir, record)
+    ctx = JobContext(job_dir, record)
+
+    try:
+        result = fn(ctx, **kwargs)
+        tmp = job_dir / f"{_RESULT_FILE}.tmp"
+        with open(tmp, "wb") as f:
+            pickle.dump(result, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, job_dir / _RESULT_FILE)
+        record.status = COMPLETED
+        record.progress = 1.0
+    except JobCancelledError:
+        record.status = CANCELLED
+        record.message = "Cancelled"
+    except Exception as e:
+        logger.error(f"Job {record.job_id} failed: {e}", exc_info=True)
+        record.status = FAILED
+        record.error = str(e)
+    _write_meta(job_dir, record)
+
+
+class JobRunner:
+    """Process-pool job runner backed by an on-disk registry.
+
+    Job functions must be importable module-level callables with signature
+    ``fn(ctx: JobContext, **kwargs) -> result``; kwargs and the result must
+    be picklable.
+    """
+
+    def __init__(self, jobs_dir: Path | None = None, max_workers: int = 2) -> None:
+        """Initialize job runner.
+
+        Jobs left pending/running by a server process that has exited are
+        marked failed, since their worker died with it; jobs of other live
+        server processes are left alone.
+
+        Args:
+            jobs_dir: Registry directory (default: data/jobs)
+            max_workers: Number of concurrent jobs
+        """
+        self.jobs_dir = jobs_dir or JOBS_DIR
+        self.jobs_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
+        self._executor: ProcessPoolExecutor | None = None
+        self._futures: dict[str, Future[None]] = {}
+        self._lock = threading.Lock()
+        self._mark_interrupted()
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        return self._executor
+
+    def _mark_interrupted(self) -> None:
+        for record in self.list_jobs():
+            if record.is_active and not _owner_alive(record):
+                record.status = FAILED
+                record.error = "Interrupted (server restarted)"
+                _write_meta(self.jobs_dir / record.job_id, record)
+
+    def submit(
+        self,
+        kind: str,
+        fn: Callable[..., Any],
+        label: str = "",
+        params: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Submit a job.
+
+        Args:
+            kind: Job category (e.g. "optimization", "monte_carlo")
+            fn: Module-level job function ``fn(ctx, **kwargs)``
+            label: Human-readable description
+            params: JSON-serializable summary of inputs shown when reopening
+            **kwargs: Arguments passed to fn
+
+        Returns:
+            Job ID
+        """
+        job_id = f"{time.strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}"
+        job_dir = self.jobs_dir / job_id
+        job_dir.mkdir(parents=True)
+        record = JobRecord(
+            job_id=job_id, kind=kind, label=label, params=params or {}, owner_pid=os.getpid()
+        )
+        _write_meta(job_dir, record)
+
+        with self._lock:
+            future = self._get_executor().submit(_execute_job, job_dir, fn, kwargs)
+            self._futures[job_id] = future
+        future.add_done_callback(partial(self._on_done, job_id))
+        logger.info(f"Submitted {kind} job {job_id}: {label}")
+        return job_id
+
+    def _on_done(self, job_id: str, future: Future[None]) -> None:
+        with self._lock:
+            self._futures.pop(job_id, None)
+        error = None if future.cancelled() else future.exception()
+        if future.cancelled() or error is not None:
+            # Worker never ran or crashed before persisting its outcome
+            record = self.get(job_id)
+            if record is not None and record.is_active:
+                record.status = CANCELLED if future.cancelled() else FAILED
+                record.error = str(error) if error else None
+                _write_meta(self.jobs_dir / job_id, record)
+
+    def get(self, job_id: str) -> JobRecord | None:
+        """Get job record by ID."""
+        return _read_meta(self.jobs_dir / job_id)
+
+    def list_jobs(self, kind: str | None = None) -> list[JobRecord]:
+        """List jobs, newest first.
+
+        Args:
+            kind: Optional job category filter
+
+        Returns:
+            List of job records
+        """
+        records = []
+        for job_dir in self.jobs_dir.iterdir():
+            if not job_dir.is_dir():
+                continue
+            record = _read_meta(job_dir)
+            if record is not None and (kind is None or record.kind == kind):
+                records.append(record)
+        records.sort(key=lambda r: r.created_at, reverse=True)
+        return records
+
+    def read_partials(self, job_id: str) -> list[dict[str, Any]]:
+        """Read streamed partial results of a job."""
+        path = self.jobs_dir / job_id / _PARTIAL_FILE
+        if not path.exists():
+            return []
+        rows = []
+        for line in path.read_text(encoding="utf-8").splitlines():
+            try:
+                rows.append(json.loads(line))
+            except ValueError:
+                break  # Partially written last line
+        return rows
+
+    def load_result(self, job_id: str) -> Any | None:
+        """Load the final result of a completed job, or None."""
+        path = self.jobs_dir / job_id / _RESULT_FILE
+        if not path.exists():
+            return None
+        with open(path, "rb") as f:
+            return pickle.load(f)  # noqa: S301 - written by this runner
+
+    def cancel(self, job_id: str) -> None:
+        """Request cancellation of a job.
+
+        Pending jobs are dropped from the pool; running jobs stop at their
+        next cancellation check.
+        """
+        job_dir = self.jobs_dir / job_id
+        if not job_dir.exists():
+            return
+        (job_dir / _CANCEL_FILE).touch()
+        with self._lock:
+            future = self._futures.get(job_id)
+        if future is not None:
+            future.cancel()
+
+    def delete(self, job_id: str) -> None:
+        """Delete a finished job and its stored results."""
+        record = self.get(job_id)
+        if record is not None and record.is_active:
+            raise ValueError(f"Cannot delete active job {job_id}")
+        shutil.rmtree(self.jobs_dir / job_id, ignore_errors=True)
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Shut down the process pool."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+
+_runner: JobRunner | None = None
+_runner_lock = threading.Lock()
+
+
+def get_job_runner() -> JobRunner:
+    """Return the process-wide job runner (shared by all Streamlit sessions)."""
+    global _runner
+    with _runner_lock:
+        if _runner is None:
+            _runner = JobRunner()
+        return _runner
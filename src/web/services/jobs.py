@@ -0,0 +1,373 @@
+"""Background job functions for dashboard pages.
+
+Module-level (picklable) workloads executed by JobRunner in worker
+processes. Each takes a JobContext first, reports progress through it,
+and returns a picklable result that the page displays once the job is done.
+"""
+
+from __future__ import annotations
+
+import random
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import date
+from functools import partial
+from itertools import product
+from typing import TYPE_CHECKING, Any
+
+from src.backtester.models import BacktestConfig, BacktestResult
+from src.utils.logger import get_logger
+from src.web.services.job_runner import JobContext
+
+if TYPE_CHECKING:
+    from src.strategies.base import Strategy
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "OptimizationSummary",
+    "backtest_job",
+    "bt_backtest_job",
+    "bt_optimization_job",
+    "create_analysis_strategy",
+    "extract_bt_metric",
+    "monte_carlo_job",
+    "optimization_job",
+    "walk_forward_job",
+]
+
+
+@dataclass
+class OptimizationSummary:
+    """Display-ready optimization result (sorted best first)."""
+
+    best_params: dict[str, Any]
+    best_score: float
+    all_params: list[dict[str, Any]]
+    all_scores: list[float]
+    metric: str
+
+
+def _instantiate(strategy_class: type[Strategy], params: dict[str, Any]) -> Strategy:
+    """Create a strategy from its class (picklable strategy factory)."""
+    return strategy_class(**params)
+
+
+def create_analysis_strategy(strategy_type: str, params: dict[str, Any] | None = None) -> Any:
+    """Create strategy object for analysis jobs.
+
+    Args:
+        strategy_type: Internal strategy type (vanilla, minimal, legacy, momentum, mean-reversion)
+        params: Optional strategy parameters (VBO variants only)
+
+    Returns:
+        Strategy instance
+    """
+    from src.strategies.mean_reversion import MeanReversionStrategy
+    from src.strategies.momentum import MomentumStrategy
+    from src.strategies.volatility_breakout import create_vbo_strategy
+
+    params = params or {}
+    if strategy_type == "vanilla":
+        return create_vbo_strategy(
+            name="VanillaVBO", use_trend_filter=False, use_noise_filter=False, **params
+        )
+    elif strategy_type == "minimal":
+        return create_vbo_strategy(
+            name="MinimalVBO", use_trend_filter=False, use_noise_filter=False, **params
+        )
+    elif strategy_type == "legacy":
+        return create_vbo_strategy(
+            name="LegacyVBO", use_trend_filter=True, use_noise_filter=True, **params
+        )
+    elif strategy_type == "momentum":
+        return MomentumStrategy(name="Momentum")
+    elif strategy_type == "mean-reversion":
+        return MeanReversionStrategy(name="MeanReversion")
+    else:
+        return create_vbo_strategy(name="DefaultVBO", **params)
+
+
+def _walk_forward_strategy(strategy_type: str, params: dict[str, Any]) -> Any:
+    """Walk-forward strategy factory (vanilla VBO or filtered legacy VBO)."""
+    return create_analysis_strategy("vanilla" if strategy_type == "vanilla" else "legacy", params)
+
+
+def backtest_job(
+    ctx: JobContext,
+    strategy_name: str,
+    strategy_params: dict[str, Any],
+    data_files: dict[str, str],
+    config_dict: dict[str, Any],
+    start_date: date | None,
+    end_date: date | None,
+) -> BacktestResult | None:
+    """Run a single native backtest (through the fingerprint-keyed result cache)."""
+    from src.web.services.backtest_runner import run_backtest_service
+
+    ctx.report(message=f"Running {strategy_name} on {len(data_files)} assets...")
+    result = run_backtest_service(
+        strategy_name=strategy_name,
+        strategy_params=strategy_params,
+        data_files_dict=data_files,
+        config_dict=config_dict,
+        start_date_str=start_date.isoformat() if start_date else None,
+        end_date_str=end_date.isoformat() if end_date else None,
+    )
+    if result is None:
+        raise RuntimeError("Backtest execution failed")
+    return result
+
+
+def bt_backtest_job(ctx: JobContext, service: str, **kwargs: Any) -> Any:
+    """Run a bt library backtest.
+
+    Args:
+        ctx: Job context
+        service: "vbo", "regime" or "generic"
+        **kwargs: Arguments of the corresponding bt backtest service
+    """
+    from src.web.services import bt_backtest_runner
+
+    services: dict[str, Callable[..., Any]] = {
+        "vbo": bt_backtest_runner.run_bt_backtest_service,
+        "regime": bt_backtest_runner.run_bt_backtest_regime_service,
+        "generic": bt_backtest_runner.run_bt_backtest_generic_service,
+    }
+    ctx.report(message="Running bt backtest...")
+    return services[service](**kwargs)
+
+
+def optimization_job(
+    ctx: JobContext,
+    strategy_class: type[Strategy],
+    param_grid: dict[str, list[Any]],
+    tickers: list[str],
+    interval: str,
+    config_dict: dict[str, Any],
+    metric: str,
+    method: str,
+    n_iter: int,
+    workers: int,
+) -> OptimizationSummary:
+    """Run native parameter optimization, streaming each finished backtest."""
+    from src.backtester import optimize_strategy_parameters
+    from src.backtester.optimization_search import extract_metric
+
+    n_combinations = 1
+    for values in param_grid.values():
+        n_combinations *= len(values)
+    # Halving runs a variable number of backtests, so its progress is indeterminate
+    expected = {"grid": n_combinations, "random": n_iter, "bayesian": n_iter}.get(method)
+    done = 0
+
+    def on_result(task_name: str, result: BacktestResult) -> None:
+        nonlocal done
+        ctx.check_cancelled()  # Raising here terminates the backtest pool
+        done += 1
+        ctx.emit({"name": task_name, metric: extract_metric(result, metric)})
+        ctx.report(
+            progress=done / expected if expected else None,
+            message=f"Finished {done}{f'/{expected}' if expected else ''} backtests",
+        )
+
+    ctx.report(progress=0.0, message="Starting optimization...")
+    result = optimize_strategy_parameters(
+        strategy_factory=partial(_instantiate, strategy_class),
+        param_grid=param_grid,
+        tickers=tickers,
+        interval=interval,
+        config=BacktestConfig(**config_dict),
+        metric=metric,
+        maximize=True,
+        method=method,
+        n_iter=n_iter,
+        n_workers=workers,
+        progress_callback=on_result,
+    )
+    return OptimizationSummary(
+        best_params=result.best_params,
+        best_score=result.best_score,
+        all_params=[params for params, _, _ in result.all_results],
+        all_scores=[score for _, _, score in result.all_results],
+        metric=metric,
+    )
+
+
+def bt_optimization_job(
+    ctx: JobContext,
+    strategy_name: str,
+    param_grid: dict[str, list[Any]],
+    symbols: list[str],
+    metric: str,
+    method: str,
+    n_iter: int,
+    initial_capital: int,
+    fee_rate: float,
+) -> OptimizationSummary:
+    """Run bt strategy optimization, checking for cancellation between backtests."""
+    from src.web.services.bt_backtest_runner import (
+        get_default_model_path,
+        run_bt_backtest_regime_service,
+        run_bt_backtest_service,
+    )
+
+    param_names = list(param_grid.keys())
+    combinations = list(product(*param_grid.values()))
+    if method != "grid":
+        combinations = random.sample(combinations, min(n_iter, len(combinations)))
+
+    total = len(combinations)
+    logger.info(f"bt optimization: {total} parameter combinations")
+
+    is_regime = "Regime" in strategy_name
+    model_path = str(get_default_model_path()) if is_regime else None
+
+    all_results: list[tuple[dict[str, Any], float]] = []
+    for i, combo in enumerate(combinations):
+        ctx.check_cancelled()
+        params = dict(zip(param_names, combo, strict=False))
+
+        try:
+            if is_regime:
+                result = run_bt_backtest_regime_service(
+                    symbols=tuple(symbols),
+                    interval="day",
+                    initial_cash=initial_capital,
+                    fee=fee_rate,
+                    slippage=fee_rate,
+                    ma_short=params.get("ma_short", 5),
+                    noise_ratio=params.get("noise_ratio", 0.5),
+                    model_path=model_path,
+                )
+            else:
+                result = run_bt_backtest_service(
+                    symbols=tuple(symbols),
+                    interval="day",
+                    initial_cash=initial_capital,
+                    fee=fee_rate,
+                    slippage=fee_rate,
+                    multiplier=params.get("multiplier", 2),
+                    lookback=params.get("lookback", 5),
+                )
+        except Exception as e:
+            logger.warning(f"bt backtest failed for {params}: {e}")
+            result = None
+
+        if result is not None:
+            score = extract_bt_metric(result, metric)
+            all_results.append((params, score))
+            ctx.emit({**params, metric: score})
+
+        ctx.report(progress=(i + 1) / total, message=f"Running backtests... ({i + 1}/{total})")
+
+    if not all_results:
+        raise RuntimeError("All backtests failed")
+
+    all_results.sort(key=lambda x: x[1], reverse=True)
+    return OptimizationSummary(
+        best_params=all_results[0][0],
+        best_score=all_results[0][1],
+        all_params=[params for params, _ in all_results],
+        all_scores=[score for _, score in all_results],
+        metric=metric,
+    )
+
+
+def extract_bt_metric(result: Any, metric: str) -> float:
+    """Extract metric value from bt backtest result.
+
+    Args:
+        result: BtBacktestResult object
+        metric: Metric name
+
+    Returns:
+        Metric value
+    """
+    metric_map = {
+        "sharpe_ratio": "sharpe_ratio",
+        "cagr": "cagr",
+        "total_return": "total_return",
+        "calmar_ratio": None,  # Calculate from cagr/mdd
+        "win_rate": "win_rate",
+        "profit_factor": "profit_factor",
+        "sortino_ratio": "sortino_ratio",
+    }
+
+    if metric == "calmar_ratio":
+        # Calmar = CAGR / |MDD|
+        mdd = abs(result.mdd) if result.mdd != 0 else 1.0
+        return float(result.cagr / mdd)
+
+    attr = metric_map.get(metric, "sharpe_ratio")
+    if attr is None:
+        return float(result.sharpe_ratio)
+
+    return float(getattr(result, attr, 0.0))
+
+
+def monte_carlo_job(
+    ctx: JobContext,
+    strategy_type: str,
+    tickers: list[str],
+    interval: str,
+    config_dict: dict[str, Any],
+    n_simulations: int,
+    method: str,
+    seed: int | None,
+) -> tuple[Any, BacktestResult]:
+    """Run a backtest followed by Monte Carlo simulation.
+
+    Returns:
+        Tuple of (MonteCarloResult, BacktestResult)
+    """
+    from src.backtester import run_backtest
+    from src.backtester.analysis.monte_carlo import run_monte_carlo
+
+    ctx.report(progress=0.0, message="Running backtest...")
+    result = run_backtest(
+        strategy=create_analysis_strategy(strategy_type),
+        tickers=tickers,
+        interval=interval,
+        config=BacktestConfig(**config_dict),
+    )
+    ctx.check_cancelled()
+
+    ctx.report(
+        progress=0.5, message=f"Running Monte Carlo simulation ({n_simulations:,} iterations)..."
+    )
+    mc_result = run_monte_carlo(
+        result=result, n_simulations=n_simulations, method=method, random_seed=seed
+    )
+    return mc_result, result
+
+
+def walk_forward_job(
+    ctx: JobContext,
+    strategy_type: str,
+    param_grid: dict[str, list[int]],
+    tickers: list[str],
+    interval: str,
+    config_dict: dict[str, Any],
+    optimization_days: int,
+    test_days: int,
+    step_days: int,
+    metric: str,
+    workers: int,
+) -> Any:
+    """Run walk-forward analysis."""
+    from src.backtester import run_walk_forward_analysis
+
+    ctx.report(message="Running Walk-Forward analysis...")
+    return run_walk_forward_analysis(
+        strategy_factory=partial(_walk_forward_strategy, strategy_type),
+        param_grid=param_grid,
+        tickers=tickers,
+        interval=interval,
+        config=BacktestConfig(**config_dict),
+        optimization_days=optimization_days,
+        test_days=test_days,
+        step_days=step_days,
+        metric=metric,
+        n_workers=workers,
+    )
@@ -2,10 +2,11 @@
 Statistical metrics calculations.
 
 Handles z-score, p-value, skewness, kurtosis, and trade metrics (SRP).
+scipy is imported inside the methods that need it to keep dashboard
+startup fast.
 """
 
 import numpy as np
-from scipy import stats
 
 
 class StatisticalMetrics:
@@ -30,6 +31,8 @@ class StatisticalMetrics:
         # H0: mean return = 0
         z_score = mean_return / (std_return / np.sqrt(len(returns)))
 
+        from scipy import stats
+
         # Two-tailed test
         p_value = 2 * (1 - stats.norm.cdf(abs(z_score)))
 
@@ -40,6 +43,8 @@ class StatisticalMetrics:
         """Calculate skewness of returns."""
         if len(returns) < 3:
             return 0.0
+        from scipy import stats
+
         return float(stats.skew(returns))
 
     @staticmethod
@@ -47,6 +52,8 @@ class StatisticalMetrics:
         """Calculate kurtosis of returns."""
         if len(returns) < 3:
             return 0.0
+        from scipy import stats
+
         return float(stats.kurtosis(returns))
 
 
@@ -5,6 +5,7 @@ from typing import Any, Literal
 
 __all__ = [
     "ParameterSpec",
+    "StrategyEntry",
     "StrategyInfo",
 ]
 
@@ -53,3 +54,20 @@ class StrategyInfo:
     strategy_class: type | None
     parameters: dict[str, ParameterSpec]
     description: str
+
+
+@dataclass(frozen=True)
+class StrategyEntry:
+    """Import-free strategy metadata from the strategy manifest.
+
+    Attributes:
+        name: Strategy name (name to display in UI)
+        module_path: Module that defines the strategy class
+        class_name: Strategy class name
+        description: Strategy description
+    """
+
+    name: str
+    module_path: str
+    class_name: str
+    description: str
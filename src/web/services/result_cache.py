@@ -0,0 +1,461 @@
+"""Backtest result cache.
+
+Two-tier LRU cache for dashboard backtest results:
+
+- Keys include a fingerprint (mtime/size) of every input data file, so a
+  result is recomputed as soon as the collector rewrites a parquet file,
+  without clearing unrelated entries.
+- Entries are stored as CompactBacktestResult: equity curve, dates and
+  trades as flat NumPy columns instead of pickled Trade dataclasses.
+- Total entry size is capped in bytes; least recently used entries are
+  evicted first, bounding memory under many concurrent users.
+- Entries are also written to ``data/result_cache/``, which is the source
+  of truth: job worker processes and the dashboard process share it, so
+  the dashboard's Clear Cache (``clear_result_cache``) reaches results
+  computed in workers, and an in-memory entry whose file is gone is
+  treated as a miss.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field, fields
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+import pandas as pd
+
+from src.backtester.models import BacktestConfig, BacktestResult, Trade
+from src.backtester.trade_ledger import EXIT_REASONS, TradeLedger
+from src.config.constants import RESULT_CACHE_DIR
+from src.risk.metrics import PortfolioRiskMetrics
+from src.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+__all__ = [
+    "CompactBacktestResult",
+    "ResultCache",
+    "backtest_cache_key",
+    "clear_result_cache",
+    "data_fingerprint",
+    "get_result_cache",
+]
+
+_ENTRY_SUFFIX = ".pkl"
+
+# Fixed per-entry allowance for Python objects (config, metrics, key)
+_ENTRY_OVERHEAD_BYTES = 2048
+
+# BacktestResult fields stored as-is rather than as columns
+_ARRAY_FIELDS = {"equity_curve", "dates", "trades", "trade_ledger", "config", "risk_metrics"}
+
+_TRADE_FLOAT_COLUMNS = (
+    "entry_price",
+    "exit_price",
+    "amount",
+    "pnl",
+    "pnl_pct",
+    "commission_cost",
+    "slippage_cost",
+)
+_TRADE_BOOL_COLUMNS = ("is_whipsaw", "is_stop_loss", "is_take_profit")
+
+
+def data_fingerprint(data_files: dict[str, str]) -> list[tuple[str, str, int, int]]:
+    """Fingerprint data files by modification time and size.
+
+    Args:
+        data_files: {ticker: file_path} dictionary
+
+    Returns:
+        Sorted list of (ticker, path, mtime_ns, size); missing files get -1
+    """
+    fingerprint = []
+    for ticker, path in sorted(data_files.items()):
+        try:
+            stat = os.stat(path)
+            fingerprint.append((ticker, str(path), stat.st_mtime_ns, stat.st_size))
+        except OSError:
+            fingerprint.append((ticker, str(path), -1, -1))
+    return fingerprint
+
+
+def backtest_cache_key(
+    strategy_name: str,
+    strategy_params: dict[str, Any],
+    data_files: dict[str, str],
+    config_dict: dict[str, Any],
+    start_date_str: str | None,
+    end_date_str: str | None,
+) -> str:
+    """Build a cache key from backtest inputs and input data fingerprints."""
+    payload = [
+        strategy_name,
+        strategy_params,
+        data_fingerprint(data_files),
+        config_dict,
+        start_date_str,
+        end_date_str,
+    ]
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode()
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _date_kind(values: np.ndarray) -> str:
+    """Classify the element type of a date array for lossless round trips."""
+    if np.issubdtype(values.dtype, np.datetime64):
+        return "datetime64"
+    sample = next((v for v in values if v is not None and not pd.isna(v)), None)
+    if isinstance(sample, pd.Timestamp):
+        return "timestamp"
+    if isinstance(sample, datetime):
+        return "datetime"
+    if isinstance(sample, date):
+        return "date"
+    return "datetime64"
+
+
+def _pack_dates(values: np.ndarray) -> tuple[np.ndarray, str]:
+    kind = _date_kind(values)
+    packed = pd.to_datetime(pd.Series(values, dtype=object)).to_numpy(dtype="datetime64[ns]")
+    return packed, kind
+
+
+def _unpack_dates(packed: np.ndarray, kind: str) -> np.ndarray:
+    if kind == "datetime64":
+        return packed
+    index = pd.DatetimeIndex(packed)
+    if kind == "timestamp":
+        items: list[Any] = list(index)
+    elif kind == "datetime":
+        items = list(index.to_pydatetime())
+    else:
+        items = [ts.date() for ts in index]
+    unpacked = np.empty(len(items), dtype=object)
+    unpacked[:] = [None if pd.isna(v) else v for v in items]
+    return unpacked
+
+
+@dataclass
+class CompactBacktestResult:
+    """Columnar representation of a BacktestResult."""
+
+    scalars: dict[str, Any]
+    equity_curve: np.ndarray
+    dates: np.ndarray
+    date_kind: str
+    trade_columns: dict[str, np.ndarray] = field(default_factory=dict)
+    trade_tickers: list[str] = field(default_factory=list)
+    exit_reasons: list[str] = field(default_factory=list)
+    trade_date_kind: str = "date"
+    config: BacktestConfig | None = None
+    risk_metrics: PortfolioRiskMetrics | None = None
+
+    @classmethod
+    def from_result(cls, result: BacktestResult) -> CompactBacktestResult:
+        """Pack a BacktestResult into columns."""
+        scalars = {
+            f.name: getattr(result, f.name) for f in fields(result) if f.name not in _ARRAY_FIELDS
+        }
+        dates, date_kind = _pack_dates(np.asarray(result.dates))
+        compact = cls(
+            scalars=scalars,
+            equity_curve=np.asarray(result.equity_curve),
+            dates=dates,
+            date_kind=date_kind,
+            config=result.config,
+            risk_metrics=result.risk_metrics,
+        )
+
+        ledger = result.trade_ledger
+        if ledger is not None and "trades" not in vars(result):
+            # Trades not materialized yet: copy the ledger columns directly
+            if len(ledger):
+                compact._pack_ledger(ledger, dates, date_kind)
+            return compact
+
+        trades = result.trades
+        if trades:
+            tickers, ticker_codes = np.unique([t.ticker for t in trades], return_inverse=True)
+            reasons, reason_codes = np.unique([t.exit_reason for t in trades], return_inverse=True)
+            entry_dates, compact.trade_date_kind = _pack_dates(
+                np.array([t.entry_date for t in trades], dtype=object)
+            )
+            exit_dates, _ = _pack_dates(np.array([t.exit_date for t in trades], dtype=object))
+            columns: dict[str, np.ndarray] = {
+                "ticker": ticker_codes.astype(np.int32),
+                "exit_reason": reason_codes.astype(np.int16),
+                "entry_date": entry_dates,
+                "exit_date": exit_dates,
+            }
+            for name in _TRADE_FLOAT_COLUMNS:
+                columns[name] = np.array(
+                    [np.nan if getattr(t, name) is None else getattr(t, name) for t in trades],
+                    dtype=np.float64,
+                )
+            for name in _TRADE_BOOL_COLUMNS:
+                columns[name] = np.array([getattr(t, name) for t in trades], dtype=bool)
+            compact.trade_columns = columns
+            compact.trade_tickers = [str(t) for t in tickers]
+            compact.exit_reasons = [str(r) for r in reasons]
+
+        return compact
+
+    def _pack_ledger(self, ledger: TradeLedger, dates: np.ndarray, date_kind: str) -> None:
+        columns: dict[str, np.ndarray] = {
+            "ticker": ledger.column("ticker_id").copy(),
+            "exit_reason": ledger.column("exit_reason").astype(np.int16),
+            "entry_date": dates[ledger.column("entry_idx")],
+            "exit_date": dates[ledger.column("exit_idx")],
+        }
+        for name in _TRADE_FLOAT_COLUMNS:
+            columns[name] = ledger.column(name).copy()
+        reasons = ledger.column("exit_reason")
+        columns["is_whipsaw"] = reasons == EXIT_REASONS.index("whipsaw")
+        columns["is_stop_loss"] = reasons == EXIT_REASONS.index("stop_loss")
+        columns["is_take_profit"] = reasons == EXIT_REASONS.index("take_profit")
+        self.trade_columns = columns
+        self.trade_tickers = list(ledger.tickers)
+        self.exit_reasons = list(EXIT_REASONS)
+        self.trade_date_kind = date_kind
+
+    @property
+    def n_trades(self) -> int:
+        """Number of stored trades."""
+        return len(self.trade_columns.get("ticker", ()))
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate memory footprint in bytes."""
+        size = _ENTRY_OVERHEAD_BYTES + self.equity_curve.nbytes + self.dates.nbytes
+        size += sum(col.nbytes for col in self.trade_columns.values())
+        size += sum(len(s) for s in self.trade_tickers) + sum(len(s) for s in self.exit_reasons)
+        return size
+
+    def trades_frame(self) -> pd.DataFrame:
+        """Trades as a DataFrame (without materializing Trade objects)."""
+        if not self.n_trades:
+            return pd.DataFrame()
+        frame = pd.DataFrame(
+            {
+                name: col
+                for name, col in self.trade_columns.items()
+                if name not in ("ticker", "exit_reason")
+            }
+        )
+        frame.insert(0, "ticker", np.asarray(self.trade_tickers)[self.trade_columns["ticker"]])
+        frame["exit_reason"] = np.asarray(self.exit_reasons)[self.trade_columns["exit_reason"]]
+        return frame
+
+    def _trades(self) -> list[Trade]:
+        if not self.n_trades:
+            return []
+        cols = self.trade_columns
+        entry_dates = _unpack_dates(cols["entry_date"], self.trade_date_kind)
+        exit_dates = _unpack_dates(cols["exit_date"], self.trade_date_kind)
+        floats = {name: cols[name].tolist() for name in _TRADE_FLOAT_COLUMNS}
+        bools = {name: cols[name].tolist() for name in _TRADE_BOOL_COLUMNS}
+        tickers = [self.trade_tickers[i] for i in cols["ticker"]]
+        reasons = [self.exit_reasons[i] for i in cols["exit_reason"]]
+
+        trades = []
+        for i in range(self.n_trades):
+            exit_price = floats["exit_price"][i]
+            trades.append(
+                Trade(
+                    ticker=tickers[i],
+                    entry_date=entry_dates[i],
+                    entry_price=floats["entry_price"][i],
+                    exit_date=exit_dates[i],
+                    exit_price=None if np.isnan(exit_price) else exit_price,
+                    amount=floats["amount"][i],
+                    pnl=floats["pnl"][i],
+                    pnl_pct=floats["pnl_pct"][i],
+                    is_whipsaw=bools["is_whipsaw"][i],
+                    commission_cost=floats["commission_cost"][i],
+                    slippage_cost=floats["slippage_cost"][i],
+                    is_stop_loss=bools["is_stop_loss"][i],
+                    is_take_profit=bools["is_take_profit"][i],
+                    exit_reason=reasons[i],
+                )
+            )
+        return trades
+
+    def to_result(self) -> BacktestResult:
+        """Rebuild a BacktestResult (arrays are copied, so callers may mutate it)."""
+        return BacktestResult(
+            **self.scalars,
+            equity_curve=self.equity_curve.copy(),
+            dates=_unpack_dates(self.dates, self.date_kind).copy(),
+            trades=self._trades(),
+            config=self.config,
+            risk_metrics=self.risk_metrics,
+        )
+
+
+class ResultCache:
+    """Thread-safe LRU cache of CompactBacktestResult bounded by total bytes.
+
+    With a cache_dir, entries are persisted as one pickle per key and the
+    directory is bounded by the same byte cap; memory then only holds
+    entries whose file still exists.
+    """
+
+    def __init__(self, max_bytes: int, cache_dir: Path | None = None) -> None:
+        """Initialize cache.
+
+        Args:
+            max_bytes: Maximum total size of cached entries (per tier)
+            cache_dir: Directory shared across processes (None = memory only)
+        """
+        self.max_bytes = max_bytes
+        self.cache_dir = cache_dir
+        self._entries: OrderedDict[str, CompactBacktestResult] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        if cache_dir is not None:
+            cache_dir.mkdir(parents=True, exist_ok=True)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def total_bytes(self) -> int:
+        """Total size of in-memory entries."""
+        return self._total_bytes
+
+    def _path(self, key: str) -> Path | None:
+        return None if self.cache_dir is None else self.cache_dir / f"{key}{_ENTRY_SUFFIX}"
+
+    def get(self, key: str) -> CompactBacktestResult | None:
+        """Return cached entry and mark it most recently used."""
+        path = self._path(key)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and path is not None and not path.exists():
+                # Cleared or evicted through the shared directory
+                self._discard(key)
+                entry = None
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+
+        entry = self._read(path) if path is not None else None
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._insert(key, entry)
+        return entry
+
+    def put(self, key: str, entry: CompactBacktestResult) -> None:
+        """Insert entry, evicting least recently used entries over the byte cap.
+
+        Entries larger than the cap are not cached.
+        """
+        size = entry.nbytes
+        if size > self.max_bytes:
+            logger.debug(f"Result of {size:,} bytes exceeds cache cap; not cached")
+            return
+        path = self._path(key)
+        if path is not None:
+            self._write(path, entry)
+        with self._lock:
+            self._insert(key, entry)
+
+    def clear(self) -> None:
+        """Remove all entries, including the shared on-disk entries."""
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+        if self.cache_dir is not None:
+            for path in self.cache_dir.glob(f"*{_ENTRY_SUFFIX}"):
+                path.unlink(missing_ok=True)
+
+    def _insert(self, key: str, entry: CompactBacktestResult) -> None:
+        self._discard(key)
+        self._entries[key] = entry
+        self._total_bytes += entry.nbytes
+        while self._total_bytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._total_bytes -= evicted.nbytes
+
+    def _discard(self, key: str) -> None:
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._total_bytes -= old.nbytes
+
+    def _read(self, path: Path) -> CompactBacktestResult | None:
+        try:
+            with open(path, "rb") as f:
+                entry = pickle.load(f)  # noqa: S301 - written by this cache
+            os.utime(path)  # Recency for disk eviction
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable cached result {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        return entry if isinstance(entry, CompactBacktestResult) else None
+
+    def _write(self, path: Path, entry: CompactBacktestResult) -> None:
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump(entry, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.warning(f"Could not persist cached result {path.name}: {e}")
+            tmp.unlink(missing_ok=True)
+            return
+        self._evict_files(path.parent)
+
+    def _evict_files(self, cache_dir: Path) -> None:
+        """Delete least recently used entry files over the byte cap."""
+        files = []
+        for path in cache_dir.glob(f"*{_ENTRY_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            files.append((stat.st_mtime_ns, stat.st_size, path))
+        total = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+_cache: ResultCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_result_cache() -> ResultCache:
+    """Return the process's backtest result cache (backed by the shared directory)."""
+    global _cache
+    with _cache_lock:
+        if _cache is None:
+            from src.web.config import get_web_settings
+
+            _cache = ResultCache(
+                get_web_settings().result_cache_max_mb * 1024 * 1024, RESULT_CACHE_DIR
+            )
+        return _cache
+
+
+def clear_result_cache() -> None:
+    """Clear cached backtest results in this process and for all job workers."""
+    get_result_cache().clear()
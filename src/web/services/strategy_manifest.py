@@ -0,0 +1,70 @@
+"""Static strategy manifest.
+
+Lists the native strategies shown in the dashboard so the registry can
+offer them without importing any strategy module; a module is imported
+only when one of its strategies is selected. Keep in sync with the
+strategy packages (tests compare it against discover_strategies()).
+"""
+
+from src.web.services.parameter_models import StrategyEntry
+
+__all__ = ["STRATEGY_MANIFEST", "STRATEGY_MODULES"]
+
+# Modules scanned by discover_strategies() to regenerate the manifest
+STRATEGY_MODULES = (
+    "src.strategies.volatility_breakout",
+    "src.strategies.momentum",
+    "src.strategies.mean_reversion",
+    "src.strategies.opening_range_breakout",
+)
+
+STRATEGY_MANIFEST: tuple[StrategyEntry, ...] = (
+    StrategyEntry(
+        name="MinimalVBO",
+        module_path="src.strategies.volatility_breakout",
+        class_name="MinimalVBO",
+        description="Minimal VBO with only breakout condition (no market conditions).",
+    ),
+    StrategyEntry(
+        name="StrictVBO",
+        module_path="src.strategies.volatility_breakout",
+        class_name="StrictVBO",
+        description="Strict VBO with additional conditions for higher quality signals.",
+    ),
+    StrategyEntry(
+        name="VanillaVBO",
+        module_path="src.strategies.volatility_breakout",
+        class_name="VanillaVBO",
+        description="Vanilla Volatility Breakout Strategy.",
+    ),
+    StrategyEntry(
+        name="MomentumStrategy",
+        module_path="src.strategies.momentum",
+        class_name="MomentumStrategy",
+        description="Momentum Trading Strategy.",
+    ),
+    StrategyEntry(
+        name="SimpleMomentumStrategy",
+        module_path="src.strategies.momentum",
+        class_name="SimpleMomentumStrategy",
+        description="Simplified momentum strategy with only price above SMA condition.",
+    ),
+    StrategyEntry(
+        name="MeanReversionStrategy",
+        module_path="src.strategies.mean_reversion",
+        class_name="MeanReversionStrategy",
+        description="Mean Reversion Trading Strategy.",
+    ),
+    StrategyEntry(
+        name="SimpleMeanReversionStrategy",
+        module_path="src.strategies.mean_reversion",
+        class_name="SimpleMeanReversionStrategy",
+        description="Simplified mean reversion strategy with only Bollinger Bands.",
+    ),
+    StrategyEntry(
+        name="ORBStrategy",
+        module_path="src.strategies.opening_range_breakout",
+        class_name="ORBStrategy",
+        description="Opening Range Breakout Strategy with ATR-based position sizing.",
+    ),
+)
@@ -1,20 +1,22 @@
 """Strategy registry service.
 
-Discover automatically registered strategies and provide metadata.
+Serve strategy metadata from the static strategy manifest and import a
+strategy module only when one of its strategies is first used.
 Includes bt library strategies integration.
 """
 
 import inspect
+from collections.abc import Sequence
 from importlib import import_module
 from typing import Any
 
-from src.strategies.base import Strategy
 from src.utils.logger import get_logger
-from src.web.services.parameter_models import ParameterSpec, StrategyInfo
+from src.web.services.parameter_models import ParameterSpec, StrategyEntry, StrategyInfo
+from src.web.services.strategy_manifest import STRATEGY_MANIFEST, STRATEGY_MODULES
 
 logger = get_logger(__name__)
 
-__all__ = ["StrategyRegistry", "is_bt_strategy"]
+__all__ = ["StrategyRegistry", "discover_strategies", "is_bt_strategy"]
 
 
 def is_bt_strategy(name: str) -> bool:
@@ -22,55 +24,95 @@ def is_bt_strategy(name: str) -> bool:
     return name.startswith("bt_")
 
 
+def _is_valid_strategy(cls: type) -> bool:
+    """Check if it's a valid strategy class."""
+    from src.strategies.base import Strategy
+
+    return issubclass(cls, Strategy) and cls is not Strategy and not inspect.isabstract(cls)
+
+
+def _extract_description(cls: type) -> str:
+    """Extract description from class docstring."""
+    doc = inspect.getdoc(cls)
+    if doc:
+        # Use only first line
+        return doc.split("\n")[0].strip()
+    return f"{cls.__name__} strategy"
+
+
+def discover_strategies(module_paths: Sequence[str] = STRATEGY_MODULES) -> list[StrategyEntry]:
+    """Scan strategy modules for Strategy subclasses (imports every module).
+
+    Used to regenerate and verify STRATEGY_MANIFEST, not at dashboard startup.
+
+    Args:
+        module_paths: Modules to scan
+
+    Returns:
+        Manifest entries in module order
+    """
+    entries = []
+    for module_path in module_paths:
+        module = import_module(module_path)
+        for name, obj in inspect.getmembers(module, inspect.isclass):
+            if _is_valid_strategy(obj):
+                entries.append(
+                    StrategyEntry(name, module_path, obj.__name__, _extract_description(obj))
+                )
+    return entries
+
+
 class StrategyRegistry:
-    """Strategy auto-detection and registry.
+    """Lazy strategy registry.
 
-    Scan all strategy modules to discover Strategy subclasses,
-    and generate metadata by extracting parameters from __init__ signature.
+    Strategy names and descriptions come from the manifest; the strategy
+    class and its parameters (extracted from the __init__ signature) are
+    resolved on first lookup of that strategy.
 
     Example:
         >>> registry = StrategyRegistry()
-        >>> strategies = registry.list_strategies()
-        >>> for info in strategies:
-        ...     print(f"{info.name}: {info.description}")
+        >>> for entry in registry.list_entries():  # No strategy imports
+        ...     print(f"{entry.name}: {entry.description}")
         >>>
-        >>> params = registry.get_parameters("VanillaVBO")
+        >>> params = registry.get_parameters("VanillaVBO")  # Imports volatility_breakout
         >>> strategy_class = registry.get_strategy_class("VanillaVBO")
     """
 
-    STRATEGY_MODULES = [
-        "src.strategies.volatility_breakout",
-        "src.strategies.momentum",
-        "src.strategies.mean_reversion",
-        "src.strategies.opening_range_breakout",
-    ]
-
-    def __init__(self) -> None:
-        """Initialize registry and discover strategies."""
-        self._strategies: dict[str, StrategyInfo] = {}
-        self._discover_strategies()
+    def __init__(self, manifest: Sequence[StrategyEntry] = STRATEGY_MANIFEST) -> None:
+        """Initialize registry from a strategy manifest.
+
+        Args:
+            manifest: Native strategy entries (default: STRATEGY_MANIFEST)
+        """
+        self._entries: dict[str, StrategyEntry] = {entry.name: entry for entry in manifest}
+        self._strategies: dict[str, StrategyInfo] = {}  # Resolved strategies
         self._register_bt_strategies()
+        for info in list(self._strategies.values()):
+            self._entries[info.name] = StrategyEntry(
+                info.name, info.module_path, info.class_name, info.description
+            )
 
-    def _discover_strategies(self) -> None:
-        """Discover Strategy subclasses from all strategy modules."""
-        for module_path in self.STRATEGY_MODULES:
-            try:
-                module = import_module(module_path)
-                for name, obj in inspect.getmembers(module, inspect.isclass):
-                    if self._is_valid_strategy(obj):
-                        self._register_strategy(name, obj, module_path)
-            except ImportError as e:
-                logger.warning(f"Failed to import module {module_path}: {e}")
-
-    def _is_valid_strategy(self, cls: type) -> bool:
-        """Check if it's a valid strategy class."""
-        return issubclass(cls, Strategy) and cls is not Strategy and not inspect.isabstract(cls)
+    def _resolve(self, name: str) -> StrategyInfo | None:
+        """Import a manifest strategy and build its StrategyInfo."""
+        entry = self._entries.get(name)
+        if entry is None:
+            return None
+        try:
+            cls = getattr(import_module(entry.module_path), entry.class_name)
+        except (ImportError, AttributeError) as e:
+            logger.warning(f"Failed to import strategy {name} from {entry.module_path}: {e}")
+            return None
+        if not _is_valid_strategy(cls):
+            logger.warning(f"{entry.module_path}.{entry.class_name} is not a Strategy")
+            return None
+        self._register_strategy(name, cls, entry.module_path)
+        return self._strategies.get(name)
 
     def _register_strategy(self, name: str, cls: type, module_path: str) -> None:
         """Register strategy to the registry."""
         try:
             parameters = self._extract_parameters(cls)
-            description = self._extract_description(cls)
+            description = _extract_description(cls)
 
             info = StrategyInfo(
                 name=name,
@@ -170,35 +212,33 @@ class StrategyRegistry:
 
         return None
 
-    def _extract_description(self, cls: type) -> str:
-        """Extract description from class docstring."""
-        doc = inspect.getdoc(cls)
-        if doc:
-            # Use only first line
-            return doc.split("\n")[0].strip()
-        return f"{cls.__name__} strategy"
+    def list_entries(self) -> list[StrategyEntry]:
+        """Return manifest entries of all strategies (imports nothing)."""
+        return list(self._entries.values())
 
     def list_strategies(self) -> list[StrategyInfo]:
-        """Return list of all registered strategies."""
-        return list(self._strategies.values())
+        """Return all strategies, resolving (importing) any not yet used."""
+        infos = (self.get_strategy(name) for name in self._entries)
+        return [info for info in infos if info is not None]
 
     def get_strategy(self, name: str) -> StrategyInfo | None:
-        """Get StrategyInfo by strategy name."""
-        return self._strategies.get(name)
+        """Get StrategyInfo by strategy name (imports its module on first use)."""
+        info = self._strategies.get(name)
+        return info if info is not None else self._resolve(name)
 
     def get_strategy_class(self, name: str) -> type | None:
         """Get class by strategy name."""
-        info = self._strategies.get(name)
+        info = self.get_strategy(name)
         return info.strategy_class if info else None
 
     def get_parameters(self, name: str) -> dict[str, ParameterSpec]:
         """Get parameter spec by strategy name."""
-        info = self._strategies.get(name)
+        info = self.get_strategy(name)
         return info.parameters if info else {}
 
     def strategy_exists(self, name: str) -> bool:
         """Check if strategy is registered."""
-        return name in self._strategies
+        return name in self._entries
 
     def _register_bt_strategies(self) -> None:
         """Register bt library strategies.
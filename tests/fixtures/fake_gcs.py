@@ -0,0 +1,108 @@
+"""
+In-memory fake of the google-cloud-storage client for testing.
+
+Implements the subset of Client/Bucket/Blob used by src.data.storage,
+including object generations/etags and listing offsets, and counts
+listings and downloads so tests can assert on network usage.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import Counter
+from typing import Any
+
+
+class FakeBlob:
+    """Blob snapshot with metadata, backed by a FakeBucket."""
+
+    def __init__(self, bucket: FakeBucket, name: str) -> None:
+        """Initialize blob reference (metadata is loaded from the bucket if present)."""
+        self.bucket = bucket
+        self.name = name
+        stored = bucket.objects.get(name)
+        self.generation: int | None = stored[1] if stored else None
+        self.etag: str | None = stored[2] if stored else None
+        self.size: int | None = len(stored[0]) if stored else None
+        self.updated = None
+
+    def exists(self) -> bool:
+        """Check whether the object exists."""
+        return self.name in self.bucket.objects
+
+    def download_as_bytes(self) -> bytes:
+        """Download the current object content."""
+        if self.name not in self.bucket.objects:
+            raise FileNotFoundError(self.name)
+        self.bucket.downloads[self.name] += 1
+        return self.bucket.objects[self.name][0]
+
+    def download_as_text(self) -> str:
+        """Download the current object content as text."""
+        return self.download_as_bytes().decode()
+
+    def upload_from_string(self, data: str | bytes) -> None:
+        """Create or replace the object, bumping its generation."""
+        self.bucket.upload(self.name, data)
+
+
+class FakeBucket:
+    """In-memory bucket mapping object names to (content, generation, etag)."""
+
+    def __init__(self, name: str) -> None:
+        """Initialize empty bucket."""
+        self.name = name
+        self.objects: dict[str, tuple[bytes, int, str]] = {}
+        self.downloads: Counter[str] = Counter()
+        self._next_generation = 1
+
+    def upload(self, name: str, data: str | bytes) -> None:
+        """Create or replace an object, bumping its generation."""
+        content = data.encode() if isinstance(data, str) else data
+        etag = hashlib.md5(content).hexdigest()  # noqa: S324 - mirrors GCS etag semantics
+        self.objects[name] = (content, self._next_generation, etag)
+        self._next_generation += 1
+
+    def blob(self, name: str) -> FakeBlob:
+        """Return a blob reference."""
+        return FakeBlob(self, name)
+
+    def get_blob(self, name: str) -> FakeBlob | None:
+        """Return a blob with metadata, or None if it does not exist."""
+        return FakeBlob(self, name) if name in self.objects else None
+
+
+class FakeClient:
+    """Fake storage client holding any number of in-memory buckets."""
+
+    def __init__(self) -> None:
+        """Initialize client without buckets."""
+        self.buckets: dict[str, FakeBucket] = {}
+        self.list_calls: list[dict[str, Any]] = []
+
+    def bucket(self, name: str) -> FakeBucket:
+        """Return (creating if needed) a bucket."""
+        return self.buckets.setdefault(name, FakeBucket(name))
+
+    def list_blobs(
+        self,
+        bucket_name: str,
+        prefix: str = "",
+        start_offset: str | None = None,
+        end_offset: str | None = None,
+        max_results: int | None = None,
+        **kwargs: Any,
+    ) -> list[FakeBlob]:
+        """List blobs in name order, honouring prefix and [start_offset, end_offset)."""
+        self.list_calls.append(
+            {"prefix": prefix, "start_offset": start_offset, "end_offset": end_offset}
+        )
+        bucket = self.bucket(bucket_name)
+        names = [
+            name
+            for name in sorted(bucket.objects)
+            if name.startswith(prefix)
+            and (start_offset is None or name >= start_offset)
+            and (end_offset is None or name < end_offset)
+        ]
+        return [FakeBlob(bucket, name) for name in names[:max_results]]
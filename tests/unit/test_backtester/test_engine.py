@@ -12,6 +12,7 @@ from src.backtester.engine import (
     VectorizedBacktestEngine,
     run_backtest,
 )
+from src.backtester.engine.array_builder import build_volatility_array
 from src.backtester.engine.metrics_calculator import calculate_metrics_vectorized
 from src.backtester.engine.signal_processor import add_price_columns
 from src.strategies.base import Strategy
@@ -497,3 +498,76 @@ class TestConvenienceFunction:
             pytest.raises(FileNotFoundError),
         ):
             run_backtest(strategy=MagicMock(), tickers=["GHOST"], data_dir=data_dir)
+
+
+class TestVolatilityArray:
+    """Tests for the precomputed position sizing volatility array."""
+
+    def test_aligned_to_simulation_dates(self) -> None:
+        index = pd.date_range("2023-01-01", periods=40, freq="D")
+        close = pd.Series(100.0 + np.random.default_rng(0).normal(0, 1, 40).cumsum(), index=index)
+        hist = {"KRW-BTC": pd.DataFrame({"close": close})}
+        # Simulation grid starts later and has a date the ticker does not have
+        sorted_dates = np.array([d.date() for d in index[25:]] + [date(2024, 1, 1)])
+
+        vols = build_volatility_array(hist, ["KRW-BTC", "KRW-ETH"], sorted_dates, 20)
+
+        assert vols.shape == (2, 16)
+        expected = close.iloc[:26].tail(20).pct_change().std()
+        assert vols[0, 0] == pytest.approx(expected)
+        assert np.isnan(vols[0, -1])
+        assert np.isnan(vols[1]).all()
+
+
+class TestRunOnData:
+    def test_matches_file_based_run(
+        self,
+        mock_config: BacktestConfig,
+        multiple_tickers_data: dict[str, pd.DataFrame],
+        tmp_path: Path,
+    ) -> None:
+        from src.strategies.volatility_breakout import VanillaVBO
+
+        files = {}
+        for ticker, df in multiple_tickers_data.items():
+            files[ticker] = tmp_path / f"{ticker}_day.parquet"
+            df.to_parquet(files[ticker])
+        engine = VectorizedBacktestEngine(mock_config)
+
+        from_files = engine.run(VanillaVBO(), files)
+        raw = {ticker: engine.load_data(path) for ticker, path in files.items()}
+        from_memory = engine.run_on_data(VanillaVBO(), raw)
+
+        np.testing.assert_allclose(from_memory.equity_curve, from_files.equity_curve)
+        assert from_memory.total_trades == from_files.total_trades
+        # Shared input frames are left untouched for the next run
+        assert list(raw["KRW-BTC"].columns) == list(engine.load_data(files["KRW-BTC"]).columns)
+
+
+class TestProfile:
+    def test_profile_attached_only_when_enabled(
+        self,
+        mock_config: BacktestConfig,
+        multiple_tickers_data: dict[str, pd.DataFrame],
+    ) -> None:
+        from src.strategies.volatility_breakout import VanillaVBO
+        from src.utils.profiling import disable_profiling, enable_profiling
+
+        engine = VectorizedBacktestEngine(mock_config)
+        assert engine.run_on_data(VanillaVBO(), multiple_tickers_data).profile is None
+
+        enable_profiling()
+        try:
+            result = engine.run_on_data(VanillaVBO(), multiple_tickers_data)
+        finally:
+            disable_profiling()
+
+        assert result.profile is not None
+        assert set(result.profile) == {
+            "backtest.array_build",
+            "backtest.indicators",
+            "backtest.metrics",
+            "backtest.signals",
+            "backtest.simulation",
+        }
+        assert result.profile["backtest.signals"]["count"] == len(multiple_tickers_data)
@@ -0,0 +1,155 @@
+"""
+Unit tests for the vectorized metrics kernel.
+"""
+
+from datetime import date, timedelta
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtester.analysis.permutation_loop import run_permutation_loop
+from src.backtester.analysis.permutation_stats import shuffle_data
+from src.backtester.metrics_helpers import (
+    calculate_return_metrics,
+    calculate_risk_metrics_from_equity,
+    calculate_trade_stats,
+)
+from src.backtester.metrics_kernel import compute_metrics, stack_curves
+from src.backtester.models import Trade
+from src.backtester.report_pkg.report_metrics import calculate_sortino_ratio
+from src.backtester.wfa.wfa_backtest import simple_backtest
+from src.risk.metrics_var import calculate_cvar, calculate_var
+
+N_PERIODS = 120
+DATES = np.array([date(2024, 1, 1) + timedelta(days=i) for i in range(N_PERIODS)], dtype=object)
+
+
+def _curves(n_runs: int, seed: int = 7) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    returns = rng.normal(0.001, 0.02, size=(n_runs, N_PERIODS))
+    return 1000.0 * np.cumprod(1 + returns, axis=1)
+
+
+def _trade(pnl: float, pnl_pct: float) -> Trade:
+    return Trade(
+        ticker="KRW-BTC",
+        entry_date=DATES[0],
+        entry_price=100.0,
+        exit_date=DATES[1],
+        exit_price=100.0 + pnl,
+        amount=1.0,
+        pnl=pnl,
+        pnl_pct=pnl_pct,
+    )
+
+
+class _MeanCrossStrategy:
+    """Long above the 10-period mean, short below it."""
+
+    def calculate_indicators(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.assign(mean=df["close"].rolling(10).mean())
+
+    def generate_signals(self, df: pd.DataFrame) -> pd.DataFrame:
+        return df.assign(signal=(df["close"] - df["mean"]).apply(np.sign).fillna(0))
+
+
+class TestComputeMetrics:
+    """Tests for compute_metrics."""
+
+    def test_batch_matches_scalar_helpers(self) -> None:
+        """Test every row of a batch equals the per-curve helper functions."""
+        curves = _curves(5)
+
+        batch = compute_metrics(curves, DATES, 1000.0)
+
+        assert len(batch) == 5
+        for i, curve in enumerate(curves):
+            total_return, cagr = calculate_return_metrics(curve, DATES, 1000.0)
+            mdd, calmar, sharpe = calculate_risk_metrics_from_equity(curve, cagr)
+            returns = np.diff(curve) / curve[:-1]
+            row = batch.row(i)
+            assert row["total_return"] == pytest.approx(total_return)
+            assert row["cagr"] == pytest.approx(cagr)
+            assert row["mdd"] == pytest.approx(mdd)
+            assert row["calmar_ratio"] == pytest.approx(calmar)
+            assert row["sharpe_ratio"] == pytest.approx(sharpe)
+            assert row["sortino_ratio"] == pytest.approx(
+                calculate_sortino_ratio(returns, annualization=252)
+            )
+            assert row["var"] == pytest.approx(calculate_var(returns))
+            assert row["cvar"] == pytest.approx(calculate_cvar(returns))
+
+    def test_trade_stats_segmented_by_run(self) -> None:
+        """Test trade columns are reduced per run like calculate_trade_stats."""
+        run_trades = [
+            [_trade(10.0, 10.0), _trade(-5.0, -5.0), _trade(0.0, 0.0)],
+            [],
+            [_trade(3.0, 3.0)],
+        ]
+        flat = [t for trades in run_trades for t in trades]
+        trade_run = np.repeat(np.arange(3), [len(t) for t in run_trades])
+
+        batch = compute_metrics(
+            _curves(3),
+            DATES,
+            1000.0,
+            pnl=np.array([t.pnl for t in flat]),
+            pnl_pct=np.array([t.pnl_pct for t in flat]),
+            trade_run=trade_run,
+        )
+
+        for i, trades in enumerate(run_trades):
+            expected = calculate_trade_stats(trades)
+            row = batch.row(i)
+            for key, value in expected.items():
+                assert row[key] == pytest.approx(value)
+
+    def test_short_curve_is_all_zero(self) -> None:
+        """Test curves with fewer than two periods produce zero metrics."""
+        metrics = compute_metrics(np.array([1000.0]), DATES[:1], 1000.0)
+
+        assert all(value == 0.0 for value in metrics.row(0).values())
+
+    def test_padded_batch_matches_each_curve(self) -> None:
+        """Test NaN-padded curves of different lengths match one-curve calls."""
+        curves = [curve[:n] for curve, n in zip(_curves(4), (N_PERIODS, 60, 1, 2), strict=True)]
+
+        batch = compute_metrics(stack_curves(curves), DATES, 1000.0)
+
+        for i, curve in enumerate(curves):
+            single = compute_metrics(curve, DATES, 1000.0).row(0)
+            for key, value in batch.row(i).items():
+                if key != "cagr":
+                    assert value == pytest.approx(single[key]), key
+
+
+class TestPermutationLoop:
+    """Tests for the batched permutation loop."""
+
+    def test_matches_per_shuffle_simple_backtest(self) -> None:
+        """Test batch metrics equal simple_backtest on the same shuffles."""
+        rng = np.random.default_rng(11)
+        close = 100 * np.cumprod(1 + rng.normal(0, 0.02, N_PERIODS))
+        data = pd.DataFrame({"close": close}, index=pd.DatetimeIndex(DATES))
+
+        np.random.seed(3)
+        returns, sharpes, win_rates = run_permutation_loop(
+            data,
+            _MeanCrossStrategy,  # type: ignore[arg-type]
+            1000.0,
+            5,
+            ["close"],
+            verbose=False,
+        )
+
+        np.random.seed(3)
+        for i in range(5):
+            expected = simple_backtest(
+                shuffle_data(data, ["close"]),
+                _MeanCrossStrategy(),  # type: ignore[arg-type]
+                1000.0,
+            )
+            assert returns[i] == pytest.approx(expected.total_return)
+            assert sharpes[i] == pytest.approx(expected.sharpe_ratio)
+            assert win_rates[i] == pytest.approx(expected.win_rate)
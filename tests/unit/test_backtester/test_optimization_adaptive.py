@@ -0,0 +1,294 @@
+"""
+Unit tests for adaptive parameter search (successive halving, Bayesian).
+"""
+
+from collections.abc import Callable
+from datetime import date
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtester.models import BacktestConfig, BacktestResult
+from src.backtester.optimization import ParameterOptimizer
+from src.backtester.optimization_bayesian import bayesian_search
+from src.backtester.optimization_halving import successive_halving_search
+from src.backtester.parallel import ParallelBacktestRunner, ParallelBacktestTask
+from src.strategies.volatility_breakout import VanillaVBO
+from tests.fixtures.data.sample_ohlcv import generate_ohlcv_data
+
+
+def _strategy_factory(params: dict[str, Any]) -> MagicMock:
+    strategy = MagicMock()
+    strategy.name = "Mock"
+    return strategy
+
+
+def _score(params: dict[str, Any]) -> float:
+    """Synthetic objective with a single optimum at a=7, b=3."""
+    return -float((params["a"] - 7) ** 2 + (params["b"] - 3) ** 2)
+
+
+class _FakeRunner:
+    """Records submitted tasks and scores them with _score."""
+
+    def __init__(self, n_workers: int | None = None) -> None:
+        self.n_workers = n_workers or 4
+        self.calls: list[list[ParallelBacktestTask]] = []
+
+    def run(
+        self,
+        tasks: list[ParallelBacktestTask],
+        progress_callback: Callable[[str, BacktestResult], None] | None = None,
+    ) -> dict[str, BacktestResult]:
+        self.calls.append(tasks)
+        assert len({t.name for t in tasks}) == len(tasks)
+        results = {t.name: BacktestResult(sharpe_ratio=_score(t.params or {})) for t in tasks}
+        if progress_callback:
+            for name, result in results.items():
+                progress_callback(name, result)
+        return results
+
+
+@pytest.fixture
+def param_grid() -> dict[str, list[Any]]:
+    return {"a": list(range(10)), "b": list(range(6))}
+
+
+@pytest.fixture
+def data_dir(tmp_path: Path) -> Path:
+    index = pd.date_range("2020-01-01", "2023-12-31", freq="D")
+    pd.DataFrame({"close": np.ones(len(index))}, index=index).to_parquet(
+        tmp_path / "KRW-BTC_day.parquet"
+    )
+    return tmp_path
+
+
+class TestSuccessiveHalving:
+    """Tests for successive_halving_search."""
+
+    def test_promotes_best_and_finishes_on_full_history(
+        self, param_grid: dict[str, list[Any]], data_dir: Path
+    ) -> None:
+        runner = _FakeRunner()
+        with patch(
+            "src.backtester.optimization_halving.ParallelBacktestRunner", return_value=runner
+        ):
+            result = successive_halving_search(
+                _strategy_factory,
+                param_grid,
+                ["KRW-BTC"],
+                "day",
+                BacktestConfig(),
+                metric="sharpe_ratio",
+                maximize=True,
+                eta=3,
+                min_window_months=6,
+                data_dir=data_dir,
+            )
+
+        # 6m and 18m rungs fit in 4 years of data, 54m does not
+        rung_sizes = [len(tasks) for tasks in runner.calls]
+        assert rung_sizes == [60, 20, 7]
+        assert runner.calls[0][0].start_date == date(2023, 6, 30)
+        assert runner.calls[1][0].start_date == date(2022, 6, 30)
+        assert all(t.start_date is None for t in runner.calls[-1])
+        assert result.best_params == {"a": 7, "b": 3}
+        assert len(result.all_results) == 7
+
+    def test_without_data_runs_single_full_rung(
+        self, param_grid: dict[str, list[Any]], tmp_path: Path
+    ) -> None:
+        runner = _FakeRunner()
+        with patch(
+            "src.backtester.optimization_halving.ParallelBacktestRunner", return_value=runner
+        ):
+            result = successive_halving_search(
+                _strategy_factory,
+                param_grid,
+                ["KRW-BTC"],
+                "day",
+                BacktestConfig(),
+                metric="sharpe_ratio",
+                maximize=True,
+                data_dir=tmp_path,
+            )
+
+        assert len(runner.calls) == 1
+        assert result.best_params == {"a": 7, "b": 3}
+
+    def test_rungs_run_engine_on_shrinking_windows(self, tmp_path: Path) -> None:
+        """Test the real engine simulates fewer bars on earlier rungs."""
+        generate_ohlcv_data(periods=1500, start_date="2020-01-01").to_parquet(
+            tmp_path / "KRW-BTC_day.parquet"
+        )
+        bars_by_rung: dict[str, set[int]] = {}
+
+        def record(name: str, result: BacktestResult) -> None:
+            rung = name.split("_")[1]  # "<strategy>_r<rung>_<params>"
+            bars_by_rung.setdefault(rung, set()).add(len(result.equity_curve))
+
+        with patch.object(ParallelBacktestRunner, "run", ParallelBacktestRunner.run_sequential):
+            successive_halving_search(
+                lambda params: VanillaVBO(**params),
+                {"sma_period": [3, 4, 5, 6, 7, 8, 9, 10, 11]},
+                ["KRW-BTC"],
+                "day",
+                BacktestConfig(use_cache=False),
+                metric="sharpe_ratio",
+                maximize=True,
+                eta=3,
+                min_window_months=6,
+                data_dir=tmp_path,
+                progress_callback=record,
+            )
+
+        bars = [bars_by_rung[rung] for rung in sorted(bars_by_rung)]
+        assert all(len(counts) == 1 for counts in bars)
+        sizes = [counts.pop() for counts in bars]
+        assert len(sizes) >= 3
+        assert sizes == sorted(sizes) and len(set(sizes)) == len(sizes)
+        assert 150 < sizes[0] < 200  # ~6 months
+        assert sizes[-1] > 1450  # Full history less indicator warm-up
+
+    def test_invalid_eta_raises(self, param_grid: dict[str, list[Any]]) -> None:
+        with pytest.raises(ValueError, match="eta must be >= 2"):
+            successive_halving_search(
+                _strategy_factory,
+                param_grid,
+                ["KRW-BTC"],
+                "day",
+                BacktestConfig(),
+                metric="sharpe_ratio",
+                maximize=True,
+                eta=1,
+            )
+
+
+class TestBayesianSearch:
+    """Tests for bayesian_search."""
+
+    def test_respects_budget_and_batches(self, param_grid: dict[str, list[Any]]) -> None:
+        runner = _FakeRunner(n_workers=5)
+        with patch(
+            "src.backtester.optimization_bayesian.ParallelBacktestRunner", return_value=runner
+        ):
+            result = bayesian_search(
+                _strategy_factory,
+                param_grid,
+                ["KRW-BTC"],
+                "day",
+                BacktestConfig(),
+                metric="sharpe_ratio",
+                maximize=True,
+                n_iter=30,
+                seed=0,
+            )
+
+        assert [len(tasks) for tasks in runner.calls] == [10, 5, 5, 5, 5]
+        evaluated = [tuple(t.params.values()) for tasks in runner.calls for t in tasks]
+        assert len(set(evaluated)) == 30
+        assert len(result.all_results) == 30
+        scores = [score for _, _, score in result.all_results]
+        assert scores == sorted(scores, reverse=True)
+
+    def test_model_guided_batches_beat_random_warmup(
+        self, param_grid: dict[str, list[Any]]
+    ) -> None:
+        runner = _FakeRunner(n_workers=4)
+        with patch(
+            "src.backtester.optimization_bayesian.ParallelBacktestRunner", return_value=runner
+        ):
+            bayesian_search(
+                _strategy_factory,
+                param_grid,
+                ["KRW-BTC"],
+                "day",
+                BacktestConfig(),
+                metric="sharpe_ratio",
+                maximize=True,
+                n_iter=40,
+                n_initial=12,
+                seed=1,
+            )
+
+        warmup = [_score(t.params or {}) for t in runner.calls[0]]
+        guided = [_score(t.params or {}) for tasks in runner.calls[1:] for t in tasks]
+        assert np.mean(guided) > np.mean(warmup)
+
+    def test_pruned_trials_do_not_guide_proposals(self, param_grid: dict[str, list[Any]]) -> None:
+        """Test a pruned run's inflated partial score is not treated as good."""
+
+        class _PruningRunner(_FakeRunner):
+            def run(
+                self,
+                tasks: list[ParallelBacktestTask],
+                progress_callback: Callable[[str, BacktestResult], None] | None = None,
+            ) -> dict[str, BacktestResult]:
+                results = super().run(tasks, progress_callback)
+                for task in tasks:
+                    if (task.params or {})["a"] < 3:
+                        results[task.name] = BacktestResult(sharpe_ratio=100.0, pruned=True)
+                return results
+
+        runner = _PruningRunner(n_workers=4)
+        with patch(
+            "src.backtester.optimization_bayesian.ParallelBacktestRunner", return_value=runner
+        ):
+            result = bayesian_search(
+                _strategy_factory,
+                param_grid,
+                ["KRW-BTC"],
+                "day",
+                BacktestConfig(),
+                metric="sharpe_ratio",
+                maximize=True,
+                n_iter=40,
+                n_initial=12,
+                seed=1,
+            )
+
+        guided = [(t.params or {})["a"] for tasks in runner.calls[1:] for t in tasks]
+        assert sum(a < 3 for a in guided) <= len(guided) // 4
+        assert result.best_params == {"a": 7, "b": 3}
+
+    def test_budget_capped_at_grid_size(self) -> None:
+        runner = _FakeRunner(n_workers=2)
+        with patch(
+            "src.backtester.optimization_bayesian.ParallelBacktestRunner", return_value=runner
+        ):
+            result = bayesian_search(
+                _strategy_factory,
+                {"a": [6, 7], "b": [2, 3]},
+                ["KRW-BTC"],
+                "day",
+                BacktestConfig(),
+                metric="sharpe_ratio",
+                maximize=False,
+                n_iter=100,
+            )
+
+        assert len(result.all_results) == 4
+        assert result.best_params == {"a": 6, "b": 2}
+
+
+class TestParameterOptimizerAdaptiveMethods:
+    """Tests for adaptive method dispatch in ParameterOptimizer."""
+
+    @pytest.mark.parametrize(
+        ("method", "target"),
+        [("halving", "successive_halving_search"), ("bayesian", "bayesian_search")],
+    )
+    def test_dispatch(self, method: str, target: str, param_grid: dict[str, list[Any]]) -> None:
+        optimizer = ParameterOptimizer(
+            strategy_factory=_strategy_factory,
+            tickers=["KRW-BTC"],
+            interval="day",
+            config=BacktestConfig(),
+        )
+        with patch(f"src.backtester.optimization.{target}") as mock_search:
+            optimizer.optimize(param_grid, method=method)
+            mock_search.assert_called_once()
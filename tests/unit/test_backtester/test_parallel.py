@@ -9,7 +9,7 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from src.backtester.engine import BacktestConfig, BacktestResult
+from src.backtester.engine import BacktestConfig, BacktestResult, VectorizedBacktestEngine
 from src.backtester.parallel import (
     ParallelBacktestRunner,
     ParallelBacktestTask,
@@ -213,7 +213,7 @@ class TestParallelBacktestRunner:
 
         mock_pool = MagicMock()
         mock_pool_class.return_value.__enter__.return_value = mock_pool
-        mock_pool.map.return_value = [("TestTask", mock_result)]
+        mock_pool.imap_unordered.return_value = [("TestTask", mock_result)]
 
         # Call run without progress_callback
         result = runner.run([sample_task])
@@ -309,12 +309,12 @@ class TestParallelBacktestRunner:
 
         callback = MagicMock()
 
-        # We can't easily mock multiprocessing.Pool.map directly,
+        # We can't easily mock multiprocessing.Pool.imap_unordered directly,
         # so we test the sequential fallback behavior is correct
         with patch("multiprocessing.Pool") as mock_pool_class:
             mock_pool = MagicMock()
             mock_pool_class.return_value.__enter__.return_value = mock_pool
-            mock_pool.map.return_value = [("TestTask", mock_result)]
+            mock_pool.imap_unordered.return_value = [("TestTask", mock_result)]
 
             result = runner.run([sample_task], progress_callback=callback)
 
@@ -547,3 +547,47 @@ class TestParallelIntegration:
         task_name, result = _run_single_backtest(result_task)
 
         assert isinstance(result, BacktestResult)
+
+
+class TestRunOnData:
+    """Tests for ParallelBacktestRunner.run_on_data."""
+
+    @pytest.mark.parametrize("n_workers", [1, 2])
+    def test_param_sets_share_data(
+        self,
+        mock_config: BacktestConfig,
+        multiple_tickers_data: dict[str, Any],
+        n_workers: int,
+    ) -> None:
+        from src.strategies.volatility_breakout import VanillaVBO
+
+        param_sets = {"fast": {"sma_period": 3}, "slow": {"sma_period": 6}}
+        results = ParallelBacktestRunner(n_workers=n_workers).run_on_data(
+            VanillaVBO, param_sets, multiple_tickers_data, mock_config
+        )
+
+        assert set(results) == {"fast", "slow"}
+        for name, params in param_sets.items():
+            expected = VectorizedBacktestEngine(mock_config).run_on_data(
+                VanillaVBO(**params), multiple_tickers_data
+            )
+            assert results[name].total_return == pytest.approx(expected.total_return)
+
+    def test_empty_param_sets(self) -> None:
+        assert ParallelBacktestRunner(n_workers=1).run_on_data(MagicMock(), {}, {}) == {}
+
+    def test_in_process_run_releases_shared_data(
+        self, mock_config: BacktestConfig, multiple_tickers_data: dict[str, Any]
+    ) -> None:
+        """Test shared module state is reset even when the progress callback raises."""
+        from src.backtester import parallel
+        from src.strategies.volatility_breakout import VanillaVBO
+
+        callback = MagicMock(side_effect=RuntimeError("boom"))
+        with pytest.raises(RuntimeError, match="boom"):
+            ParallelBacktestRunner(n_workers=1).run_on_data(
+                VanillaVBO, {"a": {}}, multiple_tickers_data, mock_config, callback
+            )
+
+        assert parallel._shared_data == {}
+        assert parallel._shared_config is None
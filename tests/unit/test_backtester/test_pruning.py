@@ -0,0 +1,156 @@
+"""
+Unit tests for early pruning of backtest simulations.
+"""
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtester.engine import VectorizedBacktestEngine
+from src.backtester.engine.pruning import PruningMonitor, create_pruning_monitor
+from src.backtester.engine.trade_simulator_state import initialize_simulation_state
+from src.backtester.models import BacktestConfig, BacktestResult
+from src.backtester.optimization_search import collect_results
+from src.backtester.parallel import ParallelBacktestTask
+from src.strategies.base import Strategy
+
+
+def _never_trades(equity: np.ndarray, n_entries: int) -> bool:
+    return n_entries == 0
+
+
+class TestPruningMonitor:
+    """Tests for PruningMonitor rules."""
+
+    def test_disabled_by_default(self) -> None:
+        assert create_pruning_monitor(BacktestConfig()) is None
+
+    def test_max_drawdown(self) -> None:
+        config = BacktestConfig(prune_max_drawdown=0.2)
+        monitor = create_pruning_monitor(config)
+        assert isinstance(monitor, PruningMonitor)
+
+        state = initialize_simulation_state(100.0, 1, 4, ["KRW-BTC"])
+        state.equity_curve[:] = [100.0, 110.0, 90.0, 85.0]
+        assert monitor.check(state, 0) is None
+        assert monitor.check(state, 1) is None
+        assert monitor.check(state, 2) is None  # 18.2% drawdown
+        assert monitor.check(state, 3) == "max_drawdown"  # 22.7% drawdown
+
+    def test_drawdown_between_checks_is_not_missed(self) -> None:
+        config = BacktestConfig(prune_max_drawdown=0.2, prune_check_every=3)
+        monitor = PruningMonitor(config)
+
+        state = initialize_simulation_state(100.0, 1, 3, ["KRW-BTC"])
+        state.equity_curve[:] = [100.0, 50.0, 100.0]
+        assert monitor.check(state, 0) is None
+        assert monitor.check(state, 1) is None  # Not a check bar
+        assert monitor.check(state, 2) == "max_drawdown"
+
+    def test_min_trades_enforced_after_bar(self) -> None:
+        config = BacktestConfig(prune_min_trades=1, prune_min_trades_bar=2)
+        monitor = PruningMonitor(config)
+
+        state = initialize_simulation_state(100.0, 1, 3, ["KRW-BTC"])
+        state.equity_curve[:] = 100.0
+        assert monitor.check(state, 1) is None
+        assert monitor.check(state, 2) == "min_trades"
+
+        state.position_amounts[0] = 1.0  # An open position counts as an entry
+        assert monitor.check(state, 2) is None
+
+    def test_predicate(self) -> None:
+        monitor = PruningMonitor(BacktestConfig(prune_predicate=_never_trades))
+        state = initialize_simulation_state(100.0, 1, 2, ["KRW-BTC"])
+        state.equity_curve[:] = 100.0
+        assert monitor.check(state, 0) == "predicate"
+
+
+class TestEnginePruning:
+    """Tests for pruning inside VectorizedBacktestEngine."""
+
+    @pytest.fixture
+    def crash_data(self) -> pd.DataFrame:
+        periods = 60
+        close = np.concatenate([np.full(10, 100.0), np.linspace(100.0, 20.0, periods - 10)])
+        entry = np.zeros(periods, dtype=bool)
+        entry[5] = True
+        return pd.DataFrame(
+            {
+                "open": close,
+                "high": close,
+                "low": close,
+                "close": close,
+                "volume": np.full(periods, 1000.0),
+                "entry_signal": entry,
+                "exit_signal": np.zeros(periods, dtype=bool),
+                "target": close,
+                "sma": np.full(periods, 10.0),
+                "short_noise": np.full(periods, 0.5),
+            },
+            index=pd.date_range("2023-01-01", periods=periods, freq="D"),
+        )
+
+    def _run(self, config: BacktestConfig, data: pd.DataFrame, tmp_path: Path) -> BacktestResult:
+        fpath = tmp_path / "KRW-BTC_day.parquet"
+        data.to_parquet(fpath)
+        strategy = MagicMock(spec=Strategy)
+        strategy.name = "Crash"
+        strategy.calculate_indicators.return_value = data
+        strategy.generate_signals.return_value = data
+        engine = VectorizedBacktestEngine(config)
+        with patch("src.backtester.engine.vectorized.optimize_dtypes", side_effect=lambda x: x):
+            return engine.run(strategy, {"KRW-BTC": fpath})
+
+    def test_pruned_run_is_flagged_and_truncated(
+        self, crash_data: pd.DataFrame, tmp_path: Path
+    ) -> None:
+        config = BacktestConfig(use_cache=False, fee_rate=0.0, slippage_rate=0.0, max_slots=1)
+        full = self._run(config, crash_data, tmp_path)
+
+        config.prune_max_drawdown = 0.3
+        pruned = self._run(config, crash_data, tmp_path)
+
+        assert not full.pruned
+        assert pruned.pruned
+        assert pruned.prune_reason == "max_drawdown"
+        assert len(pruned.equity_curve) < len(full.equity_curve)
+        assert len(pruned.dates) == len(pruned.equity_curve)
+        # Open position is marked to market at the pruning bar
+        assert pruned.trades[-1].exit_reason == "open"
+        assert pruned.trades[-1].exit_date == pruned.dates[-1]
+        np.testing.assert_allclose(
+            pruned.equity_curve, full.equity_curve[: len(pruned.equity_curve)]
+        )
+
+
+class TestPrunedRanking:
+    """Tests for ranking of pruned results in optimization."""
+
+    def _task(self, name: str, params: dict[str, Any]) -> ParallelBacktestTask:
+        return ParallelBacktestTask(
+            name=name,
+            strategy=MagicMock(),
+            tickers=[],
+            interval="day",
+            config=BacktestConfig(),
+            params=params,
+        )
+
+    @pytest.mark.parametrize("maximize", [True, False])
+    def test_pruned_ranked_below_completed(self, maximize: bool) -> None:
+        tasks = [self._task(f"t{i}", {"p": i}) for i in range(3)]
+        results = {
+            "t0": BacktestResult(sharpe_ratio=5.0, pruned=True),
+            "t1": BacktestResult(sharpe_ratio=1.0),
+            "t2": BacktestResult(sharpe_ratio=-5.0, pruned=True),
+        }
+
+        result = collect_results(tasks, results, "sharpe_ratio", maximize)
+
+        assert result.best_params == {"p": 1}
+        assert [r.pruned for _, r, _ in result.all_results] == [False, True, True]
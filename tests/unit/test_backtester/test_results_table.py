@@ -0,0 +1,59 @@
+"""Tests for the partitioned backtest results table."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.backtester.models import BacktestResult
+from src.backtester.results_table import (
+    RESULT_COLUMNS,
+    buy_and_hold_return,
+    result_row,
+    write_results_table,
+)
+
+
+class TestResultRow:
+    """Tests for result_row."""
+
+    def test_converts_percent_metrics_to_fractions(self) -> None:
+        result = BacktestResult(
+            total_return=25.0,
+            cagr=10.0,
+            mdd=15.0,
+            sharpe_ratio=1.5,
+            total_trades=7,
+            equity_curve=np.ones(30),
+        )
+        row = result_row(result, "BTC", "VanillaVBO", params={"sma_period": 4})
+
+        assert set(row) == set(RESULT_COLUMNS)
+        assert row["total_return"] == 0.25
+        assert row["cagr"] == 0.10
+        assert row["max_drawdown"] == -0.15
+        assert row["data_rows"] == 30
+        assert row["status"] == "success"
+        assert json.loads(row["params"]) == {"sma_period": 4}
+
+    def test_empty_result_is_not_success(self) -> None:
+        assert result_row(BacktestResult(), "BTC", "VanillaVBO")["status"] == "no_data"
+
+
+def test_buy_and_hold_return() -> None:
+    df = pd.DataFrame({"close": [np.nan, 100.0, 150.0]})
+    assert buy_and_hold_return(df) == 0.5
+
+
+def test_write_results_table_partition(tmp_path: Path) -> None:
+    row = result_row(BacktestResult(equity_curve=np.ones(3)), "BTC", "VanillaVBO")
+    write_results_table([row], tmp_path, "20240107")
+    path = write_results_table([row, {**row, "symbol": "ETH"}], tmp_path, "20240107")
+
+    assert path == tmp_path / "run_date=20240107" / "results.parquet"
+    table = pd.read_parquet(tmp_path)
+    assert list(table["symbol"]) == ["BTC", "ETH"]
+    assert str(table["run_date"].iloc[0]) == "20240107"
@@ -0,0 +1,117 @@
+"""
+Unit tests for rolling return moments used by MPT / risk parity sizing.
+"""
+
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.backtester.engine.position_sizer import calculate_position_sizes_for_entries
+from src.backtester.engine.rolling_returns import RollingReturnWindow
+from src.backtester.engine.trade_simulator_state import (
+    SimulationState,
+    initialize_simulation_state,
+)
+from src.backtester.models import BacktestConfig
+from src.risk.portfolio_methods import solve_mpt
+
+
+class TestRollingReturnWindow:
+    """Tests for RollingReturnWindow."""
+
+    def test_moments_match_numpy(self) -> None:
+        rng = np.random.default_rng(0)
+        returns = rng.normal(0.001, 0.02, size=(57, 3))
+        window = RollingReturnWindow(n_assets=3, window=20)
+        for row in returns:
+            window.push(row)
+
+        idx = window.full_assets(np.arange(3))
+        mean, cov = window.moments(idx)
+
+        expected = returns[-20:]
+        np.testing.assert_allclose(mean, expected.mean(axis=0))
+        np.testing.assert_allclose(cov, np.cov(expected, rowvar=False))
+
+    def test_missing_returns_exclude_asset_until_window_refills(self) -> None:
+        window = RollingReturnWindow(n_assets=2, window=3)
+        window.push(np.array([0.01, np.nan]))
+        window.push(np.array([0.02, 0.01]))
+        window.push(np.array([0.03, 0.02]))
+        assert list(window.full_assets(np.array([0, 1]))) == [0]
+
+        window.push(np.array([0.04, 0.03]))
+        assert list(window.full_assets(np.array([0, 1]))) == [0, 1]
+        mean, _ = window.moments(np.array([1]))
+        assert mean[0] == pytest.approx(0.02)
+
+    def test_invalid_window_raises(self) -> None:
+        with pytest.raises(ValueError, match="window must be >= 2"):
+            RollingReturnWindow(n_assets=1, window=1)
+
+
+class TestRollingMptSizing:
+    """Tests for MPT sizing backed by the rolling window."""
+
+    def _state(self, window_size: int = 10) -> SimulationState:
+        rng = np.random.default_rng(1)
+        state = initialize_simulation_state(1000.0, 3, 30, ["A", "B", "C"])
+        state.rolling_returns = RollingReturnWindow(3, window_size)
+        for _ in range(window_size):
+            state.rolling_returns.push(rng.normal(0.001, 0.02, size=3))
+        return state
+
+    def _sizes(
+        self, state: SimulationState, candidates: list[int], rebalance_bars: int = 1
+    ) -> dict[str, float]:
+        config = BacktestConfig(
+            position_sizing="mpt",
+            position_sizing_lookback=10,
+            portfolio_rebalance_bars=rebalance_bars,
+        )
+        return calculate_position_sizes_for_entries(
+            state, config, np.array(candidates), ["A", "B", "C"], np.ones((3, 30)), 0, None, None
+        )
+
+    def test_weights_cached_until_window_changes(self) -> None:
+        state = self._state()
+        with patch("src.backtester.engine.position_sizer.solve_mpt", wraps=solve_mpt) as solver:
+            first = self._sizes(state, [0, 1, 2])
+            second = self._sizes(state, [0, 1, 2])
+            assert solver.call_count == 1
+            assert first == second
+            assert sum(first.values()) == pytest.approx(1000.0)
+
+            assert state.rolling_returns is not None
+            state.rolling_returns.push(np.array([0.01, -0.01, 0.0]))
+            self._sizes(state, [0, 1])
+            assert solver.call_count == 2
+
+        # Warm start from the previous weights restricted to the new candidate set
+        initial = solver.call_args.kwargs["initial_weights"]
+        expected = np.array([first["A"], first["B"]])
+        np.testing.assert_allclose(initial, expected / expected.sum())
+
+    def test_weights_reused_within_rebalance_period(self) -> None:
+        state = self._state()
+        assert state.rolling_returns is not None
+        rng = np.random.default_rng(2)
+        with patch("src.backtester.engine.position_sizer.solve_mpt", wraps=solve_mpt) as solver:
+            # Window version runs 10..19: two rebalance periods of 5 bars
+            for _ in range(10):
+                self._sizes(state, [0, 1, 2], rebalance_bars=5)
+                state.rolling_returns.push(rng.normal(0.001, 0.02, size=3))
+            assert solver.call_count == 2
+
+            # A new candidate set re-solves immediately
+            self._sizes(state, [0, 1], rebalance_bars=5)
+            assert solver.call_count == 3
+
+    def test_short_window_falls_back(self) -> None:
+        state = self._state(window_size=5)
+        with patch(
+            "src.backtester.engine.position_sizer._calculate_fallback_sizes", return_value={}
+        ) as fallback:
+            assert self._sizes(state, [0, 1]) == {}
+            fallback.assert_called_once()
@@ -0,0 +1,104 @@
+"""
+Unit tests for the columnar trade ledger.
+"""
+
+import pickle
+from datetime import date
+
+import numpy as np
+
+from src.backtester.metrics_helpers import calculate_trade_stats
+from src.backtester.models import BacktestResult, Trade
+from src.backtester.trade_ledger import TradeLedger
+from src.web.services.result_cache import CompactBacktestResult
+
+DATES = np.array([date(2024, 1, d) for d in range(1, 6)], dtype=object)
+
+
+def _ledger(capacity: int = 2) -> TradeLedger:
+    ledger = TradeLedger(["KRW-BTC", "KRW-ETH"], capacity=capacity)
+    ledger.append(0, 0, 2, 100.0, 110.0, 1.0, 10.0, 10.0, 0.1, 0.05, "signal")
+    ledger.append(1, 1, 1, 50.0, 45.0, 2.0, -10.0, -10.0, 0.1, 0.05, "whipsaw")
+    ledger.append(0, 3, 4, 100.0, 90.0, 1.0, -10.0, -10.0, 0.1, 0.05, "stop_loss")
+    return ledger
+
+
+class TestTradeLedger:
+    """Tests for TradeLedger storage and views."""
+
+    def test_grows_past_capacity(self) -> None:
+        """Test appends beyond the preallocated rows double the columns."""
+        ledger = _ledger(capacity=2)
+
+        assert len(ledger) == 3
+        assert ledger.capacity == 4
+        np.testing.assert_array_equal(ledger.column("pnl"), [10.0, -10.0, -10.0])
+        assert ledger.to_records()["exit_idx"].tolist() == [2, 1, 4]
+
+    def test_frame_and_arrow_share_buffers(self) -> None:
+        """Test numeric columns are views of the ledger, codes are decoded."""
+        ledger = _ledger()
+
+        frame = ledger.to_frame(DATES)
+        assert np.shares_memory(frame["pnl"].to_numpy(), ledger.column("pnl"))
+        assert frame["ticker"].tolist() == ["KRW-BTC", "KRW-ETH", "KRW-BTC"]
+        assert frame["exit_date"].tolist() == [DATES[2], DATES[1], DATES[4]]
+        assert frame["is_whipsaw"].tolist() == [False, True, False]
+        assert frame["is_stop_loss"].tolist() == [False, False, True]
+
+        table = ledger.to_arrow()
+        assert table.column("exit_reason").to_pylist() == ["signal", "whipsaw", "stop_loss"]
+        pnl = table.column("pnl").chunk(0)
+        assert pnl.buffers()[1].address == ledger.column("pnl").ctypes.data
+
+    def test_trades_match_legacy_fields(self) -> None:
+        """Test materialized trades carry dates, flags and Python floats."""
+        trade = _ledger().to_trades(DATES)[1]
+
+        assert trade == Trade(
+            ticker="KRW-ETH",
+            entry_date=DATES[1],
+            entry_price=50.0,
+            exit_date=DATES[1],
+            exit_price=45.0,
+            amount=2.0,
+            pnl=-10.0,
+            pnl_pct=-10.0,
+            is_whipsaw=True,
+            commission_cost=0.1,
+            slippage_cost=0.05,
+            exit_reason="whipsaw",
+        )
+        assert type(trade.pnl) is float
+
+    def test_trade_stats_from_ledger_match_list(self) -> None:
+        """Test column-wise stats equal the Trade list stats."""
+        ledger = _ledger()
+
+        assert calculate_trade_stats(ledger) == calculate_trade_stats(ledger.to_trades(DATES))
+        assert calculate_trade_stats(ledger)["losing_trades"] == 2.0
+
+
+class TestLazyResultTrades:
+    """Tests for BacktestResult trades backed by a ledger."""
+
+    def test_trades_built_on_first_access(self) -> None:
+        """Test trades are materialized once and survive pickling."""
+        result = BacktestResult(dates=DATES)
+        result.attach_ledger(_ledger())
+
+        assert "trades" not in vars(result)
+        restored = pickle.loads(pickle.dumps(result))
+        assert result.trades is result.trades
+        assert [t.exit_reason for t in result.trades] == ["signal", "whipsaw", "stop_loss"]
+        assert restored.trades == result.trades
+
+    def test_compact_result_packs_ledger(self) -> None:
+        """Test the result cache packs ledger columns without building trades."""
+        result = BacktestResult(dates=DATES, equity_curve=np.ones(len(DATES)))
+        result.attach_ledger(_ledger())
+
+        compact = CompactBacktestResult.from_result(result)
+
+        assert "trades" not in vars(result)
+        assert compact.to_result().trades == _ledger().to_trades(DATES)
@@ -3,6 +3,7 @@ Unit tests for trade_simulator module.
 """
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from src.backtester.engine.trade_simulator import (
@@ -12,7 +13,9 @@ from src.backtester.engine.trade_simulator import (
     track_asset_returns,
 )
 from src.backtester.engine.trade_simulator_state import initialize_simulation_state
+from src.backtester.engine.trade_stats import TradeStats
 from src.backtester.models import BacktestConfig
+from src.risk.portfolio_kelly import optimize_kelly_portfolio
 
 # -------------------------------------------------------------------------
 # Fixtures
@@ -339,3 +342,37 @@ class TestTrackAssetReturns:
 
         assert len(sample_state.asset_returns["KRW-BTC"]) == 0  # NaN skipped
         assert len(sample_state.asset_returns["KRW-ETH"]) == 1
+
+
+class TestTradeStats:
+    """Tests for running per-ticker trade statistics."""
+
+    def test_kelly_matches_dataframe_path(self) -> None:
+        rng = np.random.default_rng(3)
+        tickers = ["A", "B", "C", "D"]
+        t_idx = rng.integers(0, 4, size=200)
+        pnl_pct = rng.normal(1.0, 8.0, size=200)
+        pnl_pct[:5] = 0.0  # Break-even trades count toward the win rate denominator
+        t_idx[t_idx == 3] = 2  # D never trades
+
+        stats = TradeStats(len(tickers))
+        for t, p in zip(t_idx, pnl_pct, strict=True):
+            stats.record(int(t), float(p))
+
+        trades = pd.DataFrame({"ticker": [tickers[t] for t in t_idx], "pnl_pct": pnl_pct})
+        expected = optimize_kelly_portfolio(trades, 10000.0, max_kelly=0.5)
+
+        assert stats.total_trades == 200
+        assert stats.kelly_allocations(tickers, 10000.0, 0.5) == pytest.approx(expected)
+
+    def test_requires_wins_and_losses(self) -> None:
+        stats = TradeStats(2)
+        for p in (5.0, 3.0, -2.0):
+            stats.record(0, p)
+        for p in (5.0, 3.0):
+            stats.record(1, p)
+
+        allocations = stats.kelly_allocations(["A", "B"], 1000.0, 0.25)
+
+        assert set(allocations) == {"A"}
+        assert allocations["A"] == pytest.approx(250.0)
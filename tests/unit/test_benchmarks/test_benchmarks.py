@@ -0,0 +1,103 @@
+"""Tests for the benchmark suite plumbing (synthetic data, runner, regression check)."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from benchmarks.cases import BenchmarkCase, Workspace
+from benchmarks.compare import compare_results
+from benchmarks.runner import load_results, run_suite, save_results
+from benchmarks.synthetic import Scale, generate_ohlcv, generate_universe
+
+
+def _document(**medians: float) -> dict[str, object]:
+    return {
+        "schema": 1,
+        "machine": {},
+        "results": [{"id": k, "median_s": v, "min_s": v} for k, v in medians.items()],
+    }
+
+
+class TestSynthetic:
+    """Tests for synthetic OHLCV generation."""
+
+    def test_ohlcv_is_deterministic_and_consistent(self) -> None:
+        df = generate_ohlcv(500, "minute60", seed=7)
+
+        pd.testing.assert_frame_equal(df, generate_ohlcv(500, "minute60", seed=7))
+        assert df.index.name == "datetime"
+        assert df.index[1] == pd.Timestamp("2020-01-01 01:00")
+        assert (df["high"] >= df["close"]).all()
+        assert (df["low"] <= df["close"]).all()
+        assert np.isfinite(df.to_numpy()).all()
+
+    def test_universe_tickers_differ(self) -> None:
+        data = generate_universe(Scale(3, "day", 50))
+
+        assert list(data) == ["KRW-SYN0000", "KRW-SYN0001", "KRW-SYN0002"]
+        assert not data["KRW-SYN0000"]["close"].equals(data["KRW-SYN0001"]["close"])
+
+    def test_unknown_interval_rejected(self) -> None:
+        with pytest.raises(ValueError, match="Unsupported interval"):
+            generate_ohlcv(10, "week")
+
+
+class TestRunner:
+    """Tests for running cases and storing results."""
+
+    def test_run_suite_records_timings_and_errors(self, tmp_path: Path) -> None:
+        def ok(ws: Workspace) -> Callable[[], object]:
+            assert all(p.exists() for p in ws.data_files.values())
+            return lambda: sum(len(df) for df in ws.data.values())
+
+        def broken(ws: Workspace) -> Callable[[], object]:
+            raise RuntimeError("boom")
+
+        cases = [
+            BenchmarkCase("ok", ok, max_repeat=2),
+            BenchmarkCase("broken", broken),
+            BenchmarkCase("skipped", ok, max_tickers=1),
+        ]
+        document = run_suite(cases, [Scale(2, "day", 30)], repeat=3, warmup=0)
+
+        ok_entry, broken_entry = document["results"]
+        assert ok_entry["id"] == "ok[2x_day_30]"
+        assert len(ok_entry["times_s"]) == 2
+        assert ok_entry["min_s"] <= ok_entry["median_s"]
+        assert broken_entry["error"] == "RuntimeError: boom"
+        assert document["machine"]["cpu_count"]
+
+        path = save_results(document, tmp_path / "out" / "results.json")
+        assert load_results(path)["results"] == document["results"]
+
+
+class TestCompare:
+    """Tests for the regression check."""
+
+    def test_statuses(self) -> None:
+        baseline = _document(slow=1.0, fast=1.0, same=1.0, tiny=0.0001, gone=1.0)
+        current = _document(slow=1.5, fast=0.5, same=1.05, tiny=0.0005, added=1.0)
+
+        statuses = {c.id: c.status for c in compare_results(baseline, current, threshold=0.1)}
+
+        assert statuses == {
+            "slow": "regression",
+            "fast": "improvement",
+            "same": "unchanged",
+            "tiny": "unchanged",  # 5x slower but below the 1 ms noise floor
+            "added": "new",
+            "gone": "missing",
+        }
+
+    def test_errors_are_reported(self) -> None:
+        current = {"results": [{"id": "a", "error": "ValueError: x"}]}
+
+        (comparison,) = compare_results(_document(a=1.0), current)
+
+        assert comparison.status == "error"
+        assert comparison.baseline_s == 1.0
@@ -0,0 +1,106 @@
+"""Tests for the incremental feature pipeline."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.feature_pipeline import (
+    FEATURE_COLUMNS,
+    WARMUP_ROWS,
+    read_feature_store,
+    update_feature_store,
+)
+from src.utils.indicators import sma
+from tests.fixtures.data.sample_ohlcv import generate_ohlcv_data
+
+
+@pytest.fixture
+def raw() -> dict[str, pd.DataFrame]:
+    return {
+        "BTC": generate_ohlcv_data(periods=500, start_date="2023-01-01", seed=1),
+        "ETH": generate_ohlcv_data(periods=400, start_date="2023-04-11", seed=2),
+    }
+
+
+class TestUpdateFeatureStore:
+    """Tests for update_feature_store."""
+
+    def test_incremental_matches_full_recompute(
+        self, raw: dict[str, pd.DataFrame], tmp_path: Path
+    ) -> None:
+        update_feature_store(raw, tmp_path / "full")
+        update_feature_store({s: df.iloc[:-40] for s, df in raw.items()}, tmp_path / "inc")
+        new_rows = update_feature_store(raw, tmp_path / "inc")
+
+        assert len(new_rows) == 80
+        full = read_feature_store(tmp_path / "full")
+        inc = read_feature_store(tmp_path / "inc")
+        assert len(full) == len(inc) == 900
+        np.testing.assert_allclose(
+            inc[list(FEATURE_COLUMNS)].to_numpy(),
+            full[list(FEATURE_COLUMNS)].to_numpy(),
+            rtol=1e-6,
+            atol=1e-6,
+        )
+
+    def test_revised_last_candle_is_recomputed(
+        self, raw: dict[str, pd.DataFrame], tmp_path: Path
+    ) -> None:
+        partial = {s: df.iloc[:-40].copy() for s, df in raw.items()}
+        for df in partial.values():
+            # Last candle fetched while still open
+            df.loc[df.index[-1], "close"] = df["close"].iloc[-1] * 0.9
+            df.loc[df.index[-1], "volume"] = df["volume"].iloc[-1] * 0.5
+        update_feature_store(partial, tmp_path / "inc")
+        new_rows = update_feature_store(raw, tmp_path / "inc")
+        update_feature_store(raw, tmp_path / "full")
+
+        assert len(new_rows) == 82
+        full = read_feature_store(tmp_path / "full")
+        inc = read_feature_store(tmp_path / "inc")
+        assert len(inc) == 900
+        np.testing.assert_allclose(
+            inc[list(FEATURE_COLUMNS)].to_numpy(),
+            full[list(FEATURE_COLUMNS)].to_numpy(),
+            rtol=1e-6,
+            atol=1e-6,
+        )
+        state = pd.read_parquet(tmp_path / "inc_state.parquet")
+        btc = state[state["symbol"] == "BTC"].set_index("timestamp")
+        revised = raw["BTC"].index[-41]
+        assert btc.loc[revised, "close"] == pytest.approx(raw["BTC"].loc[revised, "close"])
+
+    def test_uses_shared_indicators(self, raw: dict[str, pd.DataFrame], tmp_path: Path) -> None:
+        update_feature_store(raw, tmp_path / "store")
+        btc = read_feature_store(tmp_path / "store", symbols=["BTC"])
+
+        expected = sma(raw["BTC"]["close"], 20)
+        np.testing.assert_allclose(btc["ma_20"].to_numpy(), expected.to_numpy())
+
+    def test_state_keeps_warmup_rows(self, raw: dict[str, pd.DataFrame], tmp_path: Path) -> None:
+        update_feature_store(raw, tmp_path / "store")
+
+        state = pd.read_parquet(tmp_path / "store_state.parquet")
+        assert state.groupby("symbol").size().to_dict() == {"BTC": WARMUP_ROWS, "ETH": WARMUP_ROWS}
+
+        # Re-running with no new rows appends nothing
+        assert update_feature_store(raw, tmp_path / "store").empty
+
+    def test_month_partitions_and_pruned_read(
+        self, raw: dict[str, pd.DataFrame], tmp_path: Path
+    ) -> None:
+        update_feature_store(raw, tmp_path / "store")
+
+        assert (tmp_path / "store" / "month=2023-01" / "features.parquet").exists()
+        recent = read_feature_store(
+            tmp_path / "store", symbols=["ETH"], start=pd.Timestamp("2024-01-01")
+        )
+        assert set(recent["symbol"]) == {"ETH"}
+        assert recent.index.min() >= pd.Timestamp("2024-01-01")
+
+    def test_missing_store_reads_empty(self, tmp_path: Path) -> None:
+        assert read_feature_store(tmp_path / "missing").empty
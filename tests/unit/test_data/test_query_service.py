@@ -0,0 +1,140 @@
+"""Tests for the DuckDB query service."""
+
+from __future__ import annotations
+
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+pytest.importorskip("duckdb")
+
+from src.data.query_service import DuckDBQueryService
+from tests.fixtures.data.sample_ohlcv import generate_ohlcv_data
+
+
+@pytest.fixture
+def raw() -> dict[str, pd.DataFrame]:
+    return {
+        "KRW-BTC": generate_ohlcv_data(periods=300, start_date="2023-01-01", seed=1),
+        "KRW-ETH": generate_ohlcv_data(periods=200, start_date="2023-03-01", seed=2),
+    }
+
+
+@pytest.fixture
+def service(
+    raw: dict[str, pd.DataFrame], tmp_path: Path
+) -> Generator[DuckDBQueryService, None, None]:
+    raw_dir = tmp_path / "raw"
+    raw_dir.mkdir()
+    for ticker, df in raw.items():
+        df.to_parquet(raw_dir / f"{ticker}_day.parquet")
+    svc = DuckDBQueryService(raw_dir, tmp_path / "processed", tmp_path / "results", pool_size=2)
+    yield svc
+    svc.close()
+
+
+class TestOHLCVQueries:
+    """Tests for OHLCV range and aggregate queries."""
+
+    def test_read_range_matches_pandas_filter(
+        self, service: DuckDBQueryService, raw: dict[str, pd.DataFrame]
+    ) -> None:
+        df = service.ohlcv_range("KRW-BTC", "day", date(2023, 2, 1), date(2023, 3, 31))
+
+        expected = raw["KRW-BTC"].loc["2023-02-01":"2023-03-31"]
+        assert df is not None
+        pd.testing.assert_frame_equal(df, expected, check_freq=False, check_index_type=False)
+
+    def test_column_projection_and_missing_file(self, service: DuckDBQueryService) -> None:
+        df = service.ohlcv_range("KRW-BTC", "day", columns=["close"])
+
+        assert df is not None
+        assert list(df.columns) == ["close"]
+        assert len(df) == 300
+        assert service.ohlcv_range("KRW-XRP", "day") is None
+
+    def test_date_range_over_all_tickers(self, service: DuckDBQueryService) -> None:
+        assert service.date_range("day") == (date(2023, 1, 1), date(2023, 10, 27))
+        assert service.date_range("minute60") == (None, None)
+
+    def test_cross_ticker_summary(
+        self, service: DuckDBQueryService, raw: dict[str, pd.DataFrame]
+    ) -> None:
+        summary = service.cross_ticker_summary("day", start=date(2023, 6, 1)).set_index("ticker")
+
+        for ticker, df in raw.items():
+            window = df.loc["2023-06-01":]
+            row = summary.loc[ticker]
+            assert row["bars"] == len(window)
+            assert row["total_return"] == pytest.approx(
+                window["close"].iloc[-1] / window["close"].iloc[0] - 1
+            )
+            assert row["volatility"] == pytest.approx(
+                np.log(window["close"]).diff().std(), rel=1e-9
+            )
+
+    def test_views_pick_up_new_files(self, service: DuckDBQueryService, tmp_path: Path) -> None:
+        assert service.intervals() == ["day"]
+
+        generate_ohlcv_data(periods=10, start_date="2024-01-01", seed=3).to_parquet(
+            tmp_path / "raw" / "KRW-XRP_week.parquet"
+        )
+
+        assert service.intervals() == ["day", "week"]
+        assert service.date_range("week") == (date(2024, 1, 1), date(2024, 1, 10))
+
+    def test_concurrent_queries_share_pool(self, service: DuckDBQueryService) -> None:
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            sizes = list(
+                pool.map(lambda _: len(service.close_matrix("day", ["KRW-BTC"])), range(8))
+            )
+
+        assert sizes == [300] * 8
+
+
+class TestResultAndTradeQueries:
+    """Tests for backtest result and trade analytics queries."""
+
+    def test_latest_backtest_results(self, service: DuckDBQueryService, tmp_path: Path) -> None:
+        from src.backtester.results_table import write_results_table
+
+        for run_date, value in (("20240101", 0.1), ("20240102", 0.2)):
+            write_results_table(
+                [{"symbol": "KRW-BTC", "strategy": "vbo", "param_set": "default", "cagr": value}],
+                tmp_path / "results",
+                run_date,
+            )
+
+        latest = service.backtest_results(strategy="vbo", latest_only=True)
+
+        assert latest["run_date"].tolist() == ["20240102"]
+        assert latest["cagr"].tolist() == [0.2]
+        assert len(service.backtest_results(since="20240101")) == 2
+
+    def test_trade_summary_from_csv(self, service: DuckDBQueryService, tmp_path: Path) -> None:
+        trades = pd.DataFrame(
+            {
+                "ticker": ["KRW-BTC", "KRW-BTC", "KRW-ETH"],
+                "entry_date": pd.to_datetime(["2024-01-01", "2024-01-05", "2024-02-01"]),
+                "exit_date": pd.to_datetime(["2024-01-03", "2024-01-06", None]),
+                "pnl": [10.0, -5.0, None],
+                "pnl_pct": [1.0, -0.5, None],
+            }
+        )
+        path = tmp_path / "trades.csv"
+        trades.to_csv(path, index=False)
+
+        by_ticker = service.trade_summary(path).set_index("ticker")
+        by_month = service.trade_summary(trades, by="month")
+
+        btc = by_ticker.loc["KRW-BTC"]
+        assert (btc["trades"], btc["closed"], btc["wins"]) == (2, 2, 1)
+        assert btc["win_rate"] == pytest.approx(50.0)
+        assert btc["profit_factor"] == pytest.approx(2.0)
+        assert btc["avg_holding_days"] == pytest.approx(1.5)
+        assert by_month["month"].tolist() == ["2024-01", "2024-02"]
@@ -0,0 +1,78 @@
+"""Tests for GCSStorage bot log retrieval and local cache."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+from src.data.storage import GCSStorage
+from tests.fixtures.fake_gcs import FakeClient
+
+PREFIX = "logs/Main/trades_"
+
+
+def _day(days_ago: int) -> str:
+    return (datetime.now() - timedelta(days=days_ago)).strftime("%Y-%m-%d")
+
+
+@pytest.fixture
+def client() -> FakeClient:
+    fake = FakeClient()
+    bucket = fake.bucket("test-bucket")
+    for days_ago in (0, 3, 4):
+        bucket.upload(f"{PREFIX}{_day(days_ago)}.csv", f"ticker,pnl\nKRW-BTC,{days_ago}\n")
+    bucket.upload(f"{PREFIX}{_day(40)}.csv", "ticker,pnl\nKRW-BTC,1\n")
+    return fake
+
+
+@pytest.fixture
+def storage(client: FakeClient, tmp_path: Path) -> GCSStorage:
+    return GCSStorage(bucket_name="test-bucket", cache_dir=tmp_path, client=client)
+
+
+class TestGetBotLogsBatch:
+    """Tests for batched multi-date log fetch."""
+
+    def test_single_listing_bounded_to_range(self, storage: GCSStorage, client: FakeClient) -> None:
+        dates = [_day(i) for i in range(5)]
+        logs = storage.get_bot_logs_batch(dates)
+
+        assert list(logs) == sorted(dates)
+        assert logs[_day(3)]["pnl"].tolist() == [3]
+        assert logs[_day(1)].empty
+        assert len(client.list_calls) == 1
+        # The 40-day-old log is outside the listed range and never downloaded
+        assert client.bucket("test-bucket").downloads[f"{PREFIX}{_day(40)}.csv"] == 0
+
+    def test_settled_days_never_refetched(self, storage: GCSStorage, client: FakeClient) -> None:
+        bucket = client.bucket("test-bucket")
+        storage.get_bot_logs_batch([_day(3), _day(4)])
+        client.list_calls.clear()
+
+        logs = storage.get_bot_logs_batch([_day(3), _day(4)])
+
+        assert logs[_day(4)]["pnl"].tolist() == [4]
+        assert client.list_calls == []
+        assert bucket.downloads[f"{PREFIX}{_day(3)}.csv"] == 1
+
+    def test_today_revalidated_by_generation(self, storage: GCSStorage, client: FakeClient) -> None:
+        bucket = client.bucket("test-bucket")
+        name = f"{PREFIX}{_day(0)}.csv"
+
+        storage.get_bot_logs_batch([_day(0)])
+        storage.get_bot_logs_batch([_day(0)])
+        assert bucket.downloads[name] == 1  # unchanged generation: served from cache
+
+        bucket.upload(name, "ticker,pnl\nKRW-BTC,0\nKRW-ETH,5\n")
+        logs = storage.get_bot_logs_batch([_day(0)])
+
+        assert bucket.downloads[name] == 2
+        assert logs[_day(0)]["pnl"].tolist() == [0, 5]
+
+    def test_single_date_shares_cache(self, storage: GCSStorage, client: FakeClient) -> None:
+        storage.get_bot_logs_batch([_day(3)])
+        assert storage.get_bot_logs(_day(3))["pnl"].tolist() == [3]
+        assert storage.get_bot_logs(_day(2)).empty
+        assert client.bucket("test-bucket").downloads[f"{PREFIX}{_day(3)}.csv"] == 1
@@ -0,0 +1,116 @@
+"""
+Unit tests for MarketDataCache.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.exchange import IntradayBar, MarketDataCache
+
+
+class TestMarketDataCache:
+    """Test cases for MarketDataCache."""
+
+    def test_ticks_build_intraday_bar(self) -> None:
+        """Test the running bar tracks open/high/low/close/volume."""
+        cache = MarketDataCache()
+        for price, volume in ((100.0, 1.0), (105.0, 2.0), (95.0, 1.5), (101.0, 0.5)):
+            cache.update("KRW-BTC", price, volume=volume)
+
+        assert cache.get_last_price("KRW-BTC") == 101.0
+        assert cache.get_intraday_bar("KRW-BTC") == IntradayBar(100.0, 105.0, 95.0, 101.0, 5.0)
+        assert cache.get_intraday_bar("KRW-ETH") is None
+
+    def test_on_ticker_uses_exchange_day_values(self) -> None:
+        """Test WebSocket messages seed the bar with the exchange day's values."""
+        cache = MarketDataCache()
+        cache.on_ticker(
+            {
+                "type": "ticker",
+                "code": "KRW-BTC",
+                "trade_price": 100.0,
+                "opening_price": 90.0,
+                "high_price": 110.0,
+                "low_price": 85.0,
+                "acc_trade_volume": 12.5,
+            }
+        )
+        cache.on_ticker({"code": "KRW-BTC", "trade_price": 112.0})
+
+        bar = cache.get_intraday_bar("KRW-BTC")
+        assert bar == IntradayBar(90.0, 112.0, 85.0, 112.0, 12.5)
+
+    def test_stale_entries_ignored(self) -> None:
+        """Test entries older than max_age_seconds are treated as unknown."""
+        cache = MarketDataCache(max_age_seconds=5.0)
+        with patch("src.exchange.market_data_cache.time.monotonic", return_value=0.0):
+            cache.update("KRW-BTC", 100.0)
+        with patch("src.exchange.market_data_cache.time.monotonic", return_value=10.0):
+            assert cache.get_last_price("KRW-BTC") is None
+            assert cache.get_intraday_bar("KRW-BTC") is None
+
+    def test_get_current_price_falls_back_to_rest(self) -> None:
+        """Test PriceService access only calls REST on a miss."""
+        fallback = MagicMock()
+        fallback.get_current_price.return_value = 50.0
+        cache = MarketDataCache(fallback=fallback)
+        cache.update("KRW-BTC", 100.0)
+
+        assert cache.get_current_price("KRW-BTC") == 100.0
+        assert cache.get_current_price("KRW-ETH") == 50.0
+        fallback.get_current_price.assert_called_once_with("KRW-ETH")
+        with pytest.raises(KeyError):
+            MarketDataCache().get_current_price("KRW-BTC")
+
+    def test_reset_bars_starts_from_last_price(self) -> None:
+        """Test the daily reset starts new bars at the last price."""
+        cache = MarketDataCache()
+        cache.update("KRW-BTC", 100.0, volume=1.0)
+        cache.update("KRW-BTC", 120.0, volume=1.0)
+
+        cache.reset_bars()
+
+        assert cache.get_intraday_bar("KRW-BTC") == IntradayBar(120.0, 120.0, 120.0, 120.0, 0.0)
+
+
+class TestLiveMarketDataConsumers:
+    """Test cases for call sites reading the cache instead of REST."""
+
+    def test_check_advanced_orders_uses_cached_bar(self) -> None:
+        """Test advanced orders use the cached low/high without a candle request."""
+        from src.execution.trade_executor_orders import check_advanced_orders
+
+        cache = MarketDataCache()
+        cache.update("KRW-BTC", 100.0)
+        cache.update("KRW-BTC", 90.0)
+        signal_handler = MagicMock()
+        advanced = MagicMock()
+        advanced.check_orders.return_value = []
+
+        triggered = check_advanced_orders(
+            "KRW-BTC", 90.0, MagicMock(), MagicMock(), advanced, signal_handler, {}, cache
+        )
+
+        assert triggered is False
+        signal_handler.get_ohlcv_data.assert_not_called()
+        assert advanced.check_orders.call_args.kwargs["low_price"] == 90.0
+        assert advanced.check_orders.call_args.kwargs["high_price"] == 100.0
+
+    def test_managers_read_cached_price(self) -> None:
+        """Test PositionManager/OrderManager prices come from the cache."""
+        from src.execution.order_manager import OrderManager
+        from src.execution.position_manager import PositionManager
+
+        exchange = MagicMock()
+        cache = MarketDataCache()
+        cache.update("KRW-BTC", 100.0)
+
+        positions = PositionManager(exchange, publish_events=False, market_data=cache)
+        positions.add_position("KRW-BTC", entry_price=80.0, amount=2.0)
+        orders = OrderManager(exchange, publish_events=False, market_data=cache)
+        orders.place_sell_order("KRW-BTC", 2.0, min_order_amount=150.0)
+
+        assert positions.calculate_pnl("KRW-BTC") == pytest.approx(40.0)
+        exchange.get_current_price.assert_not_called()
+        exchange.sell_market_order.assert_called_once_with("KRW-BTC", 2.0)
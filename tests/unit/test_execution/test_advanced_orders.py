@@ -748,3 +748,56 @@ class TestUpdateTrailingStopHigh:
         # highest_price should be updated, but stop_loss_price shouldn't change
         assert order.highest_price == 55000.0
         assert order.stop_loss_price is None  # Not updated due to None trailing_stop_pct
+
+
+class TestTickerIndex:
+    """Test the per-ticker index and archive of finished orders."""
+
+    def test_finished_orders_move_to_bounded_archive(self, sample_date: date) -> None:
+        """Test triggered and cancelled orders leave the active set and the archive is capped."""
+        manager = AdvancedOrderManager(archive_size=2)
+        orders = [
+            manager.create_stop_loss("KRW-BTC", 100.0, sample_date, 1.0, stop_loss_price=90.0)
+            for _ in range(3)
+        ]
+
+        manager.check_orders("KRW-BTC", 95.0, sample_date, low_price=85.0)
+        assert manager.orders == {}
+        assert list(manager.archive) == [orders[1].order_id, orders[2].order_id]
+        assert manager.get_order(orders[2].order_id) is orders[2]
+        assert manager.cancel_order(orders[2].order_id) is True
+
+        # IDs stay unique after pruning
+        new = manager.create_stop_loss("KRW-BTC", 100.0, sample_date, 1.0, stop_loss_pct=0.1)
+        assert new.order_id not in {o.order_id for o in orders}
+
+    def test_check_orders_matches_per_order_handlers(self, sample_date: date) -> None:
+        """Test vectorized checks trigger the same orders at the same levels as the handlers."""
+        manager = AdvancedOrderManager()
+        manager.create_stop_loss("KRW-BTC", 100.0, sample_date, 1.0, stop_loss_price=90.0)
+        tp = manager.create_take_profit("KRW-BTC", 100.0, sample_date, 1.0, take_profit_pct=0.2)
+        ts = manager.create_trailing_stop("KRW-BTC", 100.0, sample_date, 1.0, 0.1)
+        eth = manager.create_stop_loss("KRW-ETH", 100.0, sample_date, 1.0, stop_loss_price=99.0)
+
+        assert manager.check_orders("KRW-BTC", 110.0, sample_date, 105.0, 115.0) == []
+        assert ts.highest_price == 115.0
+        assert ts.stop_loss_price == pytest.approx(103.5)
+
+        triggered = manager.check_orders("KRW-BTC", 101.0, sample_date, 100.0, 121.0)
+
+        # Trailing stop raised to 108.9 and hit; take profit hit; fixed stop untouched
+        assert triggered == [tp, ts]
+        assert tp.triggered_price == pytest.approx(120.0)
+        assert ts.triggered_price == pytest.approx(108.9)
+        assert [o.order_type for o in manager.get_active_orders("KRW-BTC")] == [OrderType.STOP_LOSS]
+        assert eth.is_active is True
+
+    def test_externally_cancelled_order_is_not_triggered(self, sample_date: date) -> None:
+        """Test orders deactivated directly on the object are pruned, not reported."""
+        manager = AdvancedOrderManager()
+        order = manager.create_stop_loss("KRW-BTC", 100.0, sample_date, 1.0, stop_loss_price=90.0)
+        order.is_active = False
+
+        assert manager.check_orders("KRW-BTC", 80.0, sample_date) == []
+        assert order.is_triggered is False
+        assert order.order_id in manager.archive
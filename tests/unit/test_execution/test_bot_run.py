@@ -2,15 +2,12 @@
 Tests for bot run execution logic.
 """
 
-import datetime
 import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from src.execution.bot.bot_run import (
-    DAILY_RESET_WINDOW_SECONDS,
-    _is_daily_reset_time,
     _should_block_in_test,
     _validate_api_connection,
     run_trading_loop,
@@ -122,46 +119,6 @@ class TestValidateApiConnection:
         mock_sleep.assert_called_once_with(3)
 
 
-class TestIsDailyResetTime:
-    """Tests for _is_daily_reset_time function."""
-
-    def test_exact_reset_time(self) -> None:
-        """Test exact reset time detection."""
-        now = datetime.datetime(2023, 1, 1, 9, 0, 5)  # 9:00:05
-        result = _is_daily_reset_time(now, reset_hour=9, reset_minute=0)
-        assert result is True
-
-    def test_within_window(self) -> None:
-        """Test time within reset window."""
-        now = datetime.datetime(2023, 1, 1, 9, 0, DAILY_RESET_WINDOW_SECONDS - 1)
-        result = _is_daily_reset_time(now, reset_hour=9, reset_minute=0)
-        assert result is True
-
-    def test_outside_window_seconds(self) -> None:
-        """Test time outside reset window (seconds)."""
-        now = datetime.datetime(2023, 1, 1, 9, 0, DAILY_RESET_WINDOW_SECONDS + 1)
-        result = _is_daily_reset_time(now, reset_hour=9, reset_minute=0)
-        assert result is False
-
-    def test_wrong_hour(self) -> None:
-        """Test wrong hour."""
-        now = datetime.datetime(2023, 1, 1, 10, 0, 0)
-        result = _is_daily_reset_time(now, reset_hour=9, reset_minute=0)
-        assert result is False
-
-    def test_wrong_minute(self) -> None:
-        """Test wrong minute."""
-        now = datetime.datetime(2023, 1, 1, 9, 1, 0)
-        result = _is_daily_reset_time(now, reset_hour=9, reset_minute=0)
-        assert result is False
-
-    def test_custom_reset_time(self) -> None:
-        """Test custom reset time."""
-        now = datetime.datetime(2023, 1, 1, 15, 30, 5)
-        result = _is_daily_reset_time(now, reset_hour=15, reset_minute=30)
-        assert result is True
-
-
 class TestRunTradingLoop:
     """Tests for run_trading_loop function."""
 
@@ -223,12 +180,3 @@ class TestRunTradingLoop:
         mock_bot_facade.initialize_targets.assert_called_once()
         mock_bot_facade.check_existing_holdings.assert_called_once()
         mock_main_loop.assert_called_once()
-
-
-class TestDailyResetWindowSeconds:
-    """Tests for DAILY_RESET_WINDOW_SECONDS constant."""
-
-    def test_constant_value(self) -> None:
-        """Test that constant has expected value."""
-        assert DAILY_RESET_WINDOW_SECONDS == 10
-        assert isinstance(DAILY_RESET_WINDOW_SECONDS, int)
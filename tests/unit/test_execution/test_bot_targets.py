@@ -0,0 +1,242 @@
+"""Tests for concurrent target calculation and the non-blocking daily reset."""
+
+import datetime
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.exchange.rate_limiter import RateLimiter
+from src.execution.bot.bot_facade import TARGET_REFRESH_RETRY_SECONDS, TradingBotFacade
+from src.execution.bot.bot_targets import compute_targets
+
+
+def _metrics(target: float) -> dict[str, float]:
+    return {"target": target, "k": 0.5, "long_noise": 0.5, "sma": 1.0, "sma_trend": 1.0}
+
+
+class TestRateLimiter:
+    """Tests for the shared token bucket."""
+
+    def test_burst_then_throttle(self) -> None:
+        """Test requests beyond the burst wait for the sustained rate."""
+        limiter = RateLimiter(rate=50.0, burst=2)
+
+        assert limiter.acquire() == 0.0
+        assert limiter.acquire() == 0.0
+        start = time.monotonic()
+        assert limiter.acquire() > 0.0
+        assert time.monotonic() - start >= 0.015
+
+    def test_invalid_rate(self) -> None:
+        """Test non-positive rates are rejected."""
+        with pytest.raises(ValueError, match="rate must be positive"):
+            RateLimiter(rate=0)
+
+
+class TestComputeTargets:
+    """Tests for compute_targets."""
+
+    def test_runs_tickers_concurrently_in_order(self) -> None:
+        """Test tickers overlap in time and results keep ticker order."""
+        barrier = threading.Barrier(3, timeout=5)
+        handler = MagicMock()
+
+        def calculate(ticker: str, period: int) -> dict[str, float]:
+            barrier.wait()  # Deadlocks (times out) unless all three run at once
+            return _metrics(float(len(ticker)))
+
+        handler.calculate_metrics.side_effect = calculate
+        tickers = ["KRW-BTC", "KRW-ETH", "KRW-XRPX"]
+
+        refresh = compute_targets(tickers, handler, 20, retry_delay=0.0, max_workers=3)
+
+        assert list(refresh.targets) == tickers
+        assert [t.ticker for t in refresh.timings] == tickers
+        assert all(t.ok and t.attempts == 1 for t in refresh.timings)
+
+    def test_retries_and_failures_are_reported(self) -> None:
+        """Test a retried ticker succeeds and a failing one is reported, not raised."""
+        handler = MagicMock()
+        calls: dict[str, int] = {}
+
+        def calculate(ticker: str, period: int) -> dict[str, float] | None:
+            calls[ticker] = calls.get(ticker, 0) + 1
+            if ticker == "KRW-BAD":
+                raise ConnectionError("timeout")
+            return _metrics(1.0) if calls[ticker] > 1 else None
+
+        handler.calculate_metrics.side_effect = calculate
+        limiter = MagicMock()
+
+        refresh = compute_targets(
+            ["KRW-BTC", "KRW-BAD"], handler, 20, retry_delay=0.0, rate_limiter=limiter
+        )
+
+        assert list(refresh.targets) == ["KRW-BTC"]
+        assert refresh.timings[0].attempts == 2
+        assert refresh.failed == ["KRW-BAD"]
+        assert refresh.timings[1].error == "ConnectionError: timeout"
+        assert limiter.acquire.call_count == 2 + 3
+        assert "failed: KRW-BAD" in refresh.summary()
+
+
+class TestStartDailyReset:
+    """Tests for the background daily reset."""
+
+    @staticmethod
+    def _bot(targets: dict[str, dict[str, float]]) -> TradingBotFacade:
+        bot = TradingBotFacade.__new__(TradingBotFacade)
+        for component in (
+            "market_data",
+            "position_manager",
+            "order_manager",
+            "advanced_order_manager",
+            "signal_handler",
+            "telegram",
+        ):
+            setattr(bot, component, MagicMock())
+        bot.trading_config = {}
+        bot.bot_config = {"daily_reset_hour": 9, "daily_reset_minute": 0}
+        bot._reset_thread = None
+        bot._reset_date = None
+        bot._refresh_failed_at = None
+        bot.target_info = targets
+        # Targets from the previous trading date
+        bot.target_date = bot.trading_date() - datetime.timedelta(days=1)
+        return bot
+
+    def test_old_targets_serve_until_swap(self) -> None:
+        """Test target_info is replaced only once the new set is complete."""
+        old_targets = {"KRW-BTC": _metrics(100.0)}
+        bot = self._bot(old_targets)
+        release = threading.Event()
+
+        def recalculate(_: TradingBotFacade) -> dict[str, dict[str, float]]:
+            release.wait(5)
+            return {"KRW-BTC": _metrics(200.0)}
+
+        with (
+            patch("src.execution.bot.bot_reset.process_exits") as process_exits,
+            patch("src.execution.bot.bot_reset.recalculate_targets", side_effect=recalculate),
+        ):
+            thread = bot.start_daily_reset()
+            assert thread is not None
+            assert bot.start_daily_reset() is None  # Already running
+            assert bot.target_info is old_targets
+            assert not bot.targets_current()
+
+            release.set()
+            thread.join(5)
+
+        process_exits.assert_called_once_with(bot)
+        bot.market_data.reset_bars.assert_called_once()
+        assert bot.target_info["KRW-BTC"]["target"] == 200.0
+        assert bot.targets_current()
+
+    def test_failed_refresh_keeps_entries_blocked(self) -> None:
+        """Test yesterday's targets are never used for entries after a failed refresh."""
+        bot = self._bot({"KRW-BTC": _metrics(100.0)})
+
+        with (
+            patch("src.execution.bot.bot_reset.process_exits"),
+            patch(
+                "src.execution.bot.bot_reset.recalculate_targets",
+                side_effect=RuntimeError("API down"),
+            ),
+        ):
+            thread = bot.start_daily_reset()
+            assert thread is not None
+            thread.join(5)
+
+        assert not bot.targets_current()
+        with patch("src.execution.trade_executor.process_ticker_update") as process:
+            bot.process_ticker_update("KRW-BTC", 150.0)
+        assert process.call_args.kwargs["allow_entry"] is False
+
+    def test_missed_reset_window_starts_on_next_tick(self) -> None:
+        """Test stale targets start the full reset whenever the next tick arrives."""
+        bot = self._bot({"KRW-BTC": _metrics(100.0)})
+
+        with (
+            patch("src.execution.bot.bot_reset.process_exits") as process_exits,
+            patch(
+                "src.execution.bot.bot_reset.recalculate_targets",
+                return_value={"KRW-BTC": _metrics(200.0)},
+            ),
+        ):
+            thread = bot.ensure_current_targets()
+            assert thread is not None
+            thread.join(5)
+            assert bot.ensure_current_targets() is None  # Targets are current again
+
+        process_exits.assert_called_once_with(bot)
+        assert bot.target_info["KRW-BTC"]["target"] == 200.0
+        assert bot.targets_current()
+
+    def test_raising_refresh_is_retried_after_backoff(self) -> None:
+        """Test a failed refresh is retried (without re-running exits) once the backoff passes."""
+        bot = self._bot({"KRW-BTC": _metrics(100.0)})
+        recalculate = MagicMock(
+            side_effect=[RuntimeError("API down"), {"KRW-BTC": _metrics(200.0)}]
+        )
+
+        with (
+            patch("src.execution.bot.bot_reset.process_exits") as process_exits,
+            patch("src.execution.bot.bot_reset.recalculate_targets", recalculate),
+        ):
+            thread = bot.ensure_current_targets()
+            assert thread is not None
+            thread.join(5)
+            assert not bot.targets_current()
+            assert bot.ensure_current_targets() is None  # Backing off
+
+            assert bot._refresh_failed_at is not None
+            bot._refresh_failed_at -= TARGET_REFRESH_RETRY_SECONDS
+            retry = bot.ensure_current_targets()
+            assert retry is not None
+            retry.join(5)
+
+        process_exits.assert_called_once_with(bot)
+        assert recalculate.call_count == 2
+        assert bot.targets_current()
+        assert bot.target_info["KRW-BTC"]["target"] == 200.0
+
+    def test_trading_date_rolls_over_at_reset_time(self) -> None:
+        """Test the trading date changes at the configured reset time, not midnight."""
+        bot = self._bot({})
+
+        assert bot.trading_date(datetime.datetime(2024, 1, 2, 8, 59)) == datetime.date(2024, 1, 1)
+        assert bot.trading_date(datetime.datetime(2024, 1, 2, 9, 0)) == datetime.date(2024, 1, 2)
+
+
+class TestEntryBlocking:
+    """Tests for exit-only tick handling while targets are stale."""
+
+    def test_blocked_tick_skips_entry_signal(self) -> None:
+        """Test allow_entry=False never evaluates or places an entry."""
+        from src.execution.trade_executor import process_ticker_update
+
+        position_manager = MagicMock()
+        position_manager.has_position.return_value = False
+        signal_handler = MagicMock()
+        execute_buy = MagicMock()
+
+        process_ticker_update(
+            "KRW-BTC",
+            150.0,
+            position_manager,
+            MagicMock(),
+            MagicMock(),
+            signal_handler,
+            {},
+            {"KRW-BTC": _metrics(100.0)},
+            MagicMock(),
+            calculate_buy_amount_fn=lambda: 10_000.0,
+            execute_buy_fn=execute_buy,
+            allow_entry=False,
+        )
+
+        signal_handler.check_entry_signal.assert_not_called()
+        execute_buy.assert_not_called()
@@ -2,12 +2,16 @@
 Unit tests for EventBus.
 """
 
+import threading
 from unittest.mock import MagicMock, patch
 
-from src.execution.event_bus import EventBus, get_event_bus, set_event_bus
+import pytest
+
+from src.execution.event_bus import EventBus, Priority, get_event_bus, set_event_bus
 from src.execution.events import (
     Event,
     EventType,
+    MarketEvent,
     OrderEvent,
     PositionEvent,
     SignalEvent,
@@ -398,3 +402,143 @@ class TestGetEventBus:
 
         assert bus is not custom_bus
         assert isinstance(bus, EventBus)
+
+
+class TestBestEffortDispatch:
+    """Test cases for queued best-effort handlers."""
+
+    def test_runs_inline_until_started(self) -> None:
+        """Test best-effort handlers stay synchronous while the bus is not started."""
+        bus = EventBus()
+        handler = MagicMock()
+        bus.subscribe(EventType.ORDER_PLACED, handler, priority=Priority.BEST_EFFORT)
+
+        bus.publish(OrderEvent(event_type=EventType.ORDER_PLACED))
+
+        handler.assert_called_once()
+
+    def test_slow_handler_does_not_block_publish(self) -> None:
+        """Test critical handlers run inline while a blocked best-effort one is queued."""
+        bus = EventBus()
+        release = threading.Event()
+        notified: list[Event] = []
+        critical = MagicMock()
+
+        def slow_notify(event: Event) -> None:
+            release.wait(5)
+            notified.append(event)
+
+        bus.subscribe(EventType.ORDER_PLACED, critical)
+        bus.subscribe(
+            EventType.ORDER_PLACED, slow_notify, priority=Priority.BEST_EFFORT, queue="telegram"
+        )
+        bus.start()
+        try:
+            event = OrderEvent(event_type=EventType.ORDER_PLACED, order_id="o1")
+            bus.publish(event)
+
+            critical.assert_called_once_with(event)
+            assert notified == []
+
+            release.set()
+            assert bus.flush(timeout=5)
+            assert notified == [event]
+            assert bus.queue_stats()["telegram"].processed == 1
+        finally:
+            bus.stop()
+
+    def test_price_updates_coalesced_and_dropped_under_backpressure(self) -> None:
+        """Test pending price updates merge per ticker and give way to other events."""
+        bus = EventBus(queue_size=2)
+        release = threading.Event()
+        started = threading.Event()
+        seen: list[tuple[EventType, float]] = []
+
+        def handler(event: Event) -> None:
+            started.set()
+            release.wait(5)
+            seen.append((event.event_type, getattr(event, "price", 0.0)))
+
+        bus.subscribe(None, handler, priority=Priority.BEST_EFFORT)
+        bus.start()
+        try:
+            bus.publish(OrderEvent(event_type=EventType.ORDER_PLACED, price=1.0))
+            assert started.wait(5)  # Worker busy with the first event
+
+            for price in (10.0, 11.0, 12.0):
+                bus.publish(
+                    MarketEvent(event_type=EventType.PRICE_UPDATE, ticker="BTC", price=price)
+                )
+            bus.publish(OrderEvent(event_type=EventType.ORDER_FILLED, price=2.0))
+            stats = bus.queue_stats()["default"]
+            assert (stats.depth, stats.coalesced, stats.dropped) == (2, 2, 0)
+
+            # Queue full: the pending price update is evicted for the order event
+            bus.publish(OrderEvent(event_type=EventType.ORDER_FAILED, price=3.0))
+            bus.publish(MarketEvent(event_type=EventType.PRICE_UPDATE, ticker="ETH", price=5.0))
+            assert bus.queue_stats()["default"].dropped == 2
+
+            release.set()
+            assert bus.flush(timeout=5)
+        finally:
+            bus.stop()
+
+        assert seen == [
+            (EventType.ORDER_PLACED, 1.0),
+            (EventType.ORDER_FILLED, 2.0),
+            (EventType.ORDER_FAILED, 3.0),
+        ]
+
+    def test_fresh_price_update_evicts_stale_one_when_full(self) -> None:
+        """Test a price update for another ticker replaces the oldest pending one."""
+        bus = EventBus(queue_size=2)
+        release = threading.Event()
+        started = threading.Event()
+        seen: list[tuple[EventType, str]] = []
+
+        def handler(event: Event) -> None:
+            started.set()
+            release.wait(5)
+            seen.append((event.event_type, getattr(event, "ticker", "")))
+
+        bus.subscribe(None, handler, priority=Priority.BEST_EFFORT)
+        bus.start()
+        try:
+            bus.publish(OrderEvent(event_type=EventType.ORDER_PLACED))
+            assert started.wait(5)  # Worker busy with the first event
+
+            bus.publish(MarketEvent(event_type=EventType.PRICE_UPDATE, ticker="BTC", price=1.0))
+            bus.publish(OrderEvent(event_type=EventType.ORDER_FILLED))
+            bus.publish(MarketEvent(event_type=EventType.PRICE_UPDATE, ticker="ETH", price=2.0))
+            stats = bus.queue_stats()["default"]
+            assert (stats.depth, stats.dropped) == (2, 1)
+
+            release.set()
+            assert bus.flush(timeout=5)
+        finally:
+            bus.stop()
+
+        assert seen == [
+            (EventType.ORDER_PLACED, ""),
+            (EventType.ORDER_FILLED, ""),
+            (EventType.PRICE_UPDATE, "ETH"),
+        ]
+
+    def test_queue_depth_exported_to_metrics(self) -> None:
+        """Test TradingMetrics reads queue counters at scrape time."""
+        pytest.importorskip("prometheus_client")
+        from src.monitoring.metrics import TradingMetrics
+
+        bus = EventBus()
+        bus.subscribe(EventType.ERROR, MagicMock(), priority=Priority.BEST_EFFORT, queue="alerts")
+        metrics = TradingMetrics(prefix="event_bus_test")
+        metrics.attach_event_bus(bus)
+
+        bus._queues["alerts"].put(MagicMock(), Event(event_type=EventType.ERROR))
+
+        assert (
+            metrics.registry.get_sample_value(
+                "event_bus_test_event_queue_depth", {"queue": "alerts"}
+            )
+            == 1
+        )
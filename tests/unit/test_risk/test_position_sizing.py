@@ -12,7 +12,10 @@ from src.risk.position_sizing import (
     _inverse_volatility_sizing,
     _volatility_based_sizing,
     calculate_multi_asset_position_sizes,
+    calculate_multi_asset_position_sizes_from_volatility,
     calculate_position_size,
+    calculate_position_size_from_volatility,
+    rolling_volatility,
 )
 
 
@@ -453,3 +456,71 @@ class TestCalculateMultiAssetPositionSizes:
         assert sizes["ETH"] < 5000.0  # Should be scaled down from 5000.0 due to normalization
         assert sizes["BTC"] > 0
         assert sum(sizes.values()) == pytest.approx(available_cash)
+
+
+class TestVolatilityArrayVariants:
+    """Array-based sizing variants must match the DataFrame-based ones."""
+
+    def test_rolling_volatility_matches_tail_std(
+        self, sample_historical_data: pd.DataFrame
+    ) -> None:
+        vol = rolling_volatility(sample_historical_data["close"], 20)
+        assert vol.iloc[:19].isna().all()
+        for i in (19, 50, 99):
+            expected = sample_historical_data.iloc[: i + 1].tail(20)["close"].pct_change().std()
+            assert vol.iloc[i] == pytest.approx(expected)
+
+    @pytest.mark.parametrize("method", ["volatility", "fixed-risk", "inverse-volatility"])
+    def test_single_asset_matches(self, method: str, sample_historical_data: pd.DataFrame) -> None:
+        volatility = float(rolling_volatility(sample_historical_data["close"], 20).iloc[-1])
+        expected = calculate_position_size(
+            method,  # type: ignore[arg-type]
+            10000.0,
+            2,
+            "BTC",
+            100.0,
+            sample_historical_data,
+            target_risk_pct=0.01,
+        )
+        actual = calculate_position_size_from_volatility(
+            method,  # type: ignore[arg-type]
+            10000.0,
+            2,
+            100.0,
+            volatility,
+            target_risk_pct=0.01,
+        )
+        assert actual == pytest.approx(expected)
+
+    def test_nan_volatility_falls_back_to_equal(self) -> None:
+        size = calculate_position_size_from_volatility("fixed-risk", 10000.0, 4, 100.0, np.nan)
+        assert size == pytest.approx(2500.0)
+
+    @pytest.mark.parametrize("method", ["inverse-volatility", "fixed-risk"])
+    def test_multi_asset_matches(self, method: str, sample_historical_data: pd.DataFrame) -> None:
+        calm = sample_historical_data
+        wild = calm.assign(close=calm["close"] * (1 + np.random.randn(100) * 0.05))
+        historical = {"BTC": calm, "ETH": wild, "XRP": calm.head(5)}
+        volatilities = {
+            ticker: float(rolling_volatility(df["close"], 20).iloc[-1])
+            for ticker, df in historical.items()
+        }
+        prices = {"BTC": 100.0, "ETH": 50.0, "XRP": 1.0}
+
+        expected = calculate_multi_asset_position_sizes(
+            method,  # type: ignore[arg-type]
+            10000.0,
+            list(historical),
+            prices,
+            historical,
+            target_risk_pct=0.01,
+        )
+        actual = calculate_multi_asset_position_sizes_from_volatility(
+            method,  # type: ignore[arg-type]
+            10000.0,
+            list(historical),
+            prices,
+            volatilities,
+            target_risk_pct=0.01,
+        )
+        assert actual == pytest.approx(expected)
@@ -0,0 +1,92 @@
+"""Tests for the rolling portfolio risk engine."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.risk.metrics import PortfolioRiskMetrics
+from src.risk.metrics_portfolio import calculate_position_concentration
+from src.risk.metrics_var import calculate_cvar, calculate_var
+from src.risk.rolling_risk import RollingRiskEngine, calculate_rolling_risk
+
+TICKERS = ["KRW-BTC", "KRW-ETH", "KRW-XRP"]
+N_DATES = 120
+
+
+def _returns(seed: int = 5) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    common = rng.normal(0, 0.02, (N_DATES, 1))
+    return common + rng.normal(0, 0.01, (N_DATES, len(TICKERS)))
+
+
+class TestRollingRiskEngine:
+    """Tests for RollingRiskEngine."""
+
+    def test_covariance_matches_pandas_ewm(self) -> None:
+        """Test incremental updates equal pandas' EW covariance and correlation."""
+        returns = _returns()
+        engine = RollingRiskEngine(TICKERS, halflife=20.0)
+        for row in returns:
+            engine.update(row, float(row.mean()))
+
+        ewm = pd.DataFrame(returns, columns=TICKERS).ewm(alpha=engine.alpha, adjust=False)
+        expected_cov = ewm.cov(bias=True).loc[N_DATES - 1].to_numpy()
+        std = np.sqrt(np.diag(expected_cov))
+        expected_corr = expected_cov / np.outer(std, std)
+
+        np.testing.assert_allclose(engine.covariance(), expected_cov, rtol=1e-10)
+        np.testing.assert_allclose(engine.correlation(), expected_corr, rtol=1e-10)
+        pairs = expected_corr[np.triu_indices(len(TICKERS), k=1)]
+        last = engine.snapshot()
+        assert last.avg_correlation == pytest.approx(pairs.mean())
+        assert last.max_correlation == pytest.approx(pairs.max())
+        assert last.min_correlation == pytest.approx(pairs.min())
+
+    def test_rolling_var_cvar_over_window(self) -> None:
+        """Test VaR/CVaR rows equal the historical helpers on the trailing window."""
+        returns = _returns()
+        portfolio = returns.mean(axis=1)
+
+        history = calculate_rolling_risk(TICKERS, returns, portfolio, var_window=60, min_periods=20)
+
+        assert len(history) == N_DATES
+        assert np.isnan(history.var_95[:19]).all()
+        for d in (19, 59, N_DATES - 1):
+            window = portfolio[max(0, d - 59) : d + 1]
+            assert history.var_95[d] == pytest.approx(calculate_var(window, 0.95))
+            assert history.var_99[d] == pytest.approx(calculate_var(window, 0.99))
+            assert history.cvar_95[d] == pytest.approx(calculate_cvar(window, 0.95))
+            assert history.cvar_99[d] == pytest.approx(calculate_cvar(window, 0.99))
+
+    def test_missing_returns_leave_other_pairs_unchanged(self) -> None:
+        """Test a not-yet-listed asset does not disturb the other assets' covariance."""
+        returns = _returns()
+        late = returns.copy()
+        late[:50, 2] = np.nan
+        full = RollingRiskEngine(TICKERS[:2])
+        partial = RollingRiskEngine(TICKERS)
+        for both, row in zip(returns[:, :2], late, strict=True):
+            full.update(both, 0.0)
+            partial.update(row, 0.0)
+
+        np.testing.assert_allclose(partial.covariance()[:2, :2], full.covariance())
+        assert partial.covariance()[2, 2] > 0
+
+    def test_concentration_and_snapshot(self) -> None:
+        """Test concentration matches the scalar helper and snapshot is a PortfolioRiskMetrics."""
+        engine = RollingRiskEngine(TICKERS, min_periods=5)
+        positions = np.array([300.0, 100.0, 0.0])
+        engine.update(np.zeros(len(TICKERS)), 0.0)
+        engine.update(np.full(len(TICKERS), 0.01), 0.01, positions, 1000.0)
+
+        snapshot = engine.snapshot()
+        max_pct, hhi = calculate_position_concentration(
+            dict(zip(TICKERS, positions, strict=True)), 1000.0
+        )
+
+        assert isinstance(snapshot, PortfolioRiskMetrics)
+        assert snapshot.max_position_pct == pytest.approx(max_pct)
+        assert snapshot.position_concentration == pytest.approx(hhi)
+        assert snapshot.avg_correlation is None
+        assert snapshot.var_95 == 0.0
+        assert np.isnan(engine.history().max_position_pct[0])
@@ -0,0 +1,130 @@
+"""Tests for compiled condition expressions."""
+
+import numpy as np
+import pandas as pd
+
+from src.backtester.engine.array_builder import (
+    EXPRESSION_COLUMNS,
+    build_numpy_arrays,
+    column_arrays,
+)
+from src.backtester.engine.data_loader import get_cache_params
+from src.strategies.expressions import (
+    all_of,
+    any_of,
+    canonical,
+    col,
+    compile_expression,
+    evaluate_frame,
+    expression_hash,
+)
+from src.strategies.volatility_breakout.vbo import StrictVBO
+
+
+def _frame(n: int = 50, seed: int = 11, dtype: type = np.float32) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 + rng.normal(0, 2, n).cumsum()
+    df = pd.DataFrame(
+        {
+            "open": close + rng.normal(0, 1, n),
+            "high": close + rng.uniform(0, 3, n),
+            "close": close,
+            "target": close + rng.normal(0, 1, n),
+            "sma": close + rng.normal(0, 1, n),
+            "short_noise": rng.uniform(0, 1, n),
+            "long_noise": rng.uniform(0, 1, n),
+            "prev_range": rng.uniform(0, 5, n),
+            "sma_trend": close + rng.normal(0, 1, n),
+        },
+        index=pd.date_range("2024-01-01", periods=n, freq="D"),
+    ).astype(dtype)
+    df.loc[df.index[:5], "sma"] = np.nan
+    return df
+
+
+class TestCanonicalHash:
+    """Tests for canonical forms and hashes."""
+
+    def test_equivalent_spellings_share_hash(self) -> None:
+        """Test mirrored comparisons and reordered/nested terms hash equally."""
+        a = all_of(col("high") >= col("target"), col("target") > col("sma"))
+        b = all_of(col("sma") < col("target"), all_of(col("target") <= col("high")))
+
+        assert canonical(a) == canonical(b)
+        assert expression_hash(a) == expression_hash(b)
+        assert compile_expression(a) is compile_expression(b)
+
+    def test_thresholds_change_hash(self) -> None:
+        """Test constants are part of the hash and cache parameters."""
+        assert expression_hash(col("rsi") > 70) != expression_hash(col("rsi") > 75)
+        assert get_cache_params(StrictVBO(max_noise=0.6)) != get_cache_params(
+            StrictVBO(max_noise=0.5)
+        )
+
+
+class TestEvaluation:
+    """Tests for fused expression evaluation."""
+
+    def test_frame_matches_pandas(self) -> None:
+        """Test results equal chained pandas operations, NaN compares False."""
+        df = _frame()
+        range_pct = col("prev_range") / col("open")
+        expr = all_of(
+            col("high") >= col("target"),
+            col("target") > col("sma"),
+            col("short_noise") <= 0.7,
+            range_pct >= 0.005,
+            range_pct <= 0.15,
+        )
+        pct = df["prev_range"] / df["open"]
+        expected = (
+            (df["high"] >= df["target"])
+            & (df["target"] > df["sma"])
+            & (df["short_noise"] <= 0.7)
+            & (pct >= 0.005)
+            & (pct <= 0.15)
+        )
+
+        result = evaluate_frame(expr, df)
+
+        pd.testing.assert_series_equal(result, expected, check_names=False)
+        assert not result.iloc[:5].any()
+
+    def test_exit_any_and_negation(self) -> None:
+        """Test OR and NOT match pandas, empty rules are constant."""
+        df = _frame(dtype=np.float64)
+        expr = any_of(col("close") < col("sma"), ~(col("short_noise") < col("long_noise")))
+        expected = (df["close"] < df["sma"]) | ~(df["short_noise"] < df["long_noise"])
+
+        pd.testing.assert_series_equal(evaluate_frame(expr, df), expected, check_names=False)
+        assert evaluate_frame(all_of(), df).all()
+        assert not evaluate_frame(any_of(), df).any()
+
+    def test_grid_matches_per_ticker_frames(self) -> None:
+        """Test one evaluation over the ticker x date grid equals per-frame results."""
+        frames = {
+            "KRW-BTC": _frame(seed=1, dtype=np.float64),
+            "KRW-ETH": _frame(seed=2, dtype=np.float64),
+        }
+        for df in frames.values():
+            for column in ("entry_signal", "exit_signal", "is_whipsaw"):
+                df[column] = False
+            for column in ("entry_price", "exit_price"):
+                df[column] = np.nan
+        grid_expr = all_of(
+            col("high") >= col("target"),
+            col("target") > col("sma"),
+            col("target") > col("sma_trend"),
+            col("short_noise") < col("long_noise"),
+            col("prev_range") / col("open") <= 0.05,
+        )
+        dates = np.array(sorted({d.date() for d in frames["KRW-BTC"].index}))
+
+        tickers, _, _, arrays = build_numpy_arrays(frames, dates, columns=EXPRESSION_COLUMNS)
+        grid = compile_expression(grid_expr)(column_arrays(arrays))
+
+        assert grid.shape == (2, len(dates))
+        for t_idx, ticker in enumerate(tickers):
+            expected = evaluate_frame(grid_expr, frames[ticker]).to_numpy()
+            np.testing.assert_array_equal(grid[t_idx], expected)
+        assert "long_noises" not in build_numpy_arrays(frames, dates)[3]
@@ -0,0 +1,109 @@
+"""Tests for shape-preserving chart downsampling."""
+
+import time
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.utils.downsampling import downsample_indices, lttb_indices, minmax_indices
+from src.utils.period_returns import monthly_return_grid, period_returns
+
+
+def _reference_lttb(values: np.ndarray, max_points: int) -> np.ndarray:
+    """Straightforward per-point LTTB used to check the vectorized version."""
+    n = len(values)
+    bucket_size = (n - 2) / (max_points - 2)
+    selected = [0]
+    a = 0
+    for i in range(max_points - 2):
+        start = int(np.floor(i * bucket_size)) + 1
+        end = int(np.floor((i + 1) * bucket_size)) + 1
+        next_start = end
+        next_end = int(np.floor((i + 2) * bucket_size)) + 1 if i < max_points - 3 else n - 1
+        if i == max_points - 3:
+            avg_x, avg_y = float(n - 1), values[-1]
+        else:
+            avg_x = (next_start + next_end - 1) / 2
+            avg_y = values[next_start:next_end].mean()
+        best, best_area = start, -1.0
+        for idx in range(start, end):
+            area = abs((a - avg_x) * (values[idx] - values[a]) - (a - idx) * (avg_y - values[a]))
+            if area > best_area:
+                best, best_area = idx, area
+        selected.append(best)
+        a = best
+    selected.append(n - 1)
+    return np.array(selected)
+
+
+class TestLttb:
+    """Tests for LTTB index selection."""
+
+    def test_matches_reference(self) -> None:
+        values = np.random.default_rng(0).normal(size=5003).cumsum()
+        np.testing.assert_array_equal(lttb_indices(values, 500), _reference_lttb(values, 500))
+
+    def test_keeps_endpoints_and_spike(self) -> None:
+        values = np.zeros(100_000)
+        values[54_321] = 100.0
+        indices = lttb_indices(values, 1000)
+        assert len(indices) == 1000
+        assert indices[0] == 0 and indices[-1] == len(values) - 1
+        assert 54_321 in indices
+        assert np.all(np.diff(indices) > 0)
+
+    def test_small_series_unchanged(self) -> None:
+        np.testing.assert_array_equal(downsample_indices(np.arange(10.0), 100), np.arange(10))
+
+
+class TestMinMax:
+    """Tests for min-max bucket selection."""
+
+    def test_keeps_global_extremes(self) -> None:
+        values = np.random.default_rng(1).normal(size=100_001).cumsum()
+        indices = minmax_indices(values, 1000)
+        assert len(indices) <= 1000
+        assert np.argmin(values) in indices
+        assert np.argmax(values) in indices
+        assert indices[0] == 0 and indices[-1] == len(values) - 1
+
+
+@pytest.mark.slow
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_benchmark_one_million_points(method: str) -> None:
+    """1M-point equity curve downsamples to 2000 points well under a second."""
+    values = np.random.default_rng(2).normal(0, 0.001, size=1_000_000).cumsum()
+
+    start = time.perf_counter()
+    indices = downsample_indices(values, 2000, method)  # type: ignore[arg-type]
+    elapsed = time.perf_counter() - start
+
+    assert len(indices) <= 2000
+    assert elapsed < 1.0, f"{method} took {elapsed:.3f}s"
+
+
+class TestPeriodReturns:
+    """Tests for vectorized calendar-period returns."""
+
+    def test_monthly_returns_chain_from_previous_month_end(self) -> None:
+        dates = pd.date_range("2024-11-15", "2025-02-10", freq="D")
+        equity = np.linspace(100, 130, len(dates))
+        periods, returns = period_returns(dates.values, equity, "M")
+
+        month_end = pd.Series(equity, index=dates).resample("ME").last()
+        expected = month_end.pct_change().to_numpy() * 100
+        expected[0] = (month_end.iloc[0] / equity[0] - 1) * 100
+        np.testing.assert_allclose(returns, expected)
+        assert [str(p) for p in periods] == ["2024-11", "2024-12", "2025-01", "2025-02"]
+
+    def test_monthly_compounds_to_yearly(self) -> None:
+        dates = pd.date_range("2023-03-01", "2024-12-31", freq="D")
+        equity = 100 * np.exp(np.random.default_rng(3).normal(0, 0.01, len(dates)).cumsum())
+        years, grid = monthly_return_grid(dates, equity)
+        _, yearly = period_returns(dates, equity, "Y")
+
+        compounded = (np.nanprod(1 + grid / 100, axis=1) - 1) * 100
+        np.testing.assert_allclose(compounded, yearly)
+        assert list(years) == [2023, 2024]
+        assert np.isnan(grid[0, :2]).all()
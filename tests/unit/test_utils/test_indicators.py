@@ -106,6 +106,17 @@ class TestATR:
         assert isinstance(result, pd.Series)
         assert len(result) == len(sample_ohlcv_data)
 
+    def test_atr_2d_matches_per_column(self, sample_ohlcv_data: pd.DataFrame) -> None:
+        """Test ATR over date x symbol DataFrames equals per-symbol Series."""
+        df = sample_ohlcv_data
+        wide = {col: pd.DataFrame({"A": df[col], "B": df[col] * 2}) for col in df.columns}
+        result = atr(wide["high"], wide["low"], wide["close"], period=5)
+
+        assert isinstance(result, pd.DataFrame)
+        for symbol in ("A", "B"):
+            expected = atr(wide["high"][symbol], wide["low"][symbol], wide["close"][symbol], 5)
+            pd.testing.assert_series_equal(result[symbol], expected, check_names=False)
+
 
 class TestVolatilityRange:
     """Test cases for volatility_range function."""
@@ -2,17 +2,26 @@
 Unit tests for logger utility module.
 """
 
+import json
 import logging
+import queue
+import sys
+from logging.handlers import QueueHandler
 from pathlib import Path
 from unittest.mock import patch
 
 from src.utils.logger import (
+    BackgroundQueueHandler,
     ContextLogger,
+    JSONFormatter,
     PerformanceLogger,
+    RateLimitFilter,
     get_context_logger,
     get_logger,
     log_performance,
     setup_logging,
+    start_queue_logging,
+    stop_queue_logging,
 )
 
 
@@ -209,3 +218,106 @@ class TestLogPerformance:
         perf_logger.__exit__(None, None, None)
 
         # Should not raise error, just do nothing
+
+
+class TestJSONFormatter:
+    """Test cases for JSONFormatter."""
+
+    def test_format_uses_record_time_and_extras(self) -> None:
+        """Test JSON output carries creation time, extra fields and exceptions."""
+        try:
+            raise ValueError("bad")
+        except ValueError:
+            record = logging.LogRecord("x", logging.ERROR, "f.py", 1, "n=%d", (3,), sys.exc_info())
+        record.created = 0.0
+        record.ticker = "KRW-BTC"
+
+        data = json.loads(JSONFormatter(extra_fields={"service": "bot"}).format(record))
+
+        assert data["timestamp"] == "1970-01-01T00:00:00+00:00"
+        assert data["message"] == "n=3"
+        assert data["ticker"] == "KRW-BTC"
+        assert data["service"] == "bot"
+        assert data["exception"]["type"] == "ValueError"
+
+
+class TestRateLimitFilter:
+    """Test cases for RateLimitFilter."""
+
+    @staticmethod
+    def _record(msg: str, created: float) -> logging.LogRecord:
+        record = logging.LogRecord("x", logging.ERROR, "f.py", 1, msg, None, None)
+        record.created = created
+        return record
+
+    def test_repeats_suppressed_and_reported(self) -> None:
+        """Test identical messages pass once per window and report suppressions."""
+        rate_filter = RateLimitFilter(interval=10.0)
+
+        assert rate_filter.filter(self._record("Loop Error", 0.0))
+        assert not rate_filter.filter(self._record("Loop Error", 1.0))
+        assert not rate_filter.filter(self._record("Loop Error", 2.0))
+        assert rate_filter.filter(self._record("Other", 2.0))
+
+        after = self._record("Loop Error", 11.0)
+        assert rate_filter.filter(after)
+        assert after.suppressed == 2  # type: ignore[attr-defined]
+        assert "suppressed 2 repeats" in after.getMessage()
+
+    def test_decision_shared_across_handlers(self) -> None:
+        """Test a record passed to several handlers is counted once."""
+        rate_filter = RateLimitFilter(interval=10.0)
+        record = self._record("Loop Error", 0.0)
+
+        assert rate_filter.filter(record)
+        assert rate_filter.filter(record)
+
+
+class TestQueueLogging:
+    """Test cases for background (queue) logging."""
+
+    def test_records_written_by_listener(self, tmp_path: Path) -> None:
+        """Test queued records reach the file handler in order once flushed."""
+        log_file = tmp_path / "queued.log"
+        file_handler = logging.FileHandler(log_file, encoding="utf-8")
+        file_handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+        queued = logging.getLogger("test_queue_logging")
+        queued.propagate = False
+        queued.setLevel(logging.DEBUG)
+
+        listener = start_queue_logging(queued, [file_handler])
+        try:
+            payload = {"n": 1}
+            queued.debug("payload=%s", payload)
+            payload["n"] = 2  # Arguments are merged before enqueueing
+            queued.warning("done")
+        finally:
+            stop_queue_logging(listener)
+            queued.handlers.clear()
+            file_handler.close()
+
+        assert log_file.read_text(encoding="utf-8").splitlines() == [
+            "DEBUG payload={'n': 1}",
+            "WARNING done",
+        ]
+
+    def test_full_queue_drops_debug_records(self) -> None:
+        """Test records below WARNING are dropped instead of blocking."""
+        handler = BackgroundQueueHandler(queue.Queue(1), block_timeout=0.01)
+        handler.handle(logging.LogRecord("x", logging.DEBUG, "f.py", 1, "a", None, None))
+        handler.handle(logging.LogRecord("x", logging.DEBUG, "f.py", 1, "b", None, None))
+        handler.handle(logging.LogRecord("x", logging.ERROR, "f.py", 1, "c", None, None))
+
+        assert handler.dropped == 2
+
+    def test_setup_logging_with_queue(self, tmp_path: Path) -> None:
+        """Test setup_logging routes the root logger through a queue."""
+        log_file = tmp_path / "app.log"
+        try:
+            setup_logging(log_file=log_file, use_queue=True, json_format=True)
+            get_logger("test_setup_queue").info("hello")
+            assert any(isinstance(h, QueueHandler) for h in logging.getLogger().handlers)
+        finally:
+            setup_logging()  # Stops the listener (flushes the file)
+
+        assert '"message": "hello"' in log_file.read_text(encoding="utf-8")
@@ -0,0 +1,122 @@
+"""Tests for span instrumentation."""
+
+from __future__ import annotations
+
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.utils.profiling import Profiler, disable_profiling, enable_profiling
+
+
+class TestProfiler:
+    """Tests for Profiler."""
+
+    def test_disabled_spans_are_shared_noops(self) -> None:
+        profiler = Profiler()
+
+        assert profiler.span("a") is profiler.span("b")
+        with profiler.span("a"), profiler.collect() as collected:
+            profiler.record("b", 1.0)
+
+        assert collected is None
+        assert profiler.stats() == {}
+
+    def test_spans_aggregate_per_stage(self) -> None:
+        profiler = Profiler(enabled=True)
+
+        for _ in range(3):
+            with profiler.span("stage"):
+                pass
+        profiler.record("stage", 0.5)
+
+        stats = profiler.stats()["stage"]
+        assert stats.count == 4
+        assert stats.max_s == pytest.approx(0.5)
+        assert json.loads(profiler.to_json())["stage"]["count"] == 4
+
+    def test_collect_is_per_thread_and_nests(self) -> None:
+        profiler = Profiler(enabled=True)
+
+        with profiler.collect() as outer:
+            with profiler.collect() as inner:
+                profiler.record("a", 0.1)
+            thread = threading.Thread(target=profiler.record, args=("other", 0.1))
+            thread.start()
+            thread.join()
+            profiler.record("b", 0.1)
+
+        assert outer is not None and inner is not None
+        assert set(outer) == {"a", "b"}
+        assert set(inner) == {"a"}
+        assert set(profiler.stats()) == {"a", "b", "other"}
+
+    def test_sinks_receive_finished_spans(self) -> None:
+        profiler = Profiler(enabled=True)
+        sink = MagicMock()
+        profiler.add_sink(sink)
+
+        profiler.record("bot.order.buy", 0.2)
+        profiler.remove_sink(sink)
+        profiler.record("bot.order.buy", 0.3)
+
+        sink.assert_called_once_with("bot.order.buy", 0.2)
+
+    def test_allocation_tracking(self) -> None:
+        profiler = Profiler()
+        enable_profiling(track_allocations=True, profiler=profiler)
+        try:
+            with profiler.span("alloc"):
+                kept = bytearray(1 << 20)
+        finally:
+            disable_profiling(profiler)
+
+        assert len(kept) == 1 << 20
+        assert profiler.stats()["alloc"].alloc_bytes >= 1 << 20
+
+
+class TestBotInstrumentation:
+    """Tests for the bot tick/order/fill spans."""
+
+    def test_order_placement_to_fill_is_recorded(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        from src.execution.order_tracker import OrderTracker
+
+        profiler = Profiler(enabled=True)
+        monkeypatch.setattr("src.execution.order_tracker.get_profiler", lambda: profiler)
+        pending, filled = MagicMock(order_id="o1", is_filled=False), MagicMock(is_filled=True)
+        exchange = MagicMock()
+        exchange.get_order_status.return_value = filled
+        tracker = OrderTracker(exchange)
+
+        tracker.add_order(pending)
+        tracker.get_status("o1")
+        tracker.get_status("o1")
+
+        assert profiler.stats()["bot.fill"].count == 1
+
+    def test_trading_metrics_exports_order_latency(self) -> None:
+        pytest.importorskip("prometheus_client")
+        from src.monitoring.metrics import TradingMetrics
+
+        profiler = Profiler(enabled=True)
+        metrics = TradingMetrics(prefix="profiling_test")
+        metrics.attach_profiler(profiler)
+
+        profiler.record("bot.order.sell", 0.02)
+        profiler.record("bot.tick", 0.001)
+
+        registry = metrics.registry
+        assert (
+            registry.get_sample_value(
+                "profiling_test_order_latency_seconds_count", {"action": "sell"}
+            )
+            == 1
+        )
+        assert (
+            registry.get_sample_value(
+                "profiling_test_stage_duration_seconds_count", {"stage": "bot.tick"}
+            )
+            == 1
+        )
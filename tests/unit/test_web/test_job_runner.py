@@ -0,0 +1,167 @@
+"""Tests for the dashboard background job runner."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from src.web.services.job_runner import (
+    CANCELLED,
+    COMPLETED,
+    FAILED,
+    RUNNING,
+    JobContext,
+    JobRecord,
+    JobRunner,
+    _write_meta,
+)
+
+
+def _add_job(ctx: JobContext, a: int, b: int) -> int:
+    for i in range(3):
+        ctx.emit({"step": i})
+        ctx.report(progress=(i + 1) / 3, message=f"step {i}")
+    return a + b
+
+
+def _failing_job(ctx: JobContext) -> None:
+    raise RuntimeError("boom")
+
+
+def _cancellable_job(ctx: JobContext, ready_file: str) -> None:
+    Path(ready_file).touch()
+    while True:
+        ctx.check_cancelled()
+        time.sleep(0.01)
+
+
+def _exited_pid() -> int:
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    return proc.pid
+
+
+def _wait(runner: JobRunner, job_id: str, timeout: float = 30.0) -> JobRecord:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        record = runner.get(job_id)
+        if record is not None and not record.is_active:
+            return record
+        time.sleep(0.02)
+    raise TimeoutError(job_id)
+
+
+@pytest.fixture
+def runner(tmp_path: Path) -> Iterator[JobRunner]:
+    job_runner = JobRunner(tmp_path / "jobs", max_workers=1)
+    yield job_runner
+    job_runner.shutdown()
+
+
+class TestJobRunner:
+    """Tests for JobRunner."""
+
+    def test_completed_job_persists_result_and_partials(self, runner: JobRunner) -> None:
+        job_id = runner.submit("test", _add_job, label="add", params={"a": 1}, a=1, b=2)
+
+        record = _wait(runner, job_id)
+        assert record.status == COMPLETED
+        assert record.progress == 1.0
+        assert record.label == "add"
+        assert record.params == {"a": 1}
+        assert runner.load_result(job_id) == 3
+        assert runner.read_partials(job_id) == [{"step": 0}, {"step": 1}, {"step": 2}]
+
+    def test_failed_job_records_error(self, runner: JobRunner) -> None:
+        job_id = runner.submit("test", _failing_job)
+
+        record = _wait(runner, job_id)
+        assert record.status == FAILED
+        assert record.error == "boom"
+        assert runner.load_result(job_id) is None
+
+    def test_cancel_running_job(self, runner: JobRunner, tmp_path: Path) -> None:
+        ready = tmp_path / "ready"
+        job_id = runner.submit("test", _cancellable_job, ready_file=str(ready))
+        deadline = time.monotonic() + 30.0
+        while not ready.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+        runner.cancel(job_id)
+        assert _wait(runner, job_id).status == CANCELLED
+
+    def test_results_reopen_from_new_runner(self, runner: JobRunner) -> None:
+        job_id = runner.submit("test", _add_job, a=2, b=3)
+        _wait(runner, job_id)
+
+        reopened = JobRunner(runner.jobs_dir)
+        assert [r.job_id for r in reopened.list_jobs("test")] == [job_id]
+        assert reopened.list_jobs("other") == []
+        assert reopened.load_result(job_id) == 5
+
+        reopened.delete(job_id)
+        assert reopened.get(job_id) is None
+
+    def test_active_jobs_marked_interrupted_on_restart(self, tmp_path: Path) -> None:
+        jobs_dir = tmp_path / "jobs"
+        job_dir = jobs_dir / "stale"
+        job_dir.mkdir(parents=True)
+        _write_meta(job_dir, JobRecord(job_id="stale", kind="test", label="", status=RUNNING))
+
+        record = JobRunner(jobs_dir).get("stale")
+        assert record is not None
+        assert record.status == FAILED
+        assert record.error is not None and "Interrupted" in record.error
+
+    def test_jobs_of_live_processes_survive_restart(self, tmp_path: Path) -> None:
+        jobs_dir = tmp_path / "jobs"
+        records = {
+            "live": JobRecord(job_id="live", kind="test", label="", owner_pid=os.getpid()),
+            "dead": JobRecord(job_id="dead", kind="test", label="", owner_pid=_exited_pid()),
+            # PID reused by a process started after the job was created
+            "reused": JobRecord(
+                job_id="reused", kind="test", label="", owner_pid=os.getpid(), created_at=0.0
+            ),
+        }
+        for job_id, record in records.items():
+            (jobs_dir / job_id).mkdir(parents=True)
+            record.status = RUNNING
+            _write_meta(jobs_dir / job_id, record)
+
+        statuses = {r.job_id: r.status for r in JobRunner(jobs_dir).list_jobs()}
+        assert statuses == {"live": RUNNING, "dead": FAILED, "reused": FAILED}
+
+    def test_delete_active_job_raises(self, tmp_path: Path) -> None:
+        runner = JobRunner(tmp_path / "jobs")
+        job_dir = runner.jobs_dir / "active"
+        job_dir.mkdir()
+        _write_meta(job_dir, JobRecord(job_id="active", kind="test", label="", status=RUNNING))
+
+        with pytest.raises(ValueError, match="active job"):
+            runner.delete("active")
+
+
+class TestJobContext:
+    """Tests for JobContext."""
+
+    def test_report_clamps_progress(self, tmp_path: Path) -> None:
+        record = JobRecord(job_id="j", kind="test", label="")
+        ctx = JobContext(tmp_path, record)
+        ctx.report(progress=1.5, message="done")
+        assert record.progress == 1.0
+        assert record.message == "done"
+
+    def test_read_partials_ignores_truncated_line(self, runner: JobRunner) -> None:
+        job_dir = runner.jobs_dir / "partial"
+        job_dir.mkdir()
+        (job_dir / "partial.jsonl").write_text('{"x": 1}\n{"x": ', encoding="utf-8")
+
+        rows: list[dict[str, Any]] = runner.read_partials("partial")
+        assert rows == [{"x": 1}]
@@ -0,0 +1,182 @@
+"""Tests for the backtest result cache."""
+
+from __future__ import annotations
+
+import os
+from datetime import date, timedelta
+from pathlib import Path
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.backtester.models import BacktestConfig, BacktestResult, Trade
+from src.web.services.backtest_runner import run_backtest_service
+from src.web.services.result_cache import (
+    CompactBacktestResult,
+    ResultCache,
+    backtest_cache_key,
+)
+
+
+def _result(n_days: int = 10, n_trades: int = 3) -> BacktestResult:
+    dates = np.array([date(2024, 1, 1) + timedelta(days=i) for i in range(n_days)])
+    trades = [
+        Trade(
+            ticker=f"KRW-{'BTC' if i % 2 else 'ETH'}",
+            entry_date=date(2024, 1, 1 + i),
+            entry_price=100.0 + i,
+            exit_date=None if i == n_trades - 1 else date(2024, 1, 2 + i),
+            exit_price=None if i == n_trades - 1 else 101.0 + i,
+            amount=1.5,
+            pnl=1.0,
+            pnl_pct=1.0,
+            is_stop_loss=i == 0,
+            exit_reason="open" if i == n_trades - 1 else "signal",
+        )
+        for i in range(n_trades)
+    ]
+    return BacktestResult(
+        total_return=12.5,
+        sharpe_ratio=1.2,
+        total_trades=n_trades,
+        equity_curve=np.linspace(1.0, 1.125, n_days),
+        dates=dates,
+        trades=trades,
+        config=BacktestConfig(),
+        strategy_name="Test",
+    )
+
+
+def _assert_same(actual: BacktestResult, expected: BacktestResult) -> None:
+    np.testing.assert_array_equal(actual.equity_curve, expected.equity_curve)
+    assert list(actual.dates) == list(expected.dates)
+    assert actual.trades == expected.trades
+    assert actual.total_return == expected.total_return
+    assert actual.strategy_name == expected.strategy_name
+    assert actual.config == expected.config
+
+
+class TestCompactBacktestResult:
+    """Tests for CompactBacktestResult."""
+
+    def test_round_trip(self) -> None:
+        original = _result()
+        restored = CompactBacktestResult.from_result(original).to_result()
+
+        _assert_same(restored, original)
+        assert type(restored.dates[0]) is date
+        assert restored.trades[-1].exit_date is None
+        assert restored.trades[-1].exit_price is None
+
+    def test_trades_frame(self) -> None:
+        frame = CompactBacktestResult.from_result(_result()).trades_frame()
+        assert list(frame["ticker"]) == ["KRW-ETH", "KRW-BTC", "KRW-ETH"]
+        assert list(frame["exit_reason"]) == ["signal", "signal", "open"]
+
+    def test_empty_result(self) -> None:
+        restored = CompactBacktestResult.from_result(BacktestResult()).to_result()
+        assert restored.trades == []
+        assert len(restored.equity_curve) == 0
+
+
+class TestResultCache:
+    """Tests for ResultCache."""
+
+    def test_lru_eviction_by_bytes(self) -> None:
+        entry = CompactBacktestResult.from_result(_result())
+        cache = ResultCache(max_bytes=entry.nbytes * 2)
+        cache.put("a", entry)
+        cache.put("b", entry)
+        assert cache.get("a") is entry  # "b" becomes least recently used
+
+        cache.put("c", entry)
+        assert cache.get("b") is None
+        assert cache.get("a") is entry
+        assert cache.total_bytes <= cache.max_bytes
+
+    def test_shared_directory_reaches_other_processes(self, tmp_path: Path) -> None:
+        entry = CompactBacktestResult.from_result(_result())
+        worker = ResultCache(1 << 20, tmp_path)
+        dashboard = ResultCache(1 << 20, tmp_path)
+        worker.put("a", entry)
+
+        loaded = dashboard.get("a")
+        assert loaded is not None
+        _assert_same(loaded.to_result(), entry.to_result())
+
+        # Clearing from the dashboard drops the worker's in-memory entry too
+        dashboard.clear()
+        assert worker.get("a") is None
+        assert not list(tmp_path.glob("*.pkl"))
+
+    def test_disk_entries_bounded_by_bytes(self, tmp_path: Path) -> None:
+        entry = CompactBacktestResult.from_result(_result())
+        cache = ResultCache(1 << 20, tmp_path)
+        cache.put("a", entry)
+        cache.max_bytes = (tmp_path / "a.pkl").stat().st_size * 2
+        os.utime(tmp_path / "a.pkl", ns=(1, 1))
+        cache.put("b", entry)
+        cache.put("c", entry)
+        assert sorted(p.stem for p in tmp_path.glob("*.pkl")) == ["b", "c"]
+
+    def test_oversized_entry_not_cached(self) -> None:
+        cache = ResultCache(max_bytes=100)
+        cache.put("a", CompactBacktestResult.from_result(_result()))
+        assert len(cache) == 0
+
+
+class TestBacktestCacheKey:
+    """Tests for data-fingerprint cache keys."""
+
+    def test_key_changes_when_data_file_changes(self, tmp_path: Path) -> None:
+        path = tmp_path / "KRW-BTC_day.parquet"
+        path.write_bytes(b"v1")
+        files = {"KRW-BTC": str(path)}
+        key = backtest_cache_key("VBO", {"k": 1}, files, {}, None, None)
+        assert key == backtest_cache_key("VBO", {"k": 1}, files, {}, None, None)
+
+        path.write_bytes(b"v2-longer")
+        os.utime(path, ns=(1, 1))
+        assert key != backtest_cache_key("VBO", {"k": 1}, files, {}, None, None)
+
+    def test_service_reuses_cached_result(self, tmp_path: Path) -> None:
+        path = tmp_path / "KRW-BTC_day.parquet"
+        path.write_bytes(b"v1")
+        args = ("VBO", {}, {"KRW-BTC": str(path)}, {}, None, None)
+
+        with (
+            patch(
+                "src.web.services.backtest_runner.get_result_cache",
+                return_value=ResultCache(1 << 20),
+            ),
+            patch(
+                "src.web.services.backtest_runner._execute_backtest", return_value=_result()
+            ) as execute,
+        ):
+            first = run_backtest_service(*args)
+            second = run_backtest_service(*args)
+            assert execute.call_count == 1
+            assert first is not None and second is not None
+            _assert_same(second, first)
+            assert first is not second
+
+            path.write_bytes(b"v2-longer")
+            run_backtest_service(*args)
+            assert execute.call_count == 2
+
+
+@pytest.mark.parametrize(
+    "dates",
+    [
+        np.array(pd.date_range("2024-01-01", periods=3).to_numpy()),
+        np.array(list(pd.date_range("2024-01-01", periods=3)), dtype=object),
+    ],
+)
+def test_date_types_preserved(dates: np.ndarray) -> None:
+    result = BacktestResult(equity_curve=np.ones(3), dates=dates)
+    restored = CompactBacktestResult.from_result(result).to_result()
+    assert restored.dates.dtype == dates.dtype
+    assert type(restored.dates[0]) is type(dates[0])
+    assert list(restored.dates) == list(dates)
@@ -0,0 +1,109 @@
+"""Tests for the lazy strategy registry and dashboard import cost."""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any
+
+from src.web.services.strategy_manifest import STRATEGY_MANIFEST
+from src.web.services.strategy_registry import StrategyRegistry, discover_strategies
+
+REPO_ROOT = Path(__file__).resolve().parents[3]
+
+# Dashboard page modules imported when the app first renders
+PAGE_MODULES = (
+    "src.web.pages.backtest",
+    "src.web.pages.optimization",
+    "src.web.pages.analysis",
+    "src.web.pages.monitor",
+    "src.web.pages.data_collect",
+)
+
+# Import budget for all pages in a cold interpreter (streamlit + pandas alone
+# take most of it); scipy by itself would add well over a second
+IMPORT_BUDGET_SECONDS = 3.0
+
+HEAVY_MODULES = ("scipy", "matplotlib", "bt", "joblib", "sklearn", "src.strategies")
+
+
+def _run_cold(code: str) -> dict[str, Any]:
+    """Run code in a fresh interpreter and return the JSON it prints."""
+    output = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=REPO_ROOT,
+        capture_output=True,
+        text=True,
+        check=True,
+        timeout=120,
+    ).stdout
+    result: dict[str, Any] = json.loads(output.strip().splitlines()[-1])
+    return result
+
+
+class TestStrategyManifest:
+    """Tests for the static strategy manifest."""
+
+    def test_manifest_matches_strategy_modules(self) -> None:
+        """Test the manifest lists exactly the discoverable strategies."""
+        assert list(STRATEGY_MANIFEST) == discover_strategies()
+
+
+class TestLazyRegistry:
+    """Tests for deferred strategy imports."""
+
+    def test_entries_do_not_import_strategies(self) -> None:
+        """Test listing strategies imports no strategy module until one is used."""
+        result = _run_cold(
+            "import json, sys\n"
+            "from src.web.services.strategy_registry import StrategyRegistry\n"
+            "registry = StrategyRegistry()\n"
+            "names = [e.name for e in registry.list_entries()]\n"
+            "before = sorted(m for m in sys.modules if m.startswith('src.strategies'))\n"
+            "params = registry.get_parameters('MomentumStrategy')\n"
+            "after = sorted(m for m in sys.modules if m.startswith('src.strategies'))\n"
+            "print(json.dumps({'names': names, 'before': before, 'after': after,"
+            " 'params': list(params)}))\n"
+        )
+
+        assert "VanillaVBO" in result["names"] and "bt_VBO" in result["names"]
+        assert result["before"] == []
+        assert "src.strategies.momentum" in result["after"]
+        assert "src.strategies.opening_range_breakout" not in result["after"]
+        assert "sma_period" in result["params"]
+
+    def test_resolved_strategy_matches_class(self) -> None:
+        """Test a resolved strategy carries its class and signature parameters."""
+        registry = StrategyRegistry()
+
+        info = registry.get_strategy("VanillaVBO")
+
+        assert info is not None
+        assert info.strategy_class is not None
+        assert info.strategy_class.__name__ == "VanillaVBO"
+        assert "sma_period" in info.parameters
+        assert registry.get_strategy("Unknown") is None
+        assert len(registry.list_strategies()) == len(registry.list_entries())
+
+
+class TestImportBudget:
+    """Tests for dashboard cold-start import cost."""
+
+    def test_pages_import_within_budget(self) -> None:
+        """Test page modules import fast and without heavy optional dependencies."""
+        result = _run_cold(
+            "import importlib, json, sys, time\n"
+            "start = time.perf_counter()\n"
+            f"for name in {PAGE_MODULES!r}:\n"
+            "    importlib.import_module(name)\n"
+            "elapsed = time.perf_counter() - start\n"
+            f"heavy_prefixes = {HEAVY_MODULES!r}\n"
+            "heavy = sorted(m for m in sys.modules"
+            " if any(m == p or m.startswith(p + '.') for p in heavy_prefixes))\n"
+            "print(json.dumps({'elapsed': elapsed, 'heavy': heavy}))\n"
+        )
+
+        assert result["heavy"] == []
+        assert result["elapsed"] < IMPORT_BUDGET_SECONDS